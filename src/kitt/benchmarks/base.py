@@ -9,6 +9,8 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+WARMUP_PROMPT = "This is a warmup prompt to initialize GPU kernels."
+
 
 @dataclass
 class WarmupConfig:
@@ -42,6 +44,10 @@ class LLMBenchmark(ABC):
     version: str = "1.0.0"
     category: str = ""  # 'performance', 'quality_standard', 'quality_custom'
     description: str = ""
+    # Metric used to decide convergence in adaptive sampling (dotted path)
+    primary_metric: str = "avg_tps"
+    # Run before the suite's session warmup, with the warmup config as given
+    requires_cold_engine: bool = False
 
     def run(self, engine, config: dict[str, Any]) -> BenchmarkResult:
         """Execute the benchmark with optional warmup phase.
@@ -93,7 +99,7 @@ class LLMBenchmark(ABC):
             start = time.perf_counter()
             try:
                 engine.generate(
-                    prompt="This is a warmup prompt to initialize GPU kernels.",
+                    prompt=WARMUP_PROMPT,
                     max_tokens=10,
                     temperature=0.0,
                 )
@@ -0,0 +1,260 @@
+"""Concurrent chat sessions benchmark — interleaved multi-turn traffic."""
+
+import logging
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
+from kitt.benchmarks.registry import register_benchmark
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONVERSATIONS = [
+    [
+        "I'm planning a week-long trip to Japan in spring. Where should I start?",
+        "What would a realistic day-by-day itinerary for Kyoto look like?",
+        "How should I budget for food and transport on that itinerary?",
+        "Summarize the whole plan in a short checklist.",
+    ],
+    [
+        "Explain how a hash map works internally.",
+        "How does it handle collisions?",
+        "Compare that with a balanced binary search tree.",
+        "When would you pick the tree over the hash map?",
+    ],
+    [
+        "Write a short story opening about a lighthouse keeper.",
+        "Continue the story and introduce a mysterious visitor.",
+        "Now add a twist involving the lighthouse itself.",
+        "Write an ending that ties the threads together.",
+    ],
+]
+
+
+@register_benchmark
+class ChatSessionsBenchmark(LLMBenchmark):
+    """Simulate many concurrent chat sessions against the chat endpoint.
+
+    Each session is a thread that holds its own message history and
+    sends one turn at a time through ``/v1/chat/completions`` with
+    streaming. Between turns it waits a random think time, drawn from an
+    exponential distribution with mean ``think_time_s``, like a user
+    reading and typing. Sessions start at staggered times, so turns
+    from different sessions interleave. The server holds the KV cache
+    of every live session at once.
+
+    Measures:
+    - TTFT per turn, and how it grows with the history length
+    - Aggregate token throughput and request rate over the whole run
+    """
+
+    name = "chat_sessions"
+    version = "1.0.0"
+    category = "performance"
+    description = "Concurrent multi-turn chat sessions with think time"
+    primary_metric = "ttft_ms.p95"
+
+    def _execute(self, engine, config: dict[str, Any]) -> BenchmarkResult:
+        sessions = config.get("sessions", 8)
+        conversations = config.get("conversations", DEFAULT_CONVERSATIONS)
+        turns = config.get("turns", max(len(c) for c in conversations))
+        think_time_s = config.get("think_time_s", 2.0)
+        max_tokens = config.get("max_tokens", 128)
+        temperature = config.get("temperature", 0.0)
+        system_prompt = config.get("system_prompt")
+        rng = random.Random(config.get("seed", 0))
+
+        base_url = getattr(engine, "_base_url", None)
+        model_name = getattr(engine, "_model_name", "default")
+        if not base_url:
+            return BenchmarkResult(
+                test_name=self.name,
+                test_version=self.version,
+                passed=False,
+                metrics={},
+                outputs=[],
+                errors=["Engine does not expose a base_url for chat streaming"],
+            )
+
+        from kitt.engines.openai_compat import openai_chat_stream
+
+        # Think times are drawn up front so runs are reproducible
+        plans = []
+        for session in range(sessions):
+            conversation = conversations[session % len(conversations)]
+            plans.append(
+                {
+                    "session": session,
+                    "turns": [
+                        conversation[t % len(conversation)] for t in range(turns)
+                    ],
+                    "start_delay_s": rng.uniform(0, think_time_s),
+                    "think_s": [
+                        rng.expovariate(1 / think_time_s) if think_time_s else 0.0
+                        for _ in range(turns)
+                    ],
+                }
+            )
+
+        outputs: list[dict[str, Any]] = []
+        errors: list[str] = []
+        lock = threading.Lock()
+        active = 0
+        peak_active = 0
+
+        def run_session(plan: dict[str, Any]) -> None:
+            nonlocal active, peak_active
+            messages: list[dict[str, str]] = []
+            if system_prompt:
+                messages.append({"role": "system", "content": system_prompt})
+            time.sleep(plan["start_delay_s"])
+
+            for turn, user_msg in enumerate(plan["turns"]):
+                if turn:
+                    time.sleep(plan["think_s"][turn])
+                messages.append({"role": "user", "content": user_msg})
+                history_chars = sum(len(m["content"]) for m in messages)
+
+                with lock:
+                    active += 1
+                    peak_active = max(peak_active, active)
+                started = time.perf_counter()
+                try:
+                    chunks = list(
+                        openai_chat_stream(
+                            base_url,
+                            messages,
+                            model=model_name,
+                            temperature=temperature,
+                            max_tokens=max_tokens,
+                        )
+                    )
+                except Exception as e:
+                    with lock:
+                        errors.append(f"Session {plan['session']} turn {turn}: {e}")
+                    return
+                finally:
+                    with lock:
+                        active -= 1
+
+                if not chunks:
+                    with lock:
+                        errors.append(
+                            f"Session {plan['session']} turn {turn}: no tokens received"
+                        )
+                    return
+
+                reply = "".join(c.token for c in chunks)
+                messages.append({"role": "assistant", "content": reply})
+                with lock:
+                    outputs.append(
+                        {
+                            "session": plan["session"],
+                            "turn": turn,
+                            "history_messages": len(messages) - 1,
+                            "history_chars": history_chars,
+                            "ttft_ms": round(chunks[0].timestamp_ms, 2),
+                            "latency_ms": round(chunks[-1].timestamp_ms, 2),
+                            "tokens": len(chunks),
+                            "started_s": started,
+                            "finished_s": started + chunks[-1].timestamp_ms / 1000,
+                        }
+                    )
+
+        wall_start = time.perf_counter()
+        with ThreadPoolExecutor(
+            max_workers=sessions, thread_name_prefix="kitt-chat"
+        ) as executor:
+            list(executor.map(run_session, plans))
+        wall_s = time.perf_counter() - wall_start
+
+        outputs.sort(key=lambda o: (o["session"], o["turn"]))
+        metrics = self._aggregate_metrics(outputs, sessions, turns)
+        if outputs:
+            # Throughput over the span with requests in flight, so the
+            # leading start delays and trailing think times don't count
+            busy_s = max(o["finished_s"] for o in outputs) - min(
+                o["started_s"] for o in outputs
+            )
+            total_tokens = sum(o["tokens"] for o in outputs)
+            metrics["wall_time_s"] = round(wall_s, 2)
+            metrics["throughput_tps"] = (
+                round(total_tokens / busy_s, 2) if busy_s > 0 else 0
+            )
+            metrics["requests_per_s"] = (
+                round(len(outputs) / busy_s, 3) if busy_s > 0 else 0
+            )
+            metrics["peak_concurrent_requests"] = peak_active
+        for o in outputs:
+            o.pop("started_s")
+            o.pop("finished_s")
+
+        return BenchmarkResult(
+            test_name=self.name,
+            test_version=self.version,
+            passed=len(errors) == 0 and bool(outputs),
+            metrics=metrics,
+            outputs=outputs,
+            errors=errors,
+        )
+
+    def _aggregate_metrics(
+        self, outputs: list[dict[str, Any]], sessions: int, turns: int
+    ) -> dict[str, Any]:
+        if not outputs:
+            return {}
+
+        ttft = [o["ttft_ms"] for o in outputs]
+        latency = [o["latency_ms"] for o in outputs]
+        metrics: dict[str, Any] = {
+            "sessions": sessions,
+            "turns_per_session": turns,
+            "turns_completed": len(outputs),
+            "total_tokens": sum(o["tokens"] for o in outputs),
+            "ttft_ms": _summary(ttft),
+            "turn_latency_ms": _summary(latency),
+        }
+
+        by_turn: dict[int, list[float]] = {}
+        for o in outputs:
+            by_turn.setdefault(o["turn"], []).append(o["ttft_ms"])
+        metrics["ttft_by_turn_ms"] = {
+            f"turn_{turn + 1}": round(statistics.mean(values), 2)
+            for turn, values in sorted(by_turn.items())
+        }
+        metrics["ttft_growth_ms_per_1k_chars"] = round(
+            _slope([o["history_chars"] / 1000 for o in outputs], ttft), 3
+        )
+        return metrics
+
+
+def _summary(values: list[float]) -> dict[str, float]:
+    ordered = sorted(values)
+    return {
+        "avg": round(statistics.mean(ordered), 2),
+        "p50": round(_percentile(ordered, 50), 2),
+        "p95": round(_percentile(ordered, 95), 2),
+        "max": round(ordered[-1], 2),
+    }
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    position = (len(ordered) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _slope(x: list[float], y: list[float]) -> float:
+    """Least-squares slope of y against x (0 if x does not vary)."""
+    mean_x = statistics.mean(x)
+    mean_y = statistics.mean(y)
+    var_x = sum((v - mean_x) ** 2 for v in x)
+    if not var_x:
+        return 0.0
+    cov = sum((a - mean_x) * (b - mean_y) for a, b in zip(x, y, strict=True))
+    return cov / var_x
@@ -30,6 +30,7 @@ class LatencyBenchmark(LLMBenchmark):
     version = "1.0.0"
     category = "performance"
     description = "Measure inference latency (TTFT, per-token, end-to-end)"
+    primary_metric = "total_latency_ms.avg"
 
     def _execute(self, engine, config: dict[str, Any]) -> BenchmarkResult:
         """Run latency benchmark."""
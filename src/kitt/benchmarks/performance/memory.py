@@ -35,6 +35,7 @@ class MemoryBenchmark(LLMBenchmark):
     version = "1.0.0"
     category = "performance"
     description = "Profile GPU memory usage during inference"
+    primary_metric = "overall_peak_gpu_memory_gb"
 
     def _execute(self, engine, config: dict[str, Any]) -> BenchmarkResult:
         """Run memory profiling benchmark."""
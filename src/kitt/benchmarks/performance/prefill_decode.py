@@ -0,0 +1,304 @@
+"""Prefill vs. decode sweep — throughput and TTFT curves over input length."""
+
+import logging
+import statistics
+import uuid
+from typing import Any
+
+from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
+from kitt.benchmarks.registry import register_benchmark
+
+logger = logging.getLogger(__name__)
+
+# Varied filler so the tokenizer sees ordinary prose rather than one
+# repeated sentence (which some tokenizers compress unusually well).
+_FILLER_SENTENCES = [
+    "The committee reviewed the quarterly report and noted steady growth. ",
+    "Rain fell over the valley while the farmers waited for the harvest. ",
+    "A small research team published results on efficient data storage. ",
+    "Engineers replaced the old bridge cables after a routine inspection. ",
+    "The library extended its opening hours during the examination period. ",
+    "Several migrating birds were observed near the northern coastline. ",
+    "The orchestra rehearsed the final movement twice before the concert. ",
+    "Local markets reported higher demand for fresh vegetables this week. ",
+]
+
+_INSTRUCTION = "\n\nSummarize the text above in detail."
+
+DEFAULT_OUTPUT_LENGTHS = [64, 256]
+DEFAULT_MAX_CONTEXT = 8192
+MIN_INPUT_LENGTH = 128
+_INITIAL_CHARS_PER_TOKEN = 4.0
+
+
+@register_benchmark
+class PrefillDecodeBenchmark(LLMBenchmark):
+    """Sweep input length x output length and separate prefill from decode.
+
+    For each grid point the benchmark issues a prefill probe
+    (``max_tokens=1``) to measure time-to-first-token, then a full
+    generation to measure decode rate. Prompt sizes are calibrated against
+    the ``prompt_tokens`` the engine reports, so curves are plotted over
+    exact token counts rather than a chars-per-token estimate.
+
+    Every request starts with a unique nonce so prefix caching cannot
+    turn a repeated prefill into a cache hit.
+    """
+
+    name = "prefill_decode"
+    version = "1.0.0"
+    category = "performance"
+    description = "Sweep input/output length and report prefill vs. decode rates"
+    primary_metric = "avg_decode_tps"
+
+    def _execute(self, engine, config: dict[str, Any]) -> BenchmarkResult:
+        input_lengths = self._input_lengths(config)
+        output_lengths = config.get("output_lengths", DEFAULT_OUTPUT_LENGTHS)
+        repetitions = config.get("repetitions", 3)
+        temperature = config.get("temperature", 0.0)
+        tolerance = config.get("token_tolerance", 0.02)
+        calibration_rounds = config.get("calibration_rounds", 4)
+
+        outputs: list[dict[str, Any]] = []
+        errors: list[str] = []
+        chars_per_token = _INITIAL_CHARS_PER_TOKEN
+        exact_counts = True
+
+        for target in input_lengths:
+            try:
+                num_chars, chars_per_token, exact = self._calibrate(
+                    engine,
+                    target,
+                    chars_per_token,
+                    tolerance,
+                    calibration_rounds,
+                )
+                exact_counts = exact_counts and exact
+            except Exception as e:
+                error_msg = f"Calibration failed at input_length={target}: {e}"
+                logger.error(error_msg)
+                errors.append(error_msg)
+                continue
+
+            for rep in range(repetitions):
+                try:
+                    prefill = engine.generate(
+                        prompt=self._build_prompt(num_chars),
+                        temperature=temperature,
+                        max_tokens=1,
+                    )
+                    ttft_ms = (
+                        prefill.metrics.ttft_ms or prefill.metrics.total_latency_ms
+                    )
+                except Exception as e:
+                    error_msg = (
+                        f"Prefill error at input_length={target}, rep={rep}: {e}"
+                    )
+                    logger.error(error_msg)
+                    errors.append(error_msg)
+                    continue
+
+                for output_length in output_lengths:
+                    try:
+                        result = engine.generate(
+                            prompt=self._build_prompt(num_chars),
+                            temperature=temperature,
+                            max_tokens=output_length,
+                        )
+                    except Exception as e:
+                        error_msg = (
+                            f"Decode error at input_length={target}, "
+                            f"output_length={output_length}, rep={rep}: {e}"
+                        )
+                        logger.error(error_msg)
+                        errors.append(error_msg)
+                        continue
+
+                    outputs.append(
+                        self._grid_point(
+                            target, output_length, rep, prefill, ttft_ms, result
+                        )
+                    )
+
+        metrics = self._aggregate_metrics(outputs)
+        if metrics:
+            metrics["exact_token_counts"] = exact_counts
+
+        return BenchmarkResult(
+            test_name=self.name,
+            test_version=self.version,
+            passed=len(errors) == 0,
+            metrics=metrics,
+            outputs=outputs,
+            errors=errors,
+        )
+
+    def _input_lengths(self, config: dict[str, Any]) -> list[int]:
+        """Explicit ``input_lengths``, or powers of two up to ``max_context``.
+
+        The generated sweep leaves room for the largest output length so
+        every grid point fits in the context window.
+        """
+        if "input_lengths" in config:
+            return sorted(int(n) for n in config["input_lengths"])
+
+        max_context = config.get("max_context", DEFAULT_MAX_CONTEXT)
+        max_output = max(config.get("output_lengths", DEFAULT_OUTPUT_LENGTHS))
+        limit = max_context - max_output
+
+        lengths = []
+        length = MIN_INPUT_LENGTH
+        while length <= limit:
+            lengths.append(length)
+            length *= 2
+        return lengths
+
+    def _calibrate(
+        self,
+        engine,
+        target_tokens: int,
+        chars_per_token: float,
+        tolerance: float,
+        max_rounds: int,
+    ) -> tuple[int, float, bool]:
+        """Find a prompt size that tokenizes to ``target_tokens``.
+
+        Starts from the ratio learned at the previous input length and
+        rescales by the engine-reported ``prompt_tokens`` until within
+        ``tolerance``.
+
+        Returns:
+            (num_chars, chars_per_token, exact) — ``exact`` is True only
+            when the returned size was measured within ``tolerance`` of
+            the target. It is False when the engine does not report
+            prompt token counts, or when ``max_rounds`` ran out first and
+            the last rescaled size is used unverified.
+        """
+        num_chars = int(target_tokens * chars_per_token)
+        for _ in range(max_rounds):
+            prompt = self._build_prompt(num_chars)
+            result = engine.generate(prompt=prompt, temperature=0.0, max_tokens=1)
+            actual = result.prompt_tokens
+            if actual <= 0:
+                return num_chars, chars_per_token, False
+
+            chars_per_token = len(prompt) / actual
+            if abs(actual - target_tokens) / target_tokens <= tolerance:
+                return num_chars, chars_per_token, True
+            num_chars = max(1, int(num_chars * target_tokens / actual))
+
+        logger.warning(
+            f"Prompt size for input_length={target_tokens} did not converge "
+            f"within {max_rounds} calibration round(s)"
+        )
+        return num_chars, chars_per_token, False
+
+    def _build_prompt(self, num_chars: int) -> str:
+        """Build a prompt of roughly ``num_chars`` filler behind a fresh nonce."""
+        parts = [f"[session {uuid.uuid4().hex}]\n"]
+        length = 0
+        i = 0
+        while length < num_chars:
+            sentence = _FILLER_SENTENCES[i % len(_FILLER_SENTENCES)]
+            parts.append(sentence)
+            length += len(sentence)
+            i += 1
+
+        body = "".join(parts)[: len(parts[0]) + num_chars]
+        return body + _INSTRUCTION
+
+    def _grid_point(
+        self,
+        target: int,
+        output_length: int,
+        rep: int,
+        prefill,
+        ttft_ms: float,
+        result,
+    ) -> dict[str, Any]:
+        """Derive prefill and decode rates for one grid measurement."""
+        prompt_tokens = result.prompt_tokens or prefill.prompt_tokens
+        completion_tokens = result.completion_tokens
+        total_ms = result.metrics.total_latency_ms
+
+        prefill_tps = prompt_tokens / (ttft_ms / 1000) if ttft_ms > 0 else 0
+        decode_ms = total_ms - ttft_ms
+        decode_tps = (
+            (completion_tokens - 1) / (decode_ms / 1000)
+            if decode_ms > 0 and completion_tokens > 1
+            else 0
+        )
+
+        return {
+            "input_length": target,
+            "output_length": output_length,
+            "repetition": rep,
+            "metrics": {
+                "prompt_tokens": prompt_tokens,
+                "completion_tokens": completion_tokens,
+                "ttft_ms": round(ttft_ms, 2),
+                "total_latency_ms": round(total_ms, 2),
+                "prefill_tps": round(prefill_tps, 2),
+                "decode_tps": round(decode_tps, 2),
+            },
+        }
+
+    def _aggregate_metrics(self, outputs: list[dict[str, Any]]) -> dict[str, Any]:
+        """Build per-grid-point summaries and per-input-length curves."""
+        if not outputs:
+            return {}
+
+        grid: dict[tuple[int, int], list[dict[str, Any]]] = {}
+        for o in outputs:
+            grid.setdefault((o["input_length"], o["output_length"]), []).append(
+                o["metrics"]
+            )
+
+        def mean(values: list[float]) -> float:
+            return round(statistics.mean(values), 2) if values else 0
+
+        def stdev(values: list[float]) -> float:
+            return round(statistics.stdev(values), 2) if len(values) > 1 else 0
+
+        points = []
+        for (input_length, output_length), samples in sorted(grid.items()):
+            ttft = [s["ttft_ms"] for s in samples]
+            prefill = [s["prefill_tps"] for s in samples]
+            decode = [s["decode_tps"] for s in samples]
+            points.append(
+                {
+                    "input_length": input_length,
+                    "output_length": output_length,
+                    "samples": len(samples),
+                    "prompt_tokens": mean([s["prompt_tokens"] for s in samples]),
+                    "ttft_ms": {"avg": mean(ttft), "std_dev": stdev(ttft)},
+                    "prefill_tps": {"avg": mean(prefill), "std_dev": stdev(prefill)},
+                    "decode_tps": {"avg": mean(decode), "std_dev": stdev(decode)},
+                }
+            )
+
+        by_input: dict[int, list[dict[str, Any]]] = {}
+        for o in outputs:
+            by_input.setdefault(o["input_length"], []).append(o["metrics"])
+
+        ttft_curve = {}
+        prefill_curve = {}
+        decode_curve = {}
+        for input_length, samples in sorted(by_input.items()):
+            key = str(input_length)
+            ttft_curve[key] = mean([s["ttft_ms"] for s in samples])
+            prefill_curve[key] = mean([s["prefill_tps"] for s in samples])
+            decode_curve[key] = mean([s["decode_tps"] for s in samples])
+
+        all_prefill = [o["metrics"]["prefill_tps"] for o in outputs]
+        all_decode = [o["metrics"]["decode_tps"] for o in outputs]
+
+        return {
+            "total_measurements": len(outputs),
+            "avg_prefill_tps": mean(all_prefill),
+            "avg_decode_tps": mean(all_decode),
+            "ttft_ms_by_input_length": ttft_curve,
+            "prefill_tps_by_input_length": prefill_curve,
+            "decode_tps_by_input_length": decode_curve,
+            "grid": points,
+        }
@@ -30,6 +30,7 @@ class StreamingLatencyBenchmark(LLMBenchmark):
     version = "1.0.0"
     category = "performance"
     description = "Measure streaming TTFT and inter-token latency"
+    primary_metric = "ttft_ms.avg"
 
     def _execute(self, engine, config: dict[str, Any]) -> BenchmarkResult:
         prompts = config.get("prompts", DEFAULT_PROMPTS)
@@ -29,6 +29,8 @@ class WarmupAnalysisBenchmark(LLMBenchmark):
     version = "1.0.0"
     category = "performance"
     description = "Measure warmup performance and CUDA kernel initialization"
+    primary_metric = "subsequent_avg_latency_ms"
+    requires_cold_engine = True
 
     def _execute(self, engine, config: dict[str, Any]) -> BenchmarkResult:
         """Run warmup analysis benchmark."""
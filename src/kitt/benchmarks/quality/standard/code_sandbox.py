@@ -0,0 +1,170 @@
+"""Sandboxed execution of generated code for the coding benchmark."""
+
+import logging
+import os
+import secrets
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+MAX_FILE_BYTES = 16 * 1024 * 1024
+MAX_OPEN_FILES = 64
+
+# Runs in the child interpreter: applies the resource limits passed on the
+# command line, then runs code and tests in one fresh namespace. The token
+# is printed only when the tests finish, so generated code that exits the
+# process early with status 0 does not count as a pass.
+_RUNNER = """\
+import sys
+try:
+    import resource
+except ImportError:
+    resource = None
+if resource is not None:
+    for name, value in zip(("AS", "CPU", "FSIZE", "NOFILE"), sys.argv[1:]):
+        limit = getattr(resource, "RLIMIT_" + name, None)
+        if limit is None:
+            continue
+        value = int(value)
+        hard = resource.getrlimit(limit)[1]
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        try:
+            resource.setrlimit(limit, (value, hard))
+        except (ValueError, OSError):
+            pass
+token, code, test_code = sys.stdin.read().split("\\0", 2)
+namespace = {"__name__": "__sandbox__"}
+try:
+    exec(compile(code, "<generated>", "exec"), namespace)
+    exec(compile(test_code, "<test>", "exec"), namespace)
+except BaseException as e:
+    sys.stderr.write(f"{type(e).__name__}: {e}"[:500])
+    sys.exit(1)
+sys.__stdout__.write(token)
+"""
+
+
+@dataclass
+class SandboxResult:
+    """Outcome of running one candidate solution against its tests.
+
+    ``status`` is ``passed``, ``failed`` (a test or the code raised),
+    ``timeout`` (killed after the per-test timeout) or ``error`` (the
+    process died, e.g. on a resource limit).
+    """
+
+    status: str
+    duration_s: float = 0.0
+    error: str = ""
+
+    @property
+    def passed(self) -> bool:
+        return self.status == "passed"
+
+
+class CodeSandbox:
+    """Run generated code and its tests in isolated, limited processes.
+
+    Every test runs in a fresh ``python -I`` process in an empty
+    temporary directory with a minimal environment, so tests cannot see
+    each other or the benchmark process. On POSIX, the child caps its own
+    memory, CPU time, file size and open files with ``setrlimit`` before
+    running anything. A test that exceeds ``timeout_s`` is killed with
+    its whole process group.
+
+    Tests run on a pool of ``workers`` threads, each supervising one
+    child process at a time. :meth:`submit` returns immediately, so the
+    caller can keep sending requests to the engine while earlier
+    solutions are tested.
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        timeout_s: float = 10.0,
+        memory_mb: int = 1024,
+        python: str | None = None,
+    ) -> None:
+        self.timeout_s = timeout_s
+        self.memory_mb = memory_mb
+        self.python = python or sys.executable
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers or min(4, os.cpu_count() or 1),
+            thread_name_prefix="kitt-sandbox",
+        )
+
+    def __enter__(self) -> "CodeSandbox":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """Wait for submitted tests to finish and stop the workers."""
+        self._pool.shutdown(wait=True)
+
+    def submit(self, code: str, test_code: str) -> "Future[SandboxResult]":
+        """Queue a solution for testing and return its pending result."""
+        return self._pool.submit(self.run, code, test_code)
+
+    def run(self, code: str, test_code: str) -> SandboxResult:
+        """Test one solution in a child process and wait for the outcome."""
+        start = time.perf_counter()
+        token = secrets.token_hex(16)
+        with tempfile.TemporaryDirectory(prefix="kitt-sandbox-") as workdir:
+            proc = subprocess.Popen(
+                [self.python, "-I", "-c", _RUNNER, *self._limits()],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                cwd=workdir,
+                env={"PATH": os.environ.get("PATH", ""), "HOME": workdir},
+                start_new_session=True,
+            )
+            try:
+                stdout, stderr = proc.communicate(
+                    f"{token}\0{code}\0{test_code}".encode(), timeout=self.timeout_s
+                )
+            except subprocess.TimeoutExpired:
+                self._kill(proc)
+                return SandboxResult(
+                    status="timeout",
+                    duration_s=time.perf_counter() - start,
+                    error=f"Timed out after {self.timeout_s}s",
+                )
+
+        duration = time.perf_counter() - start
+        message = stderr.decode(errors="replace").strip()
+        if proc.returncode == 0 and stdout.endswith(token.encode()):
+            return SandboxResult(status="passed", duration_s=duration)
+        if proc.returncode in (0, 1):
+            return SandboxResult(status="failed", duration_s=duration, error=message)
+        return SandboxResult(
+            status="error",
+            duration_s=duration,
+            error=message or f"Exited with code {proc.returncode}",
+        )
+
+    def _limits(self) -> list[str]:
+        """Address space, CPU seconds, file size and open file limits."""
+        return [
+            str(self.memory_mb * 1024 * 1024),
+            str(int(self.timeout_s) + 1),
+            str(MAX_FILE_BYTES),
+            str(MAX_OPEN_FILES),
+        ]
+
+    @staticmethod
+    def _kill(proc: subprocess.Popen) -> None:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except (AttributeError, OSError):
+            proc.kill()
+        proc.communicate()
@@ -7,6 +7,8 @@ from typing import Any
 from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
 from kitt.benchmarks.registry import register_benchmark
 
+from .code_sandbox import CodeSandbox
+
 logger = logging.getLogger(__name__)
 
 # Built-in simple test problems (no external dataset needed)
@@ -63,54 +65,72 @@ class CodingBenchmark(LLMBenchmark):
         total_pass: dict[int, int] = {k: 0 for k in k_values}
         total_problems = len(problems)
         syntax_errors = 0
+        timeouts = 0
+        max_k = max(k_values)
+
+        # Tests run in the sandbox while the next problems are generated
+        pending: list[tuple[int, list[str], list[Any]]] = []
+        with CodeSandbox(
+            workers=config.get("sandbox_workers"),
+            timeout_s=config.get("timeout_s", 10.0),
+            memory_mb=config.get("memory_mb", 1024),
+        ) as sandbox:
+            for i, problem in enumerate(problems):
+                prompt = self._build_prompt(problem["prompt"])
+
+                # Generate k samples
+                samples: list[str] = []
+                for _ in range(max_k):
+                    try:
+                        result = engine.generate(
+                            prompt=prompt,
+                            max_tokens=max_tokens,
+                            temperature=temperature,
+                        )
+                        code = self._extract_code(result.output)
+                        samples.append(code)
+                    except Exception as e:
+                        errors.append(f"Problem {i}: {e}")
+                        samples.append("")
+
+                # Queue samples for testing; None marks a sample that fails
+                # without running (empty or a syntax error)
+                futures: list[Any] = []
+                for code in samples:
+                    if not code.strip():
+                        futures.append(None)
+                    elif not self._compiles(code):
+                        syntax_errors += 1
+                        futures.append(None)
+                    else:
+                        futures.append(sandbox.submit(code, problem["test_code"]))
+                pending.append((i, samples, futures))
+
+            for i, samples, futures in pending:
+                problem = problems[i]
+                sandbox_results = [f.result() if f else None for f in futures]
+                pass_results = [bool(r and r.passed) for r in sandbox_results]
+                timeouts += sum(
+                    1 for r in sandbox_results if r and r.status == "timeout"
+                )
 
-        for i, problem in enumerate(problems):
-            prompt = self._build_prompt(problem["prompt"])
-
-            # Generate k samples
-            samples: list[str] = []
-            max_k = max(k_values)
-            for _ in range(max_k):
-                try:
-                    result = engine.generate(
-                        prompt=prompt,
-                        max_tokens=max_tokens,
-                        temperature=temperature,
-                    )
-                    code = self._extract_code(result.output)
-                    samples.append(code)
-                except Exception as e:
-                    errors.append(f"Problem {i}: {e}")
-                    samples.append("")
-
-            # Test samples
-            pass_results = []
-            for code in samples:
-                if not code.strip():
-                    pass_results.append(False)
-                    continue
-
-                passed, has_syntax_error = self._test_code(
-                    code, problem["test_code"], problem.get("entry_point", "")
+                # Calculate pass@k
+                for k in k_values:
+                    if any(pass_results[:k]):
+                        total_pass[k] += 1
+
+                outputs.append(
+                    {
+                        "index": i,
+                        "entry_point": problem.get("entry_point", ""),
+                        "pass_results": pass_results,
+                        "pass_at_1": pass_results[0] if pass_results else False,
+                        "status": [
+                            r.status if r else "skipped" for r in sandbox_results
+                        ],
+                        "code_sample": samples[0][:300] if samples else "",
+                    }
                 )
-                pass_results.append(passed)
-                if has_syntax_error:
-                    syntax_errors += 1
-
-            # Calculate pass@k
-            for k in k_values:
-                if any(pass_results[:k]):
-                    total_pass[k] += 1
-
-            outputs.append(
-                {
-                    "index": i,
-                    "entry_point": problem.get("entry_point", ""),
-                    "pass_results": pass_results,
-                    "pass_at_1": pass_results[0] if pass_results else False,
-                    "code_sample": samples[0][:300] if samples else "",
-                }
-            )
 
         metrics: dict[str, Any] = {
             "total": total_problems,
@@ -119,6 +139,7 @@ class CodingBenchmark(LLMBenchmark):
             )
             if total_problems
             else 0,
+            "timeout_count": timeouts,
         }
         for k in k_values:
             rate = total_pass[k] / total_problems if total_problems else 0
@@ -157,22 +178,9 @@ class CodingBenchmark(LLMBenchmark):
 
         return output.strip()
 
-    def _test_code(
-        self, code: str, test_code: str, entry_point: str
-    ) -> tuple[bool, bool]:
-        """Execute code and tests, return (passed, has_syntax_error)."""
+    def _compiles(self, code: str) -> bool:
         try:
-            # Compile to check syntax
             compile(code, "<generated>", "exec")
-        except SyntaxError:
-            return False, True
-
-        try:
-            namespace: dict[str, Any] = {}
-            exec(code, namespace)
-            exec(test_code, namespace)
-            return True, False
-        except AssertionError:
-            return False, False
-        except Exception:
-            return False, False
+        except (SyntaxError, ValueError):
+            return False
+        return True
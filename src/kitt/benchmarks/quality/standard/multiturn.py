@@ -60,19 +60,18 @@ class MultiTurnBenchmark(LLMBenchmark):
         for conv in conversations:
             conv_name = conv.get("name", "unnamed")
             turns = conv.get("turns", [])
-            history = ""
+            messages: list[dict[str, str]] = []
             turn_outputs = []
 
             for turn_idx, user_msg in enumerate(turns):
-                # Build multi-turn prompt with history
-                if history:
-                    prompt = f"{history}\nUser: {user_msg}\nAssistant:"
-                else:
-                    prompt = f"User: {user_msg}\nAssistant:"
+                messages.append({"role": "user", "content": user_msg})
 
                 try:
-                    result = engine.generate(
-                        prompt=prompt,
+                    # Engines with a chat API apply the model's chat template
+                    # and can reuse the cached history prefix; the base class
+                    # falls back to a plain transcript
+                    result = engine.generate_chat(
+                        messages=messages,
                         temperature=temperature,
                         max_tokens=max_tokens,
                     )
@@ -88,7 +87,7 @@ class MultiTurnBenchmark(LLMBenchmark):
                     )
 
                     # Append to history
-                    history = f"{prompt} {response}"
+                    messages.append({"role": "assistant", "content": response})
 
                 except Exception as e:
                     errors.append(f"Error in {conv_name} turn {turn_idx}: {e}")
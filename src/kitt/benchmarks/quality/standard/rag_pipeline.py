@@ -1,9 +1,23 @@
 """RAG pipeline benchmark — end-to-end retrieval-augmented generation."""
 
+import hashlib
+import heapq
+import json
 import logging
+import math
+import re
 import time
+from collections import Counter
+from pathlib import Path
 from typing import Any
 
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
 from kitt.benchmarks.registry import register_benchmark
 
@@ -62,12 +76,268 @@ class SimpleRetriever:
         return [self.documents[i] for _, i in scores[:top_k]]
 
 
+_TOKEN_RE = re.compile(r"\w+")
+
+BM25_INDEX_VERSION = 1
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased word tokens."""
+    return _TOKEN_RE.findall(text.lower())
+
+
+class BM25Retriever:
+    """Okapi BM25 retriever over an inverted index.
+
+    Postings are stored in CSR form: the postings of term ``t`` are
+    ``docs[offsets[t]:offsets[t + 1]]``. Each posting holds its
+    precomputed term weight ``tf * (k1 + 1) / (tf + k1 * norm)``, so a
+    query only touches the postings of its own terms. With NumPy, a
+    query term's weights are added to a score vector in one vectorized
+    step, and the top documents come from ``argpartition``.
+
+    Args:
+        documents: Passages to index.
+        k1: Term frequency saturation.
+        b: Document length normalization.
+    """
+
+    def __init__(self, documents: list[str], k1: float = 1.5, b: float = 0.75) -> None:
+        self.documents = documents
+        self.k1 = k1
+        self.b = b
+        self._build()
+
+    def _build(self) -> None:
+        # One (term, doc, tf) triple per distinct term of each document
+        term_ids: dict[str, int] = {}
+        terms: list[int] = []
+        docs: list[int] = []
+        tfs: list[int] = []
+        lengths: list[int] = []
+        for doc_id, doc in enumerate(self.documents):
+            tokens = tokenize(doc)
+            lengths.append(len(tokens))
+            counts = Counter(tokens)
+            terms.extend([term_ids.setdefault(t, len(term_ids)) for t in counts])
+            docs.extend([doc_id] * len(counts))
+            tfs.extend(counts.values())
+
+        n = len(self.documents)
+        avg_len = (sum(lengths) / n if n else 0.0) or 1.0
+        if NUMPY_AVAILABLE:
+            self._build_numpy(term_ids, terms, docs, tfs, lengths, avg_len)
+            return
+
+        postings: list[list[tuple[int, int]]] = [[] for _ in term_ids]
+        for term_id, doc_id, tf in zip(terms, docs, tfs, strict=True):
+            postings[term_id].append((doc_id, tf))
+        offsets = [0]
+        post_docs: list[int] = []
+        weights: list[float] = []
+        idf: list[float] = []
+        for plist in postings:
+            idf.append(math.log(1 + (n - len(plist) + 0.5) / (len(plist) + 0.5)))
+            for doc_id, tf in plist:
+                norm = 1 - self.b + self.b * lengths[doc_id] / avg_len
+                post_docs.append(doc_id)
+                weights.append(tf * (self.k1 + 1) / (tf + self.k1 * norm))
+            offsets.append(len(post_docs))
+        self._set_index(term_ids, offsets, post_docs, weights, idf)
+
+    def _build_numpy(
+        self,
+        term_ids: dict[str, int],
+        terms: list[int],
+        docs: list[int],
+        tfs: list[int],
+        lengths: list[int],
+        avg_len: float,
+    ) -> None:
+        n = len(self.documents)
+        term_arr = np.asarray(terms, dtype=np.int64)
+        order = np.argsort(term_arr, kind="stable")
+        doc_arr = np.asarray(docs, dtype=np.int32)[order]
+        tf_arr = np.asarray(tfs, dtype=np.float64)[order]
+        df = np.bincount(term_arr, minlength=len(term_ids))
+        offsets = np.concatenate(([0], np.cumsum(df)))
+        idf = np.log1p((n - df + 0.5) / (df + 0.5))
+        norm = 1 - self.b + self.b * np.asarray(lengths, dtype=np.float64) / avg_len
+        weights = tf_arr * (self.k1 + 1) / (tf_arr + self.k1 * norm[doc_arr])
+        self._set_index(term_ids, offsets, doc_arr, weights, idf)
+
+    def _set_index(
+        self,
+        term_ids: dict[str, int],
+        offsets: Any,
+        docs: Any,
+        weights: Any,
+        idf: Any,
+    ) -> None:
+        self._term_ids = term_ids
+        if NUMPY_AVAILABLE:
+            offsets = np.asarray(offsets, dtype=np.int64)
+            docs = np.asarray(docs, dtype=np.int32)
+            weights = np.asarray(weights, dtype=np.float64)
+            idf = np.asarray(idf, dtype=np.float64)
+        self._offsets = offsets
+        self._docs = docs
+        self._weights = weights
+        self._idf = idf
+
+    def scores(self, query: str) -> dict[int, float]:
+        """BM25 score of every document that shares a term with the query."""
+        scored: dict[int, float] = {}
+        for term_id in self._query_terms(query):
+            start, end = int(self._offsets[term_id]), int(self._offsets[term_id + 1])
+            idf = float(self._idf[term_id])
+            for doc_id, weight in zip(
+                self._docs[start:end], self._weights[start:end], strict=True
+            ):
+                doc_id = int(doc_id)
+                scored[doc_id] = scored.get(doc_id, 0.0) + idf * float(weight)
+        return scored
+
+    def retrieve(self, query: str, top_k: int = 3) -> list[str]:
+        """Retrieve the top_k documents by BM25 score.
+
+        Documents sharing no term with the query are not returned.
+        """
+        if top_k <= 0 or not self.documents:
+            return []
+        if not NUMPY_AVAILABLE:
+            scored = self.scores(query)
+            best = heapq.nlargest(top_k, scored.items(), key=lambda kv: (kv[1], -kv[0]))
+            return [self.documents[doc_id] for doc_id, _ in best]
+
+        totals = np.zeros(len(self.documents))
+        for term_id in self._query_terms(query):
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            totals[self._docs[start:end]] += (
+                self._idf[term_id] * self._weights[start:end]
+            )
+        candidates = np.flatnonzero(totals)
+        if len(candidates) > top_k:
+            # Keep everything scoring at least the k-th best, so ties at
+            # the cut are broken by document order below
+            kth = len(candidates) - top_k
+            cutoff = np.partition(totals[candidates], kth)[kth]
+            candidates = candidates[totals[candidates] >= cutoff]
+        # Highest score first, ties by document order
+        order = np.lexsort((candidates, -totals[candidates]))[:top_k]
+        return [self.documents[int(doc_id)] for doc_id in candidates[order]]
+
+    def _query_terms(self, query: str) -> list[int]:
+        # Repeated query terms count once
+        seen = dict.fromkeys(tokenize(query))
+        return [self._term_ids[t] for t in seen if t in self._term_ids]
+
+    def save(self, path: Path) -> None:
+        """Write the index to ``path`` as a NumPy ``.npz`` archive.
+
+        Requires NumPy.
+        """
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "wb") as f:
+            np.savez(
+                f,
+                version=BM25_INDEX_VERSION,
+                params=np.asarray([self.k1, self.b]),
+                # Tokens are \w+ runs, so a newline never occurs in one
+                terms=np.frombuffer("\n".join(self._term_ids).encode(), np.uint8),
+                offsets=self._offsets,
+                docs=self._docs,
+                weights=self._weights,
+                idf=self._idf,
+            )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path, documents: list[str]) -> "BM25Retriever":
+        """Read an index written by :meth:`save` for the same documents."""
+        with np.load(path) as data:
+            if int(data["version"]) != BM25_INDEX_VERSION:
+                raise ValueError(f"Unsupported BM25 index version in {path}")
+            terms = data["terms"].tobytes().decode()
+            retriever = cls.__new__(cls)
+            retriever.documents = documents
+            retriever.k1, retriever.b = (float(v) for v in data["params"])
+            retriever._set_index(
+                {term: i for i, term in enumerate(terms.split("\n"))} if terms else {},
+                data["offsets"],
+                data["docs"],
+                data["weights"],
+                data["idf"],
+            )
+        return retriever
+
+    @classmethod
+    def cached(
+        cls,
+        documents: list[str],
+        index_dir: Path,
+        k1: float = 1.5,
+        b: float = 0.75,
+    ) -> "BM25Retriever":
+        """Load the index for these documents from ``index_dir``, or build it.
+
+        The file name is a hash of the documents and parameters, so a
+        changed corpus gets a new index. Without NumPy the index is
+        built in memory every time.
+        """
+        if not NUMPY_AVAILABLE:
+            return cls(documents, k1=k1, b=b)
+        digest = hashlib.sha256(f"{k1}:{b}".encode())
+        for doc in documents:
+            digest.update(doc.encode())
+            digest.update(b"\0")
+        path = index_dir / f"bm25-{digest.hexdigest()[:16]}.npz"
+        if path.exists():
+            try:
+                return cls.load(path, documents)
+            except (OSError, ValueError, KeyError) as e:
+                logger.warning(f"Rebuilding unreadable BM25 index {path}: {e}")
+        retriever = cls(documents, k1=k1, b=b)
+        try:
+            retriever.save(path)
+        except OSError as e:
+            logger.warning(f"Could not write BM25 index {path}: {e}")
+        return retriever
+
+
+def load_documents(path: Path) -> list[str]:
+    """Read passages from a ``.jsonl`` file (``text`` field) or plain text.
+
+    Plain text files hold one passage per line.
+    """
+    documents = []
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            if path.suffix == ".jsonl":
+                documents.append(json.loads(line)["text"])
+            else:
+                documents.append(line)
+    return documents
+
+
+def _percentile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * q / 100
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
 @register_benchmark
 class RAGPipelineBenchmark(LLMBenchmark):
     """Benchmark end-to-end RAG pipeline performance."""
 
     name = "rag_pipeline"
-    version = "1.0.0"
+    version = "1.1.0"
     category = "quality_standard"
     description = "End-to-end retrieval-augmented generation benchmark"
 
@@ -81,11 +351,17 @@ class RAGPipelineBenchmark(LLMBenchmark):
         if sample_size and sample_size < len(corpus):
             corpus = corpus[:sample_size]
 
-        # Build retriever from all documents
+        # Build retriever from all documents plus any extra passages
         all_docs = []
         for item in corpus:
             all_docs.extend(item.get("documents", []))
-        retriever = SimpleRetriever(all_docs)
+        all_docs.extend(config.get("documents", []))
+        if config.get("documents_file"):
+            all_docs.extend(load_documents(Path(config["documents_file"])))
+
+        index_start = time.perf_counter()
+        retriever = self._build_retriever(all_docs, config)
+        index_build_ms = (time.perf_counter() - index_start) * 1000
 
         outputs: list[dict[str, Any]] = []
         errors: list[str] = []
@@ -149,6 +425,8 @@ class RAGPipelineBenchmark(LLMBenchmark):
             "answer_accuracy": round(correct / total, 4) if total else 0,
             "correct": correct,
             "total": total,
+            "corpus_documents": len(all_docs),
+            "index_build_ms": round(index_build_ms, 2),
         }
 
         if e2e_latencies:
@@ -163,6 +441,13 @@ class RAGPipelineBenchmark(LLMBenchmark):
             metrics["generation_latency_ms"] = round(
                 sum(generation_latencies) / len(generation_latencies), 2
             )
+        for name, values in (
+            ("retrieval", retrieval_latencies),
+            ("generation", generation_latencies),
+        ):
+            if values:
+                metrics[f"{name}_latency_p50_ms"] = round(_percentile(values, 50), 2)
+                metrics[f"{name}_latency_p95_ms"] = round(_percentile(values, 95), 2)
 
         return BenchmarkResult(
             test_name=self.name,
@@ -173,6 +458,17 @@ class RAGPipelineBenchmark(LLMBenchmark):
             errors=errors,
         )
 
+    def _build_retriever(
+        self, documents: list[str], config: dict[str, Any]
+    ) -> "BM25Retriever | SimpleRetriever":
+        if config.get("retriever", "bm25") == "overlap":
+            return SimpleRetriever(documents)
+        k1 = config.get("bm25_k1", 1.5)
+        b = config.get("bm25_b", 0.75)
+        if config.get("index_dir"):
+            return BM25Retriever.cached(documents, Path(config["index_dir"]), k1, b)
+        return BM25Retriever(documents, k1=k1, b=b)
+
     def _build_prompt(self, question: str, context: str) -> str:
         return (
             f"Answer the following question using the provided context.\n\n"
@@ -42,8 +42,8 @@ class VLMBenchmark(LLMBenchmark):
         correct = 0
         total = len(tasks)
 
-        # Check if engine supports chat/multimodal
-        has_chat = hasattr(engine, "generate_chat")
+        # Every engine has generate_chat; only some forward images with it
+        has_images = bool(getattr(engine, "supports_image_input", False))
 
         for i, task in enumerate(tasks):
             prompt = task["prompt"]
@@ -51,7 +51,7 @@ class VLMBenchmark(LLMBenchmark):
             expected_keywords = task.get("expected_keywords", [])
 
             try:
-                if image_url and has_chat:
+                if image_url and has_images:
                     result = engine.generate_chat(
                         messages=[
                             {
@@ -104,7 +104,7 @@ class VLMBenchmark(LLMBenchmark):
             "accuracy": round(correct / total, 4) if total else 0,
             "correct": correct,
             "total": total,
-            "multimodal_supported": has_chat,
+            "multimodal_supported": has_images,
         }
 
         if outputs:
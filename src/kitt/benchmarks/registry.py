@@ -53,9 +53,11 @@ class BenchmarkRegistry:
         """Import built-in benchmark modules to trigger registration."""
         from .performance import (
             batch_inference,  # noqa: F401
+            chat_sessions,  # noqa: F401
             latency,  # noqa: F401
             long_context,  # noqa: F401
             memory,  # noqa: F401
+            prefill_decode,  # noqa: F401
             speculative,  # noqa: F401
             streaming_latency,  # noqa: F401
             tensor_parallel,  # noqa: F401
@@ -8,6 +8,7 @@ from .models import (
     DiskConfig,
     NotificationConfig,
 )
+from .multi_gpu_runner import GPUSlot, MultiGPUCampaignRunner
 from .parallel_runner import ParallelCampaignRunner
 from .runner import CampaignRunner
 from .state_manager import CampaignStateManager
@@ -19,6 +20,8 @@ __all__ = [
     "CampaignRunSpec",
     "CampaignRunner",
     "DiskConfig",
+    "GPUSlot",
+    "MultiGPUCampaignRunner",
     "NotificationConfig",
     "CampaignStateManager",
     "ParallelCampaignRunner",
@@ -1,18 +1,27 @@
 """Auto-compare campaign runs with previous results."""
 
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+from kitt.hardware.fingerprint import HardwareFingerprint
+from kitt.storage.result_index import ResultIndex
+
 logger = logging.getLogger(__name__)
 
 
 class AutoComparer:
-    """Compare campaign results with previous runs automatically."""
+    """Compare campaign results with previous runs automatically.
+
+    Baselines come from ``store`` when one is given (an indexed query on
+    the SQL backends), otherwise from an on-disk index of the
+    ``kitt-results/`` files under ``results_dir``.
+    """
 
-    def __init__(self, results_dir: Path | None = None) -> None:
+    def __init__(self, results_dir: Path | None = None, store: Any = None) -> None:
         self.results_dir = results_dir or Path.cwd()
+        self.store = store
+        self._index = ResultIndex(self.results_dir)
 
     def compare_with_previous(
         self,
@@ -31,6 +40,9 @@ class AutoComparer:
         baseline = self._find_previous_result(
             current_result.get("model", ""),
             current_result.get("engine", ""),
+            suite_name=current_result.get("suite_name"),
+            fingerprint=HardwareFingerprint.from_result(current_result),
+            before=current_result.get("timestamp"),
         )
         if baseline is None:
             logger.debug("No baseline found for comparison")
@@ -38,23 +50,31 @@ class AutoComparer:
 
         return self._compare(current_result, baseline)
 
-    def _find_previous_result(self, model: str, engine: str) -> dict[str, Any] | None:
-        """Find the most recent result for the same model/engine combo."""
-        candidates = []
-        for metrics_file in self.results_dir.glob("kitt-results/**/metrics.json"):
-            try:
-                data = json.loads(metrics_file.read_text())
-                if data.get("model") == model and data.get("engine") == engine:
-                    candidates.append((data.get("timestamp", ""), data))
-            except Exception:
-                continue
-
-        if not candidates:
-            return None
+    def _find_previous_result(
+        self,
+        model: str,
+        engine: str,
+        suite_name: str | None = None,
+        fingerprint: str | None = None,
+        before: str | None = None,
+    ) -> dict[str, Any] | None:
+        """Find the most recent earlier result for the same model/engine combo.
 
-        candidates.sort(key=lambda x: x[0], reverse=True)
-        # Return second most recent (skip current)
-        return candidates[1][1] if len(candidates) > 1 else None
+        Without ``before``, the newest match is taken to be the current
+        run and the one preceding it is returned.
+        """
+        skip = 0 if before else 1
+        kwargs = {
+            "suite_name": suite_name,
+            "fingerprint": fingerprint,
+            "before": before,
+            "limit": skip + 1,
+        }
+        if self.store is not None:
+            candidates = self.store.find_baselines(model, engine, **kwargs)
+        else:
+            candidates = self._index.find(model, engine, **kwargs)
+        return candidates[skip] if len(candidates) > skip else None
 
     def _compare(
         self,
@@ -0,0 +1,159 @@
+"""Persistent cache for GGUF file listings and Ollama tags."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = Path.home() / ".kitt" / "cache" / "discovery"
+MIRROR_VALIDATOR = "mirror"
+
+# A fetcher receives the cached validator (commit sha / HTTP ETag) and
+# returns (value, new_validator), or None when the upstream is unchanged.
+Fetcher = Callable[[str | None], tuple[Any, str | None] | None]
+
+
+class DiscoveryCache:
+    """Cache discovery results on disk, keyed by repo id or model name.
+
+    Entries younger than ``ttl_s`` are served directly. Older entries are
+    revalidated: the fetcher is handed the stored validator and may report
+    "not modified" instead of re-listing. If the upstream is unreachable a
+    stale entry is served rather than failing. In ``offline`` mode the
+    network is never touched.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        ttl_s: float = 86400.0,
+        offline: bool = False,
+    ) -> None:
+        self.cache_dir = cache_dir or DEFAULT_CACHE_DIR
+        self.ttl_s = ttl_s
+        self.offline = offline
+
+    def get(self, kind: str, key: str, fetch: Fetcher) -> Any | None:
+        """Return the cached value for (kind, key), fetching when needed.
+
+        Returns:
+            The value, or None when nothing is cached and it could not be
+            fetched (offline, or the fetch failed).
+        """
+        entry = self._read(kind, key)
+
+        if entry is not None and (
+            self.offline or time.time() - entry["fetched_at"] < self.ttl_s
+        ):
+            return entry["value"]
+        if self.offline:
+            logger.warning(f"Offline: no cached {kind} discovery for {key}")
+            return None
+
+        try:
+            fetched = fetch(entry["validator"] if entry else None)
+        except Exception as e:
+            if entry is not None:
+                logger.warning(f"Using stale {kind} discovery for {key}: {e}")
+                return entry["value"]
+            logger.warning(f"{kind} discovery failed for {key}: {e}")
+            return None
+
+        if fetched is None:
+            if entry is None:
+                return None
+            # Not modified upstream — extend the entry's lifetime
+            self.put(kind, key, entry["value"], entry["validator"])
+            return entry["value"]
+
+        value, validator = fetched
+        self.put(kind, key, value, validator)
+        return value
+
+    def put(
+        self, kind: str, key: str, value: Any, validator: str | None = None
+    ) -> None:
+        """Store a value, replacing any previous entry atomically."""
+        path = self._path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        data = {
+            "key": key,
+            "value": value,
+            "validator": validator,
+            "fetched_at": time.time(),
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            Path(tmp_path).replace(path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def seed_from_mirror(self, mirror_dir: Path, overwrite: bool = True) -> int:
+        """Pre-populate the cache from a local model mirror.
+
+        Understands the Devon storage layout
+        (``huggingface/<org>/<repo>/**/*.gguf``) and the Ollama models
+        directory (``manifests/<registry>/library/<model>/<tag>``).
+
+        Args:
+            mirror_dir: Root of the mirror.
+            overwrite: Replace existing entries. With False, only keys that
+                have no cache entry yet are written, so existing entries
+                keep their value and age.
+
+        Returns:
+            Number of entries written.
+        """
+        seeded = 0
+
+        def seed(kind: str, key: str, value: list[str]) -> None:
+            nonlocal seeded
+            if overwrite or self._read(kind, key) is None:
+                self.put(kind, key, value, MIRROR_VALIDATOR)
+                seeded += 1
+
+        hf_root = mirror_dir / "huggingface"
+        if hf_root.is_dir():
+            for org in sorted(p for p in hf_root.iterdir() if p.is_dir()):
+                for repo in sorted(p for p in org.iterdir() if p.is_dir()):
+                    files = sorted(
+                        str(f.relative_to(repo)) for f in repo.rglob("*.gguf")
+                    )
+                    if files:
+                        seed("gguf", f"{org.name}/{repo.name}", files)
+
+        manifests = mirror_dir / "manifests"
+        if manifests.is_dir():
+            for library in sorted(manifests.glob("*/library")):
+                for model in sorted(p for p in library.iterdir() if p.is_dir()):
+                    tags = sorted(t.name for t in model.iterdir() if t.is_file())
+                    if tags:
+                        seed("ollama", model.name, tags)
+
+        logger.info(f"Seeded {seeded} discovery entries from {mirror_dir}")
+        return seeded
+
+    def _path(self, kind: str, key: str) -> Path:
+        digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+        return self.cache_dir / kind / f"{digest}.json"
+
+    def _read(self, kind: str, key: str) -> dict[str, Any] | None:
+        path = self._path(kind, key)
+        if not path.exists():
+            return None
+        try:
+            data = json.loads(path.read_text())
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable discovery cache entry {path}: {e}")
+            return None
+        return data if data.get("key") == key else None
@@ -5,6 +5,10 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .discovery_cache import DiscoveryCache
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +63,10 @@ def extract_quant_name(filename: str) -> str:
     return match.group(0) if match else name
 
 
-def discover_gguf_quants(repo_id: str) -> list[GGUFQuantInfo]:
+def discover_gguf_quants(
+    repo_id: str,
+    cache: "DiscoveryCache | None" = None,
+) -> list[GGUFQuantInfo]:
     """List available GGUF quantization variants in a HuggingFace repo.
 
     Groups sharded files into single entries and builds appropriate
@@ -67,18 +74,25 @@ def discover_gguf_quants(repo_id: str) -> list[GGUFQuantInfo]:
 
     Args:
         repo_id: HuggingFace repository ID (e.g. "bartowski/Llama-3.1-8B-GGUF").
+        cache: Optional discovery cache; the file listing is revalidated
+            against the repo's commit sha instead of re-listed.
 
     Returns:
         List of GGUFQuantInfo, one per quantization variant.
     """
-    try:
-        from huggingface_hub import list_repo_files
-
-        all_files = list(list_repo_files(repo_id))
-        gguf_files = sorted(f for f in all_files if f.endswith(".gguf"))
-    except Exception as e:
-        logger.error(f"Failed to list GGUF files for {repo_id}: {e}")
-        return []
+    if cache is not None:
+        gguf_files = cache.get(
+            "gguf", repo_id, lambda sha: _fetch_gguf_files(repo_id, sha)
+        )
+        if gguf_files is None:
+            logger.error(f"Failed to list GGUF files for {repo_id}")
+            return []
+    else:
+        try:
+            gguf_files = _list_gguf_files(repo_id)
+        except Exception as e:
+            logger.error(f"Failed to list GGUF files for {repo_id}: {e}")
+            return []
 
     if not gguf_files:
         return []
@@ -130,7 +144,66 @@ def discover_gguf_quants(repo_id: str) -> list[GGUFQuantInfo]:
     return quants
 
 
-def discover_ollama_tags(base_tag: str) -> list[str]:
+def _list_gguf_files(repo_id: str) -> list[str]:
+    from huggingface_hub import list_repo_files
+
+    return sorted(f for f in list_repo_files(repo_id) if f.endswith(".gguf"))
+
+
+def _fetch_gguf_files(
+    repo_id: str, cached_sha: str | None
+) -> tuple[list[str], str | None] | None:
+    """List GGUF files unless the repo's commit sha still matches the cache."""
+    sha = None
+    try:
+        from huggingface_hub import HfApi
+
+        sha = HfApi().model_info(repo_id).sha
+    except Exception as e:
+        logger.debug(f"Could not read commit sha for {repo_id}: {e}")
+
+    if sha and sha == cached_sha:
+        return None
+    return _list_gguf_files(repo_id), sha
+
+
+def _fetch_ollama_tags(
+    model_name: str, etag: str | None = None
+) -> tuple[list[str], str | None] | None:
+    """Scrape tag names from the Ollama library page.
+
+    Sends ``If-None-Match`` when an ETag is known and returns None on
+    304 Not Modified.
+    """
+    import urllib.error
+    import urllib.request
+
+    url = f"https://ollama.com/library/{model_name}/tags"
+    headers = {"User-Agent": "kitt/1.1"}
+    if etag:
+        headers["If-None-Match"] = etag
+    req = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(req, timeout=15) as resp:
+            html = resp.read().decode("utf-8", errors="replace")
+            new_etag = resp.headers.get("ETag") if resp.headers else None
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return None
+        raise
+
+    # Parse tags from href patterns
+    raw_tags = re.findall(rf'/library/{re.escape(model_name)}:([^"&\s]+)', html)
+
+    # Deduplicate preserving order
+    unique_tags = list(dict.fromkeys(raw_tags))
+    return unique_tags, new_etag if isinstance(new_etag, str) else None
+
+
+def discover_ollama_tags(
+    base_tag: str,
+    cache: "DiscoveryCache | None" = None,
+) -> list[str]:
     """Discover available Ollama tags for a model.
 
     Scrapes the Ollama library page and filters to quant variants
@@ -140,6 +213,7 @@ def discover_ollama_tags(base_tag: str) -> list[str]:
 
     Args:
         base_tag: Ollama tag like "llama3.1:8b".
+        cache: Optional discovery cache for the model's tag list.
 
     Returns:
         List of full tags like ["llama3.1:8b-instruct-q4_0", ...].
@@ -148,23 +222,17 @@ def discover_ollama_tags(base_tag: str) -> list[str]:
     target_size = base_tag.split(":")[-1] if ":" in base_tag else None
 
     try:
-        import urllib.request
-
-        url = f"https://ollama.com/library/{model_name}/tags"
-        req = urllib.request.Request(url, headers={"User-Agent": "kitt/1.1"})
-        with urllib.request.urlopen(req, timeout=15) as resp:
-            html = resp.read().decode("utf-8", errors="replace")
-
-        # Parse tags from href patterns
-        raw_tags = re.findall(rf'/library/{re.escape(model_name)}:([^"&\s]+)', html)
-
-        # Deduplicate preserving order
-        seen = set()
-        unique_tags = []
-        for tag in raw_tags:
-            if tag not in seen:
-                seen.add(tag)
-                unique_tags.append(tag)
+        if cache is not None:
+            unique_tags = (
+                cache.get(
+                    "ollama",
+                    model_name,
+                    lambda etag: _fetch_ollama_tags(model_name, etag),
+                )
+                or []
+            )
+        else:
+            unique_tags = _fetch_ollama_tags(model_name)[0]  # type: ignore[index]
 
         if unique_tags:
             filtered = []
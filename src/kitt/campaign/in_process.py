@@ -0,0 +1,160 @@
+"""In-process campaign execution — run benchmarks without a `kitt run` subprocess."""
+
+import logging
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from kitt import __version__
+
+if TYPE_CHECKING:
+    from kitt.config.models import SuiteConfig
+
+logger = logging.getLogger(__name__)
+
+
+class InProcessExecutor:
+    """Execute campaign runs inside the campaign process.
+
+    Everything ``kitt run`` recomputes per invocation is loaded once and
+    reused for the whole campaign: engine and benchmark registries, the
+    hardware fingerprint, and parsed suite configs. Safe to share between
+    the per-GPU worker threads of a multi-GPU campaign.
+    """
+
+    def __init__(self, results_dir: Path | None = None) -> None:
+        self.results_dir = results_dir
+        self._lock = threading.Lock()
+        self._registries_loaded = False
+        self._system_info = None
+        self._suites: dict[str, tuple[list[type], SuiteConfig | None]] = {}
+
+    def run(
+        self,
+        model_path: str,
+        engine: str,
+        suite: str,
+        engine_config: dict[str, Any] | None = None,
+    ) -> str:
+        """Run a suite against a model and return the output directory.
+
+        Raises:
+            RuntimeError: If the engine is unavailable, rejects the model,
+                or fails to initialize.
+        """
+        from kitt.engines.registry import EngineRegistry
+        from kitt.runners.run_output import default_output_dir, write_run_outputs
+        from kitt.runners.suite import SuiteRunner, suite_run_config
+
+        self._load_registries()
+
+        engine_cls = EngineRegistry.get_engine(engine)
+        if not engine_cls.is_available():
+            diag = engine_cls.diagnose()
+            raise RuntimeError(
+                f"Engine '{engine}' is not available: {diag.error or 'unknown error'}"
+            )
+
+        format_error = engine_cls.validate_model(model_path)
+        if format_error:
+            raise RuntimeError(f"Model/engine mismatch: {format_error}")
+
+        benchmark_classes, suite_cfg = self._suite(suite)
+        global_config, test_overrides = suite_run_config(suite_cfg)
+        system_info = self._hardware()
+
+        engine_instance = engine_cls()
+        try:
+            engine_instance.initialize(model_path, dict(engine_config or {}))
+        except Exception as e:
+            raise RuntimeError(f"Failed to initialize engine: {e}") from e
+
+        try:
+            suite_result = SuiteRunner(engine_instance).run(
+                suite_name=suite,
+                benchmarks=[cls() for cls in benchmark_classes],
+                global_config=global_config,
+                test_overrides=test_overrides,
+            )
+        finally:
+            engine_instance.cleanup()
+
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
+        if self.results_dir is not None:
+            output_dir = self.results_dir / Path(model_path).name / engine / timestamp
+        else:
+            output_dir = default_output_dir(model_path, engine, timestamp)
+
+        write_run_outputs(
+            suite_result,
+            output_dir,
+            system_info=system_info,
+            engine_name=engine,
+            model_name=model_path,
+            run_config={
+                "model": model_path,
+                "engine": engine,
+                "suite": suite,
+                "engine_config": engine_config or {},
+                "timestamp": timestamp,
+                "kitt_version": __version__,
+            },
+        )
+        logger.info(
+            f"{suite_result.passed_count}/{suite_result.total_benchmarks} "
+            f"benchmarks passed — results in {output_dir}"
+        )
+        return str(output_dir)
+
+    def _load_registries(self) -> None:
+        with self._lock:
+            if self._registries_loaded:
+                return
+            from kitt.benchmarks.registry import BenchmarkRegistry
+            from kitt.engines.registry import EngineRegistry
+
+            EngineRegistry.auto_discover()
+            BenchmarkRegistry.auto_discover()
+            self._registries_loaded = True
+
+    def _hardware(self):
+        """Detect hardware once per campaign."""
+        with self._lock:
+            if self._system_info is None:
+                from kitt.hardware.fingerprint import HardwareFingerprint
+
+                self._system_info = HardwareFingerprint.detect_system()
+            return self._system_info
+
+    def _suite(self, suite: str) -> tuple[list[type], "SuiteConfig | None"]:
+        """Resolve a suite name to benchmark classes and its parsed config.
+
+        Each suite config is parsed once; None when the suite has no
+        config file and the default benchmark is used.
+        """
+        with self._lock:
+            if suite in self._suites:
+                return self._suites[suite]
+
+            from kitt.benchmarks.registry import BenchmarkRegistry
+            from kitt.config.loader import find_suite_config, load_suite_config
+
+            path = find_suite_config(suite)
+            if path is None:
+                logger.warning(f"Suite config '{suite}' not found, using defaults")
+                classes = [BenchmarkRegistry.get_benchmark("throughput")]
+                suite_cfg = None
+            else:
+                suite_cfg = load_suite_config(path)
+                classes = []
+                for test_name in suite_cfg.tests:
+                    try:
+                        classes.append(BenchmarkRegistry.get_benchmark(test_name))
+                    except ValueError:
+                        logger.warning(f"Benchmark '{test_name}' not found, skipping")
+                if not classes:
+                    raise RuntimeError(f"Suite '{suite}' has no runnable benchmarks")
+
+            self._suites[suite] = (classes, suite_cfg)
+            return self._suites[suite]
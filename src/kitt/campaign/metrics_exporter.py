@@ -43,6 +43,7 @@ class CampaignMetricsExporter:
             "kitt_campaign_runs_skipped_total": 0,
             "kitt_campaign_progress_pct": 0,
             "kitt_campaign_duration_seconds": 0,
+            "kitt_campaign_gpu_idle_seconds": 0,
         }
         self._labeled_metrics: list = []
 
@@ -89,13 +90,18 @@ class CampaignMetricsExporter:
         failed: int,
         skipped: int,
         duration_s: float,
+        gpu_idle_s: float = 0.0,
     ) -> None:
-        """Update campaign-level metrics."""
+        """Update campaign-level metrics.
+
+        ``gpu_idle_s`` is the time benchmarks spent waiting on downloads.
+        """
         self._metrics["kitt_campaign_runs_total"] = total_runs
         self._metrics["kitt_campaign_runs_succeeded_total"] = succeeded
         self._metrics["kitt_campaign_runs_failed_total"] = failed
         self._metrics["kitt_campaign_runs_skipped_total"] = skipped
         self._metrics["kitt_campaign_duration_seconds"] = round(duration_s, 1)
+        self._metrics["kitt_campaign_gpu_idle_seconds"] = round(gpu_idle_s, 1)
         self._metrics["kitt_campaign_progress_pct"] = (
             round(completed / total_runs * 100, 1) if total_runs > 0 else 0
         )
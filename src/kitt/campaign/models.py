@@ -61,6 +61,42 @@ class ResourceLimitsConfig(BaseModel):
     )
 
 
+class MultiGPUConfig(BaseModel):
+    """Run independent campaign runs concurrently on disjoint GPU sets.
+
+    Each engine instance is pinned to ``gpus_per_instance`` GPUs taken from
+    ``devices`` (all detected GPUs when empty) and listens on the engine's
+    default port plus ``port_stride`` times its slot number.
+    """
+
+    enabled: bool = False
+    devices: list[int] = Field(default_factory=list)
+    gpus_per_instance: int = Field(default=1, ge=1)
+    port_stride: int = Field(default=10, ge=1)
+
+
+class DiscoveryConfig(BaseModel):
+    """Caching of GGUF quant and Ollama tag discovery.
+
+    Listings are cached under ~/.kitt/cache/discovery and revalidated
+    after ``ttl_hours``. ``offline`` never touches the network (for
+    air-gapped hosts); ``mirror_dir`` pre-seeds the cache from a local
+    model mirror.
+    """
+
+    cache: bool = True
+    ttl_hours: float = Field(default=24.0, ge=0.0)
+    offline: bool = False
+    mirror_dir: str | None = None
+
+
+class PrefetchConfig(BaseModel):
+    """Download look-ahead for the parallel campaign runner."""
+
+    depth: int = Field(default=1, ge=0)
+    max_workers: int = Field(default=1, ge=1)
+
+
 class QuantFilterConfig(BaseModel):
     """Filter rules for quantization variants."""
 
@@ -97,8 +133,12 @@ class CampaignConfig(BaseModel):
     disk: DiskConfig = Field(default_factory=DiskConfig)
     notifications: NotificationConfig = Field(default_factory=NotificationConfig)
     quant_filter: QuantFilterConfig = Field(default_factory=QuantFilterConfig)
+    discovery: DiscoveryConfig = Field(default_factory=DiscoveryConfig)
     resource_limits: ResourceLimitsConfig = Field(default_factory=ResourceLimitsConfig)
     parallel: bool = False
+    prefetch: PrefetchConfig = Field(default_factory=PrefetchConfig)
+    subprocess_isolation: bool = False
+    multi_gpu: MultiGPUConfig = Field(default_factory=MultiGPUConfig)
     devon_managed: bool = True
     devon_url: str | None = None
     devon_api_key: str | None = None
@@ -0,0 +1,263 @@
+"""Multi-GPU campaign runner — runs independent benchmarks on disjoint GPUs."""
+
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+
+from .models import CampaignConfig, CampaignRunSpec
+from .resource_planner import ScheduleSlot
+from .result import CampaignResult, CampaignRunResult
+from .runner import CampaignRunner
+from .state_manager import CampaignState, CampaignStateManager
+
+logger = logging.getLogger(__name__)
+
+_FALLBACK_PORT = 8000
+
+
+@dataclass(frozen=True)
+class GPUSlot:
+    """A disjoint set of GPUs that hosts one engine instance at a time."""
+
+    index: int
+    devices: tuple[int, ...]
+    port_offset: int = 0
+
+    @property
+    def devices_arg(self) -> str:
+        """Device list as passed to ``kitt run --gpus``."""
+        return ",".join(str(d) for d in self.devices)
+
+    @property
+    def container_prefix(self) -> str:
+        """Container name prefix, unique per slot so cleanup stays local."""
+        return "kitt-gpu" + "-".join(str(d) for d in self.devices)
+
+    def port_for(self, engine_name: str) -> int:
+        """Host port for an engine running in this slot."""
+        from kitt.engines.registry import EngineRegistry
+
+        EngineRegistry.auto_discover()
+        engine_cls = EngineRegistry.get(engine_name)
+        base = engine_cls.default_port() if engine_cls else _FALLBACK_PORT
+        return base + self.port_offset
+
+
+def detect_gpu_devices() -> list[int]:
+    """Indices of all GPUs visible through NVML (empty if none)."""
+    try:
+        from kitt.collectors.gpu_stats import GPUMonitor
+
+        return list(range(GPUMonitor().get_device_count()))
+    except Exception as e:
+        logger.debug(f"GPU detection failed: {e}")
+        return []
+
+
+def gpu_vram_gb(devices: tuple[int, ...]) -> float:
+    """Total VRAM of a device set in GB (0 when NVML is unavailable)."""
+    try:
+        from kitt.collectors.gpu_stats import GPUMonitor
+
+        monitor = GPUMonitor()
+        stats = [monitor.get_memory_stats(d) for d in devices]
+    except Exception as e:
+        logger.debug(f"GPU memory query failed: {e}")
+        return 0.0
+    if any(s is None for s in stats):
+        return 0.0
+    return sum(s.total_mb for s in stats) / 1024
+
+
+def partition_gpus(
+    devices: list[int],
+    gpus_per_instance: int = 1,
+    port_stride: int = 10,
+) -> list[GPUSlot]:
+    """Split devices into disjoint slots of ``gpus_per_instance`` GPUs.
+
+    Leftover devices that cannot fill a whole slot are left unused.
+
+    Raises:
+        ValueError: If there are fewer devices than one slot needs.
+    """
+    ordered = sorted(set(devices))
+    if len(ordered) < gpus_per_instance:
+        raise ValueError(
+            f"Need at least {gpus_per_instance} GPU(s) per instance, "
+            f"found {len(ordered)}"
+        )
+
+    slots = []
+    for i in range(len(ordered) // gpus_per_instance):
+        group = ordered[i * gpus_per_instance : (i + 1) * gpus_per_instance]
+        slots.append(
+            GPUSlot(index=i, devices=tuple(group), port_offset=i * port_stride)
+        )
+
+    unused = ordered[len(slots) * gpus_per_instance :]
+    if unused:
+        logger.warning(f"GPUs {unused} do not fill a slot and will stay idle")
+    return slots
+
+
+class MultiGPUCampaignRunner:
+    """Campaign runner that executes runs concurrently, one per GPU slot.
+
+    Available GPUs are partitioned into disjoint slots. Runs are packed
+    onto slots by estimated VRAM and wall-time, keeping runs that share a
+    model file on the same slot. Each slot runs its queue one benchmark at
+    a time with its engine pinned to the slot's devices, on a
+    slot-specific port and container name prefix, so a failure cleanup in
+    one slot never touches another slot's containers.
+    """
+
+    def __init__(
+        self,
+        config: CampaignConfig,
+        state_manager: CampaignStateManager | None = None,
+        dry_run: bool = False,
+        devices: list[int] | None = None,
+    ) -> None:
+        self.config = config
+        self.state_manager = state_manager or CampaignStateManager()
+        self.dry_run = dry_run
+
+        multi_gpu = config.multi_gpu
+        if devices is None:
+            devices = multi_gpu.devices or detect_gpu_devices()
+        self.slots = partition_gpus(
+            devices, multi_gpu.gpus_per_instance, multi_gpu.port_stride
+        )
+
+        # Delegate single-run execution to CampaignRunner
+        self._runner = CampaignRunner(
+            config=config,
+            state_manager=self.state_manager,
+            dry_run=dry_run,
+        )
+
+    def run(
+        self,
+        campaign_id: str | None = None,
+        resume: bool = False,
+    ) -> CampaignResult:
+        """Execute the campaign with one concurrent run per GPU slot."""
+        campaign_id = campaign_id or self._runner._generate_id()
+
+        # Load or create state
+        state: CampaignState | None = None
+        if resume:
+            state = self.state_manager.load(campaign_id)
+
+        if state is None:
+            state = self.state_manager.create(campaign_id, self.config.campaign_name)
+
+        # Plan and expand
+        planned = self._runner.scheduler.plan_runs(self.config)
+        expanded = self._runner._expand_runs(planned)
+        self._runner._register_runs(state, expanded)
+        self.state_manager.save(state)
+
+        remaining = [
+            r for r in expanded if not self.state_manager.is_run_done(state, r.key)
+        ]
+
+        logger.info(
+            f"Multi-GPU campaign '{self.config.campaign_name}' — "
+            f"{len(expanded)} total, {len(remaining)} remaining, "
+            f"{len(self.slots)} slot(s): "
+            + ", ".join(f"[{s.devices_arg}]" for s in self.slots)
+        )
+
+        plan = self._runner.scheduler.build_plan(remaining, self.schedule_slots())
+        self._runner.track_model_uses(remaining)
+
+        result = CampaignResult(
+            campaign_id=campaign_id,
+            campaign_name=self.config.campaign_name,
+            started_at=state.started_at,
+            predicted_makespan_s=plan.makespan_s,
+        )
+
+        finished: queue.Queue[tuple[CampaignRunSpec, CampaignRunResult]] = queue.Queue()
+
+        with ThreadPoolExecutor(
+            max_workers=len(self.slots),
+            thread_name_prefix="kitt-gpu",
+        ) as pool:
+            for slot in self.slots:
+                runs = [s.run for s in plan.assignments[slot.container_prefix]]
+                if runs:
+                    pool.submit(self._run_slot_queue, slot, runs, state, finished)
+
+            for _ in remaining:
+                run_spec, run_result = finished.get()
+                result.runs.append(run_result)
+
+                if self._runner.metrics_exporter:
+                    self._runner.metrics_exporter.update_campaign_progress(
+                        total_runs=len(expanded),
+                        completed=result.succeeded + result.failed + result.skipped,
+                        succeeded=result.succeeded,
+                        failed=result.failed,
+                        skipped=result.skipped,
+                        duration_s=result.total_duration_s,
+                    )
+
+                if run_result.status == "failed":
+                    self._runner.notifier.notify_failure(
+                        self.config.campaign_name,
+                        run_spec.key,
+                        run_result.error,
+                    )
+
+        # Finalize
+        state.status = "completed"
+        state.completed_at = datetime.now().isoformat()
+        self.state_manager.save(state)
+
+        result.completed_at = state.completed_at
+        summary = (
+            f"Total: {result.total}, "
+            f"Succeeded: {result.succeeded}, "
+            f"Failed: {result.failed}, "
+            f"Skipped: {result.skipped}"
+        )
+        logger.info(f"Multi-GPU campaign complete: {summary}")
+        self._runner.notifier.notify_complete(self.config.campaign_name, summary)
+
+        return result
+
+    def schedule_slots(self) -> list[ScheduleSlot]:
+        """Slots as seen by the packer, with their combined VRAM."""
+        return [
+            ScheduleSlot(name=slot.container_prefix, vram_gb=gpu_vram_gb(slot.devices))
+            for slot in self.slots
+        ]
+
+    def _run_slot_queue(
+        self,
+        slot: GPUSlot,
+        runs: list[CampaignRunSpec],
+        state: CampaignState,
+        finished: "queue.Queue[tuple[CampaignRunSpec, CampaignRunResult]]",
+    ) -> None:
+        """Execute a slot's planned runs in order, reporting each result."""
+        for run_spec in runs:
+            logger.info(f"GPU [{slot.devices_arg}] running {run_spec.key}")
+            try:
+                run_result = self._runner._execute_run(run_spec, state, slot=slot)
+            except Exception as e:
+                # _execute_run isolates run errors; this guards the slot queue
+                logger.error(f"Run crashed: {run_spec.key}: {e}")
+                run_result = CampaignRunResult(
+                    model_name=run_spec.model_name,
+                    engine_name=run_spec.engine_name,
+                    quant=run_spec.quant,
+                    status="failed",
+                    error=str(e),
+                )
+            finished.put((run_spec, run_result))
@@ -2,12 +2,12 @@
 
 import logging
 import shutil
-from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
 from threading import Lock
 
-from .models import CampaignConfig, CampaignRunSpec
-from .result import CampaignResult, CampaignRunResult
+from .models import CampaignConfig
+from .prefetch import PrefetchPipeline
+from .result import CampaignResult
 from .runner import CampaignRunner
 from .state_manager import CampaignState, CampaignStateManager
 
@@ -17,12 +17,11 @@ logger = logging.getLogger(__name__)
 class ParallelCampaignRunner:
     """Campaign runner that overlaps model downloads with benchmark execution.
 
-    Uses two worker pools:
-    - benchmark_worker: executes benchmarks (GPU-bound, 1 at a time)
-    - download_worker: pre-downloads next model (network-bound)
-
-    This allows downloading the next model while the current benchmark runs,
-    reducing total campaign time.
+    Benchmarks run one at a time (GPU-bound) while a
+    :class:`~kitt.campaign.prefetch.PrefetchPipeline` downloads the next
+    ``prefetch.depth`` models (network-bound), admitting each download
+    only when it fits the disk reserve. Time the GPU spends waiting on
+    downloads is reported as ``CampaignResult.gpu_idle_s``.
     """
 
     def __init__(
@@ -30,12 +29,12 @@ class ParallelCampaignRunner:
         config: CampaignConfig,
         state_manager: CampaignStateManager | None = None,
         dry_run: bool = False,
-        max_download_workers: int = 1,
+        max_download_workers: int | None = None,
     ) -> None:
         self.config = config
         self.state_manager = state_manager or CampaignStateManager()
         self.dry_run = dry_run
-        self.max_download_workers = max_download_workers
+        self.max_download_workers = max_download_workers or config.prefetch.max_workers
 
         # Delegate single-run execution to CampaignRunner
         self._runner = CampaignRunner(
@@ -46,7 +45,6 @@ class ParallelCampaignRunner:
 
         # Thread safety
         self._state_lock = Lock()
-        self._download_cache: dict = {}  # key -> model_path
 
     def run(
         self,
@@ -85,40 +83,40 @@ class ParallelCampaignRunner:
             started_at=state.started_at,
         )
 
+        self._runner.track_model_uses(remaining)
+
         # Execute with download prefetch
-        with ThreadPoolExecutor(
+        pipeline = PrefetchPipeline(
+            self._runner,
+            depth=0 if self.dry_run else self.config.prefetch.depth,
             max_workers=self.max_download_workers,
-            thread_name_prefix="kitt-download",
-        ) as download_pool:
-            # Submit first download
-            pending_download: Future | None = None
-            if len(remaining) > 0:
-                pending_download = download_pool.submit(
-                    self._safe_download, remaining[0]
-                )
-
+        )
+        try:
             for i, run_spec in enumerate(remaining):
-                # Check disk space
                 if not self._check_disk_space():
-                    logger.warning("Disk space low — pausing downloads")
-
-                # Wait for current download
-                if pending_download is not None:
-                    model_path = pending_download.result(timeout=7200)
-                    if model_path:
-                        self._download_cache[run_spec.key] = model_path
-
-                # Start prefetching next model
-                if i + 1 < len(remaining):
-                    next_spec = remaining[i + 1]
-                    pending_download = download_pool.submit(
-                        self._safe_download, next_spec
-                    )
-                else:
-                    pending_download = None
+                    logger.warning("Disk space below reserve")
+
+                # Skip checks come first so a skipped run is never
+                # downloaded; a prefetched model already passed the disk
+                # budget and is (partly) on disk
+                skip_reason = self._runner._skip_reason(
+                    run_spec, check_disk=not pipeline.prefetched(run_spec)
+                )
+
+                # Wait for this run's model, then queue the next downloads
+                model_path = None
+                if skip_reason is None and not self.dry_run:
+                    model_path = pipeline.take(run_spec)
+                pipeline.reschedule(remaining[i + 1 :])
+                result.gpu_idle_s = pipeline.stats.gpu_idle_s
 
                 # Execute benchmark (sequential — GPU bound)
-                run_result = self._execute_with_cached_download(run_spec, state)
+                if skip_reason:
+                    run_result = self._runner._skip_run(run_spec, state, skip_reason)
+                else:
+                    run_result = self._runner._execute_run(
+                        run_spec, state, model_path=model_path, checked=True
+                    )
                 result.runs.append(run_result)
 
                 # Update metrics exporter if present
@@ -130,6 +128,7 @@ class ParallelCampaignRunner:
                         failed=result.failed,
                         skipped=result.skipped,
                         duration_s=result.total_duration_s,
+                        gpu_idle_s=result.gpu_idle_s,
                     )
 
                 if run_result.status == "failed":
@@ -138,6 +137,15 @@ class ParallelCampaignRunner:
                         run_spec.key,
                         run_result.error,
                     )
+        finally:
+            pipeline.close()
+
+        stats = pipeline.stats
+        logger.info(
+            f"Prefetch: {stats.started} started, {stats.hits} ready in time, "
+            f"{stats.deferred} deferred for disk, {stats.cancelled} cancelled, "
+            f"{stats.gpu_idle_s:.0f}s GPU idle waiting for downloads"
+        )
 
         # Finalize
         from datetime import datetime
@@ -159,28 +167,6 @@ class ParallelCampaignRunner:
 
         return result
 
-    def _safe_download(self, run_spec: CampaignRunSpec) -> str | None:
-        """Download model with error handling (runs in download thread)."""
-        try:
-            return self._runner._download_model(run_spec)
-        except Exception as e:
-            logger.error(f"Pre-download failed for {run_spec.key}: {e}")
-            return None
-
-    def _execute_with_cached_download(
-        self,
-        run_spec: CampaignRunSpec,
-        state: CampaignState,
-    ) -> CampaignRunResult:
-        """Execute a run, using cached download path if available."""
-        # Use the standard runner's _execute_run
-        run_result = self._runner._execute_run(run_spec, state)
-
-        # Clean up download cache
-        self._download_cache.pop(run_spec.key, None)
-
-        return run_result
-
     def _check_disk_space(self) -> bool:
         """Check if there's enough disk space to continue."""
         try:
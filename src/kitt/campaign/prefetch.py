@@ -0,0 +1,204 @@
+"""Download prefetch pipeline with disk-budget admission control."""
+
+import logging
+import shutil
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .models import CampaignRunSpec
+from .resource_planner import model_file_key
+
+if TYPE_CHECKING:
+    from .runner import CampaignRunner
+
+logger = logging.getLogger(__name__)
+
+# Upper bound on waiting for a single download to finish
+DOWNLOAD_TIMEOUT_S = 7200
+
+
+@dataclass
+class PrefetchStats:
+    """Counters describing how well downloads kept the GPU busy."""
+
+    started: int = 0
+    hits: int = 0  # download already finished when its run came up
+    deferred: int = 0  # refused by admission control (counted once per file)
+    cancelled: int = 0
+    gpu_idle_s: float = 0.0  # time spent blocked waiting for downloads
+
+
+@dataclass
+class _Download:
+    run: CampaignRunSpec
+    future: Future
+    size_gb: float
+
+
+class PrefetchPipeline:
+    """Download upcoming models ahead of the benchmark that needs them.
+
+    Keeps up to ``depth`` distinct model files downloading or downloaded
+    ahead of the current run. A download is admitted only when free disk
+    space, minus the estimated size of every unfinished download, minus
+    the new file's estimated size, stays above ``disk.reserve_gb``.
+    Finished downloads are already reflected in free space, so only
+    in-flight bytes are projected.
+
+    Runs the runner would skip before downloading (over the size limit,
+    gated) are never prefetched.
+
+    Calling :meth:`reschedule` with a new list of upcoming runs cancels
+    prefetches that fell out of the look-ahead window. A queued download
+    is cancelled outright. A running one is detached: its result is
+    discarded, and it still counts against the disk budget until it
+    finishes.
+
+    Each prefetched repository is held on the runner, so cleanup after an
+    earlier run never deletes files that are still being downloaded.
+    """
+
+    def __init__(
+        self,
+        runner: "CampaignRunner",
+        depth: int = 1,
+        max_workers: int = 1,
+    ) -> None:
+        self.runner = runner
+        self.depth = depth
+        self.stats = PrefetchStats()
+        self._pool = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="kitt-download"
+        )
+        self._lock = threading.Lock()
+        self._downloads: dict[str, _Download] = {}
+        self._detached: list[_Download] = []
+        self._deferred: set[str] = set()
+
+    def reschedule(self, upcoming: list[CampaignRunSpec]) -> None:
+        """Align in-flight prefetches with the next runs of the plan.
+
+        Args:
+            upcoming: Runs after the current one, in execution order.
+        """
+        window: dict[str, CampaignRunSpec] = {}
+        for run in upcoming:
+            if len(window) >= self.depth:
+                break
+            if self.runner._skip_reason(run, check_disk=False):
+                continue
+            window.setdefault(model_file_key(run), run)
+
+        with self._lock:
+            for key in [k for k in self._downloads if k not in window]:
+                self._cancel(key)
+
+            for key, run in window.items():
+                if key in self._downloads:
+                    continue
+                size_gb = _download_size_gb(run)
+                if not self._admit(size_gb):
+                    if key not in self._deferred:
+                        self._deferred.add(key)
+                        self.stats.deferred += 1
+                        logger.info(
+                            f"Deferring prefetch of {run.key}: "
+                            f"~{size_gb:.1f}GB would breach the disk reserve"
+                        )
+                    # Keep plan order — later files wait for this one
+                    break
+                self._start(key, run, size_gb)
+
+    def prefetched(self, run_spec: CampaignRunSpec) -> bool:
+        """Whether a run's model file is being or has been prefetched."""
+        with self._lock:
+            return model_file_key(run_spec) in self._downloads
+
+    def take(self, run_spec: CampaignRunSpec) -> str | None:
+        """Return the model path for a run, waiting for or doing its download.
+
+        Time spent blocked here is recorded as GPU idle time.
+        """
+        key = model_file_key(run_spec)
+        with self._lock:
+            download = self._downloads.pop(key, None)
+            self._deferred.discard(key)
+
+        start = time.monotonic()
+        if download is None:
+            model_path = self._download(run_spec)
+        else:
+            if download.future.done():
+                self.stats.hits += 1
+            try:
+                model_path = download.future.result(timeout=DOWNLOAD_TIMEOUT_S)
+            except Exception as e:
+                logger.error(f"Prefetch of {run_spec.key} failed: {e}")
+                model_path = None
+            finally:
+                self.runner._drop_hold(run_spec)
+        self.stats.gpu_idle_s += time.monotonic() - start
+        return model_path
+
+    def close(self) -> None:
+        """Cancel outstanding prefetches and stop the download workers."""
+        with self._lock:
+            for key in list(self._downloads):
+                self._cancel(key)
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _start(self, key: str, run: CampaignRunSpec, size_gb: float) -> None:
+        self.runner._hold_model(run)
+        future = self._pool.submit(self._download, run)
+        self._downloads[key] = _Download(run=run, future=future, size_gb=size_gb)
+        self._deferred.discard(key)
+        self.stats.started += 1
+        logger.info(f"Prefetching {run.key} (~{size_gb:.1f}GB)")
+
+    def _cancel(self, key: str) -> None:
+        download = self._downloads.pop(key)
+        run_spec = download.run
+        if not download.future.cancel() and not download.future.done():
+            self._detached.append(download)
+        download.future.add_done_callback(lambda _: self.runner._drop_hold(run_spec))
+        self.stats.cancelled += 1
+        logger.info(f"Cancelled prefetch of {run_spec.key}")
+
+    def _admit(self, size_gb: float) -> bool:
+        self._detached = [d for d in self._detached if not d.future.done()]
+        in_flight_gb = sum(
+            d.size_gb
+            for d in [*self._downloads.values(), *self._detached]
+            if not d.future.done()
+        )
+        free_gb = self._free_gb()
+        if free_gb is None:
+            return True
+        reserve_gb = self.runner.config.disk.reserve_gb
+        return free_gb - in_flight_gb - size_gb >= reserve_gb
+
+    def _free_gb(self) -> float | None:
+        path = self.runner.config.disk.storage_path or str(Path.home())
+        try:
+            return shutil.disk_usage(path).free / (1024**3)
+        except OSError:
+            logger.warning(f"Could not check disk space at {path}")
+            return None
+
+    def _download(self, run_spec: CampaignRunSpec) -> str | None:
+        try:
+            return self.runner._download_model(run_spec)
+        except Exception as e:
+            logger.error(f"Download failed for {run_spec.key}: {e}")
+            return None
+
+
+def _download_size_gb(run: CampaignRunSpec) -> float:
+    """Disk a run's download will take; Ollama pulls inside its container."""
+    if not run.repo_id or run.engine_name == "ollama":
+        return 0.0
+    return run.estimated_size_gb
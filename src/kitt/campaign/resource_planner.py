@@ -0,0 +1,277 @@
+"""Resource-aware campaign planning — VRAM/time estimates and run packing."""
+
+import logging
+import statistics
+from dataclasses import dataclass, field
+from typing import Any
+
+from .models import CampaignRunSpec
+
+logger = logging.getLogger(__name__)
+
+# Metrics that report peak GPU memory, in order of preference.
+_VRAM_METRICS = (
+    "overall_peak_gpu_memory_gb",
+    "peak_gpu_memory_gb",
+    "gpu_memory_peak_gb",
+)
+
+# Loaded weights plus KV cache, activations and CUDA context.
+_VRAM_OVERHEAD = 1.2
+DEFAULT_RUN_DURATION_S = 1800.0
+
+
+@dataclass
+class RunEstimate:
+    """Predicted resource use of one campaign run."""
+
+    vram_gb: float
+    duration_s: float
+    source: str  # "history" or "model"
+
+
+@dataclass
+class ScheduleSlot:
+    """A place runs execute on: a GPU set on this host, or an agent."""
+
+    name: str
+    vram_gb: float = 0.0  # 0 = unknown, accept any run
+
+
+@dataclass
+class ScheduledRun:
+    """A run's slot assignment and predicted start/end offsets."""
+
+    run: CampaignRunSpec
+    slot: str
+    start_s: float
+    end_s: float
+    estimate: RunEstimate
+
+
+@dataclass
+class SchedulePlan:
+    """Output of the packer: per-slot run queues and predicted makespan."""
+
+    slots: list[ScheduleSlot]
+    assignments: dict[str, list[ScheduledRun]] = field(default_factory=dict)
+    oversized: list[str] = field(default_factory=list)
+
+    @property
+    def makespan_s(self) -> float:
+        return max(
+            (runs[-1].end_s for runs in self.assignments.values() if runs),
+            default=0.0,
+        )
+
+    @property
+    def downloads(self) -> int:
+        """Model files fetched, counting each file once per slot."""
+        return sum(
+            len({model_file_key(s.run) for s in runs})
+            for runs in self.assignments.values()
+        )
+
+    @property
+    def engine_switches(self) -> int:
+        """Consecutive runs on a slot that change engine image."""
+        switches = 0
+        for runs in self.assignments.values():
+            for prev, cur in zip(runs, runs[1:], strict=False):
+                if prev.run.engine_name != cur.run.engine_name:
+                    switches += 1
+        return switches
+
+    def ordered_runs(self) -> list[CampaignRunSpec]:
+        """All runs in predicted start order (for sequential execution)."""
+        scheduled = [s for runs in self.assignments.values() for s in runs]
+        return [s.run for s in sorted(scheduled, key=lambda s: s.start_s)]
+
+    def summary(self) -> str:
+        total = sum(len(r) for r in self.assignments.values())
+        text = (
+            f"{total} runs on {len(self.slots)} slot(s), "
+            f"predicted makespan {self.makespan_s / 3600:.1f}h, "
+            f"{self.downloads} download(s), {self.engine_switches} engine switch(es)"
+        )
+        if self.oversized:
+            text += f", {len(self.oversized)} run(s) may not fit in VRAM"
+        return text
+
+
+def model_file_key(run: CampaignRunSpec) -> str:
+    """Identify the downloaded artifact a run needs."""
+    return f"{run.repo_id or run.model_name}|{run.include_pattern or run.quant}"
+
+
+class ResourceEstimator:
+    """Estimate per-run VRAM and wall-time from past results.
+
+    Matches stored results (metrics.json dicts, e.g. from KARR repos) on
+    engine, suite and model identity. Without a match, VRAM falls back to
+    the bytes-per-parameter size estimate plus overhead and duration to the
+    median of the engine's past runs.
+    """
+
+    def __init__(
+        self,
+        history: list[dict[str, Any]] | None = None,
+        default_duration_s: float = DEFAULT_RUN_DURATION_S,
+    ) -> None:
+        self.history = history or []
+        self.default_duration_s = default_duration_s
+
+    @classmethod
+    def from_store(
+        cls, store, runs: list[CampaignRunSpec] | None = None
+    ) -> "ResourceEstimator":
+        """Build from a ResultStore, tolerating unreadable stores.
+
+        With ``runs``, only results for the engine and suite pairs those
+        runs use are loaded, since no other result can match them.
+        """
+        try:
+            if runs is None:
+                return cls(store.query())
+            history: list[dict[str, Any]] = []
+            for engine, suite in sorted({(r.engine_name, r.suite) for r in runs}):
+                history.extend(
+                    store.query(filters={"engine": engine, "suite_name": suite})
+                )
+            return cls(history)
+        except Exception as e:
+            logger.warning(f"Could not load result history: {e}")
+            return cls()
+
+    def estimate(self, run: CampaignRunSpec) -> RunEstimate:
+        matches = [r for r in self.history if self._matches(r, run)]
+
+        vram = [v for v in (self._peak_vram(r) for r in matches) if v > 0]
+        durations = [
+            r["total_time_seconds"] for r in matches if r.get("total_time_seconds")
+        ]
+        if vram and durations:
+            return RunEstimate(
+                vram_gb=max(vram),
+                duration_s=statistics.median(durations),
+                source="history",
+            )
+
+        return RunEstimate(
+            vram_gb=max(vram) if vram else run.estimated_size_gb * _VRAM_OVERHEAD,
+            duration_s=(
+                statistics.median(durations)
+                if durations
+                else self._engine_duration(run.engine_name, run.suite)
+            ),
+            source="model",
+        )
+
+    def _engine_duration(self, engine: str, suite: str) -> float:
+        durations = [
+            r["total_time_seconds"]
+            for r in self.history
+            if r.get("engine") == engine
+            and r.get("suite_name") == suite
+            and r.get("total_time_seconds")
+        ]
+        return statistics.median(durations) if durations else self.default_duration_s
+
+    @staticmethod
+    def _matches(record: dict[str, Any], run: CampaignRunSpec) -> bool:
+        if record.get("engine") != run.engine_name:
+            return False
+        if record.get("suite_name", run.suite) != run.suite:
+            return False
+
+        model = str(record.get("model", "")).lower()
+        names = [run.model_name.lower()]
+        if run.repo_id:
+            names.append(run.repo_id.split("/")[-1].split(":")[0].lower())
+        if not any(name and name in model for name in names):
+            return False
+        return run.quant.lower() in model or run.quant == "bf16"
+
+    @staticmethod
+    def _peak_vram(record: dict[str, Any]) -> float:
+        peak = 0.0
+        for result in record.get("results", []):
+            metrics = result.get("metrics", {})
+            for key in _VRAM_METRICS:
+                value = metrics.get(key)
+                if isinstance(value, (int, float)):
+                    peak = max(peak, float(value))
+        return peak
+
+
+def pack_runs(
+    runs: list[CampaignRunSpec],
+    slots: list[ScheduleSlot],
+    estimator: ResourceEstimator,
+) -> SchedulePlan:
+    """Assign runs to slots, minimizing makespan and repeated work.
+
+    Runs sharing a model file form one group that stays on one slot, so
+    the file is downloaded once; within a group runs are ordered by
+    engine. Groups are placed longest-first on the slot that frees up
+    earliest among those with enough VRAM (LPT list scheduling). A group
+    that fits no slot goes to the largest one and is reported as
+    oversized.
+    """
+    plan = SchedulePlan(slots=slots)
+    if not slots:
+        return plan
+
+    estimates = {run.key: estimator.estimate(run) for run in runs}
+
+    groups: dict[str, list[CampaignRunSpec]] = {}
+    for run in runs:
+        groups.setdefault(model_file_key(run), []).append(run)
+
+    def group_time(group: list[CampaignRunSpec]) -> float:
+        return sum(estimates[r.key].duration_s for r in group)
+
+    def group_vram(group: list[CampaignRunSpec]) -> float:
+        return max(estimates[r.key].vram_gb for r in group)
+
+    ordered = sorted(groups.values(), key=group_time, reverse=True)
+
+    finish = {slot.name: 0.0 for slot in slots}
+    placed: dict[str, list[list[CampaignRunSpec]]] = {s.name: [] for s in slots}
+    largest = max(slots, key=lambda s: s.vram_gb if s.vram_gb > 0 else float("inf"))
+
+    for group in ordered:
+        need = group_vram(group)
+        fitting = [s for s in slots if s.vram_gb <= 0 or need <= s.vram_gb]
+        if fitting:
+            slot = min(fitting, key=lambda s: finish[s.name])
+        else:
+            slot = largest
+            plan.oversized.extend(r.key for r in group)
+            logger.warning(
+                f"Runs for {model_file_key(group[0])} need ~{need:.1f}GB VRAM, "
+                f"more than any slot offers"
+            )
+        placed[slot.name].append(sorted(group, key=lambda r: r.engine_name))
+        finish[slot.name] += group_time(group)
+
+    # Within a slot, keep groups that start with the same engine adjacent
+    for slot in slots:
+        clock = 0.0
+        queue: list[ScheduledRun] = []
+        for group in sorted(placed[slot.name], key=lambda g: g[0].engine_name):
+            for run in group:
+                est = estimates[run.key]
+                queue.append(
+                    ScheduledRun(
+                        run=run,
+                        slot=slot.name,
+                        start_s=clock,
+                        end_s=clock + est.duration_s,
+                        estimate=est,
+                    )
+                )
+                clock += est.duration_s
+        plan.assignments[slot.name] = queue
+
+    return plan
@@ -28,6 +28,8 @@ class CampaignResult:
     campaign_name: str
     started_at: str = ""
     completed_at: str = ""
+    predicted_makespan_s: float = 0.0
+    gpu_idle_s: float = 0.0
     runs: list[CampaignRunResult] = field(default_factory=list)
 
     @property
@@ -4,21 +4,30 @@ import logging
 import subprocess
 import threading
 import time
+from collections import Counter
 from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
+from .discovery_cache import DiscoveryCache
 from .gguf_discovery import (
     discover_gguf_quants,
     discover_ollama_tags,
     filter_quants,
     find_model_path,
 )
+from .in_process import InProcessExecutor
 from .metrics_exporter import CampaignMetricsExporter
 from .models import CampaignConfig, CampaignRunSpec
 from .notifications import NotificationDispatcher
+from .resource_planner import model_file_key
 from .result import CampaignResult, CampaignRunResult
 from .scheduler import CampaignScheduler, estimate_quant_size_gb, parse_params
 from .state_manager import CampaignState, CampaignStateManager, RunState
 
+if TYPE_CHECKING:
+    from .multi_gpu_runner import GPUSlot
+
 logger = logging.getLogger(__name__)
 
 
@@ -74,6 +83,17 @@ class CampaignRunner:
         self.notifier = NotificationDispatcher(config.notifications)
         self.metrics_exporter = metrics_exporter
 
+        # Registries, hardware info and suite configs shared across runs
+        self.executor = InProcessExecutor()
+        self.discovery_cache = self._make_discovery_cache()
+
+        # Pending runs per model file and in-flight runs per repo, so a
+        # download is kept until the last run that needs it.
+        self._file_uses: Counter[str] = Counter()
+        self._repo_active: Counter[str] = Counter()
+        self._repo_lock = threading.Lock()
+        self._gated: dict[str, bool] = {}
+
     def run(
         self,
         campaign_id: str | None = None,
@@ -116,11 +136,17 @@ class CampaignRunner:
             f"{len(expanded)} total runs, {len(remaining)} remaining"
         )
 
+        # Group runs sharing a model file or engine, and predict makespan
+        plan = self.scheduler.build_plan(remaining)
+        remaining = plan.ordered_runs()
+        self.track_model_uses(remaining)
+
         # Execute
         result = CampaignResult(
             campaign_id=campaign_id,
             campaign_name=self.config.campaign_name,
             started_at=state.started_at,
+            predicted_makespan_s=plan.makespan_s,
         )
 
         for run_spec in remaining:
@@ -168,70 +194,30 @@ class CampaignRunner:
         self,
         run_spec: CampaignRunSpec,
         state: CampaignState,
+        slot: "GPUSlot | None" = None,
+        model_path: str | None = None,
+        checked: bool = False,
     ) -> CampaignRunResult:
-        """Execute a single benchmark run with error isolation."""
-        logger.info(f"Starting: {run_spec.key}")
+        """Execute a single benchmark run with error isolation.
 
-        # Check size limit first
-        if self.scheduler.should_skip_for_size(run_spec):
-            skip_reason = (
-                f"Estimated size {run_spec.estimated_size_gb:.1f}GB exceeds "
-                f"limit of {self.scheduler.resource_limits.max_model_size_gb:.1f}GB"
-            )
-            self.state_manager.update_run(
-                state, run_spec.key, "skipped", error=skip_reason
-            )
-            return CampaignRunResult(
-                model_name=run_spec.model_name,
-                engine_name=run_spec.engine_name,
-                quant=run_spec.quant,
-                status="skipped",
-                error=skip_reason,
-            )
-
-        # Check disk space
-        if not self.scheduler.check_disk_space(
-            run_spec, self.scheduler.disk_config.storage_path
-        ):
-            self.state_manager.update_run(
-                state, run_spec.key, "skipped", error="Insufficient disk space"
-            )
-            return CampaignRunResult(
-                model_name=run_spec.model_name,
-                engine_name=run_spec.engine_name,
-                quant=run_spec.quant,
-                status="skipped",
-                error="Insufficient disk space",
-            )
+        Args:
+            run_spec: Run to execute.
+            state: Campaign state to update.
+            slot: GPU slot to pin the engine to when runs execute
+                concurrently on one host. None uses the engine defaults.
+            model_path: Path of an already-downloaded model. None
+                downloads it here.
+            checked: The caller already ran :meth:`_skip_reason` for this
+                run, before fetching its model.
+        """
+        logger.info(f"Starting: {run_spec.key}")
+        cleanup = not self.dry_run and self.config.disk.cleanup_after_run
 
-        # Check gated model access (skip in dry-run mode)
-        if (
-            not self.dry_run
-            and self.config.skip_gated
-            and run_spec.repo_id
-            and run_spec.engine_name != "ollama"
-        ):
-            try:
-                from .gated_model_checker import GatedModelChecker
+        skip_reason = None if checked else self._skip_reason(run_spec)
+        if skip_reason:
+            return self._skip_run(run_spec, state, skip_reason)
 
-                checker = GatedModelChecker(hf_token=self.config.hf_token)
-                if checker.is_gated(run_spec.repo_id):
-                    skip_reason = (
-                        f"Model {run_spec.repo_id} is gated (requires access approval)"
-                    )
-                    logger.info(f"Skipping gated model: {run_spec.key}")
-                    self.state_manager.update_run(
-                        state, run_spec.key, "skipped", error=skip_reason
-                    )
-                    return CampaignRunResult(
-                        model_name=run_spec.model_name,
-                        engine_name=run_spec.engine_name,
-                        quant=run_spec.quant,
-                        status="skipped",
-                        error=skip_reason,
-                    )
-            except Exception as e:
-                logger.debug(f"Gated model check failed: {e}")
+        self._hold_model(run_spec)
 
         self.state_manager.update_run(state, run_spec.key, "running")
         start_time = time.time()
@@ -243,20 +229,19 @@ class CampaignRunner:
                 output_dir = "dry-run"
             else:
                 # Download model if needed
-                model_path = self._download_model(run_spec)
+                model_path = model_path or self._download_model(run_spec)
                 if not model_path:
                     raise RuntimeError("Model path not found after download")
 
-                # Run benchmark via kitt CLI
                 output_dir = self._run_benchmark(
-                    model_path, run_spec.engine_name, run_spec.suite
+                    model_path,
+                    run_spec.engine_name,
+                    run_spec.suite,
+                    slot=slot,
+                    engine_config=run_spec.engine_config,
                 )
                 duration = time.time() - start_time
 
-                # Cleanup model
-                if self.config.disk.cleanup_after_run and run_spec.repo_id:
-                    self._cleanup_model(run_spec.repo_id)
-
             self.state_manager.update_run(
                 state,
                 run_spec.key,
@@ -265,6 +250,9 @@ class CampaignRunner:
                 output_dir=output_dir,
             )
 
+            # Cleanup model once no later run shares it
+            self._release_model(run_spec, cleanup=cleanup)
+
             return CampaignRunResult(
                 model_name=run_spec.model_name,
                 engine_name=run_spec.engine_name,
@@ -287,12 +275,13 @@ class CampaignRunner:
                 error=error_msg,
             )
 
-            # Clean up Docker containers
-            self._cleanup_docker()
+            # Clean up Docker containers (only this slot's when sharing a host)
+            self._cleanup_docker(
+                f"{slot.container_prefix}-" if slot is not None else "kitt-"
+            )
 
             # Try to clean up model
-            if run_spec.repo_id:
-                self._cleanup_model(run_spec.repo_id)
+            self._release_model(run_spec, cleanup=True)
 
             return CampaignRunResult(
                 model_name=run_spec.model_name,
@@ -303,6 +292,106 @@ class CampaignRunner:
                 error=error_msg,
             )
 
+    def _skip_reason(
+        self, run_spec: CampaignRunSpec, check_disk: bool = True
+    ) -> str | None:
+        """Return why a run must be skipped, or None if it can go ahead.
+
+        Run before the model is downloaded. ``check_disk=False`` leaves
+        out the free-space check, for models that are already on disk or
+        whose download was admitted against the disk budget.
+        """
+        if self.scheduler.should_skip_for_size(run_spec):
+            return (
+                f"Estimated size {run_spec.estimated_size_gb:.1f}GB exceeds "
+                f"limit of {self.scheduler.resource_limits.max_model_size_gb:.1f}GB"
+            )
+        if check_disk and not self.scheduler.check_disk_space(
+            run_spec, self.scheduler.disk_config.storage_path
+        ):
+            return "Insufficient disk space"
+        if self._is_gated(run_spec):
+            return f"Model {run_spec.repo_id} is gated (requires access approval)"
+        return None
+
+    def _is_gated(self, run_spec: CampaignRunSpec) -> bool:
+        """Check gated model access, once per repository (never in dry-run)."""
+        if (
+            self.dry_run
+            or not self.config.skip_gated
+            or not run_spec.repo_id
+            or run_spec.engine_name == "ollama"
+        ):
+            return False
+        with self._repo_lock:
+            gated = self._gated.get(run_spec.repo_id)
+        if gated is not None:
+            return gated
+        try:
+            from .gated_model_checker import GatedModelChecker
+
+            checker = GatedModelChecker(hf_token=self.config.hf_token)
+            gated = checker.is_gated(run_spec.repo_id)
+        except Exception as e:
+            logger.debug(f"Gated model check failed: {e}")
+            return False
+        with self._repo_lock:
+            self._gated[run_spec.repo_id] = gated
+        return gated
+
+    def _skip_run(
+        self, run_spec: CampaignRunSpec, state: CampaignState, reason: str
+    ) -> CampaignRunResult:
+        """Record a run as skipped and drop its claim on the model file."""
+        logger.info(f"Skipping {run_spec.key}: {reason}")
+        self.state_manager.update_run(state, run_spec.key, "skipped", error=reason)
+        self._hold_model(run_spec)
+        self._release_model(
+            run_spec, cleanup=not self.dry_run and self.config.disk.cleanup_after_run
+        )
+        return CampaignRunResult(
+            model_name=run_spec.model_name,
+            engine_name=run_spec.engine_name,
+            quant=run_spec.quant,
+            status="skipped",
+            error=reason,
+        )
+
+    def track_model_uses(self, runs: list[CampaignRunSpec]) -> None:
+        """Record how many pending runs use each model file."""
+        with self._repo_lock:
+            self._file_uses = Counter(model_file_key(r) for r in runs if r.repo_id)
+
+    def _hold_model(self, run_spec: CampaignRunSpec) -> None:
+        """Mark a run's repository as in use."""
+        if run_spec.repo_id:
+            with self._repo_lock:
+                self._repo_active[run_spec.repo_id] += 1
+
+    def _drop_hold(self, run_spec: CampaignRunSpec) -> None:
+        """Undo :meth:`_hold_model` without considering cleanup."""
+        if run_spec.repo_id:
+            with self._repo_lock:
+                self._repo_active[run_spec.repo_id] -= 1
+
+    def _release_model(self, run_spec: CampaignRunSpec, cleanup: bool) -> None:
+        """Drop a finished run's hold on its model, removing it if unused.
+
+        The model is kept while a pending run needs the same file or
+        another in-flight run uses the same repository.
+        """
+        if not run_spec.repo_id:
+            return
+        with self._repo_lock:
+            key = model_file_key(run_spec)
+            self._file_uses[key] -= 1
+            self._repo_active[run_spec.repo_id] -= 1
+            unused = (
+                self._file_uses[key] <= 0 and self._repo_active[run_spec.repo_id] <= 0
+            )
+        if unused and cleanup:
+            self._cleanup_model(run_spec.repo_id)
+
     def _expand_runs(self, planned: list[CampaignRunSpec]) -> list[CampaignRunSpec]:
         """Expand discovery placeholders into concrete runs.
 
@@ -310,6 +399,7 @@ class CampaignRunner:
         name and model parameter count for size-based skip rules.
         """
         expanded: list[CampaignRunSpec] = []
+        cache = self.discovery_cache
 
         # Build a lookup from model name to params string
         model_params: dict[str, str] = {m.name: m.params for m in self.config.models}
@@ -318,7 +408,7 @@ class CampaignRunner:
             params_b = parse_params(model_params.get(run.model_name, ""))
 
             if run.quant == "__discover_gguf__" and run.repo_id:
-                quants = discover_gguf_quants(run.repo_id)
+                quants = discover_gguf_quants(run.repo_id, cache=cache)
                 quants = filter_quants(
                     quants,
                     skip_patterns=self.config.quant_filter.skip_patterns,
@@ -340,7 +430,7 @@ class CampaignRunner:
                     )
 
             elif run.quant == "__discover_ollama__" and run.repo_id:
-                tags = discover_ollama_tags(run.repo_id)
+                tags = discover_ollama_tags(run.repo_id, cache=cache)
                 for tag in tags:
                     quant = tag.split(":")[-1] if ":" in tag else tag
                     est_size = estimate_quant_size_gb(params_b, quant)
@@ -366,6 +456,26 @@ class CampaignRunner:
 
         return expanded
 
+    def _make_discovery_cache(self) -> DiscoveryCache | None:
+        """Build the discovery cache, seeding it from a mirror if configured.
+
+        Only keys missing from the cache are seeded here, so starting a
+        campaign never resets the age of existing entries; ``kitt campaign
+        seed-cache`` refreshes them explicitly.
+        """
+        discovery = self.config.discovery
+        if not (discovery.cache or discovery.offline):
+            return None
+
+        cache = DiscoveryCache(
+            ttl_s=discovery.ttl_hours * 3600, offline=discovery.offline
+        )
+        if discovery.mirror_dir:
+            cache.seed_from_mirror(
+                Path(discovery.mirror_dir).expanduser(), overwrite=False
+            )
+        return cache
+
     def _register_runs(self, state: CampaignState, runs: list[CampaignRunSpec]) -> None:
         """Register all planned runs in state (skipping already-registered)."""
         existing_keys = {r.key for r in state.runs}
@@ -462,9 +572,42 @@ class CampaignRunner:
 
         return find_model_path(run_spec.repo_id, run_spec.include_pattern)  # type: ignore[arg-type]
 
-    def _run_benchmark(self, model_path: str, engine: str, suite: str) -> str:
-        """Run a KITT benchmark and return the output directory."""
+    def _run_benchmark(
+        self,
+        model_path: str,
+        engine: str,
+        suite: str,
+        slot: "GPUSlot | None" = None,
+        engine_config: dict[str, Any] | None = None,
+    ) -> str:
+        """Run a KITT benchmark and return the output directory.
+
+        Runs in-process by default; with ``subprocess_isolation`` each run
+        gets its own ``kitt run`` process instead, so an engine crash
+        cannot take down the campaign.
+        """
+        if self.config.subprocess_isolation:
+            return self._run_benchmark_subprocess(model_path, engine, suite, slot)
+
+        engine_config = dict(engine_config or {})
+        if slot is not None:
+            engine_config["gpu_devices"] = list(slot.devices)
+            engine_config["name_prefix"] = slot.container_prefix
+            engine_config["port"] = slot.port_for(engine)
+        logger.info(f"Running in-process: {engine} / {suite} on {model_path}")
+        return self.executor.run(model_path, engine, suite, engine_config)
+
+    def _run_benchmark_subprocess(
+        self,
+        model_path: str,
+        engine: str,
+        suite: str,
+        slot: "GPUSlot | None" = None,
+    ) -> str:
+        """Run a KITT benchmark via the kitt CLI and return the output directory."""
         args = ["kitt", "run", "-m", model_path, "-e", engine, "-s", suite]
+        if slot is not None:
+            args += ["--gpus", slot.devices_arg, "--port", str(slot.port_for(engine))]
         logger.info(f"Running: {' '.join(args)}")
 
         result = _run_subprocess_with_heartbeat(args, timeout=14400, label="kitt run")
@@ -538,8 +681,8 @@ class CampaignRunner:
         except Exception as e:
             logger.warning(f"Failed to clean up model via CLI: {e}")
 
-    def _cleanup_docker(self) -> None:
-        """Clean up leftover kitt Docker containers."""
+    def _cleanup_docker(self, name_filter: str = "kitt-") -> None:
+        """Clean up leftover kitt Docker containers matching name_filter."""
         try:
             result = subprocess.run(
                 [
@@ -547,7 +690,7 @@ class CampaignRunner:
                     "ps",
                     "-a",
                     "--filter",
-                    "name=kitt-",
+                    f"name={name_filter}",
                     "--format",
                     "{{.Names}}",
                 ],
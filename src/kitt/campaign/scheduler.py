@@ -6,6 +6,7 @@ import shutil
 from pathlib import Path
 
 from .models import CampaignConfig, CampaignRunSpec, DiskConfig, ResourceLimitsConfig
+from .resource_planner import ResourceEstimator, SchedulePlan, ScheduleSlot, pack_runs
 from .state_manager import CampaignState
 
 logger = logging.getLogger(__name__)
@@ -56,16 +57,40 @@ class CampaignScheduler:
     """Schedule campaign runs with disk space and resource awareness.
 
     Orders runs by estimated size and skips runs that would exceed
-    the configured disk reserve or model size limit.
+    the configured disk reserve or model size limit. ``build_plan`` packs
+    runs onto execution slots using VRAM and wall-time estimates.
     """
 
     def __init__(
         self,
         disk_config: DiskConfig,
         resource_limits: ResourceLimitsConfig | None = None,
+        estimator: ResourceEstimator | None = None,
     ) -> None:
         self.disk_config = disk_config
         self.resource_limits = resource_limits or ResourceLimitsConfig()
+        self._estimator = estimator
+
+    def estimator_for(self, runs: list[CampaignRunSpec]) -> ResourceEstimator:
+        """Estimator over past results relevant to ``runs``.
+
+        Reads the SQLite result store when it exists, otherwise local JSON
+        results (kitt-results/ and karr-*). Only the engine and suite
+        pairs in ``runs`` are queried.
+        """
+        if self._estimator is not None:
+            return self._estimator
+        try:
+            from kitt.storage.sqlite_store import DEFAULT_DB_PATH, SQLiteStore
+
+            if DEFAULT_DB_PATH.exists():
+                return ResourceEstimator.from_store(SQLiteStore(), runs)
+        except Exception as e:
+            logger.warning(f"Could not open the SQLite result store: {e}")
+
+        from kitt.storage.json_store import JsonStore
+
+        return ResourceEstimator.from_store(JsonStore(), runs)
 
     def plan_runs(self, config: CampaignConfig) -> list[CampaignRunSpec]:
         """Generate ordered list of runs from campaign config.
@@ -124,6 +149,22 @@ class CampaignScheduler:
         """Order runs by estimated size (smallest first) to maximize throughput."""
         return sorted(runs, key=lambda r: r.estimated_size_gb)
 
+    def build_plan(
+        self,
+        runs: list[CampaignRunSpec],
+        slots: list[ScheduleSlot] | None = None,
+    ) -> SchedulePlan:
+        """Pack runs onto slots and predict the campaign makespan.
+
+        With no slots, plans sequential execution on a single slot, which
+        still groups runs that share a model file or engine.
+        """
+        plan = pack_runs(
+            runs, slots or [ScheduleSlot(name="local")], self.estimator_for(runs)
+        )
+        logger.info(f"Schedule: {plan.summary()}")
+        return plan
+
     def filter_completed(
         self, runs: list[CampaignRunSpec], state: CampaignState
     ) -> list[CampaignRunSpec]:
@@ -4,6 +4,7 @@ import json
 import logging
 import os
 import tempfile
+import threading
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -11,6 +12,8 @@ from typing import Any
 
 logger = logging.getLogger(__name__)
 
+_DONE_STATUSES = ("success", "failed", "skipped")
+
 
 @dataclass
 class RunState:
@@ -41,12 +44,27 @@ class CampaignState:
     completed_at: str = ""
     status: str = "running"  # "running", "completed", "failed", "paused"
     runs: list[RunState] = field(default_factory=list)
+    _index: dict[str, RunState] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _indexed: list[RunState] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def get_run(self, key: str) -> RunState | None:
+        """Look up a run by key in O(1).
+
+        The index is rebuilt when ``runs`` is replaced or grows, so runs
+        may still be appended to the list directly.
+        """
+        if self._indexed is not self.runs or len(self._index) != len(self.runs):
+            self._index = {r.key: r for r in self.runs}
+            self._indexed = self.runs
+        return self._index.get(key)
 
     @property
     def completed_keys(self) -> set:
-        return {
-            r.key for r in self.runs if r.status in ("success", "failed", "skipped")
-        }
+        return {r.key for r in self.runs if r.status in _DONE_STATUSES}
 
     @property
     def total(self) -> int:
@@ -70,19 +88,36 @@ class CampaignState:
 
 
 class CampaignStateManager:
-    """Persist campaign state to disk with atomic writes.
+    """Persist campaign state to disk as a snapshot plus a journal.
 
     Follows the CheckpointManager pattern — stores JSON state files
     in ~/.kitt/campaigns/ with atomic write-then-rename for safety.
+    Run transitions are appended to ``<id>.journal`` (one JSON line each)
+    instead of rewriting the snapshot, and folded into the snapshot every
+    ``compact_every`` records and on every explicit ``save``. Loading
+    replays the journal over the snapshot.
+
+    State updates are serialized with a lock so concurrent runners (e.g.
+    one per GPU) can share a manager.
     """
 
-    def __init__(self, campaigns_dir: Path | None = None) -> None:
+    def __init__(
+        self,
+        campaigns_dir: Path | None = None,
+        compact_every: int = 200,
+    ) -> None:
         self.campaigns_dir = campaigns_dir or (Path.home() / ".kitt" / "campaigns")
         self.campaigns_dir.mkdir(parents=True, exist_ok=True)
+        self.compact_every = compact_every
+        self._lock = threading.RLock()
+        self._journal_records: dict[str, int] = {}
 
     def _state_file(self, campaign_id: str) -> Path:
         return self.campaigns_dir / f"{campaign_id}.json"
 
+    def _journal_file(self, campaign_id: str) -> Path:
+        return self.campaigns_dir / f"{campaign_id}.journal"
+
     def create(self, campaign_id: str, campaign_name: str) -> CampaignState:
         """Create a new campaign state."""
         state = CampaignState(
@@ -94,7 +129,7 @@ class CampaignStateManager:
         return state
 
     def save(self, state: CampaignState) -> None:
-        """Atomically save campaign state to disk."""
+        """Atomically save a campaign snapshot to disk and reset its journal."""
         state_file = self._state_file(state.campaign_id)
         data = {
             "campaign_id": state.campaign_id,
@@ -106,22 +141,41 @@ class CampaignStateManager:
         }
 
         # Atomic write: write to temp file, then rename
-        try:
-            fd, tmp_path = tempfile.mkstemp(dir=self.campaigns_dir, suffix=".tmp")
+        with self._lock:
             try:
-                os.fchmod(fd, 0o600)
-                with open(fd, "w") as f:
-                    json.dump(data, f, indent=2)
-                Path(tmp_path).replace(state_file)
-            except Exception:
-                Path(tmp_path).unlink(missing_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=self.campaigns_dir, suffix=".tmp")
+                try:
+                    os.fchmod(fd, 0o600)
+                    with open(fd, "w") as f:
+                        json.dump(data, f, indent=2)
+                    Path(tmp_path).replace(state_file)
+                except Exception:
+                    Path(tmp_path).unlink(missing_ok=True)
+                    raise
+            except Exception as e:
+                logger.error(f"Failed to save campaign state: {e}")
                 raise
-        except Exception as e:
-            logger.error(f"Failed to save campaign state: {e}")
-            raise
+
+            # The snapshot now covers every journaled transition
+            self._journal_file(state.campaign_id).unlink(missing_ok=True)
+            self._journal_records[state.campaign_id] = 0
 
     def load(self, campaign_id: str) -> CampaignState | None:
-        """Load campaign state from disk."""
+        """Load campaign state from disk and continue its journal."""
+        loaded = self._read(campaign_id)
+        if loaded is None:
+            return None
+        state, records = loaded
+        self._journal_records[campaign_id] = records
+        return state
+
+    def _read(self, campaign_id: str) -> tuple[CampaignState, int] | None:
+        """Read a snapshot with its journal applied, without adopting it.
+
+        Returns:
+            The state and the number of journal records applied, or None
+            when there is no readable snapshot.
+        """
         state_file = self._state_file(campaign_id)
         if not state_file.exists():
             return None
@@ -136,33 +190,71 @@ class CampaignStateManager:
                 status=data.get("status", "running"),
                 runs=[RunState(**r) for r in data.get("runs", [])],
             )
-            return state
         except Exception as e:
             logger.error(f"Failed to load campaign state: {e}")
             return None
 
+        return state, self._replay(state)
+
+    def _replay(self, state: CampaignState) -> int:
+        """Apply journaled run records to a loaded snapshot.
+
+        Returns:
+            Number of records applied.
+        """
+        journal = self._journal_file(state.campaign_id)
+        if not journal.exists():
+            return 0
+
+        applied = 0
+        with open(journal) as f:
+            for line in f:
+                try:
+                    record = RunState(**json.loads(line))
+                except (ValueError, TypeError):
+                    # A torn final write from a crash — ignore it
+                    logger.warning(f"Skipping unreadable journal record in {journal}")
+                    continue
+                existing = state.get_run(record.key)
+                if existing is None:
+                    state.runs.append(record)
+                else:
+                    existing.__dict__.update(record.__dict__)
+                applied += 1
+        return applied
+
+    def _append(self, state: CampaignState, run: RunState) -> None:
+        """Journal one run transition, compacting when the journal is long."""
+        campaign_id = state.campaign_id
+        with open(self._journal_file(campaign_id), "a") as f:
+            f.write(json.dumps(asdict(run)) + "\n")
+
+        records = self._journal_records.get(campaign_id, 0) + 1
+        self._journal_records[campaign_id] = records
+        if records >= self.compact_every:
+            self.save(state)
+
     def list_campaigns(self) -> list[dict[str, Any]]:
         """List all campaigns with summary info."""
         campaigns = []
         for state_file in sorted(self.campaigns_dir.glob("*.json")):
-            try:
-                data = json.loads(state_file.read_text())
-                runs = data.get("runs", [])
-                campaigns.append(
-                    {
-                        "campaign_id": data["campaign_id"],
-                        "campaign_name": data["campaign_name"],
-                        "status": data.get("status", "unknown"),
-                        "started_at": data.get("started_at", ""),
-                        "total_runs": len(runs),
-                        "succeeded": sum(
-                            1 for r in runs if r.get("status") == "success"
-                        ),
-                        "failed": sum(1 for r in runs if r.get("status") == "failed"),
-                    }
-                )
-            except Exception as e:
-                logger.warning(f"Could not read {state_file}: {e}")
+            # Read-only: journal counters of loaded campaigns stay untouched
+            loaded = self._read(state_file.stem)
+            if loaded is None:
+                logger.warning(f"Could not read {state_file}")
+                continue
+            state = loaded[0]
+            campaigns.append(
+                {
+                    "campaign_id": state.campaign_id,
+                    "campaign_name": state.campaign_name,
+                    "status": state.status,
+                    "started_at": state.started_at,
+                    "total_runs": state.total,
+                    "succeeded": state.succeeded,
+                    "failed": state.failed,
+                }
+            )
         return campaigns
 
     def update_run(
@@ -174,20 +266,23 @@ class CampaignStateManager:
         output_dir: str = "",
         error: str = "",
     ) -> None:
-        """Update a specific run's status and save."""
-        for run in state.runs:
-            if run.key == run_key:
-                run.status = status
-                run.duration_s = duration_s
-                run.output_dir = output_dir
-                run.error = error
-                if status == "running":
-                    run.started_at = datetime.now().isoformat()
-                elif status in ("success", "failed", "skipped"):
-                    run.completed_at = datetime.now().isoformat()
-                break
-        self.save(state)
+        """Update a specific run's status and journal the transition."""
+        with self._lock:
+            run = state.get_run(run_key)
+            if run is None:
+                logger.warning(f"Unknown run in campaign state: {run_key}")
+                return
+            run.status = status
+            run.duration_s = duration_s
+            run.output_dir = output_dir
+            run.error = error
+            if status == "running":
+                run.started_at = datetime.now().isoformat()
+            elif status in _DONE_STATUSES:
+                run.completed_at = datetime.now().isoformat()
+            self._append(state, run)
 
     def is_run_done(self, state: CampaignState, run_key: str) -> bool:
         """Check if a run has already completed (for resume)."""
-        return run_key in state.completed_keys
+        run = state.get_run(run_key)
+        return run is not None and run.status in _DONE_STATUSES
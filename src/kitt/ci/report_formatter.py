@@ -103,6 +103,38 @@ class CIReportFormatter:
 
         return "\n".join(lines)
 
+    def format_change_points(self, change_points: list[Any]) -> str:
+        """Format history-based regressions as Markdown.
+
+        Args:
+            change_points: ChangePoint list from HistoryRegressionDetector.
+
+        Returns:
+            Markdown string.
+        """
+        if not change_points:
+            return "No regressions detected in result history."
+
+        lines = ["### Regressions in History", ""]
+        lines.append(
+            "| Model | Engine | Benchmark | Metric | Since | Before | After "
+            "| Change | Kind | Severity |"
+        )
+        lines.append(
+            "|-------|--------|-----------|--------|-------|--------|-------"
+            "|--------|------|----------|"
+        )
+
+        for c in change_points:
+            lines.append(
+                f"| {c.model} | {c.engine} | {c.benchmark} | {c.metric} | "
+                f"{c.timestamp} ({c.runs_since} runs) | {c.baseline_value:.2f} | "
+                f"{c.current_value:.2f} | {c.delta_pct:.1f}% | {c.kind} | "
+                f"{c.severity} |"
+            )
+
+        return "\n".join(lines)
+
     def _format_regression(
         self,
         current: dict[str, Any],
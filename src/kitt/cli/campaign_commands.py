@@ -24,6 +24,8 @@ def campaign():
 @click.option("--campaign-id", default=None, help="Explicit campaign ID (for resume)")
 def run(config_path, resume, dry_run, campaign_id):
     """Run a benchmark campaign from a YAML config file."""
+    from kitt.campaign.multi_gpu_runner import MultiGPUCampaignRunner
+    from kitt.campaign.parallel_runner import ParallelCampaignRunner
     from kitt.campaign.runner import CampaignRunner
     from kitt.config.loader import load_campaign_config
 
@@ -37,7 +39,15 @@ def run(config_path, resume, dry_run, campaign_id):
         console.print(f"  Resuming: {campaign_id or 'latest'}")
     console.print()
 
-    runner = CampaignRunner(config, dry_run=dry_run)
+    if config.multi_gpu.enabled:
+        runner = MultiGPUCampaignRunner(config, dry_run=dry_run)
+        slots = ", ".join(f"[{s.devices_arg}]" for s in runner.slots)
+        console.print(f"  GPU slots: {slots}")
+    elif config.parallel:
+        runner = ParallelCampaignRunner(config, dry_run=dry_run)
+        console.print(f"  Prefetch depth: {config.prefetch.depth}")
+    else:
+        runner = CampaignRunner(config, dry_run=dry_run)
     result = runner.run(campaign_id=campaign_id, resume=resume)
 
     # Summary
@@ -51,6 +61,12 @@ def run(config_path, resume, dry_run, campaign_id):
         console.print(f"  Skipped:     [yellow]{result.skipped}[/yellow]")
     hours = result.total_duration_s / 3600
     console.print(f"  Duration:    {hours:.1f}h")
+    if result.predicted_makespan_s:
+        predicted = result.predicted_makespan_s / 3600
+        console.print(f"  Predicted:   {predicted:.1f}h")
+    if result.gpu_idle_s:
+        idle = result.gpu_idle_s / 60
+        console.print(f"  GPU idle:    {idle:.0f}m waiting for downloads")
 
     if result.failed > 0:
         console.print()
@@ -214,6 +230,16 @@ def schedule(config_path, cron, schedule_id):
         raise SystemExit(1)
 
 
+@campaign.command("seed-cache")
+@click.argument("mirror_dir", type=click.Path(exists=True, file_okay=False))
+def seed_cache(mirror_dir):
+    """Pre-populate the discovery cache from a local model mirror."""
+    from kitt.campaign.discovery_cache import DiscoveryCache
+
+    seeded = DiscoveryCache().seed_from_mirror(Path(mirror_dir))
+    console.print(f"[green]Seeded {seeded} discovery entries[/green] from {mirror_dir}")
+
+
 @campaign.command("unschedule")
 @click.argument("schedule_id")
 def unschedule(schedule_id):
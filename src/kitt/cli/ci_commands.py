@@ -71,3 +71,60 @@ def report(results_dir, baseline_dir, github_token, repo, pr, output):
             raise SystemExit(1)
     else:
         console.print(report_md)
+
+
+@ci.command()
+@click.option(
+    "--db-path",
+    type=click.Path(exists=True),
+    default=None,
+    help="SQLite database path (default: ~/.kitt/kitt.db)",
+)
+@click.option("--model", default=None, help="Only scan this model")
+@click.option("--engine", default=None, help="Only scan this engine")
+@click.option(
+    "--z-threshold",
+    type=float,
+    default=4.0,
+    show_default=True,
+    help="Minimum robust z-score for a shift to count",
+)
+@click.option(
+    "--fail-on",
+    type=click.Choice(["critical", "warning", "none"]),
+    default="critical",
+    show_default=True,
+    help="Exit non-zero when a regression of this severity is found",
+)
+@click.option(
+    "--output", "-o", default=None, help="Write report to file instead of stdout"
+)
+def regressions(db_path, model, engine, z_threshold, fail_on, output):
+    """Scan the full result history for statistically significant regressions."""
+    from kitt.ci.report_formatter import CIReportFormatter
+    from kitt.reporters.regression import HistoryRegressionDetector
+    from kitt.storage.sqlite_store import SQLiteStore
+
+    filters = {}
+    if model:
+        filters["model"] = model
+    if engine:
+        filters["engine"] = engine
+
+    store = SQLiteStore(db_path=Path(db_path) if db_path else None)
+    try:
+        detector = HistoryRegressionDetector(z_threshold=z_threshold)
+        found = detector.scan(store, filters=filters or None)
+    finally:
+        store.close()
+
+    report_md = CIReportFormatter().format_change_points(found)
+    if output:
+        Path(output).write_text(report_md)
+        console.print(f"Report saved to [green]{output}[/green]")
+    else:
+        console.print(report_md)
+
+    failing = {"critical": {"critical"}, "warning": {"critical", "warning"}}
+    if any(c.severity in failing.get(fail_on, set()) for c in found):
+        raise SystemExit(1)
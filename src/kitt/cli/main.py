@@ -52,12 +52,15 @@ cli.add_command(stack)
 
 @cli.command()
 @click.option("--verbose", is_flag=True, help="Show detailed hardware info")
-def fingerprint(verbose):
+@click.option(
+    "--refresh", is_flag=True, help="Re-run hardware probes instead of using the cache"
+)
+def fingerprint(verbose, refresh):
     """Display hardware fingerprint for this system."""
     from kitt.hardware.fingerprint import HardwareFingerprint
 
+    info = HardwareFingerprint.detect_system(use_cache=not refresh)
     if verbose:
-        info = HardwareFingerprint.detect_system()
         console.print()
         console.print("[bold]System Information[/bold]")
         console.print(f"  Environment: {info.environment_type}")
@@ -124,6 +127,11 @@ def compare(runs):
 @click.option("--tls-key", type=click.Path(), help="Path to TLS private key")
 @click.option("--tls-ca", type=click.Path(), help="Path to CA certificate")
 @click.option("--auth-token", help="Bearer token for API auth")
+@click.option("--dev-server", is_flag=True, help="Use the Flask development server")
+@click.option("--threads", default=16, show_default=True, help="Request worker threads")
+@click.option(
+    "--workers", default=1, show_default=True, help="Server processes (uvicorn only)"
+)
 def web(
     port,
     host,
@@ -135,8 +143,15 @@ def web(
     tls_key,
     tls_ca,
     auth_token,
+    dev_server,
+    threads,
+    workers,
 ):
-    """Launch web dashboard for viewing results."""
+    """Launch web dashboard for viewing results.
+
+    Serves with uvicorn when it and a2wsgi are installed (SSE streams are
+    held on the event loop), otherwise with the Flask development server.
+    """
     try:
         from kitt.web.app import create_app
     except ImportError:
@@ -144,6 +159,13 @@ def web(
         console.print("Install with: pip install kitt[web]")
         raise SystemExit(1) from None
 
+    from kitt.web.server import production_server_available, serve
+
+    if workers > 1 and not production_server_available():
+        console.print("[red]--workers needs uvicorn and a2wsgi.[/red]")
+        console.print("Install with: pip install 'kitt[web]'")
+        raise SystemExit(1)
+
     app = create_app(
         results_dir=results_dir,
         insecure=insecure,
@@ -176,6 +198,15 @@ def web(
             )
             console.print("Install with: pip install 'kitt[web]'")
 
+    production = not (dev_server or debug)
+    if production and not production_server_available():
+        production = False
+        console.print(
+            "[yellow]uvicorn/a2wsgi not installed — "
+            "using the Flask development server[/yellow]"
+        )
+        console.print("Install with: pip install 'kitt[web]'")
+
     console.print("[bold]KITT Web Dashboard[/bold]")
     console.print(f"  URL: {scheme}://{host}:{port}")
     console.print(f"  Results: {results_dir or 'current directory'}")
@@ -183,9 +214,40 @@ def web(
         console.print("  Mode: legacy (read-only)")
     if insecure:
         console.print("  [yellow]WARNING: Running without TLS (--insecure)[/yellow]")
+    if not production or legacy:
+        workers = 1
+    if workers > 1:
+        import os
+        from pathlib import Path
+
+        # Each worker process rebuilds the app from the environment
+        if results_dir:
+            os.environ["KITT_RESULTS_DIR"] = str(Path(results_dir).resolve())
+        if auth_token:
+            os.environ["KITT_AUTH_TOKEN"] = auth_token
+        if insecure:
+            os.environ["KITT_WEB_INSECURE"] = "1"
+        # Workers share events through the database
+        os.environ.setdefault("KITT_EVENT_BUS", "sqlite")
+
+    console.print(
+        f"  Server: uvicorn ({workers} x {threads} threads)"
+        if production
+        else "  Server: Flask dev"
+    )
     console.print()
 
-    app.run(host=host, port=port, debug=debug, ssl_context=ssl_ctx)
+    if production:
+        serve(
+            app,
+            host=host,
+            port=port,
+            ssl_context=ssl_ctx,
+            threads=threads,
+            workers=workers,
+        )
+    else:
+        app.run(host=host, port=port, debug=debug, ssl_context=ssl_ctx)
 
 
 if __name__ == "__main__":
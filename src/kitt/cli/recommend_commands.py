@@ -23,6 +23,11 @@ logger = logging.getLogger(__name__)
     "--sort", type=click.Choice(["score", "throughput", "accuracy"]), default="score"
 )
 @click.option("--pareto", is_flag=True, help="Show only Pareto-optimal models")
+@click.option(
+    "--pareto-memory",
+    is_flag=True,
+    help="Also treat lower peak VRAM as better on the Pareto frontier",
+)
 @click.option("--limit", default=10, help="Number of recommendations")
 def recommend(
     max_vram,
@@ -33,6 +38,7 @@ def recommend(
     engine,
     sort,
     pareto,
+    pareto_memory,
     limit,
 ):
     """Recommend models based on benchmark history."""
@@ -65,8 +71,10 @@ def recommend(
 
     recommender = ModelRecommender(store)
 
-    if pareto:
-        results = recommender.pareto_frontier(constraints=constraints)
+    if pareto or pareto_memory:
+        results = recommender.pareto_frontier(
+            constraints=constraints, include_memory=pareto_memory
+        )
         title = "Pareto-Optimal Models"
     else:
         results = recommender.recommend(
@@ -82,6 +90,8 @@ def recommend(
     table.add_column("Rank", style="dim")
     table.add_column("Model", style="cyan")
     table.add_column("Engine")
+    table.add_column("Quant")
+    table.add_column("Hardware")
     table.add_column("Score", justify="right")
     table.add_column("Accuracy", justify="right")
     table.add_column("Throughput", justify="right")
@@ -91,6 +101,8 @@ def recommend(
             str(i),
             r.get("model", "?"),
             r.get("engine", "?"),
+            r.get("quant") or "-",
+            r.get("hardware_class") or "-",
             f"{r.get('score', 0):.3f}",
             f"{r.get('accuracy', 0):.3f}",
             f"{r.get('throughput', 0):.1f} tps",
@@ -1,8 +1,6 @@
 """kitt run - Execute benchmarks against a model."""
 
-import json
 import logging
-from dataclasses import asdict
 from datetime import datetime
 from pathlib import Path
 
@@ -52,6 +50,19 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Override number of runs per benchmark",
 )
+@click.option(
+    "--target-ci",
+    type=float,
+    default=None,
+    help="Repeat each benchmark until its 95% CI is within this relative "
+    "half-width (e.g. 0.05), instead of a fixed run count",
+)
+@click.option(
+    "--time-budget",
+    type=float,
+    default=None,
+    help="Per-benchmark time budget in seconds for --target-ci sampling",
+)
 @click.option(
     "--config",
     type=click.Path(exists=True),
@@ -73,18 +84,40 @@ logger = logging.getLogger(__name__)
     default=None,
     help="Engine execution mode (docker or native). Uses engine default if not set.",
 )
+@click.option(
+    "--gpus",
+    default=None,
+    help="Comma-separated GPU indices to pin the engine to (e.g. '2,3')",
+)
+@click.option(
+    "--port",
+    type=int,
+    default=None,
+    help="Host port for the engine server (default: engine's default port)",
+)
 def run(
-    model, engine, suite, output, skip_warmup, runs, config, store_karr, auto_pull, mode
+    model,
+    engine,
+    suite,
+    output,
+    skip_warmup,
+    runs,
+    target_ci,
+    time_budget,
+    config,
+    store_karr,
+    auto_pull,
+    mode,
+    gpus,
+    port,
 ):
     """Run benchmarks against a model using a specified engine."""
     from kitt.benchmarks.registry import BenchmarkRegistry
-    from kitt.config.loader import load_suite_config
+    from kitt.config.loader import find_suite_config, load_suite_config
     from kitt.engines.registry import EngineRegistry
     from kitt.hardware.fingerprint import HardwareFingerprint
-    from kitt.reporters.json_reporter import save_json_report
-    from kitt.reporters.markdown import generate_summary
-    from kitt.runners.suite import SuiteRunner
-    from kitt.utils.compression import ResultCompression
+    from kitt.runners.run_output import default_output_dir, write_run_outputs
+    from kitt.runners.suite import SuiteRunner, suite_run_config
 
     # Discover engines
     EngineRegistry.auto_discover()
@@ -131,7 +164,7 @@ def run(
     console.print()
 
     # Load suite config
-    suite_config_path = _find_suite_config(suite)
+    suite_config_path = find_suite_config(suite)
     suite_cfg = None
     if suite_config_path:
         suite_cfg = load_suite_config(suite_config_path)
@@ -164,6 +197,17 @@ def run(
 
     if mode:
         engine_config["mode"] = mode
+    if gpus:
+        try:
+            gpu_devices = [int(g) for g in gpus.split(",") if g.strip()]
+        except ValueError as e:
+            console.print(f"[red]Invalid --gpus value: {gpus}[/red]")
+            raise SystemExit(1) from e
+        engine_config["gpu_devices"] = gpu_devices
+        # Distinct container names so concurrent instances can be told apart
+        engine_config["name_prefix"] = "kitt-gpu" + "-".join(map(str, gpu_devices))
+    if port:
+        engine_config["port"] = port
 
     try:
         engine_instance.initialize(model, engine_config)
@@ -194,12 +238,19 @@ def run(
         engine_instance.cleanup()
         raise SystemExit(1)
 
-    # Build global config
-    global_config = {}
+    # Build global config: the suite file's settings, then CLI flags
+    global_config, test_overrides = suite_run_config(suite_cfg)
     if skip_warmup:
-        global_config["warmup"] = {"enabled": False}
+        global_config["warmup"] = {**global_config.get("warmup", {}), "enabled": False}
     if runs is not None:
         global_config["runs"] = runs
+    if target_ci is not None:
+        adaptive: dict = {**global_config.get("adaptive", {}), "relative_ci": target_ci}
+        if runs is not None:
+            adaptive["max_runs"] = runs
+        if time_budget is not None:
+            adaptive["time_budget_s"] = time_budget
+        global_config["adaptive"] = adaptive
 
     # Run suite
     console.print(
@@ -211,6 +262,7 @@ def run(
         suite_name=suite,
         benchmarks=benchmarks,
         global_config=global_config,
+        test_overrides=test_overrides,
     )
 
     # Cleanup engine
@@ -220,67 +272,31 @@ def run(
     timestamp = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     model_name_clean = Path(model).name if "/" in model or "\\" in model else model
     output_dir = (
-        Path(output)
-        if output
-        else Path.home() / ".kitt" / "results" / model_name_clean / engine / timestamp
-    )
-    output_dir.mkdir(parents=True, exist_ok=True)
-
-    # Save JSON metrics report
-    save_json_report(
-        suite_result,
-        output_dir / "metrics.json",
-        system_info=system_info,
-        engine_name=engine,
-        model_name=model,
+        Path(output) if output else default_output_dir(model, engine, timestamp)
     )
 
-    # Save hardware info separately
-    hardware_data = asdict(system_info)
-    with open(output_dir / "hardware.json", "w") as f:
-        json.dump(hardware_data, f, indent=2)
-
-    # Save configuration used
+    # Save metrics, hardware info, configuration used, summary and outputs
     run_config = {
         "model": model,
         "engine": engine,
         "suite": suite,
         "skip_warmup": skip_warmup,
         "runs_override": runs,
+        "target_ci": target_ci,
+        "gpus": gpus,
         "timestamp": timestamp,
         "kitt_version": __version__,
     }
-    with open(output_dir / "config.json", "w") as f:
-        json.dump(run_config, f, indent=2)
-
-    # Save markdown summary
-    summary = generate_summary(
+    chunk_count = write_run_outputs(
         suite_result,
+        output_dir,
         system_info=system_info,
         engine_name=engine,
         model_name=model,
+        run_config=run_config,
     )
-    (output_dir / "summary.md").write_text(summary)
-
-    # Compress and save outputs
-    all_outputs = []
-    for result in suite_result.results:
-        for output_item in result.outputs:
-            all_outputs.append(
-                {
-                    "benchmark": result.test_name,
-                    "run_number": result.run_number,
-                    **output_item,
-                }
-            )
-
-    if all_outputs:
-        outputs_dir = output_dir / "outputs"
-        outputs_dir.mkdir(exist_ok=True)
-        chunk_files = ResultCompression.save_outputs(
-            all_outputs, outputs_dir / "results"
-        )
-        console.print(f"  Outputs compressed: {len(chunk_files)} chunk(s)")
+    if chunk_count:
+        console.print(f"  Outputs compressed: {chunk_count} chunk(s)")
 
     # Store in KARR repo if requested
     if store_karr:
@@ -329,21 +345,3 @@ def _store_in_karr(
 
     KARRRepoManager.store_results(karr_path, model_name, engine_name, timestamp, files)
     console.print(f"[green]Results stored in KARR: {karr_path}[/green]")
-
-
-def _find_suite_config(suite_name: str) -> Path | None:
-    """Find suite configuration file."""
-    # Check standard locations
-    search_paths = [
-        Path("configs/suites") / f"{suite_name}.yaml",
-        Path(__file__).parent.parent.parent.parent
-        / "configs"
-        / "suites"
-        / f"{suite_name}.yaml",
-    ]
-
-    for path in search_paths:
-        if path.exists():
-            return path
-
-    return None
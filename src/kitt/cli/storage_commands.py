@@ -105,6 +105,62 @@ def export_result(result_id, output, db_path):
     store.close()
 
 
+@storage.command("export-table")
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    required=True,
+    help="Output .parquet or .csv path",
+)
+@click.option("--db-path", type=click.Path(), default=None)
+@click.option("--model", default=None, help="Filter by model")
+@click.option("--engine", default=None, help="Filter by engine")
+def export_table(output, db_path, model, engine):
+    """Export all stored results as one flat CSV or Parquet table."""
+    from kitt.reporters.export import export_store
+    from kitt.storage.sqlite_store import SQLiteStore
+
+    path = Path(db_path) if db_path else None
+    store = SQLiteStore(db_path=path)
+
+    filters = {}
+    if model:
+        filters["model"] = model
+    if engine:
+        filters["engine"] = engine
+
+    try:
+        count = export_store(store, Path(output), filters=filters or None)
+    except (ImportError, ValueError) as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+    finally:
+        store.close()
+    console.print(f"[green]Exported {count} row(s) to {output}[/green]")
+
+
+@storage.command("export-outputs")
+@click.argument("run_dir", type=click.Path(exists=True, file_okay=False))
+@click.option(
+    "--output",
+    "-o",
+    type=click.Path(),
+    required=True,
+    help="Output .parquet or .csv path",
+)
+def export_outputs(run_dir, output):
+    """Export a run's per-iteration outputs as a CSV or Parquet table."""
+    from kitt.reporters.export import export_rows, iter_output_rows
+
+    try:
+        count = export_rows(iter_output_rows(Path(run_dir)), Path(output))
+    except (ImportError, ValueError) as e:
+        console.print(f"[red]{e}[/red]")
+        raise SystemExit(1) from None
+    console.print(f"[green]Exported {count} row(s) to {output}[/green]")
+
+
 @storage.command("list")
 @click.option("--db-path", type=click.Path(), default=None)
 @click.option("--model", default=None, help="Filter by model")
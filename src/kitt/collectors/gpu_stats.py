@@ -132,10 +132,21 @@ class GPUMonitor:
 
 
 class GPUMemoryTracker:
-    """Context manager for tracking GPU memory during a code block."""
-
-    def __init__(self, gpu_index: int = 0, sample_interval_ms: int = 100) -> None:
-        self.gpu_index = gpu_index
+    """Context manager for tracking GPU memory during a code block.
+
+    When ``gpu_indices`` names several devices (an engine instance pinned
+    to a GPU set), each sample sums memory across exactly those devices so
+    usage is attributed to the instance rather than the whole host.
+    """
+
+    def __init__(
+        self,
+        gpu_index: int = 0,
+        sample_interval_ms: int = 100,
+        gpu_indices: list[int] | None = None,
+    ) -> None:
+        self.gpu_indices = list(gpu_indices) if gpu_indices else [gpu_index]
+        self.gpu_index = self.gpu_indices[0]
         self.sample_interval_ms = sample_interval_ms
         self.monitor = GPUMonitor()
         self.samples: list[GPUMemoryStats] = []
@@ -151,7 +162,7 @@ class GPUMemoryTracker:
 
         def sample_loop() -> None:
             while self._stop_event is not None and not self._stop_event.is_set():
-                stats = self.monitor.get_memory_stats(self.gpu_index)
+                stats = self._sample()
                 if stats:
                     self.samples.append(stats)
                 time.sleep(self.sample_interval_ms / 1000.0)
@@ -160,6 +171,22 @@ class GPUMemoryTracker:
         self._thread.start()
         return self
 
+    def _sample(self) -> GPUMemoryStats | None:
+        """Take one sample across the tracked devices."""
+        if len(self.gpu_indices) == 1:
+            return self.monitor.get_memory_stats(self.gpu_index)
+
+        per_device = [self.monitor.get_memory_stats(i) for i in self.gpu_indices]
+        stats = [s for s in per_device if s is not None]
+        if not stats:
+            return None
+        return GPUMemoryStats(
+            used_mb=sum(s.used_mb for s in stats),
+            free_mb=sum(s.free_mb for s in stats),
+            total_mb=sum(s.total_mb for s in stats),
+            utilization_percent=sum(s.utilization_percent for s in stats) / len(stats),
+        )
+
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
         """Stop monitoring."""
         if self._stop_event:
@@ -62,6 +62,26 @@ def load_config(path: Path, model_class: type[T]) -> T:
         raise ConfigError(f"Configuration validation failed for {path}: {e}") from e
 
 
+def find_suite_config(suite_name: str) -> Path | None:
+    """Find a suite configuration file by name.
+
+    Looks in ./configs/suites first, then in the configs shipped with KITT.
+    """
+    search_paths = [
+        Path("configs/suites") / f"{suite_name}.yaml",
+        Path(__file__).parent.parent.parent.parent
+        / "configs"
+        / "suites"
+        / f"{suite_name}.yaml",
+    ]
+
+    for path in search_paths:
+        if path.exists():
+            return path
+
+    return None
+
+
 def load_test_config(path: Path) -> TestConfig:
     """Load a test configuration file."""
     return load_config(path, TestConfig)
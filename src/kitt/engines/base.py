@@ -41,6 +41,35 @@ class EngineDiagnostics:
     guidance: str | None = None
 
 
+def message_text(message: dict[str, Any]) -> str:
+    """Text of a chat message, joining the text parts of list content.
+
+    Raises:
+        ValueError: If the content has a non-text part, such as an image,
+            which a text-only prompt cannot carry.
+    """
+    content = message.get("content") or ""
+    if isinstance(content, list):
+        for part in content:
+            if part.get("type") != "text":
+                raise ValueError(
+                    f"Content part of type {part.get('type')!r} is not supported "
+                    "by a text-only chat prompt"
+                )
+        return "\n".join(part.get("text", "") for part in content)
+    return content
+
+
+def render_chat_prompt(messages: list[dict[str, Any]]) -> str:
+    """Render chat messages as a plain transcript ending in ``Assistant:``."""
+    lines = [
+        f"{message.get('role', 'user').capitalize()}: {message_text(message)}"
+        for message in messages
+    ]
+    lines.append("Assistant:")
+    return "\n".join(lines)
+
+
 class InferenceEngine(ABC):
     """Abstract base class for inference engines.
 
@@ -53,6 +82,10 @@ class InferenceEngine(ABC):
     _container_id: str | None = None
     _process: subprocess.Popen | None = None
     _mode: EngineMode | None = None
+    _gpu_devices: list[int] | None = None
+
+    # Whether generate_chat() forwards image content parts to the model
+    supports_image_input: bool = False
 
     @classmethod
     @abstractmethod
@@ -243,12 +276,35 @@ class InferenceEngine(ABC):
             guidance=f"Install {cls.name()} or add it to your PATH",
         )
 
+    def _configure_gpus(self, config: dict[str, Any]) -> None:
+        """Record the GPU set this instance is pinned to.
+
+        ``config["gpu_devices"]`` lists physical GPU indices. Unset means
+        the engine may use every GPU and metrics are taken from GPU 0.
+        """
+        devices = config.get("gpu_devices")
+        self._gpu_devices = [int(d) for d in devices] if devices else None
+
+    def _native_env(self, config: dict[str, Any]) -> dict[str, str]:
+        """Environment for a native process, restricted to the pinned GPUs."""
+        env = dict(config.get("env", {}))
+        if self._gpu_devices:
+            env["CUDA_VISIBLE_DEVICES"] = ",".join(str(d) for d in self._gpu_devices)
+        return env
+
+    def _gpu_tracker(self):
+        """GPU memory tracker covering the devices this instance runs on."""
+        from kitt.collectors.gpu_stats import GPUMemoryTracker
+
+        return GPUMemoryTracker(gpu_indices=self._gpu_devices or [0])
+
     @abstractmethod
     def initialize(self, model_path: str, config: dict[str, Any]) -> None:
         """Start the engine and wait for healthy.
 
         The ``config`` dict may include a ``mode`` key to override the
-        default execution mode (``"docker"`` or ``"native"``).
+        default execution mode (``"docker"`` or ``"native"``), and a
+        ``gpu_devices`` list to pin the instance to specific GPUs.
 
         Args:
             model_path: Path to model directory or model identifier.
@@ -279,6 +335,44 @@ class InferenceEngine(ABC):
             GenerationResult with output and metrics.
         """
 
+    def generate_chat(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        top_k: int = 50,
+        max_tokens: int = 2048,
+        **engine_specific_params: Any,
+    ) -> GenerationResult:
+        """Generate the next assistant message for a conversation.
+
+        Engines override this to send ``messages`` to their chat API, so
+        the model's own chat template is applied and the server can
+        reuse the cached prefix of the history. This fallback renders the
+        messages as a plain ``Role: content`` transcript and calls
+        :meth:`generate`; it raises ``ValueError`` on image content parts.
+        Engines that accept images set ``supports_image_input``.
+
+        Args:
+            messages: Chat messages (``{"role": ..., "content": ...}``).
+            temperature: Sampling temperature.
+            top_p: Nucleus sampling parameter.
+            top_k: Top-k sampling parameter.
+            max_tokens: Maximum tokens to generate.
+            **engine_specific_params: Engine-specific parameters.
+
+        Returns:
+            GenerationResult with the assistant reply and metrics.
+        """
+        return self.generate(
+            render_chat_prompt(messages),
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            max_tokens=max_tokens,
+            **engine_specific_params,
+        )
+
     def cleanup(self) -> None:
         """Stop the engine (Docker container or native process)."""
         if self._mode == EngineMode.NATIVE:
@@ -18,6 +18,7 @@ class ContainerConfig:
     port: int  # Host port (used with --network host, engine binds here)
     container_port: int  # Port inside container
     gpu: bool = True
+    gpu_devices: list[int] | None = None  # None = all GPUs
     volumes: dict[str, str] = field(default_factory=dict)  # host_path -> container_path
     env: dict[str, str] = field(default_factory=dict)
     extra_args: list[str] = field(default_factory=list)  # e.g. --shm-size=8g
@@ -97,12 +98,17 @@ class DockerManager:
             RuntimeError: If the container fails to start.
         """
         timestamp = int(time.time())
-        container_name = f"{config.name_prefix}-{timestamp}"
+        # Port suffix keeps names unique when several instances start at once
+        container_name = f"{config.name_prefix}-{timestamp}-{config.port}"
 
         cmd = ["docker", "run", "-d", "--network", "host", "--name", container_name]
 
         if config.gpu:
-            cmd.extend(["--gpus", "all"])
+            if config.gpu_devices:
+                devices = ",".join(str(d) for d in config.gpu_devices)
+                cmd.extend(["--gpus", f'"device={devices}"'])
+            else:
+                cmd.extend(["--gpus", "all"])
 
         for host_path, container_path in config.volumes.items():
             cmd.extend(["-v", f"{host_path}:{container_path}"])
@@ -52,6 +52,7 @@ class ExLlamaV2Engine(InferenceEngine):
         from .lifecycle import EngineMode
 
         self._mode = EngineMode.DOCKER
+        self._configure_gpus(config)
 
         from .docker_manager import ContainerConfig, DockerManager
 
@@ -66,7 +67,8 @@ class ExLlamaV2Engine(InferenceEngine):
             "--host",
             "0.0.0.0",
             "--port",
-            str(self.container_port()),
+            # Host networking: bind the requested host port directly
+            str(port),
         ]
 
         if "max_seq_len" in config:
@@ -87,9 +89,11 @@ class ExLlamaV2Engine(InferenceEngine):
                 if is_directory
                 else "/models"
             },
+            gpu_devices=self._gpu_devices,
             env=config.get("env", {}),
             extra_args=config.get("extra_args", []),
             command_args=cmd_args,
+            name_prefix=config.get("name_prefix", "kitt"),
         )
         self._container_id = DockerManager.run_container(container_cfg)
 
@@ -110,11 +114,9 @@ class ExLlamaV2Engine(InferenceEngine):
         **engine_specific_params: Any,
     ) -> GenerationResult:
         """Generate via OpenAI-compatible API."""
-        from kitt.collectors.gpu_stats import GPUMemoryTracker
-
         from .openai_compat import openai_generate, parse_openai_result
 
-        with GPUMemoryTracker(gpu_index=0) as tracker:
+        with self._gpu_tracker() as tracker:
             start = time.perf_counter()
             response = openai_generate(
                 self._base_url,
@@ -128,6 +130,32 @@ class ExLlamaV2Engine(InferenceEngine):
 
         return parse_openai_result(response, elapsed_ms, tracker)
 
+    def generate_chat(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        top_k: int = 50,
+        max_tokens: int = 2048,
+        **engine_specific_params: Any,
+    ) -> GenerationResult:
+        """Generate via the OpenAI-compatible chat API."""
+        from .openai_compat import openai_chat, parse_openai_result
+
+        with self._gpu_tracker() as tracker:
+            start = time.perf_counter()
+            response = openai_chat(
+                self._base_url,
+                messages,
+                model=self._model_name,
+                temperature=temperature,
+                top_p=top_p,
+                max_tokens=max_tokens,
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        return parse_openai_result(response, elapsed_ms, tracker)
+
     def cleanup(self) -> None:
         """Stop the ExLlamaV2 engine."""
         super().cleanup()
@@ -90,6 +90,7 @@ class LlamaCppEngine(InferenceEngine):
     def initialize(self, model_path: str, config: dict[str, Any]) -> None:
         """Start llama.cpp server and wait for healthy."""
         self._mode = EngineMode(config.get("mode", self.default_mode()))
+        self._configure_gpus(config)
 
         if self._mode == EngineMode.NATIVE:
             self._initialize_native(model_path, config)
@@ -130,7 +131,7 @@ class LlamaCppEngine(InferenceEngine):
         self._process = ProcessManager.start_process(
             binary,
             args,
-            env=config.get("env", {}),
+            env=self._native_env(config),
         )
 
         health_url = f"http://localhost:{port}{self.health_endpoint()}"
@@ -168,10 +169,12 @@ class LlamaCppEngine(InferenceEngine):
             image=config.get("image", self.resolved_image()),
             port=port,
             container_port=self.container_port(),
+            gpu_devices=self._gpu_devices,
             volumes={model_dir: "/models"},
             env=config.get("env", {}),
             extra_args=config.get("extra_args", []),
             command_args=cmd_args,
+            name_prefix=config.get("name_prefix", "kitt"),
         )
         self._container_id = DockerManager.run_container(container_cfg)
 
@@ -192,11 +195,9 @@ class LlamaCppEngine(InferenceEngine):
         **engine_specific_params: Any,
     ) -> GenerationResult:
         """Generate via OpenAI-compatible API."""
-        from kitt.collectors.gpu_stats import GPUMemoryTracker
-
         from .openai_compat import openai_generate, parse_openai_result
 
-        with GPUMemoryTracker(gpu_index=0) as tracker:
+        with self._gpu_tracker() as tracker:
             start = time.perf_counter()
             response = openai_generate(
                 self._base_url,
@@ -211,6 +212,33 @@ class LlamaCppEngine(InferenceEngine):
 
         return parse_openai_result(response, elapsed_ms, tracker)
 
+    def generate_chat(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        top_k: int = 50,
+        max_tokens: int = 2048,
+        **engine_specific_params: Any,
+    ) -> GenerationResult:
+        """Generate via the OpenAI-compatible chat API."""
+        from .openai_compat import openai_chat, parse_openai_result
+
+        with self._gpu_tracker() as tracker:
+            start = time.perf_counter()
+            response = openai_chat(
+                self._base_url,
+                messages,
+                model=self._model_name,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                max_tokens=max_tokens,
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        return parse_openai_result(response, elapsed_ms, tracker)
+
     def cleanup(self) -> None:
         """Stop the llama.cpp engine."""
         super().cleanup()
@@ -10,6 +10,8 @@ from .base import (
     GenerationMetrics,
     GenerationResult,
     InferenceEngine,
+    message_text,
+    render_chat_prompt,
 )
 from .lifecycle import EngineMode
 from .registry import register_engine
@@ -157,6 +159,36 @@ class MLXEngine(InferenceEngine):
             completion_tokens=completion_tokens,
         )
 
+    def generate_chat(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        top_k: int = 50,
+        max_tokens: int = 2048,
+        **engine_specific_params: Any,
+    ) -> GenerationResult:
+        """Generate with the prompt built by the tokenizer's chat template."""
+        if self._model is None or self._tokenizer is None:
+            raise RuntimeError("Engine not initialized — call initialize() first")
+
+        if getattr(self._tokenizer, "chat_template", None):
+            # Text-only: content parts are flattened, and images rejected
+            text_messages = [{**m, "content": message_text(m)} for m in messages]
+            prompt = self._tokenizer.apply_chat_template(
+                text_messages, tokenize=False, add_generation_prompt=True
+            )
+        else:
+            prompt = render_chat_prompt(messages)
+        return self.generate(
+            prompt,
+            temperature=temperature,
+            top_p=top_p,
+            top_k=top_k,
+            max_tokens=max_tokens,
+            **engine_specific_params,
+        )
+
     def cleanup(self) -> None:
         """Release model from memory."""
         self._model = None
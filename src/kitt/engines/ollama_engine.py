@@ -8,7 +8,7 @@ import urllib.request
 from datetime import datetime
 from typing import Any
 
-from .base import GenerationMetrics, GenerationResult, InferenceEngine
+from .base import GenerationMetrics, GenerationResult, InferenceEngine, message_text
 from .lifecycle import EngineMode
 from .registry import register_engine
 
@@ -19,7 +19,7 @@ logger = logging.getLogger(__name__)
 class OllamaEngine(InferenceEngine):
     """Ollama inference engine — Docker or native service.
 
-    Communicates via the Ollama HTTP API (/api/generate).
+    Communicates via the Ollama HTTP API (/api/generate and /api/chat).
     """
 
     def __init__(self) -> None:
@@ -99,6 +99,7 @@ class OllamaEngine(InferenceEngine):
         local GGUF files/directories.
         """
         self._mode = EngineMode(config.get("mode", self.default_mode()))
+        self._configure_gpus(config)
 
         if self._mode == EngineMode.NATIVE:
             self._initialize_native(model_path, config)
@@ -134,7 +135,7 @@ class OllamaEngine(InferenceEngine):
                     "ollama not found. Install Ollama or add it to your PATH."
                 )
             env = {"OLLAMA_HOST": f"0.0.0.0:{port}"}
-            env.update(config.get("env", {}))
+            env.update(self._native_env(config))
             self._process = ProcessManager.start_process(binary, ["serve"], env=env)
 
         health_url = f"http://localhost:{port}{self.health_endpoint()}"
@@ -189,14 +190,21 @@ class OllamaEngine(InferenceEngine):
             # Mount the model directory into the container
             volumes[gguf_dir] = "/models"
 
+        # Host networking: tell the server which host port to bind
+        env = dict(config.get("env", {}))
+        if port != self.container_port():
+            env.setdefault("OLLAMA_HOST", f"0.0.0.0:{port}")
+
         container_cfg = ContainerConfig(
             image=config.get("image", self.resolved_image()),
             port=port,
             container_port=self.container_port(),
+            gpu_devices=self._gpu_devices,
             volumes=volumes,
-            env=config.get("env", {}),
+            env=env,
             extra_args=config.get("extra_args", []),
             command_args=[],
+            name_prefix=config.get("name_prefix", "kitt"),
         )
         self._container_id = DockerManager.run_container(container_cfg)
 
@@ -240,8 +248,6 @@ class OllamaEngine(InferenceEngine):
         **engine_specific_params: Any,
     ) -> GenerationResult:
         """Generate via Ollama HTTP API."""
-        from kitt.collectors.gpu_stats import GPUMemoryTracker
-
         payload = {
             "model": self._model_name,
             "prompt": prompt,
@@ -254,14 +260,46 @@ class OllamaEngine(InferenceEngine):
             },
         }
 
+        return self._request("/api/generate", payload)
+
+    def generate_chat(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        top_k: int = 50,
+        max_tokens: int = 2048,
+        **engine_specific_params: Any,
+    ) -> GenerationResult:
+        """Generate via Ollama's chat API (/api/chat)."""
+        payload = {
+            "model": self._model_name,
+            # Ollama takes plain-text content, not OpenAI content parts;
+            # message_text rejects images rather than dropping them
+            "messages": [
+                {"role": m.get("role", "user"), "content": message_text(m)}
+                for m in messages
+            ],
+            "stream": False,
+            "options": {
+                "temperature": temperature,
+                "top_p": top_p,
+                "top_k": top_k,
+                "num_predict": max_tokens,
+            },
+        }
+        return self._request("/api/chat", payload)
+
+    def _request(self, path: str, payload: dict[str, Any]) -> GenerationResult:
+        """POST a non-streaming request and parse Ollama's timing fields."""
         data = json.dumps(payload).encode("utf-8")
         req = urllib.request.Request(
-            f"{self._base_url}/api/generate",
+            f"{self._base_url}{path}",
             data=data,
             headers={"Content-Type": "application/json"},
         )
 
-        with GPUMemoryTracker(gpu_index=0) as tracker:
+        with self._gpu_tracker() as tracker:
             start_time = time.perf_counter()
             with urllib.request.urlopen(req) as response:
                 result = json.loads(response.read())
@@ -269,7 +307,10 @@ class OllamaEngine(InferenceEngine):
 
         total_latency_ms = (end_time - start_time) * 1000
 
-        output = result.get("response", "")
+        if "message" in result:
+            output = (result.get("message") or {}).get("content", "")
+        else:
+            output = result.get("response", "")
         prompt_tokens = result.get("prompt_eval_count", 0)
         completion_tokens = result.get("eval_count", 0)
 
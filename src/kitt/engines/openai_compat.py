@@ -1,4 +1,4 @@
-"""Shared HTTP client for OpenAI-compatible /v1/completions endpoints.
+"""Shared HTTP client for OpenAI-compatible completion and chat endpoints.
 
 Used by vLLM and llama.cpp engines which expose OpenAI-compatible APIs.
 Uses urllib.request (no external dependencies).
@@ -52,8 +52,50 @@ def openai_generate(
         "max_tokens": max_tokens,
     }
 
+    return _post_json(base_url, "/v1/completions", payload)
+
+
+def openai_chat(
+    base_url: str,
+    messages: list[dict[str, Any]],
+    model: str = "default",
+    temperature: float = 0.0,
+    top_p: float = 1.0,
+    top_k: int = 50,
+    max_tokens: int = 2048,
+) -> dict[str, Any]:
+    """Send a chat request to an OpenAI-compatible ``/v1/chat/completions``.
+
+    The server formats ``messages`` with the model's chat template.
+
+    Args:
+        base_url: Base URL of the server (e.g. "http://localhost:8000").
+        messages: Chat messages (``{"role": ..., "content": ...}``).
+        model: Model name to pass in the request.
+        temperature: Sampling temperature.
+        top_p: Nucleus sampling parameter.
+        top_k: Top-k sampling parameter (ignored by standard OpenAI API).
+        max_tokens: Maximum tokens to generate.
+
+    Returns:
+        Parsed JSON response dict.
+
+    Raises:
+        RuntimeError: If the request fails.
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "top_p": top_p,
+        "max_tokens": max_tokens,
+    }
+    return _post_json(base_url, "/v1/chat/completions", payload)
+
+
+def _post_json(base_url: str, path: str, payload: dict[str, Any]) -> dict[str, Any]:
     data = json.dumps(payload).encode("utf-8")
-    url = f"{base_url.rstrip('/')}/v1/completions"
+    url = f"{base_url.rstrip('/')}{path}"
     req = urllib.request.Request(
         url,
         data=data,
@@ -75,7 +117,7 @@ def parse_openai_result(
     total_latency_ms: float,
     gpu_tracker: Any,
 ) -> GenerationResult:
-    """Parse an OpenAI completions response into a GenerationResult.
+    """Parse an OpenAI completions or chat response into a GenerationResult.
 
     Args:
         response: Parsed JSON response from the OpenAI API.
@@ -86,7 +128,13 @@ def parse_openai_result(
         GenerationResult with extracted metrics.
     """
     choices = response.get("choices", [])
-    output = choices[0]["text"] if choices else ""
+    output = ""
+    if choices:
+        message = choices[0].get("message")
+        if message is not None:
+            output = message.get("content") or ""
+        else:
+            output = choices[0].get("text", "")
 
     usage = response.get("usage", {})
     prompt_tokens = usage.get("prompt_tokens", 0)
@@ -155,8 +203,59 @@ def openai_generate_stream(
         "stream": True,
     }
 
+    for chunk, elapsed_ms in _stream_sse(base_url, "/v1/completions", payload):
+        choices = chunk.get("choices", [])
+        if choices:
+            token = choices[0].get("text", "")
+            if token:
+                yield StreamChunk(token=token, timestamp_ms=elapsed_ms)
+
+
+def openai_chat_stream(
+    base_url: str,
+    messages: list[dict[str, Any]],
+    model: str = "default",
+    temperature: float = 0.0,
+    top_p: float = 1.0,
+    max_tokens: int = 2048,
+) -> Generator[StreamChunk, None, None]:
+    """Send a streaming chat request to ``/v1/chat/completions``.
+
+    The server applies the model's chat template to ``messages``.
+
+    Args:
+        base_url: Base URL of the server.
+        messages: Chat messages (``{"role": ..., "content": ...}``).
+        model: Model name.
+        temperature: Sampling temperature.
+        top_p: Nucleus sampling parameter.
+        max_tokens: Maximum tokens to generate.
+
+    Yields:
+        StreamChunk with token text and timestamp.
+    """
+    payload = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "top_p": top_p,
+        "max_tokens": max_tokens,
+        "stream": True,
+    }
+    for chunk, elapsed_ms in _stream_sse(base_url, "/v1/chat/completions", payload):
+        choices = chunk.get("choices", [])
+        if choices:
+            token = (choices[0].get("delta") or {}).get("content") or ""
+            if token:
+                yield StreamChunk(token=token, timestamp_ms=elapsed_ms)
+
+
+def _stream_sse(
+    base_url: str, path: str, payload: dict[str, Any]
+) -> Generator[tuple[dict[str, Any], float], None, None]:
+    """POST ``payload`` and yield each SSE data event with its arrival time."""
     data = json.dumps(payload).encode("utf-8")
-    url = f"{base_url.rstrip('/')}/v1/completions"
+    url = f"{base_url.rstrip('/')}{path}"
     req = urllib.request.Request(
         url,
         data=data,
@@ -177,17 +276,9 @@ def openai_generate_stream(
                     break
                 try:
                     chunk_data = json.loads(line)
-                    choices = chunk_data.get("choices", [])
-                    if choices:
-                        token = choices[0].get("text", "")
-                        if token:
-                            elapsed_ms = (time.perf_counter() - start_time) * 1000
-                            yield StreamChunk(
-                                token=token,
-                                timestamp_ms=elapsed_ms,
-                            )
                 except json.JSONDecodeError:
                     continue
+                yield chunk_data, (time.perf_counter() - start_time) * 1000
     except urllib.error.HTTPError as e:
         body = e.read().decode("utf-8", errors="replace")
         raise RuntimeError(f"Streaming request failed ({e.code}): {body}") from e
@@ -22,6 +22,9 @@ class VLLMEngine(InferenceEngine):
     Communicates via the OpenAI-compatible /v1/completions API.
     """
 
+    # Chat requests pass image parts through for vision models
+    supports_image_input = True
+
     def __init__(self) -> None:
         self._container_id: str | None = None  # type: ignore[assignment]
         self._base_url: str = ""
@@ -111,6 +114,7 @@ class VLLMEngine(InferenceEngine):
     def initialize(self, model_path: str, config: dict[str, Any]) -> None:
         """Start vLLM and wait for healthy."""
         self._mode = EngineMode(config.get("mode", self.default_mode()))
+        self._configure_gpus(config)
 
         if self._mode == EngineMode.NATIVE:
             self._initialize_native(model_path, config)
@@ -145,7 +149,7 @@ class VLLMEngine(InferenceEngine):
         self._process = ProcessManager.start_process(
             binary,
             args,
-            env=config.get("env", {}),
+            env=self._native_env(config),
         )
 
         health_url = f"http://localhost:{port}{self.health_endpoint()}"
@@ -175,6 +179,9 @@ class VLLMEngine(InferenceEngine):
         else:
             cmd_args = ["--model", self._model_name]
 
+        # Host networking: the server must bind the requested host port itself
+        if port != self.container_port():
+            cmd_args += ["--port", str(port)]
         if config.get("tensor_parallel_size", 1) > 1:
             cmd_args += [
                 "--tensor-parallel-size",
@@ -190,10 +197,12 @@ class VLLMEngine(InferenceEngine):
             image=image,
             port=port,
             container_port=self.container_port(),
+            gpu_devices=self._gpu_devices,
             volumes={model_abs: self._model_name},
             env=config.get("env", {}),
             extra_args=config.get("extra_args", ["--shm-size=8g"]),
             command_args=cmd_args,
+            name_prefix=config.get("name_prefix", "kitt"),
         )
         self._container_id = DockerManager.run_container(container_cfg)
 
@@ -214,11 +223,9 @@ class VLLMEngine(InferenceEngine):
         **engine_specific_params: Any,
     ) -> GenerationResult:
         """Generate via OpenAI-compatible API."""
-        from kitt.collectors.gpu_stats import GPUMemoryTracker
-
         from .openai_compat import openai_generate, parse_openai_result
 
-        with GPUMemoryTracker(gpu_index=0) as tracker:
+        with self._gpu_tracker() as tracker:
             start = time.perf_counter()
             response = openai_generate(
                 self._base_url,
@@ -232,6 +239,32 @@ class VLLMEngine(InferenceEngine):
 
         return parse_openai_result(response, elapsed_ms, tracker)
 
+    def generate_chat(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float = 0.0,
+        top_p: float = 1.0,
+        top_k: int = 50,
+        max_tokens: int = 2048,
+        **engine_specific_params: Any,
+    ) -> GenerationResult:
+        """Generate via the OpenAI-compatible chat API."""
+        from .openai_compat import openai_chat, parse_openai_result
+
+        with self._gpu_tracker() as tracker:
+            start = time.perf_counter()
+            response = openai_chat(
+                self._base_url,
+                messages,
+                model=self._model_name,
+                temperature=temperature,
+                top_p=top_p,
+                max_tokens=max_tokens,
+            )
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+        return parse_openai_result(response, elapsed_ms, tracker)
+
     def cleanup(self) -> None:
         """Stop the vLLM engine."""
         super().cleanup()
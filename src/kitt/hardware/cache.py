@@ -0,0 +1,96 @@
+"""On-disk cache of detected system hardware, keyed by host identity."""
+
+import hashlib
+import json
+import logging
+import os
+import platform
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = Path.home() / ".kitt" / "cache" / "hardware.json"
+
+# Bump when SystemInfo gains fields or detection logic changes
+CACHE_FORMAT = 1
+
+
+def _read(path: str) -> str:
+    try:
+        return Path(path).read_text().strip()
+    except OSError:
+        return ""
+
+
+def _boot_id() -> str:
+    boot_id = _read("/proc/sys/kernel/random/boot_id")
+    if boot_id:
+        return boot_id
+    try:
+        import psutil
+
+        return str(int(psutil.boot_time()))
+    except Exception:
+        return ""
+
+
+def _nvidia_devices() -> list[str]:
+    gpus = Path("/proc/driver/nvidia/gpus")
+    try:
+        if gpus.is_dir():
+            return sorted(p.name for p in gpus.iterdir())
+        return sorted(p.name for p in Path("/dev").glob("nvidia[0-9]*"))
+    except OSError:
+        return []
+
+
+def host_key(environment_type: str) -> str:
+    """Identify this host's current hardware state without running probes.
+
+    Combines the boot ID, the loaded NVIDIA driver version and the GPU
+    device list. A reboot, driver upgrade or GPU swap changes the key.
+    Everything is read from ``/proc`` and ``/dev``, so this takes
+    microseconds.
+    """
+    parts = {
+        "format": CACHE_FORMAT,
+        "host": platform.node(),
+        "kernel": platform.release(),
+        "environment": environment_type,
+        "boot_id": _boot_id(),
+        "driver": _read("/proc/driver/nvidia/version").split("\n")[0],
+        "devices": _nvidia_devices(),
+    }
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+def load(key: str, path: Path | None = None) -> dict[str, Any] | None:
+    """Return the cached system info if it was stored under ``key``."""
+    path = path or DEFAULT_CACHE_PATH
+    try:
+        with open(path) as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    return entry.get("system_info")
+
+
+def save(key: str, system_info: dict[str, Any], path: Path | None = None) -> None:
+    """Write system info under ``key``, replacing the file atomically."""
+    path = path or DEFAULT_CACHE_PATH
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump({"key": key, "system_info": system_info}, f)
+            Path(tmp_path).replace(path)
+        except Exception:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+    except OSError as e:
+        logger.debug(f"Could not write hardware cache {path}: {e}")
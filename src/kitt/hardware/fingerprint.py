@@ -2,8 +2,13 @@
 
 import logging
 import platform
-from dataclasses import dataclass
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
 
+from . import cache
 from .detector import (
     CPUInfo,
     GPUInfo,
@@ -20,6 +25,10 @@ from .detector import (
 
 logger = logging.getLogger(__name__)
 
+# Wall-clock budget for all probes together. Probes still running after
+# it fall back to their "unknown" value and the result is not cached.
+PROBE_TIMEOUT_S = 15.0
+
 
 TESTED_ENVIRONMENTS = [
     "Ubuntu 22.04 LTS (Native)",
@@ -56,10 +65,20 @@ class HardwareFingerprint:
         return HardwareFingerprint._format_fingerprint(info)
 
     @staticmethod
-    def detect_system() -> SystemInfo:
+    def detect_system(
+        use_cache: bool = True, cache_path: Path | None = None
+    ) -> SystemInfo:
         """Detect all system hardware with fallbacks.
 
+        The probes run concurrently. The result is cached on disk under
+        :func:`kitt.hardware.cache.host_key`, so later calls on the same
+        boot, driver and GPUs skip probing entirely.
+
         Logs warnings for low-confidence detections.
+
+        Args:
+            use_cache: Read and write the on-disk cache.
+            cache_path: Cache file; defaults to ``~/.kitt/cache/hardware.json``.
         """
         env_type = detect_environment_type()
         if env_type not in ("native_linux", "native_macos", "dgx", "dgx_spark"):
@@ -69,18 +88,56 @@ class HardwareFingerprint:
                 f"See docs/supported_environments.md"
             )
 
-        return SystemInfo(
-            gpu=detect_gpu(environment_type=env_type),
-            cpu=detect_cpu(),
-            ram_gb=detect_ram_gb(),
-            ram_type=detect_ram_type(),
-            storage=detect_storage(),
-            cuda_version=detect_cuda_version(),
-            driver_version=detect_driver_version(),
+        key = cache.host_key(env_type) if use_cache else ""
+        if use_cache:
+            cached = cache.load(key, cache_path)
+            if cached is not None:
+                try:
+                    return _system_info_from_dict(cached)
+                except (KeyError, TypeError) as e:
+                    logger.debug(f"Ignoring malformed hardware cache: {e}")
+
+        probes: dict[str, tuple[Callable[[], Any], Any]] = {
+            "gpu": (lambda: detect_gpu(environment_type=env_type), None),
+            "cpu": (detect_cpu, CPUInfo(model="Unknown", cores=0, threads=0)),
+            "ram_gb": (detect_ram_gb, 0),
+            "ram_type": (detect_ram_type, "Unknown"),
+            "storage": (
+                detect_storage,
+                StorageInfo(brand="Unknown", model="Unknown", type="unknown"),
+            ),
+            "cuda_version": (detect_cuda_version, None),
+            "driver_version": (detect_driver_version, None),
+        }
+        values, complete = _run_probes(probes)
+
+        info = SystemInfo(
+            **values,
             os=f"{platform.system()}-{platform.release()}",
             kernel=platform.version(),
             environment_type=env_type,
         )
+        if use_cache and complete:
+            cache.save(key, asdict(info), cache_path)
+        return info
+
+    @staticmethod
+    def from_result(result: dict[str, Any]) -> str | None:
+        """Fingerprint of the hardware a stored result ran on.
+
+        Uses ``system_info.fingerprint`` when the result carries one,
+        otherwise formats its full ``system_info``. Returns None when
+        neither is available.
+        """
+        info = result.get("system_info")
+        if not isinstance(info, dict):
+            return None
+        if info.get("fingerprint"):
+            return info["fingerprint"]
+        try:
+            return HardwareFingerprint._format_fingerprint(_system_info_from_dict(info))
+        except (KeyError, TypeError, AttributeError):
+            return None
 
     @staticmethod
     def _format_fingerprint(info: SystemInfo) -> str:
@@ -131,3 +188,48 @@ class HardwareFingerprint:
         parts.append(info.os)
 
         return "_".join(parts)
+
+
+def _run_probes(
+    probes: dict[str, tuple[Callable[[], Any], Any]],
+) -> tuple[dict[str, Any], bool]:
+    """Run probes concurrently within ``PROBE_TIMEOUT_S``.
+
+    Returns:
+        Each probe's value (its fallback if it failed or timed out) and
+        whether every probe finished.
+    """
+    pool = ThreadPoolExecutor(max_workers=len(probes), thread_name_prefix="kitt-probe")
+    futures = {name: pool.submit(probe) for name, (probe, _) in probes.items()}
+    wait(futures.values(), timeout=PROBE_TIMEOUT_S)
+    # Don't block on hung probes; their subprocess timeouts reap them
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    values: dict[str, Any] = {}
+    complete = True
+    for name, future in futures.items():
+        fallback = probes[name][1]
+        if not future.done():
+            logger.warning(f"Hardware probe '{name}' timed out")
+            values[name], complete = fallback, False
+        elif future.exception() is not None:
+            logger.warning(f"Hardware probe '{name}' failed: {future.exception()}")
+            values[name], complete = fallback, False
+        else:
+            values[name] = future.result()
+    return values, complete
+
+
+def _system_info_from_dict(data: dict[str, Any]) -> SystemInfo:
+    gpu = data["gpu"]
+    if gpu is not None:
+        cc = gpu.get("compute_capability")
+        gpu = GPUInfo(**{**gpu, "compute_capability": tuple(cc) if cc else None})
+    return SystemInfo(
+        **{
+            **data,
+            "gpu": gpu,
+            "cpu": CPUInfo(**data["cpu"]),
+            "storage": StorageInfo(**data["storage"]),
+        }
+    )
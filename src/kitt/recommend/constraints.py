@@ -2,6 +2,8 @@
 
 from pydantic import BaseModel, Field
 
+from kitt.storage.result_query import Condition
+
 
 class HardwareConstraints(BaseModel):
     """Hardware constraints for filtering model recommendations."""
@@ -17,6 +19,25 @@ class HardwareConstraints(BaseModel):
     )
     engine: str | None = Field(None, description="Restrict to specific engine")
 
+    def conditions(self) -> list[Condition]:
+        """These constraints as conditions on the recommendation index.
+
+        Store backends evaluate them with the same missing-value rules
+        as :meth:`matches`.
+        """
+        conditions = []
+        if self.max_vram_gb is not None:
+            conditions.append(Condition("peak_vram_gb", "<=", self.max_vram_gb))
+        if self.min_throughput_tps is not None:
+            conditions.append(Condition("avg_tps", ">=", self.min_throughput_tps))
+        if self.min_accuracy is not None:
+            conditions.append(Condition("accuracy", ">=", self.min_accuracy))
+        if self.max_latency_ms is not None:
+            conditions.append(Condition("avg_latency_ms", "<=", self.max_latency_ms))
+        if self.engine is not None:
+            conditions.append(Condition("engine", "=", self.engine))
+        return conditions
+
     def matches(self, result: dict) -> bool:
         """Check if a result satisfies these constraints.
 
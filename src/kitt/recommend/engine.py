@@ -1,6 +1,7 @@
 """Model recommendation engine."""
 
 import logging
+from collections.abc import Callable
 from typing import Any
 
 from .constraints import HardwareConstraints
@@ -26,6 +27,10 @@ class ModelRecommender:
     ) -> list[dict[str, Any]]:
         """Get ranked model recommendations.
 
+        Each (model, engine, quant, hardware class) is represented by its
+        latest run. Constraints are applied by the store, in SQL on the
+        database backends.
+
         Args:
             constraints: Hardware constraints to filter by.
             limit: Maximum number of recommendations.
@@ -34,25 +39,7 @@ class ModelRecommender:
         Returns:
             Sorted list of recommendation dicts.
         """
-        # Get all results
-        results = self.store.query(order_by="-timestamp", limit=500)
-        if not results:
-            return []
-
-        # Aggregate by model+engine (use latest result for each)
-        seen = {}
-        for r in results:
-            key = f"{r.get('model', '')}|{r.get('engine', '')}"
-            if key not in seen:
-                seen[key] = r
-
-        # Filter by constraints
-        candidates = []
-        for r in seen.values():
-            if constraints and not constraints.matches(r):
-                continue
-            scored = self._score_result(r)
-            candidates.append(scored)
+        candidates = self._candidates(constraints)
 
         # Sort
         if sort_by == "throughput":
@@ -64,6 +51,15 @@ class ModelRecommender:
 
         return candidates[:limit]
 
+    def _candidates(
+        self, constraints: HardwareConstraints | None
+    ) -> list[dict[str, Any]]:
+        conditions = constraints.conditions() if constraints else []
+        return [
+            self._score_result(summary)
+            for summary in self.store.recommendation_candidates(conditions)
+        ]
+
     def _score_result(self, result: dict[str, Any]) -> dict[str, Any]:
         """Compute a composite score for a result.
 
@@ -73,8 +69,8 @@ class ModelRecommender:
             Enriched result dict with score fields.
         """
         metrics = result.get("metrics", {})
-        accuracy = metrics.get("accuracy", 0)
-        throughput = metrics.get("avg_tps", 0)
+        accuracy = metrics.get("accuracy") or 0
+        throughput = metrics.get("avg_tps") or 0
 
         # Normalize (assume rough ranges)
         norm_acc = min(accuracy, 1.0)
@@ -92,37 +88,81 @@ class ModelRecommender:
     def pareto_frontier(
         self,
         constraints: HardwareConstraints | None = None,
+        include_memory: bool = False,
     ) -> list[dict[str, Any]]:
         """Find models on the Pareto frontier of quality vs performance.
 
-        A model is Pareto-optimal if no other model is better in both
-        accuracy and throughput.
+        A model is Pareto-optimal if no other model is at least as good
+        in accuracy and throughput (and peak VRAM, with
+        ``include_memory``) and strictly better in one of them.
 
         Returns:
-            List of Pareto-optimal results.
+            Pareto-optimal results, highest accuracy first.
         """
-        candidates = self.recommend(constraints=constraints, limit=500, sort_by="score")
-        if not candidates:
-            return []
-
-        # Find Pareto frontier
-        frontier = []
-        for c in candidates:
-            dominated = False
-            for other in candidates:
-                if other is c:
-                    continue
-                if (
-                    other.get("accuracy", 0) >= c.get("accuracy", 0)
-                    and other.get("throughput", 0) >= c.get("throughput", 0)
-                    and (
-                        other.get("accuracy", 0) > c.get("accuracy", 0)
-                        or other.get("throughput", 0) > c.get("throughput", 0)
-                    )
-                ):
-                    dominated = True
-                    break
-            if not dominated:
-                frontier.append(c)
-
-        return frontier
+        candidates = self._candidates(constraints)
+        if include_memory:
+            # Lower VRAM is better; an unknown peak counts as zero
+            return pareto_front(
+                candidates,
+                lambda c: (
+                    c["accuracy"],
+                    c["throughput"],
+                    -(c["metrics"].get("peak_vram_gb") or 0.0),
+                ),
+            )
+        return pareto_front(candidates, lambda c: (c["accuracy"], c["throughput"]))
+
+
+def pareto_front(
+    items: list[dict[str, Any]],
+    objectives: Callable[[dict[str, Any]], tuple[float, ...]],
+) -> list[dict[str, Any]]:
+    """Items not dominated by any other item, in O(n log n).
+
+    Args:
+        items: Candidates.
+        objectives: Two or three values per item, all to be maximized.
+
+    Returns:
+        The non-dominated items, ordered by their first objective,
+        descending. Items with identical objectives are all kept.
+    """
+    keyed = sorted(
+        ((objectives(item), i) for i, item in enumerate(items)), reverse=True
+    )
+    if keyed and len(keyed[0][0]) == 2:
+        keyed = [((a, b, 0.0), i) for (a, b), i in keyed]
+
+    # Sorted descending on (a, b, c), any dominator of a point comes
+    # before it. Rank the third objective so a Fenwick tree can answer
+    # "best b among earlier points with c >= this c" in O(log n).
+    ranks = {c: r for r, c in enumerate(sorted({k[2] for k, _ in keyed}, reverse=True))}
+    tree = [float("-inf")] * (len(ranks) + 1)
+
+    def best_b(rank: int) -> float:
+        best, pos = float("-inf"), rank + 1
+        while pos > 0:
+            best = max(best, tree[pos])
+            pos -= pos & -pos
+        return best
+
+    def insert(rank: int, b: float) -> None:
+        pos = rank + 1
+        while pos < len(tree):
+            tree[pos] = max(tree[pos], b)
+            pos += pos & -pos
+
+    front = []
+    start = 0
+    while start < len(keyed):
+        # Identical points don't dominate each other, so a group is
+        # checked against earlier points before any of it is inserted.
+        end = start
+        while end < len(keyed) and keyed[end][0] == keyed[start][0]:
+            end += 1
+        (_, b, c), _ = keyed[start]
+        if best_b(ranks[c]) < b:
+            front.extend(items[i] for _, i in keyed[start:end])
+        insert(ranks[c], b)
+        start = end
+    return front
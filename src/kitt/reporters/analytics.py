@@ -0,0 +1,536 @@
+"""Columnar analytics over benchmark results.
+
+:class:`MetricTable` flattens results once into parallel columns with one
+entry per (run, benchmark, metric) value. Group-bys then work on whole
+columns. Key columns are dictionary-encoded, so grouping packs integer
+codes instead of comparing strings. Entries are then ordered by group and
+value, and each group's statistics are read off its contiguous slice.
+Percentiles are simple index lookups.
+
+NumPy does the reductions when it is installed; it comes with the
+``pyarrow`` and ``matplotlib`` extras. Without it, a pure-Python path
+computes the same statistics.
+"""
+
+import logging
+import math
+from typing import Any
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMNS = ("model", "engine", "quant", "benchmark", "metric")
+RUN_COLUMNS = ("model", "engine", "quant", "suite_name")
+
+
+class MetricTable:
+    """Benchmark metric values in columnar form.
+
+    Key columns are ``model``, ``engine``, ``quant``, ``benchmark`` and
+    ``metric``. ``run`` indexes into the run-level columns (``passed``,
+    ``total_time_seconds`` and :data:`RUN_COLUMNS`). Nested metric dicts
+    are flattened to ``metric.sub_key``. A result's top-level ``metrics``
+    dict is filed under benchmark ``""``.
+    """
+
+    def __init__(self) -> None:
+        # Key columns are dictionary-encoded: codes index into levels
+        self.codes: dict[str, list[int]] = {c: [] for c in KEY_COLUMNS}
+        self.levels: dict[str, list[str]] = {c: [] for c in KEY_COLUMNS}
+        self._level_index: dict[str, dict[str, int]] = {c: {} for c in KEY_COLUMNS}
+        self.run: list[int] = []
+        self.value: list[float] = []
+        self.runs: dict[str, list[Any]] = {
+            c: [] for c in (*RUN_COLUMNS, "passed", "total_time_seconds")
+        }
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    @property
+    def run_count(self) -> int:
+        return len(self.runs["model"])
+
+    def column(self, name: str) -> list[str]:
+        """Decoded values of a key column."""
+        levels = self.levels[name]
+        return [levels[code] for code in self.codes[name]]
+
+    def _encode(self, name: str, value: str) -> int:
+        index = self._level_index[name]
+        code = index.get(value)
+        if code is None:
+            code = index[value] = len(self.levels[name])
+            self.levels[name].append(value)
+        return code
+
+    @classmethod
+    def from_results(cls, results: list[dict[str, Any]]) -> "MetricTable":
+        """Flatten result dicts (``metrics.json`` content) into a table."""
+        table = cls()
+        for result in results:
+            table._add_result(result)
+        return table
+
+    @classmethod
+    def from_rows(cls, rows: list[tuple[Any, ...]]) -> "MetricTable":
+        """Build a table from :meth:`ResultStore.metric_rows` output."""
+        table = cls()
+        runs: dict[Any, tuple[int, list[tuple[str, int]]]] = {}
+        for run_id, model, engine, quant, suite, passed, seconds, *entry in rows:
+            run = runs.get(run_id)
+            if run is None:
+                run = runs[run_id] = table._add_run(
+                    {
+                        "model": model or "unknown",
+                        "engine": engine or "unknown",
+                        "quant": quant or "",
+                        "suite_name": suite or "",
+                    },
+                    passed,
+                    seconds,
+                )
+            bench_name, name, value = entry
+            if name is not None and value is not None:
+                run_index, run_codes = run
+                table._append(
+                    run_index,
+                    run_codes,
+                    table._encode("benchmark", bench_name or ""),
+                    name,
+                    float(value),
+                )
+        return table
+
+    @classmethod
+    def from_store(
+        cls,
+        store: Any,
+        filters: dict[str, Any] | None = None,
+        metrics: list[str] | None = None,
+    ) -> "MetricTable":
+        """Load matching scalar metrics from a ResultStore in one query.
+
+        SQL stores answer from their metric tables, so no result document
+        is decoded. Nested metric dicts are not stored there and are left
+        out; use :meth:`from_results` for those.
+        """
+        return cls.from_rows(
+            store.metric_rows(filters=filters or None, metrics=metrics)
+        )
+
+    def _add_run(
+        self, run_values: dict[str, str], passed: Any, seconds: Any
+    ) -> tuple[int, list[tuple[str, int]]]:
+        """Append a run; return its index and encoded key columns."""
+        run_index = self.run_count
+        for name, value in run_values.items():
+            self.runs[name].append(value)
+        self.runs["passed"].append(bool(passed))
+        self.runs["total_time_seconds"].append(float(seconds or 0.0))
+        run_codes = [
+            (name, self._encode(name, run_values[name]))
+            for name in ("model", "engine", "quant")
+        ]
+        return run_index, run_codes
+
+    def _append(
+        self,
+        run_index: int,
+        run_codes: list[tuple[str, int]],
+        bench_code: int,
+        name: str,
+        value: float,
+    ) -> None:
+        for column, code in run_codes:
+            self.codes[column].append(code)
+        self.codes["benchmark"].append(bench_code)
+        self.codes["metric"].append(self._encode("metric", name))
+        self.run.append(run_index)
+        self.value.append(value)
+
+    def _add_result(self, result: dict[str, Any]) -> None:
+        run_index, run_codes = self._add_run(
+            {
+                "model": result.get("model") or "unknown",
+                "engine": result.get("engine") or "unknown",
+                "quant": result.get("quant") or "",
+                "suite_name": result.get("suite_name") or "",
+            },
+            result.get("passed", False),
+            result.get("total_time_seconds"),
+        )
+        sources = [("", result.get("metrics") or {})]
+        sources += [
+            (bench.get("test_name", ""), bench.get("metrics") or {})
+            for bench in result.get("results", [])
+        ]
+        for bench_name, metrics in sources:
+            bench_code = self._encode("benchmark", bench_name)
+            for name, value in _flatten(metrics):
+                self._append(run_index, run_codes, bench_code, name, value)
+
+    def group_stats(
+        self,
+        by: tuple[str, ...],
+        metrics: list[str] | None = None,
+        percentiles: tuple[float, ...] = (50, 95, 99),
+    ) -> list[dict[str, Any]]:
+        """Per-group summary statistics of the metric values.
+
+        Args:
+            by: Key columns to group on, e.g. ``("model", "metric")``.
+            metrics: Only use these metric names.
+            percentiles: Percentiles to report as ``p50`` etc., with
+                linear interpolation as in ``numpy.percentile``.
+
+        Returns:
+            One dict per group, sorted by key. Each dict has the key
+            columns plus ``count``, ``mean``, ``median``, ``std`` (sample),
+            ``min``, ``max`` and one entry per percentile.
+        """
+        for column in by:
+            if column not in KEY_COLUMNS:
+                raise ValueError(f"Unknown group column: {column}")
+        wanted = None
+        if metrics:
+            index = self._level_index["metric"]
+            wanted = {index[m] for m in metrics if m in index}
+
+        if NUMPY_AVAILABLE:
+            keys, stats = self._group_stats_numpy(by, wanted, percentiles)
+        else:
+            keys, stats = self._group_stats_python(by, wanted, percentiles)
+        decoded = [
+            tuple(self.levels[c][code] for c, code in zip(by, key, strict=True))
+            for key in keys
+        ]
+        return [
+            {**dict(zip(by, key, strict=True)), **group}
+            for key, group in sorted(
+                zip(decoded, stats, strict=True), key=lambda pair: pair[0]
+            )
+        ]
+
+    def _group_stats_numpy(
+        self,
+        by: tuple[str, ...],
+        wanted: set[int] | None,
+        percentiles: tuple[float, ...],
+    ) -> tuple[list[tuple[int, ...]], list[dict[str, float]]]:
+        values = np.asarray(self.value, dtype=np.float64)
+        # Pack the key codes into one integer per entry
+        combined = np.zeros(len(values), dtype=np.int64)
+        for column in by:
+            codes = np.asarray(self.codes[column], dtype=np.int64)
+            combined = combined * max(len(self.levels[column]), 1) + codes
+        if wanted is not None:
+            mask = np.isin(
+                np.asarray(self.codes["metric"]), np.fromiter(wanted, dtype=np.int64)
+            )
+            combined, values = combined[mask], values[mask]
+        if not len(values):
+            return [], []
+
+        packed, group_codes = np.unique(combined, return_inverse=True)
+        keys = []
+        for value in packed.tolist():
+            key = []
+            for column in reversed(by):
+                value, code = divmod(value, max(len(self.levels[column]), 1))
+                key.append(code)
+            keys.append(tuple(reversed(key)))
+        return keys, _reduce_numpy(group_codes, values, len(keys), percentiles)
+
+    def _group_stats_python(
+        self,
+        by: tuple[str, ...],
+        wanted: set[int] | None,
+        percentiles: tuple[float, ...],
+    ) -> tuple[list[tuple[int, ...]], list[dict[str, float]]]:
+        buckets: dict[tuple[int, ...], list[float]] = {}
+        metric_codes = self.codes["metric"]
+        keys = zip(*(self.codes[c] for c in by), strict=True)
+        for i, (key, value) in enumerate(zip(keys, self.value, strict=True)):
+            if wanted is None or metric_codes[i] in wanted:
+                buckets.setdefault(key, []).append(value)
+        return list(buckets), [
+            _reduce_python(bucket, percentiles) for bucket in buckets.values()
+        ]
+
+    def run_values(self, metrics: list[str]) -> dict[str, list[float | None]]:
+        """One value per run for each metric, indexed like :attr:`runs`.
+
+        The value in a run's top-level ``metrics`` dict takes precedence;
+        otherwise it is the mean over the run's benchmarks, as in
+        :func:`kitt.storage.result_query.run_summary`. Runs without the
+        metric get ``None``.
+        """
+        if NUMPY_AVAILABLE:
+            return {
+                name: [None if math.isnan(v) else v for v in column.tolist()]
+                for name, column in self._run_values_numpy(metrics).items()
+            }
+        return self._run_values_python(metrics)
+
+    def run_stats(
+        self, by: tuple[str, ...], metrics: list[str]
+    ) -> list[dict[str, Any]]:
+        """Mean of each metric over the runs in each group.
+
+        Every run counts once, with its :meth:`run_values` value, however
+        many benchmarks report the metric.
+
+        Returns:
+            One dict per group, sorted by key, with the key columns,
+            ``runs`` and one mean per metric (``None`` if no run in the
+            group reports it).
+        """
+        for column in by:
+            if column not in RUN_COLUMNS:
+                raise ValueError(f"Unknown run column: {column}")
+        if not self.run_count:
+            return []
+        if NUMPY_AVAILABLE:
+            groups = self._run_stats_numpy(by, metrics)
+        else:
+            groups = self._run_stats_python(by, metrics)
+        return sorted(groups, key=lambda g: tuple(g[c] for c in by))
+
+    def _run_values_numpy(self, metrics: list[str]) -> dict[str, Any]:
+        runs = np.asarray(self.run, dtype=np.int64)
+        values = np.asarray(self.value, dtype=np.float64)
+        metric_codes = np.asarray(self.codes["metric"], dtype=np.int64)
+        top_code = self._level_index["benchmark"].get("")
+        top = np.asarray(self.codes["benchmark"], dtype=np.int64) == (
+            -1 if top_code is None else top_code
+        )
+        index = self._level_index["metric"]
+        columns = {}
+        for name in metrics:
+            column = np.full(self.run_count, np.nan)
+            if name in index:
+                wanted = metric_codes == index[name]
+                rest = wanted & ~top
+                counts = np.bincount(runs[rest], minlength=self.run_count)
+                sums = np.bincount(
+                    runs[rest], weights=values[rest], minlength=self.run_count
+                )
+                np.divide(sums, counts, out=column, where=counts > 0)
+                # Top-level values overwrite the benchmark means
+                column[runs[wanted & top]] = values[wanted & top]
+            columns[name] = column
+        return columns
+
+    def _run_values_python(self, metrics: list[str]) -> dict[str, list[float | None]]:
+        index = self._level_index["metric"]
+        wanted = {index[m]: m for m in metrics if m in index}
+        top = self._level_index["benchmark"].get("")
+        top_values: dict[tuple[str, int], float] = {}
+        sums: dict[tuple[str, int], list[float]] = {}
+        for i, code in enumerate(self.codes["metric"]):
+            name = wanted.get(code)
+            if name is None:
+                continue
+            key = (name, self.run[i])
+            if self.codes["benchmark"][i] == top:
+                top_values[key] = self.value[i]
+            else:
+                entry = sums.setdefault(key, [0.0, 0])
+                entry[0] += self.value[i]
+                entry[1] += 1
+
+        values: dict[str, list[float | None]] = {}
+        for name in metrics:
+            column: list[float | None] = []
+            for run in range(self.run_count):
+                key = (name, run)
+                if key in top_values:
+                    column.append(top_values[key])
+                elif key in sums:
+                    total, count = sums[key]
+                    column.append(total / count)
+                else:
+                    column.append(None)
+            values[name] = column
+        return values
+
+    def _run_stats_numpy(
+        self, by: tuple[str, ...], metrics: list[str]
+    ) -> list[dict[str, Any]]:
+        # Encode and pack the run key columns, as group_stats does
+        combined = np.zeros(self.run_count, dtype=np.int64)
+        levels = []
+        for column in by:
+            column_levels, codes = np.unique(
+                np.asarray(self.runs[column], dtype=str), return_inverse=True
+            )
+            levels.append(column_levels.tolist())
+            combined = combined * len(column_levels) + codes.reshape(-1)
+        packed, group_codes = np.unique(combined, return_inverse=True)
+        group_codes = group_codes.reshape(-1)
+        group_count = len(packed)
+
+        groups = []
+        for value in packed.tolist():
+            key = []
+            for column_levels in reversed(levels):
+                value, code = divmod(value, len(column_levels))
+                key.append(column_levels[code])
+            groups.append(dict(zip(by, reversed(key), strict=True)))
+        run_counts = np.bincount(group_codes, minlength=group_count).tolist()
+        for group, count in zip(groups, run_counts, strict=True):
+            group["runs"] = count
+
+        for name, column in self._run_values_numpy(metrics).items():
+            present = ~np.isnan(column)
+            counts = np.bincount(group_codes[present], minlength=group_count)
+            sums = np.bincount(
+                group_codes[present], weights=column[present], minlength=group_count
+            )
+            for group, total, count in zip(
+                groups, sums.tolist(), counts.tolist(), strict=True
+            ):
+                group[name] = total / count if count else None
+        return groups
+
+    def _run_stats_python(
+        self, by: tuple[str, ...], metrics: list[str]
+    ) -> list[dict[str, Any]]:
+        values = self._run_values_python(metrics)
+        buckets: dict[tuple[str, ...], list[int]] = {}
+        keys = zip(*(self.runs[c] for c in by), strict=True)
+        for run, key in enumerate(keys):
+            buckets.setdefault(key, []).append(run)
+        groups = []
+        for key, runs in buckets.items():
+            group: dict[str, Any] = {
+                **dict(zip(by, key, strict=True)),
+                "runs": len(runs),
+            }
+            for name in metrics:
+                present = [values[name][r] for r in runs if values[name][r] is not None]
+                group[name] = sum(present) / len(present) if present else None
+            groups.append(group)
+        return groups
+
+    def run_totals(self, by: tuple[str, ...] = ("model", "engine")) -> list[dict]:
+        """Run counts, pass/fail counts and total time per group of runs.
+
+        Returns:
+            One dict per group, sorted by key, with the key columns plus
+            ``runs``, ``passed``, ``failed`` and ``total_time_s``.
+        """
+        for column in by:
+            if column not in RUN_COLUMNS:
+                raise ValueError(f"Unknown run column: {column}")
+        totals: dict[tuple[str, ...], list[float]] = {}
+        keys = zip(*(self.runs[c] for c in by), strict=True)
+        for key, passed, seconds in zip(
+            keys, self.runs["passed"], self.runs["total_time_seconds"], strict=True
+        ):
+            entry = totals.setdefault(key, [0, 0, 0.0])
+            entry[0] += 1
+            entry[1] += passed
+            entry[2] += seconds
+        return [
+            {
+                **dict(zip(by, key, strict=True)),
+                "runs": runs,
+                "passed": passed,
+                "failed": runs - passed,
+                "total_time_s": total_time,
+            }
+            for key, (runs, passed, total_time) in sorted(totals.items())
+        ]
+
+
+def _flatten(metrics: dict[str, Any]) -> list[tuple[str, float]]:
+    flat = []
+    for name, value in metrics.items():
+        if isinstance(value, bool):
+            continue
+        if isinstance(value, (int, float)):
+            flat.append((name, float(value)))
+        elif isinstance(value, dict):
+            for sub_name, sub_value in value.items():
+                if isinstance(sub_value, (int, float)) and not isinstance(
+                    sub_value, bool
+                ):
+                    flat.append((f"{name}.{sub_name}", float(sub_value)))
+    return flat
+
+
+def _reduce_numpy(
+    code_arr: Any, value_arr: Any, group_count: int, percentiles: tuple[float, ...]
+) -> list[dict[str, float]]:
+    order = np.lexsort((value_arr, code_arr))
+    ordered = value_arr[order]
+
+    counts = np.bincount(code_arr, minlength=group_count)
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    ends = starts + counts - 1
+    means = np.bincount(code_arr, weights=value_arr, minlength=group_count) / counts
+    squares = np.bincount(
+        code_arr, weights=(value_arr - means[code_arr]) ** 2, minlength=group_count
+    )
+    stds = np.sqrt(squares / np.maximum(counts - 1, 1))
+
+    def percentile(q: float) -> Any:
+        position = starts + (counts - 1) * (q / 100)
+        lower = np.floor(position).astype(np.int64)
+        upper = np.minimum(lower + 1, ends)
+        frac = position - lower
+        return ordered[lower] + (ordered[upper] - ordered[lower]) * frac
+
+    columns = {
+        "count": counts.tolist(),
+        "mean": means.tolist(),
+        "median": percentile(50).tolist(),
+        "std": stds.tolist(),
+        "min": ordered[starts].tolist(),
+        "max": ordered[ends].tolist(),
+    }
+    for q in percentiles:
+        columns[_percentile_name(q)] = percentile(q).tolist()
+    return [
+        {name: column[g] for name, column in columns.items()}
+        for g in range(group_count)
+    ]
+
+
+def _reduce_python(
+    bucket: list[float], percentiles: tuple[float, ...]
+) -> dict[str, float]:
+    bucket.sort()
+    n = len(bucket)
+    mean = sum(bucket) / n
+    squares = sum((v - mean) ** 2 for v in bucket)
+    group = {
+        "count": n,
+        "mean": mean,
+        "median": _percentile(bucket, 50),
+        "std": math.sqrt(squares / max(n - 1, 1)),
+        "min": bucket[0],
+        "max": bucket[-1],
+    }
+    for q in percentiles:
+        group[_percentile_name(q)] = _percentile(bucket, q)
+    return group
+
+
+def _percentile(ordered: list[float], q: float) -> float:
+    position = (len(ordered) - 1) * (q / 100)
+    lower = math.floor(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def _percentile_name(q: float) -> str:
+    return f"p{q:g}".replace(".", "_")
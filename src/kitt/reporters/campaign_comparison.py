@@ -3,6 +3,8 @@
 import logging
 from typing import Any
 
+from .analytics import MetricTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -14,6 +16,8 @@ def compare_campaigns(
     """Compare results between two campaigns.
 
     Matches runs by (model, engine) and computes deltas for numeric metrics.
+    When a campaign ran a (model, engine) more than once, each metric is
+    the mean over those runs.
 
     Args:
         campaign_a: List of result dicts from campaign A (baseline).
@@ -23,8 +27,8 @@ def compare_campaigns(
     Returns:
         Dict mapping run key to comparison data with deltas.
     """
-    index_a = _index_by_key(campaign_a)
-    index_b = _index_by_key(campaign_b)
+    index_a = _metric_means(campaign_a, metric_keys)
+    index_b = _metric_means(campaign_b, metric_keys)
 
     all_keys = sorted(set(index_a.keys()) | set(index_b.keys()))
     comparison = {}
@@ -39,9 +43,8 @@ def compare_campaigns(
             "in_b": result_b is not None,
         }
 
-        if result_a and result_b:
-            metrics_a = _extract_flat_metrics(result_a, metric_keys)
-            metrics_b = _extract_flat_metrics(result_b, metric_keys)
+        if result_a is not None and result_b is not None:
+            metrics_a, metrics_b = result_a, result_b
 
             deltas: dict[str, dict[str, float | None]] = {}
             for metric in sorted(set(metrics_a.keys()) | set(metrics_b.keys())):
@@ -63,7 +66,7 @@ def compare_campaigns(
                     deltas[metric] = {"baseline": None, "comparison": val_b}
 
             entry["deltas"] = deltas
-        elif result_a:
+        elif result_a is not None:
             entry["note"] = "Only in baseline"
         else:
             entry["note"] = "Only in comparison"
@@ -73,34 +76,23 @@ def compare_campaigns(
     return comparison
 
 
-def _index_by_key(
+def _metric_means(
     results: list[dict[str, Any]],
-) -> dict[str, dict[str, Any]]:
-    """Index results by (model, engine) key."""
-    index = {}
-    for r in results:
-        model = r.get("model", "unknown")
-        engine = r.get("engine", "unknown")
-        key = f"{model}|{engine}"
-        index[key] = r
-    return index
-
-
-def _extract_flat_metrics(
-    result: dict[str, Any],
     metric_keys: list[str] | None = None,
-) -> dict[str, float]:
-    """Extract flat numeric metrics from a result."""
-    flat = {}
-    for bench in result.get("results", []):
-        for key, value in bench.get("metrics", {}).items():
-            if isinstance(value, (int, float)):
-                if metric_keys is None or key in metric_keys:
-                    flat[f"{bench.get('test_name', '')}.{key}"] = float(value)
-            elif isinstance(value, dict):
-                for sub_key, sub_value in value.items():
-                    if isinstance(sub_value, (int, float)):
-                        full_key = f"{bench.get('test_name', '')}.{key}.{sub_key}"
-                        if metric_keys is None or full_key in metric_keys:
-                            flat[full_key] = float(sub_value)
-    return flat
+) -> dict[str, dict[str, float]]:
+    """Mean of each ``benchmark.metric`` per (model, engine) key."""
+    table = MetricTable.from_results(results)
+    index: dict[str, dict[str, float]] = {
+        f"{g['model']}|{g['engine']}": {} for g in table.run_totals()
+    }
+    for stats in table.group_stats(
+        ("model", "engine", "benchmark", "metric"), percentiles=()
+    ):
+        if not stats["benchmark"]:
+            continue
+        flat_key = f"{stats['benchmark']}.{stats['metric']}"
+        # Plain metrics match metric_keys by name, nested ones by full key
+        name = flat_key if "." in stats["metric"] else stats["metric"]
+        if metric_keys is None or name in metric_keys:
+            index[f"{stats['model']}|{stats['engine']}"][flat_key] = stats["mean"]
+    return index
@@ -4,6 +4,8 @@ import json
 import logging
 from typing import Any
 
+from .analytics import MetricTable
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,39 +26,27 @@ def generate_campaign_rollup(
         return "No results to aggregate."
 
     # Group by model × engine
+    table = MetricTable.from_results(results)
     groups: dict[str, dict[str, Any]] = {}
-    for r in results:
-        model = r.get("model", "unknown")
-        engine = r.get("engine", "unknown")
-        key = f"{model}|{engine}"
-
-        if key not in groups:
-            groups[key] = {
-                "model": model,
-                "engine": engine,
-                "passed": 0,
-                "failed": 0,
-                "total_time_s": 0.0,
-                "metrics": {},
-            }
-
-        group = groups[key]
-        if r.get("passed", False):
-            group["passed"] += 1
-        else:
-            group["failed"] += 1
-
-        group["total_time_s"] += r.get("total_time_seconds", 0)
+    for totals in table.run_totals(("model", "engine")):
+        key = f"{totals['model']}|{totals['engine']}"
+        groups[key] = {
+            "model": totals["model"],
+            "engine": totals["engine"],
+            "passed": totals["passed"],
+            "failed": totals["failed"],
+            "total_time_s": totals["total_time_s"],
+            "metrics": {},
+        }
 
-        # Collect aggregate metrics
-        for bench in r.get("results", []):
-            test_name = bench.get("test_name", "")
-            for k, v in bench.get("metrics", {}).items():
-                if isinstance(v, (int, float)):
-                    metric_key = f"{test_name}.{k}"
-                    if metric_key not in group["metrics"]:
-                        group["metrics"][metric_key] = []
-                    group["metrics"][metric_key].append(float(v))
+    # Per-benchmark metric statistics in one group-by
+    for stats in table.group_stats(
+        ("model", "engine", "benchmark", "metric"), percentiles=(95,)
+    ):
+        if not stats["benchmark"]:
+            continue
+        group = groups[f"{stats['model']}|{stats['engine']}"]
+        group["metrics"][f"{stats['benchmark']}.{stats['metric']}"] = stats
 
     if output_format == "json":
         return _to_json(groups)
@@ -120,12 +110,8 @@ def _to_markdown(groups: dict[str, dict[str, Any]]) -> str:
             g = groups[key]
             vals = []
             for mk in highlighted:
-                values = g["metrics"].get(mk, [])
-                if values:
-                    avg = sum(values) / len(values)
-                    vals.append(f"{avg:.2f}")
-                else:
-                    vals.append("-")
+                stats = g["metrics"].get(mk)
+                vals.append(f"{stats['mean']:.2f}" if stats else "-")
             lines.append(f"| {g['model']} | {g['engine']} | " + " | ".join(vals) + " |")
 
     lines.append("")
@@ -136,10 +122,14 @@ def _to_json(groups: dict[str, dict[str, Any]]) -> str:
     """Generate JSON rollup."""
     output = {}
     for key, g in groups.items():
-        # Average all metric values
         avg_metrics = {}
-        for mk, values in g["metrics"].items():
-            avg_metrics[mk] = round(sum(values) / len(values), 4) if values else 0
+        metric_stats = {}
+        for mk, stats in g["metrics"].items():
+            avg_metrics[mk] = round(stats["mean"], 4)
+            metric_stats[mk] = {
+                name: round(stats[name], 4)
+                for name in ("median", "std", "min", "max", "p95")
+            }
 
         output[key] = {
             "model": g["model"],
@@ -148,6 +138,7 @@ def _to_json(groups: dict[str, dict[str, Any]]) -> str:
             "failed": g["failed"],
             "total_time_s": round(g["total_time_s"], 1),
             "avg_metrics": avg_metrics,
+            "metric_stats": metric_stats,
         }
 
     return json.dumps(output, indent=2)
@@ -1,10 +1,20 @@
-"""Export results to CSV and Parquet formats."""
+"""Export results to CSV and Parquet formats.
+
+Exports stream: results are flattened lazily, spooled to a temporary
+file, and written in batches, so memory use does not grow with the
+number of results.
+"""
 
 import csv
+import json
 import logging
+import tempfile
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from typing import Any
 
+from kitt.utils.compression import ResultCompression
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,42 +60,199 @@ def flatten_result(result_data: dict[str, Any]) -> list[dict[str, Any]]:
     return rows
 
 
+def iter_rows(results: Iterable[dict[str, Any]]) -> Iterator[dict[str, Any]]:
+    """Flatten results lazily, one benchmark row at a time."""
+    for result_data in results:
+        yield from flatten_result(result_data)
+
+
+def flatten_output(output: dict[str, Any], prefix: str = "") -> dict[str, Any]:
+    """Flatten one per-iteration output record into a single row.
+
+    Nested dicts use dot notation. Lists and other non-scalar values are
+    stored as JSON strings.
+    """
+    row: dict[str, Any] = {}
+    for key, value in output.items():
+        name = f"{prefix}{key}"
+        if isinstance(value, dict):
+            row.update(flatten_output(value, prefix=f"{name}."))
+        elif value is None or isinstance(value, (int, float, str, bool)):
+            row[name] = value
+        else:
+            row[name] = json.dumps(value, default=str)
+    return row
+
+
+def iter_output_rows(run_dir: Path) -> Iterator[dict[str, Any]]:
+    """Stream the per-iteration outputs of a run from its ``.jsonl.gz`` chunks.
+
+    Args:
+        run_dir: A run's output directory (containing ``outputs/``).
+    """
+    base_path = run_dir / "outputs" / "results"
+    for output in ResultCompression.load_outputs(base_path):
+        yield flatten_output(output)
+
+
+class _RowSpool:
+    """Rows spooled to a temporary file while the column set is learned.
+
+    Neither CSV nor Parquet can add a column after the header or schema is
+    written, so a first pass records every column and its value types.
+    The second pass writes from the spool one batch at a time. Memory
+    use stays at one batch however many rows there are.
+    """
+
+    def __init__(self, rows: Iterable[dict[str, Any]]) -> None:
+        self.columns: dict[str, set[type]] = {}
+        self.count = 0
+        self._file = tempfile.TemporaryFile("w+", encoding="utf-8")  # noqa: SIM115
+        for row in rows:
+            for key, value in row.items():
+                kinds = self.columns.setdefault(key, set())
+                if value is not None:
+                    kinds.add(type(value))
+            self._file.write(json.dumps(row, default=str) + "\n")
+            self.count += 1
+
+    def batches(self, size: int) -> Iterator[list[dict[str, Any]]]:
+        self._file.seek(0)
+        batch = []
+        for line in self._file:
+            batch.append(json.loads(line))
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def write_csv(
+    rows: Iterable[dict[str, Any]],
+    output_path: Path,
+    batch_size: int = 10_000,
+) -> int:
+    """Stream rows into a CSV file whose header covers every column.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If there are no rows.
+    """
+    spool = _RowSpool(rows)
+    try:
+        if not spool.count:
+            raise ValueError("No data to export")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(output_path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=list(spool.columns))
+            writer.writeheader()
+            for batch in spool.batches(batch_size):
+                writer.writerows(batch)
+    finally:
+        spool.close()
+    logger.info(f"Exported {spool.count} rows to {output_path}")
+    return spool.count
+
+
+def write_parquet(
+    rows: Iterable[dict[str, Any]],
+    output_path: Path,
+    row_group_size: int = 10_000,
+) -> int:
+    """Stream rows into a Parquet file, one row group per batch.
+
+    The schema is the union of all columns. A column holding only ints
+    is int64, ints mixed with floats become float64, and anything mixed
+    with strings becomes string. Rows missing a column get nulls.
+
+    Requires pyarrow.
+
+    Returns:
+        Number of rows written.
+
+    Raises:
+        ValueError: If there are no rows.
+    """
+    pa, pq = _import_pyarrow()
+
+    spool = _RowSpool(rows)
+    try:
+        if not spool.count:
+            raise ValueError("No data to export")
+        schema = pa.schema(
+            [(name, _arrow_type(pa, kinds)) for name, kinds in spool.columns.items()]
+        )
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+        with pq.ParquetWriter(str(output_path), schema) as writer:
+            for batch in spool.batches(row_group_size):
+                arrays = [
+                    pa.array(
+                        [_coerce(field.type, row.get(field.name)) for row in batch],
+                        type=field.type,
+                    )
+                    for field in schema
+                ]
+                writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+    finally:
+        spool.close()
+    logger.info(f"Exported {spool.count} rows to {output_path}")
+    return spool.count
+
+
+def export_rows(rows: Iterable[dict[str, Any]], output_path: Path) -> int:
+    """Write rows as Parquet or CSV depending on the file extension."""
+    if output_path.suffix == ".parquet":
+        return write_parquet(rows, output_path)
+    return write_csv(rows, output_path)
+
+
+def export_store(
+    store: Any,
+    output_path: Path,
+    filters: dict[str, Any] | None = None,
+    batch_size: int = 500,
+) -> int:
+    """Export every matching result in a store without loading them all.
+
+    Args:
+        store: A :class:`kitt.storage.base.ResultStore`.
+        output_path: ``.parquet`` or ``.csv`` file.
+        filters: Exact matches on run columns, e.g. ``{"model": ...}``.
+        batch_size: Results fetched from the store per round trip.
+
+    Returns:
+        Number of rows written.
+    """
+    results = store.iter_results(filters=filters, batch_size=batch_size)
+    return export_rows(iter_rows(results), output_path)
+
+
 def export_to_csv(
-    result_data: list[dict[str, Any]],
+    result_data: Iterable[dict[str, Any]],
     output_path: Path,
 ) -> Path:
     """Export results to CSV.
 
     Args:
-        result_data: List of result dicts (from metrics.json files).
+        result_data: Result dicts (from metrics.json files), or an
+            iterator such as :meth:`ResultStore.iter_results`.
         output_path: Path for the output CSV file.
 
     Returns:
         Path to the created CSV file.
     """
-    all_rows = []
-    for data in result_data:
-        all_rows.extend(flatten_result(data))
-
-    if not all_rows:
-        raise ValueError("No data to export")
-
-    # Collect all column names
-    columns = list(dict.fromkeys(col for row in all_rows for col in row))
-
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(output_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=columns)
-        writer.writeheader()
-        writer.writerows(all_rows)
-
-    logger.info(f"Exported {len(all_rows)} rows to {output_path}")
+    write_csv(iter_rows(result_data), output_path)
     return output_path
 
 
 def export_to_parquet(
-    result_data: list[dict[str, Any]],
+    result_data: Iterable[dict[str, Any]],
     output_path: Path,
 ) -> Path:
     """Export results to Parquet format.
@@ -93,12 +260,17 @@ def export_to_parquet(
     Requires pyarrow.
 
     Args:
-        result_data: List of result dicts.
+        result_data: Result dicts, or an iterator over them.
         output_path: Path for the output Parquet file.
 
     Returns:
         Path to the created Parquet file.
     """
+    write_parquet(iter_rows(result_data), output_path)
+    return output_path
+
+
+def _import_pyarrow() -> tuple[Any, Any]:
     try:
         import pyarrow as pa
         import pyarrow.parquet as pq
@@ -106,25 +278,29 @@ def export_to_parquet(
         raise ImportError(
             "pyarrow is required for Parquet export. Install with: pip install pyarrow"
         ) from None
+    return pa, pq
 
-    all_rows = []
-    for data in result_data:
-        all_rows.extend(flatten_result(data))
 
-    if not all_rows:
-        raise ValueError("No data to export")
+def _arrow_type(pa: Any, kinds: set[type]) -> Any:
+    if (
+        not kinds
+        or not kinds <= {bool, int, float}
+        or (bool in kinds and len(kinds) > 1)
+    ):
+        return pa.string()
+    if kinds == {bool}:
+        return pa.bool_()
+    if kinds == {int}:
+        return pa.int64()
+    return pa.float64()
 
-    # Convert to columnar format
-    columns = list(dict.fromkeys(col for row in all_rows for col in row))
 
-    arrays = {}
-    for col in columns:
-        values = [row.get(col) for row in all_rows]
-        arrays[col] = values
-
-    table = pa.table(arrays)
-    output_path.parent.mkdir(parents=True, exist_ok=True)
-    pq.write_table(table, str(output_path))
-
-    logger.info(f"Exported {len(all_rows)} rows to {output_path}")
-    return output_path
+def _coerce(arrow_type: Any, value: Any) -> Any:
+    if value is None:
+        return None
+    type_name = str(arrow_type)
+    if type_name == "string":
+        return value if isinstance(value, str) else json.dumps(value)
+    if type_name == "double":
+        return float(value)
+    return value
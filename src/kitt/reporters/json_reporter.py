@@ -52,6 +52,12 @@ def suite_result_to_dict(
     if system_info:
         data["system_info"] = asdict(system_info)
 
+    if suite_result.warmup is not None:
+        data["warmup"] = suite_result.warmup.to_dict()
+
+    if suite_result.sampling:
+        data["sampling"] = suite_result.sampling
+
     for result in suite_result.results:
         result_dict = {
             "test_name": result.test_name,
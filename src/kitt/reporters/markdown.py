@@ -35,6 +35,10 @@ def generate_summary(
         f"({suite_result.passed_count}/{suite_result.total_benchmarks})"
     )
     lines.append(f"**Total Time**: {suite_result.total_time_seconds:.1f}s")
+    if suite_result.warmup is not None:
+        warmup = suite_result.warmup
+        state = "converged" if warmup.converged else "did not converge"
+        lines.append(f"**Warmup**: {warmup.iterations} iterations ({state})")
     lines.append("")
 
     # System info
@@ -72,6 +76,21 @@ def generate_summary(
 
     lines.append("")
 
+    if suite_result.sampling:
+        lines.append("## Adaptive Sampling")
+        lines.append("")
+        lines.append("| Benchmark | Metric | Runs | Mean | Relative CI | Stop Reason |")
+        lines.append("|-----------|--------|------|------|-------------|-------------|")
+        for name, sampling in suite_result.sampling.items():
+            rel_ci = sampling.get("relative_ci")
+            rel_ci_str = f"±{rel_ci:.1%}" if rel_ci is not None else "-"
+            lines.append(
+                f"| {name} | {sampling['metric']} | {sampling['runs']} | "
+                f"{sampling.get('mean', '-')} | {rel_ci_str} | "
+                f"{sampling['stop_reason']} |"
+            )
+        lines.append("")
+
     # Detailed metrics per benchmark
     lines.append("## Detailed Metrics")
     lines.append("")
@@ -4,6 +4,8 @@ import logging
 from pathlib import Path
 from typing import Any
 
+from .analytics import MetricTable
+
 logger = logging.getLogger(__name__)
 
 # Bits per parameter for common quantization types
@@ -48,7 +50,8 @@ class QuantCurveGenerator:
             model_family: Filter by model family (e.g. "Llama-3").
 
         Returns:
-            List of data points with quant, bpp, accuracy, throughput.
+            One data point per (model, engine, quant) with bpp and the mean
+            accuracy and throughput over all of its runs.
         """
         if not self.store:
             return []
@@ -57,34 +60,28 @@ class QuantCurveGenerator:
         if model_family:
             filters["model"] = model_family
 
-        results = self.store.query(
-            filters=filters or None,
-            order_by="-timestamp",
-            limit=200,
+        # One query over the full history; each run counts once, with
+        # its top-level metric if present, else its benchmark mean
+        table = MetricTable.from_store(
+            self.store, filters=filters or None, metrics=["accuracy", "avg_tps"]
         )
-
         points = []
-        for r in results:
-            quant = r.get("quant", "")
-            if not quant:
-                continue
-
-            bpp = _QUANT_BPP.get(quant)
+        for group in table.run_stats(
+            ("model", "engine", "quant"), metrics=["accuracy", "avg_tps"]
+        ):
+            bpp = _QUANT_BPP.get(group["quant"])
             if bpp is None:
                 continue
 
-            metrics = r.get("metrics", {})
-            accuracy = metrics.get("accuracy", 0)
-            throughput = metrics.get("avg_tps", 0)
-
             points.append(
                 {
-                    "model": r.get("model", ""),
-                    "engine": r.get("engine", ""),
-                    "quant": quant,
+                    "model": group["model"],
+                    "engine": group["engine"],
+                    "quant": group["quant"],
                     "bpp": bpp,
-                    "accuracy": accuracy,
-                    "throughput": throughput,
+                    "accuracy": group["accuracy"] or 0,
+                    "throughput": group["avg_tps"] or 0,
+                    "runs": group["runs"],
                 }
             )
 
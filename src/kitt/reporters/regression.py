@@ -1,11 +1,26 @@
 """Regression detection for benchmark results."""
 
 import logging
+import math
 from dataclasses import dataclass
+from itertools import groupby
+from statistics import median
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_HIGHER_IS_BETTER = ["avg_tps", "accuracy", "max_tps", "min_tps"]
+DEFAULT_LOWER_IS_BETTER = [
+    "avg_latency_ms",
+    "p99_latency_ms",
+    "p95_latency_ms",
+    "total_latency_ms",
+    "ttft_ms",
+]
+
+# Scales a median absolute deviation to a standard deviation for normal data
+_MAD_SCALE = 1.4826
+
 
 @dataclass
 class RegressionAlert:
@@ -36,25 +51,8 @@ class RegressionDetector:
     ) -> None:
         self.warning_threshold = warning_threshold_pct
         self.critical_threshold = critical_threshold_pct
-        self.higher_is_better = set(
-            higher_is_better
-            or [
-                "avg_tps",
-                "accuracy",
-                "max_tps",
-                "min_tps",
-            ]
-        )
-        self.lower_is_better = set(
-            lower_is_better
-            or [
-                "avg_latency_ms",
-                "p99_latency_ms",
-                "p95_latency_ms",
-                "total_latency_ms",
-                "ttft_ms",
-            ]
-        )
+        self.higher_is_better = set(higher_is_better or DEFAULT_HIGHER_IS_BETTER)
+        self.lower_is_better = set(lower_is_better or DEFAULT_LOWER_IS_BETTER)
 
     def detect(
         self,
@@ -127,3 +125,177 @@ class RegressionDetector:
                 if isinstance(value, (int, float)):
                     metrics[key] = float(value)
         return metrics
+
+
+@dataclass
+class ChangePoint:
+    """A regression found in a metric's history.
+
+    ``kind`` is ``"shift"`` for a sustained level change starting at
+    ``timestamp``, or ``"outlier"`` when only the latest run is off.
+    """
+
+    model: str
+    engine: str
+    fingerprint: str
+    benchmark: str
+    metric: str
+    timestamp: str
+    baseline_value: float
+    current_value: float
+    delta_pct: float
+    score: float
+    runs_since: int
+    kind: str  # "shift", "outlier"
+    severity: str  # "warning", "critical"
+
+
+class HistoryRegressionDetector:
+    """Detect regressions across the full history of each metric.
+
+    Each (model, engine, hardware fingerprint, benchmark, metric) series is
+    scanned for the single most significant level shift. The split point
+    is the one with the largest mean shift, and the shift is then scored
+    on the medians either side against a noise estimate from successive
+    differences, which a step barely inflates. Slow drifts show up as a
+    shift between their early and late medians. The latest run is also
+    checked as a robust z-score outlier against everything before it, so
+    a fresh drop is reported before it has repeated.
+
+    Only shifts in the worse direction, scoring at least ``z_threshold``
+    and moving the median by at least ``min_delta_pct``, are reported.
+    This keeps noisy metrics quiet without a fixed percent threshold.
+    """
+
+    def __init__(
+        self,
+        z_threshold: float = 4.0,
+        min_delta_pct: float = 5.0,
+        critical_threshold_pct: float = 25.0,
+        min_history: int = 5,
+        min_segment: int = 3,
+        window: int = 200,
+        noise_floor_pct: float = 0.5,
+        higher_is_better: list[str] | None = None,
+        lower_is_better: list[str] | None = None,
+    ) -> None:
+        self.z_threshold = z_threshold
+        self.min_delta_pct = min_delta_pct
+        self.critical_threshold = critical_threshold_pct
+        self.min_history = min_history
+        self.min_segment = min_segment
+        self.window = window
+        self.noise_floor_pct = noise_floor_pct
+        self.higher_is_better = set(higher_is_better or DEFAULT_HIGHER_IS_BETTER)
+        self.lower_is_better = set(lower_is_better or DEFAULT_LOWER_IS_BETTER)
+
+    def scan(
+        self, store: Any, filters: dict[str, Any] | None = None
+    ) -> list[ChangePoint]:
+        """Load every relevant series from ``store`` and analyze it.
+
+        Args:
+            store: A :class:`kitt.storage.base.ResultStore`.
+            filters: Exact matches on run columns, e.g. ``{"model": ...}``.
+        """
+        metrics = sorted(self.higher_is_better | self.lower_is_better)
+        return self.analyze(store.metric_history(filters=filters, metrics=metrics))
+
+    def analyze(
+        self, rows: list[tuple[str, str, str, str, str, Any, float]]
+    ) -> list[ChangePoint]:
+        """Analyze rows shaped like :meth:`ResultStore.metric_history` output.
+
+        Returns:
+            Change points, most severe first.
+        """
+        found = []
+        for series, points in groupby(rows, key=lambda r: r[:5]):
+            metric = series[4]
+            if metric in self.higher_is_better:
+                sign = -1.0
+            elif metric in self.lower_is_better:
+                sign = 1.0
+            else:
+                continue
+            points = list(points)[-self.window :]
+            change = self._detect(
+                [p[6] for p in points], [str(p[5]) for p in points], sign
+            )
+            if change is not None:
+                model, engine, fingerprint, benchmark, _ = series
+                found.append(
+                    ChangePoint(model, engine, fingerprint, benchmark, metric, **change)
+                )
+        return sorted(found, key=lambda c: (c.severity != "critical", -c.delta_pct))
+
+    def _detect(
+        self, values: list[float], timestamps: list[str], sign: float
+    ) -> dict[str, Any] | None:
+        """Find the most significant worsening shift in one series.
+
+        Args:
+            values: Chronological values.
+            timestamps: Matching timestamps.
+            sign: +1 when increases are regressions, -1 when decreases are.
+        """
+        n = len(values)
+        if n < self.min_history:
+            return None
+
+        level = abs(median(values))
+        floor = max(level * self.noise_floor_pct / 100, 1e-12)
+        diffs = [abs(b - a) for a, b in zip(values, values[1:], strict=False)]
+        sigma = max(_MAD_SCALE * median(diffs) / math.sqrt(2), floor)
+
+        # Locate the split with the largest mean shift (binary
+        # segmentation), then score it robustly on the segment medians.
+        prefix = [0.0]
+        for v in values:
+            prefix.append(prefix[-1] + v)
+        total = prefix[-1]
+        split, split_stat = None, 0.0
+        for k in range(self.min_segment, n - self.min_segment + 1):
+            shift = ((total - prefix[k]) / (n - k) - prefix[k] / k) * sign
+            stat = shift * math.sqrt(k * (n - k) / n)
+            if stat > split_stat:
+                split, split_stat = k, stat
+
+        best = None
+        if split is not None:
+            before, after = median(values[:split]), median(values[split:])
+            shift = (after - before) * sign
+            if shift > 0 and before != 0:
+                score = shift / (sigma * math.sqrt(1 / split + 1 / (n - split)))
+                best = (score, split, before, after)
+
+        if best is None or best[0] < self.z_threshold:
+            # Fall back to the newest run on its own
+            history = values[:-1]
+            center = median(history)
+            spread = _MAD_SCALE * median(abs(v - center) for v in history)
+            shift = (values[-1] - center) * sign
+            score = shift / max(spread, floor)
+            if center == 0 or score < self.z_threshold:
+                return None
+            best = (score, n - 1, center, values[-1])
+            kind = "outlier"
+        else:
+            kind = "shift"
+
+        score, k, before, after = best
+        delta_pct = abs(after - before) / abs(before) * 100
+        if delta_pct < self.min_delta_pct:
+            return None
+        return {
+            "timestamp": timestamps[k],
+            "baseline_value": before,
+            "current_value": after,
+            "delta_pct": round(delta_pct, 2),
+            "score": round(score, 2),
+            "runs_since": n - k,
+            "kind": kind,
+            "severity": "critical"
+            if delta_pct >= self.critical_threshold
+            else "warning",
+        }
@@ -0,0 +1,152 @@
+"""Adaptive run counts — keep sampling until a confidence interval is tight."""
+
+import math
+import statistics
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+
+def t_critical(confidence: float, df: int) -> float:
+    """Two-sided Student's t critical value.
+
+    Exact for one and two degrees of freedom, Cornish-Fisher expansion of
+    the normal quantile otherwise (accurate to ~1% from df=3 upward).
+    """
+    p = 1 - (1 - confidence) / 2
+    if df == 1:
+        return math.tan(math.pi * (p - 0.5))
+    if df == 2:
+        return (2 * p - 1) / math.sqrt(2 * p * (1 - p))
+
+    z = statistics.NormalDist().inv_cdf(p)
+    return (
+        z
+        + (z**3 + z) / (4 * df)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * df**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * df**3)
+    )
+
+
+def confidence_interval(
+    values: list[float], confidence: float = 0.95
+) -> tuple[float, float, float]:
+    """Return (mean, lower, upper) of a t-based confidence interval."""
+    mean = statistics.mean(values)
+    if len(values) < 2:
+        return mean, mean, mean
+    half_width = t_critical(confidence, len(values) - 1) * (
+        statistics.stdev(values) / math.sqrt(len(values))
+    )
+    return mean, mean - half_width, mean + half_width
+
+
+def get_metric(metrics: dict[str, Any], path: str) -> float | None:
+    """Look up a possibly nested metric (``"ttft_ms.avg"``)."""
+    value: Any = metrics
+    for part in path.split("."):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+@dataclass
+class AdaptiveConfig:
+    """Stopping rule for adaptive sampling."""
+
+    metric: str | None = None  # None = the benchmark's primary_metric
+    relative_ci: float = 0.05  # Target CI half-width as a fraction of the mean
+    confidence: float = 0.95
+    min_runs: int = 3
+    max_runs: int = 20
+    time_budget_s: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "AdaptiveConfig":
+        min_runs = max(2, data.get("min_runs", 3))
+        return cls(
+            metric=data.get("metric"),
+            relative_ci=data.get("relative_ci", 0.05),
+            confidence=data.get("confidence", 0.95),
+            min_runs=min_runs,
+            max_runs=max(min_runs, data.get("max_runs", 20)),
+            time_budget_s=data.get("time_budget_s"),
+        )
+
+
+@dataclass
+class AdaptiveSampler:
+    """Track one benchmark's samples and decide when to stop running it."""
+
+    config: AdaptiveConfig
+    metric: str
+    values: list[float] = field(default_factory=list)
+    runs: int = 0
+    stop_reason: str = ""
+    _start: float = field(init=False)
+
+    def __post_init__(self) -> None:
+        self._start = time.perf_counter()
+
+    def add(self, metrics: dict[str, Any]) -> None:
+        """Record the target metric from one run's metrics."""
+        self.runs += 1
+        value = get_metric(metrics, self.metric)
+        if value is not None:
+            self.values.append(value)
+
+    def relative_half_width(self) -> float | None:
+        if len(self.values) < 2:
+            return None
+        mean, lower, upper = confidence_interval(self.values, self.config.confidence)
+        if mean == 0:
+            return 0.0 if upper == lower else None
+        return (upper - lower) / 2 / abs(mean)
+
+    def should_continue(self) -> bool:
+        """True while another run is needed to reach the target width."""
+        if self.runs < self.config.min_runs:
+            return True
+
+        width = self.relative_half_width()
+        if not self.values:
+            self.stop_reason = "metric_unavailable"
+        elif width is not None and width <= self.config.relative_ci:
+            self.stop_reason = "converged"
+        elif self.runs >= self.config.max_runs:
+            self.stop_reason = "max_runs"
+        elif (
+            self.config.time_budget_s is not None
+            and time.perf_counter() - self._start >= self.config.time_budget_s
+        ):
+            self.stop_reason = "time_budget"
+        else:
+            return True
+        return False
+
+    def summary(self) -> dict[str, Any]:
+        """Achieved confidence interval, for the suite result."""
+        data: dict[str, Any] = {
+            "metric": self.metric,
+            "runs": self.runs,
+            "samples": len(self.values),
+            "confidence": self.config.confidence,
+            "target_relative_ci": self.config.relative_ci,
+            "converged": self.stop_reason == "converged",
+            "stop_reason": self.stop_reason,
+        }
+        if self.values:
+            mean, lower, upper = confidence_interval(
+                self.values, self.config.confidence
+            )
+            width = self.relative_half_width()
+            data.update(
+                {
+                    "mean": round(mean, 4),
+                    "ci_lower": round(lower, 4),
+                    "ci_upper": round(upper, 4),
+                    "relative_ci": round(width, 4) if width is not None else None,
+                }
+            )
+        return data
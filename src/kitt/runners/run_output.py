@@ -0,0 +1,75 @@
+"""Write the on-disk artifacts of a completed benchmark run."""
+
+import json
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any
+
+from kitt.hardware.fingerprint import SystemInfo
+from kitt.reporters.json_reporter import save_json_report
+from kitt.reporters.markdown import generate_summary
+from kitt.utils.compression import ResultCompression
+
+from .suite import SuiteResult
+
+
+def default_output_dir(model: str, engine: str, timestamp: str) -> Path:
+    """~/.kitt/results/<model>/<engine>/<timestamp>."""
+    model_name_clean = Path(model).name if "/" in model or "\\" in model else model
+    return Path.home() / ".kitt" / "results" / model_name_clean / engine / timestamp
+
+
+def write_run_outputs(
+    suite_result: SuiteResult,
+    output_dir: Path,
+    system_info: SystemInfo,
+    engine_name: str,
+    model_name: str,
+    run_config: dict[str, Any],
+) -> int:
+    """Save metrics.json, hardware.json, config.json, summary.md and outputs.
+
+    Returns:
+        Number of compressed output chunk files written.
+    """
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    save_json_report(
+        suite_result,
+        output_dir / "metrics.json",
+        system_info=system_info,
+        engine_name=engine_name,
+        model_name=model_name,
+    )
+
+    with open(output_dir / "hardware.json", "w") as f:
+        json.dump(asdict(system_info), f, indent=2)
+
+    with open(output_dir / "config.json", "w") as f:
+        json.dump(run_config, f, indent=2)
+
+    summary = generate_summary(
+        suite_result,
+        system_info=system_info,
+        engine_name=engine_name,
+        model_name=model_name,
+    )
+    (output_dir / "summary.md").write_text(summary)
+
+    all_outputs = []
+    for result in suite_result.results:
+        for output_item in result.outputs:
+            all_outputs.append(
+                {
+                    "benchmark": result.test_name,
+                    "run_number": result.run_number,
+                    **output_item,
+                }
+            )
+
+    if not all_outputs:
+        return 0
+
+    outputs_dir = output_dir / "outputs"
+    outputs_dir.mkdir(exist_ok=True)
+    return len(ResultCompression.save_outputs(all_outputs, outputs_dir / "results"))
@@ -1,14 +1,18 @@
 """Test suite runner - execute multiple benchmarks."""
 
+import copy
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any
 
 from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
+from kitt.config.models import SuiteConfig
 from kitt.engines.base import InferenceEngine
 
+from .adaptive import AdaptiveConfig, AdaptiveSampler
 from .single_test import SingleTestRunner
+from .warmup import SessionWarmup, SessionWarmupResult
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +25,8 @@ class SuiteResult:
     results: list[BenchmarkResult] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
     total_time_seconds: float = 0.0
+    warmup: SessionWarmupResult | None = None
+    sampling: dict[str, dict[str, Any]] = field(default_factory=dict)
 
     @property
     def passed(self) -> bool:
@@ -40,11 +46,56 @@ class SuiteResult:
         return sum(1 for r in self.results if not r.passed)
 
 
+def suite_run_config(
+    suite_cfg: SuiteConfig | None,
+) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Return the global config and per-test overrides a suite file sets.
+
+    Overrides keep only the keys written in the suite YAML, so unset
+    fields do not replace values from the global config.
+    """
+    if suite_cfg is None:
+        return {}, {}
+    test_overrides = {
+        name: overrides.model_dump(exclude_unset=True)
+        for name, overrides in suite_cfg.test_overrides.items()
+    }
+    return copy.deepcopy(suite_cfg.global_config), test_overrides
+
+
 class SuiteRunner:
-    """Run a suite of benchmarks against an engine."""
+    """Run a suite of benchmarks against an engine.
+
+    Warmup is a session-level concern: the engine is warmed once, until
+    latency converges, the first time a suite runs against it. Individual
+    benchmarks then skip their own warmup phase. Set ``warmup.session`` to
+    false in the global config to restore per-benchmark warmup. Benchmarks
+    with ``requires_cold_engine`` run first, before the session warmup,
+    and keep their own warmup config.
+
+    Run counts are fixed (``runs``) unless an ``adaptive`` block is given,
+    in which case each benchmark is re-run until the confidence interval
+    of its target metric is narrow enough, ``max_runs`` is reached, or
+    the time budget runs out. The achieved interval is recorded per
+    benchmark in ``SuiteResult.sampling``.
+    """
 
     def __init__(self, engine: InferenceEngine) -> None:
         self.engine = engine
+        self.session_warmup: SessionWarmupResult | None = None
+
+    def warm_up(self, warmup_config: dict[str, Any]) -> SessionWarmupResult:
+        """Warm the engine once per session; later calls reuse the result."""
+        if self.session_warmup is None:
+            logger.info("Warming up engine session...")
+            self.session_warmup = SessionWarmup.from_config(warmup_config).run(
+                self.engine
+            )
+        return self.session_warmup
+
+    def reset_warmup(self) -> None:
+        """Forget the session warmup, e.g. after the engine was restarted."""
+        self.session_warmup = None
 
     def run(
         self,
@@ -70,14 +121,35 @@ class SuiteRunner:
         suite_result = SuiteResult(suite_name=suite_name)
         start_time = time.perf_counter()
 
-        for benchmark in benchmarks:
+        warmup_config = global_config.get("warmup", {})
+        session_warmup = warmup_config.get("enabled", True) and warmup_config.get(
+            "session", True
+        )
+
+        # Benchmarks that measure a cold engine go before the session warmup
+        ordered = [b for b in benchmarks if b.requires_cold_engine] + [
+            b for b in benchmarks if not b.requires_cold_engine
+        ]
+
+        for benchmark in ordered:
             # Merge global config with per-test overrides
             config = global_config.copy()
             if benchmark.name in test_overrides:
                 config.update(test_overrides[benchmark.name])
+            if session_warmup and not benchmark.requires_cold_engine:
+                if suite_result.warmup is None:
+                    suite_result.warmup = self.warm_up(warmup_config)
+                config["warmup"] = {**config.get("warmup", {}), "enabled": False}
 
             # Handle multiple runs
             runs = config.pop("runs", 1)
+            adaptive = config.pop("adaptive", None)
+
+            if adaptive:
+                suite_result.sampling[benchmark.name] = self._run_adaptive(
+                    benchmark, config, adaptive, suite_result
+                )
+                continue
 
             for run_num in range(1, runs + 1):
                 logger.info(f"[{benchmark.name}] Run {run_num}/{runs}")
@@ -97,3 +169,36 @@ class SuiteRunner:
         )
 
         return suite_result
+
+    def _run_adaptive(
+        self,
+        benchmark: LLMBenchmark,
+        config: dict[str, Any],
+        adaptive: dict[str, Any],
+        suite_result: SuiteResult,
+    ) -> dict[str, Any]:
+        """Repeat a benchmark until its target metric's CI is narrow enough."""
+        adaptive_config = AdaptiveConfig.from_dict(adaptive)
+        sampler = AdaptiveSampler(
+            config=adaptive_config,
+            metric=adaptive_config.metric or benchmark.primary_metric,
+        )
+
+        while sampler.should_continue():
+            run_num = sampler.runs + 1
+            logger.info(f"[{benchmark.name}] Adaptive run {run_num}")
+
+            runner = SingleTestRunner(self.engine, benchmark)
+            result = runner.run(config)
+            result.run_number = run_num
+
+            suite_result.results.append(result)
+            sampler.add(result.metrics)
+
+        summary = sampler.summary()
+        logger.info(
+            f"[{benchmark.name}] Stopped after {sampler.runs} run(s) "
+            f"({sampler.stop_reason}), {sampler.metric} "
+            f"relative CI {summary.get('relative_ci')}"
+        )
+        return summary
@@ -0,0 +1,95 @@
+"""Session-level engine warmup with convergence detection."""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any
+
+from kitt.benchmarks.base import WARMUP_PROMPT
+from kitt.engines.base import InferenceEngine
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class SessionWarmupResult:
+    """Warmup curve recorded once per engine session."""
+
+    times: list[float] = field(default_factory=list)
+    converged: bool = False
+
+    @property
+    def iterations(self) -> int:
+        return len(self.times)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "iterations": self.iterations,
+            "converged": self.converged,
+            "times": [round(t, 4) for t in self.times],
+        }
+
+
+class SessionWarmup:
+    """Warm an engine until request latency stabilizes.
+
+    Instead of a fixed iteration count, requests are issued until the last
+    ``window`` latencies all lie within ``threshold`` (relative) of their
+    mean, or ``max_iterations`` is reached.
+    """
+
+    def __init__(
+        self,
+        max_iterations: int = 20,
+        window: int = 3,
+        threshold: float = 0.10,
+    ) -> None:
+        self.max_iterations = max_iterations
+        self.window = max(2, window)
+        self.threshold = threshold
+
+    @classmethod
+    def from_config(cls, warmup: dict[str, Any]) -> "SessionWarmup":
+        """Build from a suite ``warmup`` config block."""
+        return cls(
+            max_iterations=warmup.get("max_iterations", 20),
+            window=warmup.get("stability_window", 3),
+            threshold=warmup.get("stability_threshold", 0.10),
+        )
+
+    def run(self, engine: InferenceEngine) -> SessionWarmupResult:
+        """Issue warmup requests until latency converges."""
+        result = SessionWarmupResult()
+
+        for i in range(self.max_iterations):
+            start = time.perf_counter()
+            try:
+                engine.generate(prompt=WARMUP_PROMPT, max_tokens=10, temperature=0.0)
+            except Exception as e:
+                logger.warning(f"Session warmup iteration {i + 1} failed: {e}")
+                continue
+
+            result.times.append(time.perf_counter() - start)
+            if self.is_stable(result.times):
+                result.converged = True
+                break
+
+        if result.converged:
+            logger.info(f"Engine warm after {result.iterations} iterations")
+        else:
+            logger.warning(
+                f"Warmup latency did not stabilize within "
+                f"{self.max_iterations} iterations"
+            )
+
+        return result
+
+    def is_stable(self, times: list[float]) -> bool:
+        """True when the trailing window deviates less than the threshold."""
+        if len(times) < self.window:
+            return False
+        recent = times[-self.window :]
+        mean = sum(recent) / len(recent)
+        if mean <= 0:
+            return False
+        return max(abs(t - mean) / mean for t in recent) < self.threshold
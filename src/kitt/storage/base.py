@@ -1,8 +1,22 @@
 """Abstract base class for result storage backends."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from typing import Any
 
+from .result_query import (
+    SUMMARY_KEY_COLUMNS,
+    Condition,
+    ResultPage,
+    ResultQuery,
+    decode_cursor,
+    encode_cursor,
+    run_hardware,
+    run_metric,
+    run_summary,
+    summary_matches,
+)
+
 
 class ResultStore(ABC):
     """Abstract interface for storing and querying benchmark results."""
@@ -50,6 +64,244 @@ class ResultStore(ABC):
             List of matching result dicts.
         """
 
+    def query_page(self, query: ResultQuery) -> ResultPage:
+        """Fetch one keyset-paginated page of results.
+
+        SQL backends override this to filter, sort and page in the
+        database. This fallback applies the same rules in Python on top
+        of :meth:`query`.
+
+        Args:
+            query: Filters, sort key, cursor and page size.
+
+        Returns:
+            The page's results and the cursor for the next page.
+
+        Raises:
+            ValueError: If the query has an unknown filter, sort key or
+                a malformed cursor.
+        """
+        query.validate()
+        keyed = []
+        for result in self.query(filters=query.filters or None):
+            if not all(c.matches(run_metric(result, c.field)) for c in query.metrics):
+                continue
+            if query.hardware:
+                hw = run_hardware(result) or {}
+                if not all(c.matches(hw.get(c.field)) for c in query.hardware):
+                    continue
+            if query.sorts_by_metric:
+                key = run_metric(result, query.sort_key)
+                if key is None:
+                    continue
+            else:
+                key = result.get(query.sort_key) or ""
+            keyed.append((key, str(result.get("id", "")), result))
+
+        keyed.sort(key=lambda k: (k[0], k[1]), reverse=query.descending)
+        if query.cursor:
+            position = decode_cursor(query.cursor, query.sort)
+            if query.descending:
+                keyed = [k for k in keyed if (k[0], k[1]) < position]
+            else:
+                keyed = [k for k in keyed if (k[0], k[1]) > position]
+
+        page = keyed[: query.limit]
+        next_cursor = None
+        if len(keyed) > query.limit:
+            key, run_id, _ = page[-1]
+            next_cursor = encode_cursor(query.sort, key, run_id)
+        return ResultPage(items=[r for _, _, r in page], next_cursor=next_cursor)
+
+    def iter_results(
+        self,
+        filters: dict[str, Any] | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[dict[str, Any]]:
+        """Yield every matching result, oldest first, without loading all.
+
+        SQL backends stream rows from one statement through a database
+        cursor. This fallback walks :meth:`query_page` with keyset
+        cursors, holding one page at a time.
+
+        Args:
+            filters: Exact matches on run columns, as for :meth:`query`.
+            batch_size: Rows fetched per round trip.
+        """
+        cursor = None
+        while True:
+            page = self.query_page(
+                ResultQuery(
+                    filters=dict(filters or {}),
+                    sort="timestamp",
+                    cursor=cursor,
+                    limit=batch_size,
+                )
+            )
+            yield from page.items
+            if page.next_cursor is None:
+                return
+            cursor = page.next_cursor
+
+    def find_baselines(
+        self,
+        model: str,
+        engine: str,
+        suite_name: str | None = None,
+        fingerprint: str | None = None,
+        before: str | None = None,
+        limit: int = 1,
+    ) -> list[dict[str, Any]]:
+        """Most recent results for a model/engine pair, newest first.
+
+        On the SQL backends this is one range scan of the
+        ``(model, engine, suite_name, timestamp)`` index.
+
+        Args:
+            model: Model name.
+            engine: Engine name.
+            suite_name: Restrict to one suite.
+            fingerprint: Restrict to one hardware fingerprint.
+            before: Only results with an earlier timestamp.
+            limit: Maximum number of baselines.
+        """
+        filters = {"model": model, "engine": engine}
+        if suite_name:
+            filters["suite_name"] = suite_name
+        hardware = [Condition("fingerprint", "=", fingerprint)] if fingerprint else []
+        # An empty id sorts before every real one, so the cursor
+        # excludes all results at the ``before`` timestamp itself.
+        cursor = encode_cursor("-timestamp", before, "") if before else None
+        query = ResultQuery(
+            filters=filters, hardware=hardware, cursor=cursor, limit=limit
+        )
+        return self.query_page(query).items
+
+    def metric_history(
+        self,
+        filters: dict[str, Any] | None = None,
+        metrics: list[str] | None = None,
+    ) -> list[tuple[str, str, str, str, str, str, float]]:
+        """Every stored metric value, grouped into time series.
+
+        SQL backends answer this with one aggregate query. This fallback
+        walks :meth:`query`.
+
+        Args:
+            filters: Exact matches on run columns, as for :meth:`query`.
+            metrics: Only these metric names.
+
+        Returns:
+            ``(model, engine, fingerprint, benchmark, metric, timestamp,
+            value)`` rows, ordered by series and then by timestamp. Values
+            are averaged over a benchmark's repeated runs.
+        """
+        rows = []
+        for result in self.query(filters=filters):
+            fingerprint = (run_hardware(result) or {}).get("fingerprint") or ""
+            sums: dict[tuple[str, str], list[float]] = {}
+            for bench in result.get("results", []):
+                for name, value in bench.get("metrics", {}).items():
+                    if metrics and name not in metrics:
+                        continue
+                    if isinstance(value, (int, float)):
+                        key = (bench.get("test_name", ""), name)
+                        sums.setdefault(key, []).append(float(value))
+            for (bench_name, name), values in sums.items():
+                rows.append(
+                    (
+                        result.get("model", ""),
+                        result.get("engine", ""),
+                        fingerprint,
+                        bench_name,
+                        name,
+                        result.get("timestamp", ""),
+                        sum(values) / len(values),
+                    )
+                )
+        rows.sort(key=lambda r: (r[:5], r[5]))
+        return rows
+
+    def metric_rows(
+        self,
+        filters: dict[str, Any] | None = None,
+        metrics: list[str] | None = None,
+    ) -> list[tuple[Any, ...]]:
+        """Every scalar metric value with its run's key columns.
+
+        SQL backends read these from their metric tables without decoding
+        the stored result documents. This fallback walks :meth:`query`.
+
+        Args:
+            filters: Exact matches on run columns, as for :meth:`query`.
+            metrics: Only these metric names.
+
+        Returns:
+            ``(run_id, model, engine, quant, suite_name, passed,
+            total_time_seconds, benchmark, metric, value)`` rows. A
+            result's top-level ``metrics`` are filed under benchmark
+            ``""``. A run without matching values yields one row whose
+            benchmark, metric and value are None.
+        """
+        rows: list[tuple[Any, ...]] = []
+        for index, result in enumerate(self.query(filters=filters)):
+            run = (
+                result.get("id") or str(index),
+                result.get("model", ""),
+                result.get("engine", ""),
+                result.get("quant") or "",
+                result.get("suite_name", ""),
+                bool(result.get("passed", False)),
+                float(result.get("total_time_seconds") or 0.0),
+            )
+            sources = [("", result.get("metrics") or {})]
+            sources += [
+                (bench.get("test_name", ""), bench.get("metrics") or {})
+                for bench in result.get("results", [])
+            ]
+            values = [
+                (bench_name, name, float(value))
+                for bench_name, bench_metrics in sources
+                for name, value in bench_metrics.items()
+                if isinstance(value, (int, float)) and (not metrics or name in metrics)
+            ]
+            rows.extend((*run, *value) for value in values or [(None, None, None)])
+        return rows
+
+    def recommendation_candidates(
+        self, conditions: list[Condition] | None = None
+    ) -> list[dict[str, Any]]:
+        """Latest summary of each (model, engine, quant, hardware class).
+
+        SQL backends keep a ``run_summaries`` row per run, written by
+        :meth:`save_result`, and pick and filter the latest one per
+        configuration in the database. This fallback summarizes every
+        result returned by :meth:`query`.
+
+        Args:
+            conditions: Comparisons on ``accuracy``, ``avg_tps``,
+                ``avg_latency_ms``, ``peak_vram_gb`` or a key column,
+                applied to the latest summary of each configuration.
+
+        Returns:
+            Summaries newest first: ``id``, the key columns, ``timestamp``
+            and a ``metrics`` dict.
+        """
+        latest: dict[tuple[str, ...], dict[str, Any]] = {}
+        for result in self.query():
+            summary = run_summary(result)
+            summary["id"] = result.get("id", "")
+            key = tuple(summary[c] for c in SUMMARY_KEY_COLUMNS)
+            current = latest.get(key)
+            if current is None or (summary["timestamp"], summary["id"]) > (
+                current["timestamp"],
+                current["id"],
+            ):
+                latest[key] = summary
+        matching = [s for s in latest.values() if summary_matches(s, conditions or [])]
+        matching.sort(key=lambda s: (s["timestamp"], s["id"]), reverse=True)
+        return matching
+
     @abstractmethod
     def list_results(self) -> list[dict[str, Any]]:
         """List all stored results (summary view).
@@ -3,6 +3,7 @@
 import hashlib
 import json
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
@@ -111,6 +112,14 @@ class JsonStore(ResultStore):
         # Strip internal fields
         return [{k: v for k, v in r.items() if not k.startswith("_")} for r in results]
 
+    def iter_results(
+        self,
+        filters: dict[str, Any] | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[dict[str, Any]]:
+        # Results are already held in memory, so no paging is needed
+        yield from self.query(filters=filters, order_by="timestamp")
+
     def list_results(self) -> list[dict[str, Any]]:
         results = self._scan_results()
         return [
@@ -195,6 +195,45 @@ MIGRATIONS: list[Migration] = [
         CREATE INDEX IF NOT EXISTS idx_agent_engines_agent ON agent_engines(agent_id);
         """,
     ),
+    (
+        12,
+        "Add keyset pagination indexes for result listing",
+        """
+        CREATE INDEX IF NOT EXISTS idx_runs_timestamp_id ON runs(timestamp, id);
+        CREATE INDEX IF NOT EXISTS idx_metrics_name_benchmark
+            ON metrics(metric_name, benchmark_id, metric_value);
+        """,
+    ),
+    (
+        13,
+        "Add baseline lookup indexes",
+        """
+        CREATE INDEX IF NOT EXISTS idx_runs_baseline
+            ON runs(model, engine, suite_name, timestamp, id);
+        CREATE INDEX IF NOT EXISTS idx_hardware_fingerprint
+            ON hardware(fingerprint, run_id);
+        """,
+    ),
+    (
+        14,
+        "Add run_summaries table for model recommendations",
+        """
+        CREATE TABLE IF NOT EXISTS run_summaries (
+            run_id TEXT PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+            model TEXT NOT NULL,
+            engine TEXT NOT NULL,
+            quant TEXT NOT NULL DEFAULT '',
+            hardware_class TEXT NOT NULL DEFAULT '',
+            timestamp TEXT NOT NULL,
+            accuracy REAL,
+            avg_tps REAL,
+            avg_latency_ms REAL,
+            peak_vram_gb REAL
+        );
+        CREATE INDEX IF NOT EXISTS idx_run_summaries_config
+            ON run_summaries(model, engine, quant, hardware_class, timestamp, run_id);
+        """,
+    ),
 ]
 
 
@@ -3,14 +3,31 @@
 import json
 import logging
 import uuid
+from collections.abc import Iterator
 from typing import Any
 
+from kitt.hardware.fingerprint import HardwareFingerprint
+
 from .base import ResultStore
 from .migrations import (
     get_current_version_postgres,
     run_migrations_postgres,
     set_version_postgres,
 )
+from .result_query import (
+    Condition,
+    ResultPage,
+    ResultQuery,
+    build_history_sql,
+    build_iter_sql,
+    build_metric_rows_sql,
+    build_page_sql,
+    build_recommendation_sql,
+    load_raw_json,
+    page_from_rows,
+    run_summary,
+    summary_from_row,
+)
 from .schema import POSTGRES_SCHEMA, SCHEMA_VERSION
 
 logger = logging.getLogger(__name__)
@@ -50,6 +67,12 @@ class PostgresStore(ResultStore):
             logger.info("Initialized PostgreSQL schema")
         elif current < SCHEMA_VERSION:
             run_migrations_postgres(self._conn, current)
+            if current < 13:
+                # Baseline lookups match on hardware.fingerprint from v13
+                self._backfill_fingerprints()
+            if current < 14:
+                # run_summaries arrived in v14; fill it in for existing runs
+                self._backfill_summaries()
 
     def save_result(self, result_data: dict[str, Any]) -> str:
         run_id = uuid.uuid4().hex[:16]
@@ -118,13 +141,70 @@ class PostgresStore(ResultStore):
                     cpu.get("cores"),
                     system_info.get("ram_gb"),
                     system_info.get("environment_type"),
-                    system_info.get("fingerprint"),
+                    HardwareFingerprint.from_result(result_data),
                 ),
             )
 
+        self._save_summary(cursor, run_id, result_data)
         self._conn.commit()
         return run_id
 
+    def _save_summary(
+        self, cursor: Any, run_id: str, result_data: dict[str, Any]
+    ) -> None:
+        summary = run_summary(result_data)
+        metrics = summary["metrics"]
+        cursor.execute(
+            """INSERT INTO run_summaries
+               (run_id, model, engine, quant, hardware_class, timestamp,
+                accuracy, avg_tps, avg_latency_ms, peak_vram_gb)
+               VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s)""",
+            (
+                run_id,
+                summary["model"],
+                summary["engine"],
+                summary["quant"],
+                summary["hardware_class"],
+                summary["timestamp"],
+                metrics["accuracy"],
+                metrics["avg_tps"],
+                metrics["avg_latency_ms"],
+                metrics["peak_vram_gb"],
+            ),
+        )
+
+    def _backfill_fingerprints(self) -> None:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """SELECT h.run_id, r.raw_json FROM hardware h
+               JOIN runs r ON r.id = h.run_id
+               WHERE COALESCE(h.fingerprint, '') = ''"""
+        )
+        updates = []
+        for run_id, raw in cursor.fetchall():
+            fingerprint = HardwareFingerprint.from_result(load_raw_json(raw))
+            if fingerprint:
+                updates.append((fingerprint, run_id))
+        cursor.executemany(
+            "UPDATE hardware SET fingerprint = %s WHERE run_id = %s", updates
+        )
+        self._conn.commit()
+        if updates:
+            logger.info(f"Fingerprinted hardware of {len(updates)} run(s)")
+
+    def _backfill_summaries(self) -> None:
+        cursor = self._conn.cursor()
+        cursor.execute(
+            """SELECT id, raw_json FROM runs
+               WHERE id NOT IN (SELECT run_id FROM run_summaries)"""
+        )
+        rows = cursor.fetchall()
+        for run_id, raw in rows:
+            self._save_summary(cursor, run_id, load_raw_json(raw))
+        self._conn.commit()
+        if rows:
+            logger.info(f"Indexed {len(rows)} run(s) for recommendations")
+
     def get_result(self, result_id: str) -> dict[str, Any] | None:
         cursor = self._conn.cursor()
         cursor.execute("SELECT raw_json FROM runs WHERE id = %s", (result_id,))
@@ -181,6 +261,64 @@ class PostgresStore(ResultStore):
         cursor.execute(sql, params)
         return [json.loads(row[0]) for row in cursor.fetchall()]
 
+    def query_page(self, query: ResultQuery) -> ResultPage:
+        query.validate()
+        sql, params = build_page_sql(query, placeholder="%s", bool_as_int=False)
+        cursor = self._conn.cursor()
+        cursor.execute(sql, params)
+        return page_from_rows(query, cursor.fetchall())
+
+    def iter_results(
+        self,
+        filters: dict[str, Any] | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[dict[str, Any]]:
+        sql, params = build_iter_sql(filters, placeholder="%s", bool_as_int=False)
+        # A named cursor is server-side: rows arrive batch_size at a time
+        cursor = self._conn.cursor(name=f"kitt_iter_{uuid.uuid4().hex[:8]}")
+        cursor.itersize = batch_size
+        try:
+            cursor.execute(sql, params)
+            for run_id, raw in cursor:
+                data = load_raw_json(raw)
+                data["id"] = run_id
+                yield data
+        finally:
+            cursor.close()
+            self._conn.commit()
+
+    def metric_history(
+        self,
+        filters: dict[str, Any] | None = None,
+        metrics: list[str] | None = None,
+    ) -> list[tuple[str, str, str, str, str, str, float]]:
+        sql, params = build_history_sql(
+            filters, metrics, placeholder="%s", bool_as_int=False
+        )
+        cursor = self._conn.cursor()
+        cursor.execute(sql, params)
+        return [tuple(row) for row in cursor.fetchall()]
+
+    def metric_rows(
+        self,
+        filters: dict[str, Any] | None = None,
+        metrics: list[str] | None = None,
+    ) -> list[tuple[Any, ...]]:
+        sql, params = build_metric_rows_sql(
+            filters, metrics, placeholder="%s", bool_as_int=False, jsonb=True
+        )
+        cursor = self._conn.cursor()
+        cursor.execute(sql, params)
+        return [tuple(row) for row in cursor.fetchall()]
+
+    def recommendation_candidates(
+        self, conditions: list[Condition] | None = None
+    ) -> list[dict[str, Any]]:
+        sql, params = build_recommendation_sql(conditions or [], placeholder="%s")
+        cursor = self._conn.cursor()
+        cursor.execute(sql, params)
+        return [summary_from_row(tuple(row)) for row in cursor.fetchall()]
+
     def list_results(self) -> list[dict[str, Any]]:
         cursor = self._conn.cursor()
         cursor.execute(
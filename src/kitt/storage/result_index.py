@@ -0,0 +1,126 @@
+"""On-disk index of ``kitt-results/**/metrics.json`` for baseline lookup."""
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Any
+
+from kitt.hardware.fingerprint import HardwareFingerprint
+
+logger = logging.getLogger(__name__)
+
+INDEX_FILENAME = ".kitt-index.json"
+INDEX_VERSION = 1
+
+
+class ResultIndex:
+    """Index result files by (model, engine, suite, fingerprint, timestamp).
+
+    The index lives at ``kitt-results/.kitt-index.json``. On refresh it
+    only stats the result files, and parses just those that are new or
+    changed since the last refresh. Lookups then read only the files
+    they return.
+    """
+
+    def __init__(self, results_dir: Path) -> None:
+        self.root = results_dir / "kitt-results"
+        self.path = self.root / INDEX_FILENAME
+        self._entries: dict[str, dict[str, Any]] | None = None
+
+    def refresh(self) -> dict[str, dict[str, Any]]:
+        """Bring the index up to date with the files on disk."""
+        old = self._entries if self._entries is not None else self._load()
+        entries: dict[str, dict[str, Any]] = {}
+        changed = False
+        for metrics_file in self.root.glob("**/metrics.json"):
+            rel = str(metrics_file.relative_to(self.root))
+            try:
+                st = metrics_file.stat()
+            except OSError:
+                continue
+            entry = old.get(rel)
+            if (
+                entry
+                and entry["mtime_ns"] == st.st_mtime_ns
+                and entry["size"] == st.st_size
+            ):
+                entries[rel] = entry
+                continue
+            changed = True
+            try:
+                data = json.loads(metrics_file.read_text())
+            except (OSError, ValueError):
+                continue
+            entries[rel] = {
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+                "model": data.get("model", ""),
+                "engine": data.get("engine", ""),
+                "suite_name": data.get("suite_name", ""),
+                "fingerprint": HardwareFingerprint.from_result(data),
+                "timestamp": data.get("timestamp", ""),
+            }
+
+        if changed or entries.keys() != old.keys():
+            self._save(entries)
+        self._entries = entries
+        return entries
+
+    def find(
+        self,
+        model: str,
+        engine: str,
+        suite_name: str | None = None,
+        fingerprint: str | None = None,
+        before: str | None = None,
+        limit: int = 1,
+    ) -> list[dict[str, Any]]:
+        """Most recent matching results, newest first.
+
+        Same arguments as :meth:`kitt.storage.base.ResultStore.find_baselines`.
+        """
+        matches = sorted(
+            (
+                (entry["timestamp"], rel)
+                for rel, entry in self.refresh().items()
+                if entry["model"] == model
+                and entry["engine"] == engine
+                and (not suite_name or entry["suite_name"] == suite_name)
+                and (not fingerprint or entry["fingerprint"] == fingerprint)
+                and (not before or entry["timestamp"] < before)
+            ),
+            reverse=True,
+        )
+        results = []
+        for _, rel in matches[:limit]:
+            try:
+                results.append(json.loads((self.root / rel).read_text()))
+            except (OSError, ValueError) as e:
+                logger.debug(f"Skipping unreadable result {rel}: {e}")
+        return results
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != INDEX_VERSION:
+            return {}
+        return data.get("entries", {})
+
+    def _save(self, entries: dict[str, dict[str, Any]]) -> None:
+        if not self.root.is_dir():
+            return
+        try:
+            fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    json.dump({"version": INDEX_VERSION, "entries": entries}, f)
+                Path(tmp_path).replace(self.path)
+            except Exception:
+                Path(tmp_path).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug(f"Could not write result index {self.path}: {e}")
@@ -0,0 +1,561 @@
+"""Keyset-paginated result queries shared by the SQL storage backends.
+
+A :class:`ResultQuery` describes one page of results: exact-match filters
+on ``runs`` columns, range conditions on per-run metric values and on the
+``hardware`` table, a sort key and an opaque cursor. SQLite and PostgreSQL
+both run the SQL built by :func:`build_page_sql`. They differ only in
+placeholder style and in how booleans are stored.
+
+A run's value for a metric is the average over its benchmarks, as in
+:meth:`ResultStore.aggregate`. Sorting by a metric only returns runs
+that report it.
+"""
+
+import base64
+import json
+import operator
+import re
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any
+
+from kitt.hardware.fingerprint import HardwareFingerprint
+
+RUN_FILTER_COLUMNS = ("model", "engine", "suite_name", "passed", "kitt_version")
+RUN_SORT_COLUMNS = ("timestamp", "model", "engine", "suite_name", "total_time_seconds")
+HARDWARE_TEXT_COLUMNS = ("gpu_model", "cpu_model", "environment_type", "fingerprint")
+HARDWARE_NUMERIC_COLUMNS = ("gpu_vram_gb", "gpu_count", "cpu_cores", "ram_gb")
+
+OPERATORS = {
+    ">=": operator.ge,
+    "<=": operator.le,
+    "!=": operator.ne,
+    ">": operator.gt,
+    "<": operator.lt,
+    "=": operator.eq,
+}
+
+_CONDITION_RE = re.compile(r"^\s*([A-Za-z_][\w.]*)\s*(>=|<=|!=|>|<|=)\s*(.+?)\s*$")
+_METRIC_NAME_RE = re.compile(r"^[A-Za-z_][\w.]*$")
+
+
+@dataclass(frozen=True)
+class Condition:
+    """A ``field op value`` comparison, e.g. ``avg_tps > 50``."""
+
+    field: str
+    op: str
+    value: Any
+
+    def matches(self, actual: Any) -> bool:
+        if actual is None:
+            return False
+        try:
+            return OPERATORS[self.op](actual, self.value)
+        except TypeError:
+            return False
+
+
+def parse_condition(text: str) -> Condition:
+    """Parse ``"avg_tps>50"`` into a :class:`Condition`.
+
+    Raises:
+        ValueError: If the expression is malformed.
+    """
+    match = _CONDITION_RE.match(text or "")
+    if match is None:
+        raise ValueError(f"Invalid condition {text!r}; expected e.g. 'avg_tps>50'")
+    name, op, raw = match.groups()
+    try:
+        value = float(raw)
+    except ValueError:
+        raise ValueError(f"Condition {text!r} needs a numeric value") from None
+    return Condition(name, op, value)
+
+
+def parse_hardware_condition(text: str) -> Condition:
+    """Parse a hardware condition such as ``gpu_vram_gb>=24``.
+
+    Raises:
+        ValueError: For unknown fields, or text fields compared with
+            anything but ``=`` and ``!=``.
+    """
+    match = _CONDITION_RE.match(text or "")
+    if match is None:
+        raise ValueError(f"Invalid condition {text!r}; expected e.g. 'gpu_vram_gb>=24'")
+    name, op, raw = match.groups()
+    if name in HARDWARE_NUMERIC_COLUMNS:
+        return parse_condition(text)
+    if name not in HARDWARE_TEXT_COLUMNS:
+        allowed = HARDWARE_TEXT_COLUMNS + HARDWARE_NUMERIC_COLUMNS
+        raise ValueError(f"Unknown hardware field {name!r}; use one of {allowed}")
+    if op not in ("=", "!="):
+        raise ValueError(f"Hardware field {name!r} only supports = and !=")
+    return Condition(name, op, raw)
+
+
+@dataclass
+class ResultQuery:
+    """One page of a filtered, sorted result listing.
+
+    Attributes:
+        filters: Exact matches on run columns (see ``RUN_FILTER_COLUMNS``).
+        metrics: Conditions on per-run metric averages.
+        hardware: Conditions on the run's ``hardware`` row.
+        sort: Run column or metric name, prefixed with ``-`` for descending.
+        cursor: ``next_cursor`` of the previous page, or None for the first.
+        limit: Page size.
+    """
+
+    filters: dict[str, Any] = field(default_factory=dict)
+    metrics: list[Condition] = field(default_factory=list)
+    hardware: list[Condition] = field(default_factory=list)
+    sort: str = "-timestamp"
+    cursor: str | None = None
+    limit: int = 25
+
+    @property
+    def descending(self) -> bool:
+        return self.sort.startswith("-")
+
+    @property
+    def sort_key(self) -> str:
+        return self.sort.lstrip("-")
+
+    @property
+    def sorts_by_metric(self) -> bool:
+        return self.sort_key not in RUN_SORT_COLUMNS
+
+    def validate(self) -> None:
+        """Raise ValueError for unknown filters, sort keys or cursors."""
+        unknown = set(self.filters) - set(RUN_FILTER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown filter(s): {sorted(unknown)}")
+        if self.sorts_by_metric and not _METRIC_NAME_RE.match(self.sort_key):
+            raise ValueError(f"Invalid sort key {self.sort!r}")
+        if self.limit < 1:
+            raise ValueError("limit must be at least 1")
+        if self.cursor:
+            decode_cursor(self.cursor, self.sort)
+
+
+@dataclass
+class ResultPage:
+    """Results for one page plus the cursor for the next one."""
+
+    items: list[dict[str, Any]]
+    next_cursor: str | None = None
+
+
+def encode_cursor(sort: str, key: Any, run_id: str) -> str:
+    """Encode the position after ``(key, run_id)`` in ``sort`` order."""
+    if isinstance(key, datetime):
+        key = key.isoformat()
+    payload = json.dumps({"s": sort, "k": key, "id": run_id}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> tuple[Any, str]:
+    """Decode a cursor into ``(key, run_id)``.
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        key, run_id, cursor_sort = payload["k"], payload["id"], payload["s"]
+    except (ValueError, TypeError, KeyError):
+        raise ValueError("Invalid cursor") from None
+    if cursor_sort != sort:
+        raise ValueError(f"Cursor was issued for sort {cursor_sort!r}, not {sort!r}")
+    return key, str(run_id)
+
+
+def load_raw_json(raw: Any) -> dict[str, Any]:
+    """Decode ``runs.raw_json``; PostgreSQL JSONB arrives already parsed."""
+    return raw if isinstance(raw, dict) else json.loads(raw)
+
+
+def _filter_clauses(
+    filters: dict[str, Any] | None, placeholder: str, bool_as_int: bool
+) -> tuple[list[str], list[Any]]:
+    """Exact-match WHERE clauses on ``runs r`` for the known filter keys."""
+    where: list[str] = []
+    params: list[Any] = []
+    for key, value in (filters or {}).items():
+        if key not in RUN_FILTER_COLUMNS:
+            continue
+        if key == "passed":
+            value = (1 if value else 0) if bool_as_int else bool(value)
+        # Safe: key is validated against RUN_FILTER_COLUMNS above
+        where.append(f"r.{key} = {placeholder}")
+        params.append(value)
+    return where, params
+
+
+def build_iter_sql(
+    filters: dict[str, Any] | None = None,
+    placeholder: str = "?",
+    bool_as_int: bool = True,
+) -> tuple[str, list[Any]]:
+    """Build the SQL behind :meth:`ResultStore.iter_results`.
+
+    Selects ``id`` and ``raw_json`` of every matching run, oldest first,
+    for the caller to fetch in batches.
+    """
+    where, params = _filter_clauses(filters, placeholder, bool_as_int)
+    sql = "SELECT r.id, r.raw_json FROM runs r"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    return sql + " ORDER BY r.timestamp, r.id", params
+
+
+def build_page_sql(
+    query: ResultQuery,
+    placeholder: str = "?",
+    bool_as_int: bool = True,
+) -> tuple[str, list[Any]]:
+    """Build the SQL for one page of ``query``.
+
+    The statement selects ``id``, ``raw_json`` and ``sort_value`` and
+    fetches one row beyond ``query.limit`` so callers can tell whether
+    another page follows. The keyset predicate compares
+    ``(sort_value, id)`` as a row value, so each page is an index range
+    scan rather than an OFFSET skip.
+
+    Args:
+        query: Validated query.
+        placeholder: Bind parameter marker (``?`` or ``%s``).
+        bool_as_int: Bind ``passed`` as 0/1 (SQLite) instead of a boolean.
+    """
+    p = placeholder
+    params: list[Any] = []
+    joins = ""
+
+    if query.sorts_by_metric:
+        sort_expr = "s.value"
+        joins = (
+            " JOIN (SELECT b.run_id, AVG(m.metric_value) AS value"
+            " FROM benchmarks b JOIN metrics m ON m.benchmark_id = b.id"
+            f" WHERE m.metric_name = {p} AND m.metric_value IS NOT NULL"
+            " GROUP BY b.run_id) s ON s.run_id = r.id"
+        )
+        params.append(query.sort_key)
+    else:
+        # Safe: sort_key is one of RUN_SORT_COLUMNS
+        sort_expr = f"r.{query.sort_key}"
+
+    where, filter_params = _filter_clauses(query.filters, p, bool_as_int)
+    params.extend(filter_params)
+
+    for cond in query.metrics:
+        where.append(
+            "r.id IN (SELECT b.run_id FROM benchmarks b"
+            " JOIN metrics m ON m.benchmark_id = b.id"
+            f" WHERE m.metric_name = {p} GROUP BY b.run_id"
+            f" HAVING AVG(m.metric_value) {cond.op} {p})"
+        )
+        params.extend([cond.field, cond.value])
+
+    if query.hardware:
+        clauses = []
+        for cond in query.hardware:
+            if cond.field not in HARDWARE_TEXT_COLUMNS + HARDWARE_NUMERIC_COLUMNS:
+                continue
+            # Safe: field and op are validated by parse_hardware_condition
+            clauses.append(f"h.{cond.field} {cond.op} {p}")
+            params.append(cond.value)
+        where.append(
+            "EXISTS (SELECT 1 FROM hardware h WHERE h.run_id = r.id"
+            + "".join(f" AND {c}" for c in clauses)
+            + ")"
+        )
+
+    if query.cursor:
+        key, run_id = decode_cursor(query.cursor, query.sort)
+        cmp = "<" if query.descending else ">"
+        where.append(f"({sort_expr}, r.id) {cmp} ({p}, {p})")
+        params.extend([key, run_id])
+
+    direction = "DESC" if query.descending else "ASC"
+    sql = f"SELECT r.id, r.raw_json, {sort_expr} AS sort_value FROM runs r{joins}"
+    if where:
+        sql += " WHERE " + " AND ".join(where)
+    sql += f" ORDER BY {sort_expr} {direction}, r.id {direction} LIMIT {p}"
+    params.append(query.limit + 1)
+    return sql, params
+
+
+def build_history_sql(
+    filters: dict[str, Any] | None = None,
+    metrics: list[str] | None = None,
+    placeholder: str = "?",
+    bool_as_int: bool = True,
+) -> tuple[str, list[Any]]:
+    """Build the SQL behind :meth:`ResultStore.metric_history`.
+
+    One statement returns every (run, benchmark, metric) value, averaged
+    over repeated benchmark runs. Rows are ordered by series and then
+    chronologically, so callers can split them into time series in a
+    single pass.
+    """
+    p = placeholder
+    where, params = _filter_clauses(filters, p, bool_as_int)
+    where.insert(0, "m.metric_value IS NOT NULL")
+    if metrics:
+        where.append(f"m.metric_name IN ({', '.join([p] * len(metrics))})")
+        params.extend(metrics)
+
+    sql = (
+        "SELECT r.model, r.engine, COALESCE(h.fingerprint, '') AS fingerprint,"
+        " b.test_name, m.metric_name, r.timestamp, AVG(m.metric_value) AS value"
+        " FROM runs r"
+        " JOIN benchmarks b ON b.run_id = r.id"
+        " JOIN metrics m ON m.benchmark_id = b.id"
+        " LEFT JOIN hardware h ON h.run_id = r.id"
+        " WHERE " + " AND ".join(where) + " GROUP BY r.id, r.model, r.engine,"
+        " h.fingerprint, b.test_name, m.metric_name, r.timestamp"
+        " ORDER BY r.model, r.engine, fingerprint, b.test_name, m.metric_name,"
+        " r.timestamp, r.id"
+    )
+    return sql, params
+
+
+# Numeric entries of a run's top-level ``metrics`` object, per dialect:
+# (table-valued function, value expression, WHERE condition)
+_TOP_LEVEL_METRICS = {
+    False: (
+        "json_each(r.raw_json, '$.metrics') t",
+        "t.value",
+        "json_type(r.raw_json, '$.metrics') = 'object'"
+        " AND t.type IN ('integer', 'real')",
+    ),
+    True: (
+        "jsonb_each(CASE WHEN jsonb_typeof(r.raw_json -> 'metrics') = 'object'"
+        " THEN r.raw_json -> 'metrics' ELSE '{}'::jsonb END) t",
+        "(t.value #>> '{}')::float8",
+        "jsonb_typeof(t.value) = 'number'",
+    ),
+}
+
+
+def build_metric_rows_sql(
+    filters: dict[str, Any] | None = None,
+    metrics: list[str] | None = None,
+    placeholder: str = "?",
+    bool_as_int: bool = True,
+    jsonb: bool = False,
+) -> tuple[str, list[Any]]:
+    """Build the SQL behind :meth:`ResultStore.metric_rows`.
+
+    Benchmark values come from the ``metrics`` table. Top-level values
+    are read out of ``raw_json`` with the dialect's JSON functions
+    (``jsonb`` for PostgreSQL). A run without matching benchmark values
+    still yields one row with a NULL metric.
+    """
+    p = placeholder
+    where, filter_params = _filter_clauses(filters, p, bool_as_int)
+    metric_in = f" IN ({', '.join([p] * len(metrics))})" if metrics else ""
+    metric_params = list(metrics or [])
+    columns = (
+        "r.id, r.model, r.engine, COALESCE(s.quant, ''), r.suite_name, r.passed,"
+        " r.total_time_seconds"
+    )
+    runs = "FROM runs r LEFT JOIN run_summaries s ON s.run_id = r.id"
+
+    bench_sql = (
+        f"SELECT {columns}, b.test_name, m.metric_name, m.metric_value {runs}"
+        " LEFT JOIN benchmarks b ON b.run_id = r.id"
+        " LEFT JOIN metrics m ON m.benchmark_id = b.id"
+        " AND m.metric_value IS NOT NULL"
+    )
+    if metrics:
+        bench_sql += f" AND m.metric_name{metric_in}"
+    if where:
+        bench_sql += " WHERE " + " AND ".join(where)
+
+    source, value, condition = _TOP_LEVEL_METRICS[jsonb]
+    top_where = [condition]
+    if metrics:
+        top_where.append(f"t.key{metric_in}")
+    top_sql = (
+        f"SELECT {columns}, '', t.key, {value} {runs} CROSS JOIN {source}"
+        " WHERE " + " AND ".join(top_where + where)
+    )
+    params = metric_params + filter_params
+    return f"{bench_sql} UNION ALL {top_sql}", params + params
+
+
+def page_from_rows(query: ResultQuery, rows: list[tuple[Any, Any, Any]]) -> ResultPage:
+    """Build a :class:`ResultPage` from ``(id, raw_json, sort_value)`` rows."""
+    items = []
+    for run_id, raw, _ in rows[: query.limit]:
+        data = load_raw_json(raw)
+        data["id"] = run_id
+        items.append(data)
+    next_cursor = None
+    if len(rows) > query.limit:
+        run_id, _, key = rows[query.limit - 1]
+        next_cursor = encode_cursor(query.sort, key, run_id)
+    return ResultPage(items=items, next_cursor=next_cursor)
+
+
+def run_metric(result: dict[str, Any], name: str) -> float | None:
+    """A run's average value for ``name`` across its benchmarks."""
+    values = [
+        float(bench["metrics"][name])
+        for bench in result.get("results", [])
+        if isinstance(bench.get("metrics", {}).get(name), (int, float))
+    ]
+    return sum(values) / len(values) if values else None
+
+
+def run_hardware(result: dict[str, Any]) -> dict[str, Any] | None:
+    """The ``hardware`` row a SQL store would derive from ``system_info``."""
+    info = result.get("system_info")
+    if not info:
+        return None
+    gpu = info.get("gpu") or {}
+    cpu = info.get("cpu") or {}
+    return {
+        "gpu_model": gpu.get("model"),
+        "gpu_vram_gb": gpu.get("vram_gb"),
+        "gpu_count": gpu.get("count", 1),
+        "cpu_model": cpu.get("model"),
+        "cpu_cores": cpu.get("cores"),
+        "ram_gb": info.get("ram_gb"),
+        "environment_type": info.get("environment_type"),
+        "fingerprint": HardwareFingerprint.from_result(result),
+    }
+
+
+# Per-run summary kept in ``run_summaries`` for recommendations. Each
+# column is the run's average of the named metric, except peak VRAM,
+# which is the maximum of any of its peak-memory metrics.
+SUMMARY_COLUMNS = ("accuracy", "avg_tps", "avg_latency_ms", "peak_vram_gb")
+SUMMARY_KEY_COLUMNS = ("model", "engine", "quant", "hardware_class")
+_PEAK_VRAM_METRICS = (
+    "peak_vram_gb",
+    "gpu_memory_peak_gb",
+    "overall_peak_gpu_memory_gb",
+)
+
+# What a missing value counts as when filtering, as in
+# HardwareConstraints.matches. A missing latency never matches.
+SUMMARY_DEFAULTS = {"accuracy": 0.0, "avg_tps": 0.0, "peak_vram_gb": 0.0}
+
+
+def hardware_class(result: dict[str, Any]) -> str:
+    """Coarse hardware label used to group recommendations, e.g. ``2x A100``."""
+    hw = run_hardware(result) or {}
+    gpu = hw.get("gpu_model")
+    if gpu:
+        count = hw.get("gpu_count") or 1
+        return f"{count}x {gpu}" if count > 1 else gpu
+    return hw.get("cpu_model") or ""
+
+
+def run_summary(result: dict[str, Any]) -> dict[str, Any]:
+    """Summarize a run for the recommendation index.
+
+    Metrics come from the run's benchmarks. A top-level ``metrics`` dict
+    on the result, if present, takes precedence.
+    """
+    top = result.get("metrics") or {}
+    metrics: dict[str, float | None] = {}
+    for name in SUMMARY_COLUMNS[:3]:
+        value = top.get(name)
+        metrics[name] = (
+            float(value)
+            if isinstance(value, (int, float))
+            else run_metric(result, name)
+        )
+    peaks = [
+        float(source[name])
+        for source in [top] + [b.get("metrics", {}) for b in result.get("results", [])]
+        for name in _PEAK_VRAM_METRICS
+        if isinstance(source.get(name), (int, float))
+    ]
+    metrics["peak_vram_gb"] = max(peaks) if peaks else None
+    return {
+        "model": result.get("model", ""),
+        "engine": result.get("engine", ""),
+        "quant": result.get("quant") or "",
+        "hardware_class": hardware_class(result),
+        "timestamp": str(result.get("timestamp", "")),
+        "metrics": metrics,
+    }
+
+
+def summary_matches(summary: dict[str, Any], conditions: list[Condition]) -> bool:
+    """Python equivalent of the filters in :func:`build_recommendation_sql`."""
+    for cond in conditions:
+        if cond.field in SUMMARY_COLUMNS:
+            actual = summary["metrics"].get(cond.field)
+            if actual is None:
+                actual = SUMMARY_DEFAULTS.get(cond.field)
+        else:
+            actual = summary.get(cond.field)
+        if not cond.matches(actual):
+            return False
+    return True
+
+
+def build_recommendation_sql(
+    conditions: list[Condition], placeholder: str = "?"
+) -> tuple[str, list[Any]]:
+    """Select the latest summary of every configuration matching ``conditions``.
+
+    A configuration is one (model, engine, quant, hardware class). The
+    latest run per configuration is found with an anti-join on
+    ``idx_run_summaries_config``, and the conditions are then applied to it.
+    """
+    p = placeholder
+    where = [
+        "NOT EXISTS (SELECT 1 FROM run_summaries n WHERE "
+        + " AND ".join(f"n.{c} = s.{c}" for c in SUMMARY_KEY_COLUMNS)
+        + " AND (n.timestamp, n.run_id) > (s.timestamp, s.run_id))"
+    ]
+    params: list[Any] = []
+    for cond in conditions:
+        if cond.op not in OPERATORS:
+            raise ValueError(f"Unknown operator: {cond.op}")
+        if cond.field in SUMMARY_COLUMNS:
+            default = SUMMARY_DEFAULTS.get(cond.field)
+            column = f"s.{cond.field}"
+            if default is not None:
+                column = f"COALESCE({column}, {p})"
+                params.append(default)
+        elif cond.field in SUMMARY_KEY_COLUMNS:
+            column = f"s.{cond.field}"
+        else:
+            raise ValueError(f"Unknown recommendation field: {cond.field}")
+        # Safe: field and op are validated against fixed whitelists above
+        where.append(f"{column} {cond.op} {p}")
+        params.append(cond.value)
+
+    columns = ", ".join(
+        f"s.{c}"
+        for c in ("run_id", *SUMMARY_KEY_COLUMNS, "timestamp", *SUMMARY_COLUMNS)
+    )
+    sql = (
+        f"SELECT {columns} FROM run_summaries s WHERE "
+        + " AND ".join(where)
+        + " ORDER BY s.timestamp DESC, s.run_id DESC"
+    )
+    return sql, params
+
+
+def summary_from_row(row: tuple[Any, ...]) -> dict[str, Any]:
+    """Turn a row from :func:`build_recommendation_sql` into a summary dict."""
+    run_id, model, engine, quant, hw_class, timestamp, *values = row
+    return {
+        "id": run_id,
+        "model": model,
+        "engine": engine,
+        "quant": quant,
+        "hardware_class": hw_class,
+        "timestamp": timestamp,
+        "metrics": dict(zip(SUMMARY_COLUMNS, values, strict=True)),
+    }
@@ -1,7 +1,7 @@
 """Shared database schema definitions for KITT storage backends."""
 
 # SQLite schema — version-tracked for migrations.
-SCHEMA_VERSION = 11
+SCHEMA_VERSION = 14
 
 SQLITE_SCHEMA = """
 CREATE TABLE IF NOT EXISTS schema_version (
@@ -271,4 +271,30 @@ CREATE TABLE IF NOT EXISTS agent_settings (
     UNIQUE(agent_id, key)
 );
 CREATE INDEX IF NOT EXISTS idx_agent_settings_agent ON agent_settings(agent_id);
+
+-- v12: keyset pagination for result listing
+CREATE INDEX IF NOT EXISTS idx_runs_timestamp_id ON runs(timestamp, id);
+CREATE INDEX IF NOT EXISTS idx_metrics_name_benchmark
+    ON metrics(metric_name, benchmark_id, metric_value);
+
+-- v13: baseline lookup
+CREATE INDEX IF NOT EXISTS idx_runs_baseline
+    ON runs(model, engine, suite_name, timestamp, id);
+CREATE INDEX IF NOT EXISTS idx_hardware_fingerprint ON hardware(fingerprint, run_id);
+
+-- v14: recommendation index
+CREATE TABLE IF NOT EXISTS run_summaries (
+    run_id TEXT PRIMARY KEY REFERENCES runs(id) ON DELETE CASCADE,
+    model TEXT NOT NULL,
+    engine TEXT NOT NULL,
+    quant TEXT NOT NULL DEFAULT '',
+    hardware_class TEXT NOT NULL DEFAULT '',
+    timestamp TEXT NOT NULL,
+    accuracy REAL,
+    avg_tps REAL,
+    avg_latency_ms REAL,
+    peak_vram_gb REAL
+);
+CREATE INDEX IF NOT EXISTS idx_run_summaries_config
+    ON run_summaries(model, engine, quant, hardware_class, timestamp, run_id);
 """
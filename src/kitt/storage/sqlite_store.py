@@ -5,15 +5,32 @@ import logging
 import sqlite3
 import threading
 import uuid
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from kitt.hardware.fingerprint import HardwareFingerprint
+
 from .base import ResultStore
 from .migrations import (
     get_current_version_sqlite,
     run_migrations_sqlite,
     set_version_sqlite,
 )
+from .result_query import (
+    Condition,
+    ResultPage,
+    ResultQuery,
+    build_history_sql,
+    build_iter_sql,
+    build_metric_rows_sql,
+    build_page_sql,
+    build_recommendation_sql,
+    load_raw_json,
+    page_from_rows,
+    run_summary,
+    summary_from_row,
+)
 from .schema import SCHEMA_VERSION, SQLITE_SCHEMA
 
 logger = logging.getLogger(__name__)
@@ -54,6 +71,12 @@ class SQLiteStore(ResultStore):
             current = 1
         if current < SCHEMA_VERSION:
             run_migrations_sqlite(conn, current)
+        if current < 13:
+            # Baseline lookups match on hardware.fingerprint from v13
+            self._backfill_fingerprints()
+        if current < 14:
+            # run_summaries arrived in v14; fill it in for existing runs
+            self._backfill_summaries()
 
     def save_result(self, result_data: dict[str, Any]) -> str:
         conn = self._get_conn()
@@ -124,13 +147,69 @@ class SQLiteStore(ResultStore):
                     cpu.get("cores"),
                     system_info.get("ram_gb"),
                     system_info.get("environment_type"),
-                    system_info.get("fingerprint"),
+                    HardwareFingerprint.from_result(result_data),
                 ),
             )
 
+        self._save_summary(run_id, result_data)
         conn.commit()
         return run_id
 
+    def _save_summary(self, run_id: str, result_data: dict[str, Any]) -> None:
+        summary = run_summary(result_data)
+        metrics = summary["metrics"]
+        self._get_conn().execute(
+            """INSERT INTO run_summaries
+               (run_id, model, engine, quant, hardware_class, timestamp,
+                accuracy, avg_tps, avg_latency_ms, peak_vram_gb)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+            (
+                run_id,
+                summary["model"],
+                summary["engine"],
+                summary["quant"],
+                summary["hardware_class"],
+                summary["timestamp"],
+                metrics["accuracy"],
+                metrics["avg_tps"],
+                metrics["avg_latency_ms"],
+                metrics["peak_vram_gb"],
+            ),
+        )
+
+    def _backfill_fingerprints(self) -> None:
+        conn = self._get_conn()
+        rows = conn.execute(
+            """SELECT h.run_id, r.raw_json FROM hardware h
+               JOIN runs r ON r.id = h.run_id
+               WHERE COALESCE(h.fingerprint, '') = ''"""
+        ).fetchall()
+        updates = []
+        for row in rows:
+            fingerprint = HardwareFingerprint.from_result(
+                load_raw_json(row["raw_json"])
+            )
+            if fingerprint:
+                updates.append((fingerprint, row["run_id"]))
+        conn.executemany(
+            "UPDATE hardware SET fingerprint = ? WHERE run_id = ?", updates
+        )
+        conn.commit()
+        if updates:
+            logger.info(f"Fingerprinted hardware of {len(updates)} run(s)")
+
+    def _backfill_summaries(self) -> None:
+        conn = self._get_conn()
+        rows = conn.execute(
+            """SELECT id, raw_json FROM runs
+               WHERE id NOT IN (SELECT run_id FROM run_summaries)"""
+        ).fetchall()
+        for row in rows:
+            self._save_summary(row["id"], load_raw_json(row["raw_json"]))
+        conn.commit()
+        if rows:
+            logger.info(f"Indexed {len(rows)} run(s) for recommendations")
+
     def get_result(self, result_id: str) -> dict[str, Any] | None:
         conn = self._get_conn()
         row = conn.execute(
@@ -207,6 +286,53 @@ class SQLiteStore(ResultStore):
             results.append(data)
         return results
 
+    def query_page(self, query: ResultQuery) -> ResultPage:
+        query.validate()
+        sql, params = build_page_sql(query)
+        rows = self._get_conn().execute(sql, params).fetchall()
+        return page_from_rows(query, [tuple(row) for row in rows])
+
+    def iter_results(
+        self,
+        filters: dict[str, Any] | None = None,
+        batch_size: int = 500,
+    ) -> Iterator[dict[str, Any]]:
+        sql, params = build_iter_sql(filters)
+        cursor = self._get_conn().execute(sql, params)
+        try:
+            while rows := cursor.fetchmany(batch_size):
+                for row in rows:
+                    data = json.loads(row["raw_json"])
+                    data["id"] = row["id"]
+                    yield data
+        finally:
+            cursor.close()
+
+    def metric_history(
+        self,
+        filters: dict[str, Any] | None = None,
+        metrics: list[str] | None = None,
+    ) -> list[tuple[str, str, str, str, str, str, float]]:
+        sql, params = build_history_sql(filters, metrics)
+        rows = self._get_conn().execute(sql, params).fetchall()
+        return [tuple(row) for row in rows]
+
+    def metric_rows(
+        self,
+        filters: dict[str, Any] | None = None,
+        metrics: list[str] | None = None,
+    ) -> list[tuple[Any, ...]]:
+        sql, params = build_metric_rows_sql(filters, metrics)
+        rows = self._get_conn().execute(sql, params).fetchall()
+        return [tuple(row) for row in rows]
+
+    def recommendation_candidates(
+        self, conditions: list[Condition] | None = None
+    ) -> list[dict[str, Any]]:
+        sql, params = build_recommendation_sql(conditions or [])
+        rows = self._get_conn().execute(sql, params).fetchall()
+        return [summary_from_row(tuple(row)) for row in rows]
+
     def list_results(self) -> list[dict[str, Any]]:
         conn = self._get_conn()
         rows = conn.execute(
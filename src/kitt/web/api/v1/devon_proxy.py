@@ -3,13 +3,20 @@
 Eliminates cross-origin issues and Devon re-authentication by proxying
 all requests server-side and injecting Devon's API key.  The browser
 never sees or needs Devon's credentials.
+
+Responses are streamed to the browser chunk by chunk over pooled
+keep-alive upstream connections, so model downloads, file listings and
+event streams never sit in memory. Only HTML documents are buffered, for
+the base-URL rewrite.
 """
 
+import gzip
+import http.client
 import logging
 import os
-import urllib.error
+import threading
 import urllib.parse
-import urllib.request
+from collections.abc import Iterator
 
 from flask import Blueprint, Response, jsonify, request
 
@@ -31,10 +38,64 @@ _HOP_HEADERS = frozenset(
     }
 )
 
+# Browser request headers passed through to Devon
+_FORWARD_HEADERS = (
+    "Accept",
+    "Accept-Encoding",
+    "Cache-Control",
+    "If-Modified-Since",
+    "If-None-Match",
+    "If-Range",
+    "Last-Event-ID",
+    "Range",
+)
+
 # The placeholder in Devon's index.html that we rewrite
 _BASE_URL_PLACEHOLDER = 'window.__DEVON_BASE_URL__=""'
 _BASE_URL_REPLACEMENT = 'window.__DEVON_BASE_URL__="/devon-app"'
 
+# Socket timeout for connecting and between received chunks; event
+# streams have none since they may idle between events
+_TIMEOUT_S = 30
+_CHUNK_SIZE = 64 * 1024
+
+
+class _ConnectionPool:
+    """Idle keep-alive connections to upstream hosts, reused across requests."""
+
+    def __init__(self, max_idle: int = 8) -> None:
+        self.max_idle = max_idle
+        self._idle: dict[tuple[str, str], list[http.client.HTTPConnection]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, scheme: str, netloc: str) -> tuple[http.client.HTTPConnection, bool]:
+        """Return a connection and whether it was reused from the pool."""
+        with self._lock:
+            idle = self._idle.get((scheme, netloc))
+            if idle:
+                return idle.pop(), True
+        if scheme == "https":
+            return http.client.HTTPSConnection(netloc, timeout=_TIMEOUT_S), False
+        return http.client.HTTPConnection(netloc, timeout=_TIMEOUT_S), False
+
+    def put(self, scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault((scheme, netloc), [])
+            if len(idle) < self.max_idle:
+                idle.append(conn)
+                return
+        conn.close()
+
+    def clear(self) -> None:
+        with self._lock:
+            conns = [c for idle in self._idle.values() for c in idle]
+            self._idle.clear()
+        for conn in conns:
+            conn.close()
+
+
+_pool = _ConnectionPool()
+
 
 def _get_devon_url() -> str:
     from kitt.web.app import get_services
@@ -47,6 +108,105 @@ def _get_devon_api_key() -> str:
     return os.environ.get("DEVON_API_KEY", "")
 
 
+def _open_upstream(
+    upstream: urllib.parse.SplitResult,
+    method: str,
+    path: str,
+    body: bytes | None,
+    headers: dict[str, str],
+) -> tuple[http.client.HTTPConnection, http.client.HTTPResponse]:
+    """Send a request, retrying on a fresh connection if a pooled one went stale."""
+    while True:
+        conn, reused = _pool.get(upstream.scheme, upstream.netloc)
+        try:
+            conn.request(method, path, body=body, headers=headers)
+            return conn, conn.getresponse()
+        except (ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not reused:
+                raise
+        except BaseException:
+            conn.close()
+            raise
+
+
+def _release(
+    upstream: urllib.parse.SplitResult,
+    conn: http.client.HTTPConnection,
+    resp: http.client.HTTPResponse,
+) -> None:
+    if resp.will_close:
+        conn.close()
+        return
+    if not resp.isclosed():
+        # read1() leaves a fully read fixed-length body open, and
+        # http.client refuses the next request until it is closed
+        resp.read()
+    if conn.sock is not None:
+        # Event streams lift the read timeout; pooled connections need it back
+        conn.sock.settimeout(_TIMEOUT_S)
+    _pool.put(upstream.scheme, upstream.netloc, conn)
+
+
+def _stream_body(
+    upstream: urllib.parse.SplitResult,
+    conn: http.client.HTTPConnection,
+    resp: http.client.HTTPResponse,
+) -> Iterator[bytes]:
+    # read1() returns whatever has arrived, so event streams flush per event
+    finished = False
+    try:
+        while chunk := resp.read1(_CHUNK_SIZE):
+            yield chunk
+        finished = True
+    finally:
+        # A browser that disconnects mid-body leaves the connection unusable
+        if finished:
+            _release(upstream, conn, resp)
+        else:
+            conn.close()
+
+
+def _rewrite_location(
+    location: str, upstream: urllib.parse.SplitResult, path: str
+) -> str:
+    """Map a redirect into Devon back under ``/devon-app``.
+
+    Devon's absolute redirects name its internal host, which the browser
+    cannot reach. Locations outside Devon pass through unchanged.
+    """
+    origin = f"{upstream.scheme}://{upstream.netloc}"
+    target = urllib.parse.urlsplit(urllib.parse.urljoin(origin + path, location))
+    base = upstream.path.rstrip("/")
+    if f"{target.scheme}://{target.netloc}" != origin or not (
+        target.path == base or target.path.startswith(base + "/")
+    ):
+        return location
+    rest = target.path[len(base) :] or "/"
+    return urllib.parse.urlunsplit(
+        ("", "", f"/devon-app{rest}", target.query, target.fragment)
+    )
+
+
+def _rewrite_html(content: bytes, encoding: str) -> tuple[bytes, bool]:
+    """Rewrite BASE_URL in Devon's SPA index.html.
+
+    Relative API paths then resolve through this proxy. The replacement
+    is a fixed string, so a tainted devon_url cannot inject script.
+
+    Returns:
+        The document and whether it is now uncompressed.
+    """
+    if encoding not in ("", "identity", "gzip"):
+        return content, False
+    try:
+        raw = gzip.decompress(content) if encoding == "gzip" else content
+        text = raw.decode("utf-8")
+    except (OSError, EOFError, UnicodeDecodeError, ValueError):
+        return content, False  # Undecodable HTML — pass through unmodified
+    return text.replace(_BASE_URL_PLACEHOLDER, _BASE_URL_REPLACEMENT).encode(), True
+
+
 @bp.route("/", defaults={"subpath": ""})
 @bp.route("/<path:subpath>", methods=["GET", "POST", "PUT", "DELETE", "PATCH"])
 def proxy(subpath):
@@ -59,13 +219,21 @@ def proxy(subpath):
     if ".." in subpath.split("/"):
         return jsonify({"error": "Invalid path"}), 400
 
-    # Build target URL
-    target = f"{devon_url.rstrip('/')}/{subpath}"
+    upstream = urllib.parse.urlsplit(devon_url)
+    if upstream.scheme not in ("http", "https") or not upstream.netloc:
+        return jsonify({"error": "Devon URL is invalid"}), 503
+
+    # Build target path
+    path = f"{upstream.path.rstrip('/')}/{urllib.parse.quote(subpath)}"
     if request.query_string:
-        target += f"?{request.query_string.decode()}"
+        path += f"?{request.query_string.decode()}"
 
     # Build headers — inject Devon API key
-    headers = {}
+    headers = {
+        name: request.headers[name]
+        for name in _FORWARD_HEADERS
+        if name in request.headers
+    }
     devon_api_key = _get_devon_api_key()
     if devon_api_key:
         headers["Authorization"] = f"Bearer {devon_api_key}"
@@ -80,46 +248,43 @@ def proxy(subpath):
         body = request.get_data() or None
 
     try:
-        req = urllib.request.Request(
-            target,
-            data=body,
-            headers=headers,
-            method=request.method,
-        )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            content = resp.read()
-            status = resp.status
-            resp_headers = dict(resp.headers)
-
-    except urllib.error.HTTPError as e:
-        content = e.read()
-        status = e.code
-        resp_headers = dict(e.headers)
-
-    except (urllib.error.URLError, OSError) as e:
+        conn, resp = _open_upstream(upstream, request.method, path, body, headers)
+    except (http.client.HTTPException, OSError) as e:
         logger.warning(f"Devon proxy error: {e}")
         return jsonify({"error": "Devon unreachable"}), 502
 
-    # Filter hop-by-hop headers
-    filtered_headers = {
-        k: v for k, v in resp_headers.items() if k.lower() not in _HOP_HEADERS
-    }
-
+    # Filter hop-by-hop headers, keeping repeats such as Set-Cookie, and
+    # point redirects back through the proxy
+    filtered_headers = [
+        (k, _rewrite_location(v, upstream, path) if k.lower() == "location" else v)
+        for k, v in resp.getheaders()
+        if k.lower() not in _HOP_HEADERS
+        and k.lower() not in ("x-frame-options", "content-security-policy")
+    ]
     # Replace Devon's security headers with KITT-appropriate ones
-    for hdr in ("x-frame-options", "content-security-policy"):
-        filtered_headers.pop(hdr, None)
-    filtered_headers["Content-Security-Policy"] = "frame-ancestors 'self'"
-
-    # Rewrite BASE_URL in Devon's SPA index.html so relative API
-    # paths resolve through this proxy.  Uses json.dumps for safe
-    # interpolation (prevents XSS if devon_url were ever tainted).
-    content_type = resp_headers.get("Content-Type", "")
-    if "text/html" in content_type:
-        try:
-            text = content.decode("utf-8")
-            text = text.replace(_BASE_URL_PLACEHOLDER, _BASE_URL_REPLACEMENT)
-            content = text.encode("utf-8")
-        except (UnicodeDecodeError, ValueError):
-            pass  # Non-UTF-8 HTML — pass through unmodified
+    filtered_headers.append(("Content-Security-Policy", "frame-ancestors 'self'"))
+
+    content_type = resp.getheader("Content-Type", "")
+    if "text/html" not in content_type:
+        if "text/event-stream" in content_type and conn.sock is not None:
+            conn.sock.settimeout(None)
+        return Response(
+            _stream_body(upstream, conn, resp),
+            status=resp.status,
+            headers=filtered_headers,
+            direct_passthrough=True,
+        )
+
+    try:
+        content = resp.read()
+    except (http.client.HTTPException, OSError) as e:
+        conn.close()
+        logger.warning(f"Devon proxy error: {e}")
+        return jsonify({"error": "Devon unreachable"}), 502
+    _release(upstream, conn, resp)
 
-    return Response(content, status=status, headers=filtered_headers)
+    encoding = (resp.getheader("Content-Encoding") or "").lower()
+    content, decoded = _rewrite_html(content, encoding)
+    drop = {"content-length"} | ({"content-encoding"} if decoded else set())
+    filtered_headers = [(k, v) for k, v in filtered_headers if k.lower() not in drop]
+    return Response(content, status=resp.status, headers=filtered_headers)
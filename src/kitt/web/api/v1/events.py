@@ -2,11 +2,20 @@
 
 import uuid
 
-from flask import Blueprint, Response
+from flask import Blueprint, Response, request
 
 bp = Blueprint("api_events", __name__, url_prefix="/api/v1/events")
 
 
+def _last_event_id() -> int | None:
+    """Resume point sent by a reconnecting EventSource (or ?last_event_id=)."""
+    from kitt.web.services.event_bus import parse_last_event_id
+
+    return parse_last_event_id(
+        request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+    )
+
+
 @bp.route("/stream")
 def global_stream():
     """Global SSE event stream — all events."""
@@ -15,7 +24,7 @@ def global_stream():
     subscriber_id = f"web-{uuid.uuid4().hex[:8]}"
 
     return Response(
-        event_bus.subscribe(subscriber_id),
+        event_bus.subscribe(subscriber_id, last_event_id=_last_event_id()),
         mimetype="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -33,7 +42,11 @@ def filtered_stream(source_id):
     subscriber_id = f"web-{uuid.uuid4().hex[:8]}"
 
     return Response(
-        event_bus.subscribe(subscriber_id, source_filter=source_id),
+        event_bus.subscribe(
+            subscriber_id,
+            source_filter=source_id,
+            last_event_id=_last_event_id(),
+        ),
         mimetype="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
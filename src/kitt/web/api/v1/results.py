@@ -2,10 +2,28 @@
 
 from flask import Blueprint, jsonify, request
 
+from kitt.storage.result_query import (
+    HARDWARE_TEXT_COLUMNS,
+    ResultQuery,
+    parse_condition,
+    parse_hardware_condition,
+)
 from kitt.web.auth import require_auth
 
 bp = Blueprint("api_results", __name__, url_prefix="/api/v1/results")
 
+MAX_PER_PAGE = 200
+
+# Parameters that switch list_results to keyset (cursor) pagination
+CURSOR_PARAMS = (
+    "cursor",
+    "sort",
+    "metric",
+    "hardware",
+    "passed",
+    *HARDWARE_TEXT_COLUMNS,
+)
+
 
 def _get_result_service():
     from kitt.web.app import get_services
@@ -15,18 +33,54 @@ def _get_result_service():
 
 @bp.route("/", methods=["GET"])
 def list_results():
-    """List results with filters and pagination."""
+    """List results with filters and pagination.
+
+    Returns the offset-based page envelope by default. Any of
+    :data:`CURSOR_PARAMS` without ``page`` switches to cursor paging.
+    """
     model = request.args.get("model", "")
     engine = request.args.get("engine", "")
     suite = request.args.get("suite_name", "")
-    page = request.args.get("page", 1, type=int)
     per_page = request.args.get("per_page", 25, type=int)
 
     svc = _get_result_service()
-    result = svc.list_results(
-        model=model, engine=engine, suite_name=suite, page=page, per_page=per_page
-    )
-    return jsonify(result)
+    cursor_mode = any(request.args.get(name) for name in CURSOR_PARAMS)
+    if "page" in request.args or not cursor_mode:
+        page = request.args.get("page", 1, type=int)
+        result = svc.list_results(
+            model=model, engine=engine, suite_name=suite, page=page, per_page=per_page
+        )
+        return jsonify(result)
+
+    filters = {
+        key: value
+        for key, value in (("model", model), ("engine", engine), ("suite_name", suite))
+        if value
+    }
+    passed = request.args.get("passed")
+    if passed is not None:
+        filters["passed"] = passed.lower() in ("1", "true", "yes")
+
+    try:
+        hardware = [
+            parse_hardware_condition(c) for c in request.args.getlist("hardware")
+        ]
+        hardware += [
+            parse_hardware_condition(f"{column}={request.args[column]}")
+            for column in HARDWARE_TEXT_COLUMNS
+            if request.args.get(column)
+        ]
+        query = ResultQuery(
+            filters=filters,
+            metrics=[parse_condition(c) for c in request.args.getlist("metric")],
+            hardware=hardware,
+            sort=request.args.get("sort", "-timestamp"),
+            cursor=request.args.get("cursor") or None,
+            limit=max(1, min(per_page, MAX_PER_PAGE)),
+        )
+        return jsonify(svc.query_page(query))
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
 
 
 @bp.route("/<result_id>", methods=["GET"])
@@ -137,6 +137,20 @@ def create_app(
     if current < SCHEMA_VERSION:
         run_migrations_sqlite(db_conn, current)
 
+    # --- Event bus ---
+    # The SQLite broker lets SSE subscribers in one worker process see
+    # events published in another, and backs Last-Event-ID resume. It
+    # costs a database write per event, so a single process only uses it
+    # when asked; ``kitt web --workers`` turns it on for its children.
+    from kitt.web.services.event_bus import event_bus
+
+    if os.environ.get("KITT_EVENT_BUS", "memory") == "sqlite":
+        from kitt.web.services.event_broker import SQLiteEventBroker
+
+        event_bus.attach_broker(SQLiteEventBroker(_db_path))
+    else:
+        event_bus.detach_broker()
+
     # --- Initialize services ---
     from kitt.web.services.agent_manager import AgentManager
     from kitt.web.services.campaign_service import CampaignService
@@ -281,6 +295,7 @@ def create_app(
 
     # --- Shutdown cleanup ---
     def _shutdown():
+        event_bus.detach_broker()
         if db_conn:
             db_conn.close()
 
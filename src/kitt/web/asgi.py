@@ -0,0 +1,167 @@
+"""ASGI front end for the KITT web app.
+
+Regular requests are handed to the Flask app on a bounded thread pool.
+SSE streams under /api/v1/events/stream are served directly on the event
+loop, so idle dashboards and agents do not each pin a worker thread.
+"""
+
+import asyncio
+import contextlib
+import logging
+import os
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+from urllib.parse import parse_qs
+
+logger = logging.getLogger(__name__)
+
+Scope = dict[str, Any]
+Message = dict[str, Any]
+Receive = Callable[[], Awaitable[Message]]
+Send = Callable[[Message], Awaitable[None]]
+ASGIApp = Callable[[Scope, Receive, Send], Awaitable[None]]
+
+STREAM_PREFIX = "/api/v1/events/stream"
+
+_SSE_HEADERS = [
+    (b"content-type", b"text/event-stream; charset=utf-8"),
+    (b"cache-control", b"no-cache"),
+    (b"x-accel-buffering", b"no"),
+]
+
+
+def stream_source(path: str) -> str | None:
+    """Return the source filter for an SSE path.
+
+    Returns:
+        "" for the global stream, the source ID for a filtered stream,
+        or None if the path is not an SSE stream.
+    """
+    if path in (STREAM_PREFIX, STREAM_PREFIX + "/"):
+        return ""
+    if path.startswith(STREAM_PREFIX + "/"):
+        source = path[len(STREAM_PREFIX) + 1 :]
+        if source and "/" not in source:
+            return source
+    return None
+
+
+class SSEDispatcher:
+    """Serve SSE on the event loop and delegate everything else.
+
+    Args:
+        app: ASGI app for non-SSE requests (the wrapped Flask app).
+        bus: Event bus to stream from. Defaults to the global bus.
+        keepalive_s: Interval between keepalive comments on idle streams.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        bus: Any | None = None,
+        keepalive_s: float = 30.0,
+    ) -> None:
+        if bus is None:
+            from kitt.web.services.event_bus import event_bus as bus
+        self.app = app
+        self.bus = bus
+        self.keepalive_s = keepalive_s
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["method"] == "GET":
+            source = stream_source(scope["path"])
+            if source is not None:
+                await self._stream(receive, send, source or None, _last_event_id(scope))
+                return
+        await self.app(scope, receive, send)
+
+    async def _stream(
+        self,
+        receive: Receive,
+        send: Send,
+        source_filter: str | None,
+        last_event_id: int | None = None,
+    ) -> None:
+        await send(
+            {"type": "http.response.start", "status": 200, "headers": _SSE_HEADERS}
+        )
+
+        events = self.bus.subscribe_async(
+            f"web-{uuid.uuid4().hex[:8]}",
+            source_filter=source_filter,
+            keepalive_s=self.keepalive_s,
+            last_event_id=last_event_id,
+        )
+        disconnected = asyncio.ensure_future(_wait_disconnect(receive))
+        try:
+            while True:
+                next_chunk = asyncio.ensure_future(events.__anext__())
+                await asyncio.wait(
+                    {next_chunk, disconnected}, return_when=asyncio.FIRST_COMPLETED
+                )
+                if disconnected.done():
+                    next_chunk.cancel()
+                    with contextlib.suppress(
+                        asyncio.CancelledError, StopAsyncIteration
+                    ):
+                        await next_chunk
+                    break
+                chunk = next_chunk.result()
+                await send(
+                    {
+                        "type": "http.response.body",
+                        "body": chunk.encode(),
+                        "more_body": True,
+                    }
+                )
+        except OSError as e:
+            logger.debug(f"SSE client went away: {e}")
+        finally:
+            disconnected.cancel()
+            await events.aclose()
+
+
+def _last_event_id(scope: Scope) -> int | None:
+    from kitt.web.services.event_bus import parse_last_event_id
+
+    for name, value in scope.get("headers", []):
+        if name == b"last-event-id":
+            return parse_last_event_id(value.decode("latin-1"))
+    query = parse_qs(scope.get("query_string", b"").decode("latin-1"))
+    return parse_last_event_id(query.get("last_event_id", [None])[0])
+
+
+async def _wait_disconnect(receive: Receive) -> None:
+    while (await receive())["type"] != "http.disconnect":
+        pass
+
+
+def create_asgi_app(flask_app: Any, threads: int = 16) -> SSEDispatcher:
+    """Wrap a Flask app for an ASGI server.
+
+    Args:
+        flask_app: App from :func:`kitt.web.app.create_app`.
+        threads: Size of the thread pool running Flask requests.
+
+    Raises:
+        ImportError: If a2wsgi is not installed.
+    """
+    from a2wsgi import WSGIMiddleware
+
+    return SSEDispatcher(WSGIMiddleware(flask_app, workers=threads))
+
+
+def app_from_env() -> SSEDispatcher:
+    """App factory for multi-process uvicorn; each worker builds its own app.
+
+    Reads KITT_RESULTS_DIR, KITT_AUTH_TOKEN, KITT_WEB_INSECURE and
+    KITT_WEB_THREADS, which ``kitt web --workers`` sets for its children.
+    """
+    from kitt.web.app import create_app
+
+    app = create_app(
+        results_dir=os.environ.get("KITT_RESULTS_DIR") or None,
+        insecure=os.environ.get("KITT_WEB_INSECURE") == "1",
+    )
+    return create_asgi_app(app, threads=int(os.environ.get("KITT_WEB_THREADS", "16")))
@@ -0,0 +1,71 @@
+"""Production server for the KITT web app."""
+
+import logging
+import os
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+
+def production_server_available() -> bool:
+    """Check whether uvicorn and a2wsgi are installed."""
+    try:
+        import a2wsgi  # noqa: F401
+        import uvicorn  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def serve(
+    app: Any,
+    host: str = "0.0.0.0",
+    port: int = 8080,
+    ssl_context: tuple[str, str] | None = None,
+    threads: int = 16,
+    log_level: str = "info",
+    workers: int = 1,
+) -> None:
+    """Serve a KITT Flask app with uvicorn.
+
+    Each process runs ``threads`` Flask worker threads plus an event loop
+    holding SSE streams. With ``workers`` > 1, uvicorn forks that many
+    processes. Each builds its own app via
+    :func:`kitt.web.asgi.app_from_env`, and they share events through the
+    SQLite event broker.
+
+    Args:
+        app: App from :func:`kitt.web.app.create_app`; used when
+            ``workers`` is 1.
+        host: Interface to bind.
+        port: Port to bind.
+        ssl_context: (cert_path, key_path) to serve HTTPS, as produced by
+            :func:`kitt.security.cert_manager.ensure_server_certs`.
+        threads: Thread pool size for non-streaming requests.
+        log_level: uvicorn log level.
+        workers: Number of server processes.
+    """
+    import uvicorn
+
+    from kitt.web.asgi import create_asgi_app
+
+    cert_path, key_path = ssl_context or (None, None)
+    if workers > 1:
+        target: Any = "kitt.web.asgi:app_from_env"
+        os.environ["KITT_WEB_THREADS"] = str(threads)
+    else:
+        target = create_asgi_app(app, threads=threads)
+
+    uvicorn.run(
+        target,
+        factory=workers > 1,
+        workers=workers,
+        host=host,
+        port=port,
+        ssl_certfile=cert_path,
+        ssl_keyfile=key_path,
+        lifespan="off",
+        log_level=log_level,
+        # Open SSE streams never finish on their own
+        timeout_graceful_shutdown=5,
+    )
@@ -26,6 +26,9 @@ logger = logging.getLogger(__name__)
 # Agent is considered offline if no heartbeat for this many seconds
 HEARTBEAT_TIMEOUT_S = 90
 
+# Minimum spacing between stale-agent sweeps triggered by list_agents()
+STALE_CHECK_INTERVAL_S = 10
+
 
 class AgentManager:
     """Manages agent lifecycle and command dispatch."""
@@ -35,6 +38,7 @@ class AgentManager:
     ) -> None:
         self._conn = db_conn
         self._write_lock: threading.Lock = write_lock or threading.Lock()
+        self._last_stale_check = 0.0
 
     def _commit(self) -> None:
         """Commit the current transaction (must be called inside _write_lock)."""
@@ -644,7 +648,14 @@ class AgentManager:
         """Mark agents as offline if heartbeat is stale.
 
         Test agents (tags contain "test") are always online and skipped.
+        Runs at most once per STALE_CHECK_INTERVAL_S, since every dashboard
+        load lists agents.
         """
+        now = time.monotonic()
+        if now - self._last_stale_check < STALE_CHECK_INTERVAL_S:
+            return
+        self._last_stale_check = now
+
         with self._write_lock:
             rows = self._conn.execute(
                 "SELECT id, last_heartbeat, tags FROM agents WHERE status != 'offline'"
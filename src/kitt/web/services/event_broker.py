@@ -0,0 +1,156 @@
+"""SQLite-backed broker fanning event bus traffic out across processes.
+
+Every published event is appended to the ``events`` table. Its row ID
+becomes the event ID that SSE clients echo back in ``Last-Event-ID``. Each
+process polls the table for rows written by other processes and hands
+them to its local subscribers. Only a database file shared by the worker
+processes of one host is needed, with no external broker.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from kitt.web.services.event_bus import Event
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteEventBroker:
+    """Durable, cross-process event transport on the ``events`` table.
+
+    Args:
+        db_path: SQLite database shared by all web worker processes.
+        poll_interval_s: How often to look for other processes' events.
+        retain: Number of most recent events kept for replay.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        poll_interval_s: float = 0.25,
+        retain: int = 10_000,
+    ) -> None:
+        self.db_path = db_path
+        self.poll_interval_s = poll_interval_s
+        self.retain = retain
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False, timeout=10)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._lock = threading.Lock()
+        self._own_ids: set[int] = set()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def append(self, event: "Event") -> int:
+        """Persist an event and return its ID."""
+        payload = json.dumps(event.data, default=str)
+        with self._lock:
+            cursor = self._conn.execute(
+                "INSERT INTO events (event_type, source_id, data) VALUES (?, ?, ?)",
+                (event.event_type, event.source_id, payload),
+            )
+            self._conn.commit()
+            event_id = cursor.lastrowid or 0
+            self._own_ids.add(event_id)
+        return event_id
+
+    def since(
+        self,
+        after_id: int,
+        source_id: str | None = None,
+        limit: int = 1000,
+    ) -> list["Event"]:
+        """Events newer than ``after_id``, oldest first."""
+        sql = (
+            "SELECT id, event_type, source_id, data, created_at "
+            "FROM events WHERE id > ?"
+        )
+        params: list = [after_id]
+        if source_id:
+            sql += " AND source_id = ?"
+            params.append(source_id)
+        sql += " ORDER BY id LIMIT ?"
+        params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [_row_to_event(row) for row in rows]
+
+    def start(self, deliver: Callable[["Event"], None]) -> None:
+        """Start forwarding other processes' events to ``deliver``."""
+        with self._lock:
+            row = self._conn.execute("SELECT MAX(id) FROM events").fetchone()
+        last_id = row[0] or 0
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._poll,
+            args=(last_id, deliver),
+            name="kitt-event-broker",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop polling and close the connection."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+        with self._lock:
+            self._conn.close()
+
+    def _poll(self, last_id: int, deliver: Callable[["Event"], None]) -> None:
+        last_prune = time.monotonic()
+        while not self._stop.wait(self.poll_interval_s):
+            try:
+                events = self.since(last_id)
+            except sqlite3.Error as e:
+                logger.warning(f"Event broker poll failed: {e}")
+                continue
+
+            for event in events:
+                last_id = event.event_id
+                with self._lock:
+                    own = event.event_id in self._own_ids
+                    self._own_ids.discard(event.event_id)
+                if not own:
+                    deliver(event)
+
+            if time.monotonic() - last_prune > 60:
+                last_prune = time.monotonic()
+                self._prune()
+
+    def _prune(self) -> None:
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "DELETE FROM events WHERE id <= (SELECT MAX(id) FROM events) - ?",
+                    (self.retain,),
+                )
+                self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Event broker prune failed: {e}")
+
+
+def _row_to_event(row: tuple) -> "Event":
+    from kitt.web.services.event_bus import Event
+
+    event_id, event_type, source_id, data, created_at = row
+    try:
+        created = datetime.fromisoformat(created_at).replace(tzinfo=timezone.utc)
+        timestamp = created.timestamp()
+    except (TypeError, ValueError):
+        timestamp = time.time()
+    return Event(
+        event_type=event_type,
+        source_id=source_id,
+        data=json.loads(data),
+        timestamp=timestamp,
+        event_id=event_id,
+    )
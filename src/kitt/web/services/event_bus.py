@@ -1,18 +1,27 @@
-"""In-process pub/sub event bus for SSE streaming.
+"""Pub/sub event bus for SSE streaming.
 
 Clients subscribe to channels and receive events as they are published.
 Used for real-time log streaming, status updates, and notifications.
+Delivery is in-process unless a broker is attached (see
+:mod:`kitt.web.services.event_broker`), which fans events out across
+web worker processes and makes streams resumable via ``Last-Event-ID``.
 """
 
+import asyncio
 import contextlib
+import itertools
 import json
 import logging
 import queue
 import threading
 import time
-from collections.abc import Generator
+from collections import deque
+from collections.abc import AsyncGenerator, Generator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from kitt.web.services.event_broker import SQLiteEventBroker
 
 logger = logging.getLogger(__name__)
 
@@ -25,9 +34,19 @@ class Event:
     source_id: str
     data: dict[str, Any]
     timestamp: float = field(default_factory=time.time)
+    event_id: int = 0
+    _sse: str | None = field(default=None, init=False, repr=False, compare=False)
 
     def to_sse(self) -> str:
-        """Format as a Server-Sent Event string."""
+        """Format as a Server-Sent Event string.
+
+        Serialized once and cached; every subscriber shares the result.
+        """
+        if self._sse is None:
+            self._sse = self._format_sse()
+        return self._sse
+
+    def _format_sse(self) -> str:
         payload = json.dumps(self.data, default=str)
         lines = [
             f"event: {self.event_type}",
@@ -35,18 +54,72 @@ class Event:
             "",
             "",
         ]
+        if self.event_id:
+            lines.insert(0, f"id: {self.event_id}")
         return "\n".join(lines)
 
 
+class _AsyncSubscriber:
+    """Queue-like adapter delivering events onto an asyncio event loop.
+
+    ``publish`` runs on arbitrary threads, so events are handed to the
+    loop with ``call_soon_threadsafe``; a full queue drops the event, the
+    same as a full ``queue.Queue`` subscriber.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.loop = loop
+        self.queue: asyncio.Queue[Event] = asyncio.Queue(maxsize=maxsize)
+
+    def put_nowait(self, event: Event) -> None:
+        # The loop may already be closed during server shutdown
+        with contextlib.suppress(RuntimeError):
+            self.loop.call_soon_threadsafe(self._deliver, event)
+
+    def _deliver(self, event: Event) -> None:
+        with contextlib.suppress(asyncio.QueueFull):
+            self.queue.put_nowait(event)
+
+
+Subscriber = queue.Queue | _AsyncSubscriber
+
+
 class EventBus:
-    """Thread-safe in-process pub/sub for SSE events."""
+    """Thread-safe pub/sub for SSE events.
+
+    Subscribers are indexed by their source filter, so publishing touches
+    only the unfiltered subscribers and those watching the event's source.
+    History is a bounded deque of the last ``max_history`` events, plus a
+    per-source deque holding that source's share of it, so lookups by
+    source cost O(limit) rather than a scan.
+    """
 
     def __init__(self, max_history: int = 200) -> None:
         self._lock = threading.Lock()
-        self._subscribers: dict[str, queue.Queue] = {}
-        self._history: list[Event] = []
+        # subscriber_id -> (source_filter, subscriber)
+        self._subscribers: dict[str, tuple[str | None, Subscriber]] = {}
+        # source_filter (None = all sources) -> subscriber_id -> subscriber
+        self._by_source: dict[str | None, dict[str, Subscriber]] = {}
+        self._history: deque[Event] = deque()
+        self._source_history: dict[str, deque[Event]] = {}
         self._max_history = max_history
         self._counter = 0
+        self._broker: SQLiteEventBroker | None = None
+
+    def attach_broker(self, broker: "SQLiteEventBroker") -> None:
+        """Route events through a cross-process broker.
+
+        Replaces (and stops) any previously attached broker.
+        """
+        self.detach_broker()
+        self._broker = broker
+        broker.start(self._dispatch)
+
+    def detach_broker(self) -> None:
+        """Return to in-process delivery."""
+        broker, self._broker = self._broker, None
+        if broker is not None:
+            broker.stop()
 
     def publish(self, event_type: str, source_id: str, data: dict[str, Any]) -> None:
         """Publish an event to all subscribers.
@@ -58,21 +131,82 @@ class EventBus:
         """
         event = Event(event_type=event_type, source_id=source_id, data=data)
 
+        broker = self._broker
+        if broker is not None:
+            try:
+                event.event_id = broker.append(event)
+            except Exception as e:
+                logger.warning(f"Event broker append failed: {e}")
+
+        self._dispatch(event)
+
+    def _dispatch(self, event: Event) -> None:
+        """Record an event and hand it to local subscribers."""
         with self._lock:
-            self._history.append(event)
-            if len(self._history) > self._max_history:
-                self._history = self._history[-self._max_history :]
             self._counter += 1
+            if not event.event_id and self._broker is None:
+                event.event_id = self._counter
+            self._record(event)
+
+            targets = [
+                *self._by_source.get(None, {}).values(),
+                *self._by_source.get(event.source_id, {}).values(),
+            ]
+
+        if targets:
+            event.to_sse()  # serialize once, before any subscriber reads it
+        for sub_queue in targets:
+            with contextlib.suppress(queue.Full):
+                sub_queue.put_nowait(event)
+
+    def _record(self, event: Event) -> None:
+        """Append to history, evicting the oldest event (caller holds lock)."""
+        if self._max_history <= 0:
+            return
+        if len(self._history) >= self._max_history:
+            oldest = self._history.popleft()
+            source_events = self._source_history[oldest.source_id]
+            source_events.popleft()
+            if not source_events:
+                del self._source_history[oldest.source_id]
+        self._history.append(event)
+        self._source_history.setdefault(event.source_id, deque()).append(event)
+
+    def _register(
+        self, subscriber_id: str, source_filter: str | None, sub: Subscriber
+    ) -> None:
+        with self._lock:
+            self._unregister_locked(subscriber_id)
+            self._subscribers[subscriber_id] = (source_filter, sub)
+            self._by_source.setdefault(source_filter, {})[subscriber_id] = sub
 
-            for sub_queue in self._subscribers.values():
-                with contextlib.suppress(queue.Full):
-                    sub_queue.put_nowait(event)
+    def _unregister_locked(self, subscriber_id: str) -> None:
+        entry = self._subscribers.pop(subscriber_id, None)
+        if entry is None:
+            return
+        source_filter, _ = entry
+        index = self._by_source[source_filter]
+        index.pop(subscriber_id, None)
+        if not index:
+            del self._by_source[source_filter]
+
+    def replay(self, after_id: int, source_id: str | None = None) -> list[Event]:
+        """Events published after ``after_id``, for resuming a stream."""
+        broker = self._broker
+        if broker is not None:
+            return broker.since(after_id, source_id)
+        with self._lock:
+            events = (
+                self._source_history.get(source_id, ()) if source_id else self._history
+            )
+            return [e for e in events if e.event_id > after_id]
 
     def subscribe(
         self,
         subscriber_id: str,
         source_filter: str | None = None,
         max_queue_size: int = 100,
+        last_event_id: int | None = None,
     ) -> Generator[str, None, None]:
         """Subscribe to events and yield SSE-formatted strings.
 
@@ -80,20 +214,27 @@ class EventBus:
             subscriber_id: Unique subscriber identifier.
             source_filter: If set, only yield events from this source_id.
             max_queue_size: Max events to buffer per subscriber.
+            last_event_id: ``Last-Event-ID`` sent by a reconnecting client;
+                missed events are replayed before live ones.
 
         Yields:
             SSE-formatted event strings.
         """
         sub_queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
-
-        with self._lock:
-            self._subscribers[subscriber_id] = sub_queue
+        self._register(subscriber_id, source_filter, sub_queue)
 
         try:
+            # Register before replaying so nothing falls in between
+            seen = last_event_id or 0
+            if last_event_id is not None:
+                for event in self.replay(last_event_id, source_filter):
+                    seen = max(seen, event.event_id)
+                    yield event.to_sse()
+
             while True:
                 try:
                     event = sub_queue.get(timeout=30)
-                    if source_filter and event.source_id != source_filter:
+                    if event.event_id and event.event_id <= seen:
                         continue
                     yield event.to_sse()
                 except queue.Empty:
@@ -101,12 +242,51 @@ class EventBus:
                     yield ": keepalive\n\n"
         finally:
             with self._lock:
-                self._subscribers.pop(subscriber_id, None)
+                self._unregister_locked(subscriber_id)
+
+    async def subscribe_async(
+        self,
+        subscriber_id: str,
+        source_filter: str | None = None,
+        max_queue_size: int = 100,
+        keepalive_s: float = 30.0,
+        last_event_id: int | None = None,
+    ) -> AsyncGenerator[str, None]:
+        """Async variant of :meth:`subscribe` for event-loop servers.
+
+        An idle subscriber costs a pending future rather than a blocked
+        thread, so one loop can hold thousands of open streams.
+        """
+        sub = _AsyncSubscriber(asyncio.get_running_loop(), max_queue_size)
+        self._register(subscriber_id, source_filter, sub)
+
+        try:
+            seen = last_event_id or 0
+            if last_event_id is not None:
+                missed = await asyncio.to_thread(
+                    self.replay, last_event_id, source_filter
+                )
+                for event in missed:
+                    seen = max(seen, event.event_id)
+                    yield event.to_sse()
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(sub.queue.get(), keepalive_s)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event.event_id and event.event_id <= seen:
+                    continue
+                yield event.to_sse()
+        finally:
+            with self._lock:
+                self._unregister_locked(subscriber_id)
 
     def unsubscribe(self, subscriber_id: str) -> None:
         """Remove a subscriber."""
         with self._lock:
-            self._subscribers.pop(subscriber_id, None)
+            self._unregister_locked(subscriber_id)
 
     def get_history(
         self,
@@ -114,11 +294,16 @@ class EventBus:
         limit: int = 50,
     ) -> list[Event]:
         """Get recent events, optionally filtered by source."""
+        if limit <= 0:
+            return []
         with self._lock:
-            events = self._history
             if source_id:
-                events = [e for e in events if e.source_id == source_id]
-            return events[-limit:]
+                events = self._source_history.get(source_id, deque())
+            else:
+                events = self._history
+            recent = list(itertools.islice(reversed(events), limit))
+        recent.reverse()
+        return recent
 
     @property
     def subscriber_count(self) -> int:
@@ -126,5 +311,15 @@ class EventBus:
             return len(self._subscribers)
 
 
+def parse_last_event_id(value: str | None) -> int | None:
+    """Parse a ``Last-Event-ID`` header; None if absent or malformed."""
+    if not value:
+        return None
+    try:
+        return max(int(value.strip()), 0)
+    except ValueError:
+        return None
+
+
 # Global event bus instance
 event_bus = EventBus()
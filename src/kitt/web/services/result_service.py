@@ -1,9 +1,13 @@
 """Result service wrapping the existing storage layer for web use."""
 
 import logging
+import threading
+import time
 from pathlib import Path
 from typing import Any
 
+from kitt.storage.result_query import ResultQuery
+
 logger = logging.getLogger(__name__)
 
 
@@ -12,10 +16,40 @@ class ResultService:
 
     Wraps the existing SQLiteStore (or any ResultStore) with
     web-specific convenience methods.
+
+    The dashboard summary and recent-results list are cached. Writes made
+    through this service invalidate them at once. ``cache_ttl_s`` bounds
+    how stale they get from writes made elsewhere, such as other web
+    workers or ``kitt storage import``.
     """
 
-    def __init__(self, store: Any) -> None:
+    def __init__(self, store: Any, cache_ttl_s: float = 30.0) -> None:
         self._store = store
+        self.cache_ttl_s = cache_ttl_s
+        self._cache: dict[Any, tuple[float, Any]] = {}
+        self._cache_lock = threading.Lock()
+        self._generation = 0
+
+    def _cached(self, key: Any, compute: Any) -> Any:
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._cache.get(key)
+            if hit is not None and now - hit[0] < self.cache_ttl_s:
+                return hit[1]
+            generation = self._generation
+        value = compute()
+        with self._cache_lock:
+            # A write that invalidated the cache while computing may not be
+            # reflected in ``value``; serve it but don't keep it
+            if self._generation == generation:
+                self._cache[key] = (now, value)
+        return value
+
+    def invalidate_cache(self) -> None:
+        """Drop cached summaries after results change."""
+        with self._cache_lock:
+            self._generation += 1
+            self._cache.clear()
 
     def list_results(
         self,
@@ -52,13 +86,30 @@ class ResultService:
             "pages": pages,
         }
 
+    def query_page(self, query: ResultQuery) -> dict[str, Any]:
+        """List results with keyset pagination and server-side filters.
+
+        Raises:
+            ValueError: If the query is invalid, e.g. a stale cursor.
+        """
+        page = self._store.query_page(query)
+        return {
+            "items": page.items,
+            "next_cursor": page.next_cursor,
+            "per_page": query.limit,
+            "sort": query.sort,
+        }
+
     def get_result(self, result_id: str) -> dict[str, Any] | None:
         """Get a single result by ID."""
         return self._store.get_result(result_id)
 
     def delete_result(self, result_id: str) -> bool:
         """Delete a result by ID."""
-        return self._store.delete_result(result_id)
+        deleted = self._store.delete_result(result_id)
+        if deleted:
+            self.invalidate_cache()
+        return deleted
 
     def aggregate(
         self, group_by: str, metrics: list[str] | None = None
@@ -68,6 +119,9 @@ class ResultService:
 
     def get_summary(self) -> dict[str, Any]:
         """Get overall results summary for the dashboard."""
+        return self._cached("summary", self._compute_summary)
+
+    def _compute_summary(self) -> dict[str, Any]:
         total = self._store.count()
         passed = self._store.count(filters={"passed": True})
         pass_rate = round(passed / total * 100) if total > 0 else 0
@@ -87,7 +141,10 @@ class ResultService:
 
     def get_recent(self, limit: int = 10) -> list[dict[str, Any]]:
         """Get the most recent results."""
-        return self._store.query(order_by="-timestamp", limit=limit)
+        return self._cached(
+            ("recent", limit),
+            lambda: self._store.query(order_by="-timestamp", limit=limit),
+        )
 
     def compare_results(self, result_ids: list[str]) -> list[dict[str, Any]]:
         """Get multiple results for comparison."""
@@ -101,9 +158,13 @@ class ResultService:
     def save_result(self, result_data: dict[str, Any]) -> None:
         """Persist a result received from an agent."""
         self._store.save_result(result_data)
+        self.invalidate_cache()
 
     def import_directory(self, directory: Path) -> int:
         """Import results from a directory tree."""
         if hasattr(self._store, "import_directory"):
-            return self._store.import_directory(directory)
+            imported = self._store.import_directory(directory)
+            if imported:
+                self.invalidate_cache()
+            return imported
         return 0
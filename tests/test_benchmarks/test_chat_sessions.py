@@ -0,0 +1,105 @@
+"""Tests for concurrent chat sessions benchmark."""
+
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kitt.benchmarks.performance.chat_sessions import ChatSessionsBenchmark
+from kitt.engines.openai_compat import StreamChunk
+
+
+@pytest.fixture
+def benchmark():
+    return ChatSessionsBenchmark()
+
+
+@pytest.fixture
+def engine():
+    mock = MagicMock()
+    mock._base_url = "http://localhost:8000"
+    mock._model_name = "test-model"
+    return mock
+
+
+def _fake_stream(base_url, messages, **kwargs):
+    # TTFT grows with the number of messages in the history
+    ttft = 10.0 + 5.0 * len(messages)
+    return iter(
+        [
+            StreamChunk(token="ok", timestamp_ms=ttft),
+            StreamChunk(token="!", timestamp_ms=ttft + 5.0),
+        ]
+    )
+
+
+class TestChatSessionsBenchmark:
+    def test_metadata(self, benchmark):
+        assert benchmark.name == "chat_sessions"
+        assert benchmark.category == "performance"
+
+    def test_no_base_url(self, benchmark):
+        engine = MagicMock()
+        del engine._base_url
+        result = benchmark._execute(engine, {})
+        assert not result.passed
+        assert "base_url" in result.errors[0]
+
+    @patch("kitt.engines.openai_compat.openai_chat_stream")
+    def test_sessions_keep_history(self, mock_stream, benchmark, engine):
+        history_sizes = []
+
+        def recording_stream(base_url, messages, **kwargs):
+            history_sizes.append(len(messages))
+            return _fake_stream(base_url, messages)
+
+        mock_stream.side_effect = recording_stream
+        config = {"sessions": 3, "turns": 3, "think_time_s": 0}
+        result = benchmark._execute(engine, config)
+
+        assert result.passed
+        assert result.metrics["turns_completed"] == 9
+        assert result.metrics["total_tokens"] == 18
+        assert sorted(history_sizes) == [1, 1, 1, 3, 3, 3, 5, 5, 5]
+
+    @patch("kitt.engines.openai_compat.openai_chat_stream", side_effect=_fake_stream)
+    def test_ttft_growth_reported(self, mock_stream, benchmark, engine):
+        config = {"sessions": 2, "turns": 3, "think_time_s": 0}
+        metrics = benchmark._execute(engine, config).metrics
+
+        assert metrics["ttft_by_turn_ms"] == {
+            "turn_1": 15.0,
+            "turn_2": 25.0,
+            "turn_3": 35.0,
+        }
+        assert metrics["ttft_growth_ms_per_1k_chars"] > 0
+        assert metrics["ttft_ms"]["max"] == 35.0
+        assert "p95" in metrics["ttft_ms"]
+        assert metrics["throughput_tps"] > 0
+
+    @patch("kitt.engines.openai_compat.openai_chat_stream")
+    def test_sessions_run_concurrently(self, mock_stream, benchmark, engine):
+        barrier = threading.Barrier(4, timeout=5)
+
+        def slow_stream(base_url, messages, **kwargs):
+            barrier.wait()
+            time.sleep(0.01)
+            return iter([StreamChunk(token="x", timestamp_ms=1.0)])
+
+        mock_stream.side_effect = slow_stream
+        config = {"sessions": 4, "turns": 1, "think_time_s": 0}
+        result = benchmark._execute(engine, config)
+
+        assert result.passed
+        assert result.metrics["peak_concurrent_requests"] == 4
+
+    @patch("kitt.engines.openai_compat.openai_chat_stream")
+    def test_failed_turn_ends_session(self, mock_stream, benchmark, engine):
+        mock_stream.side_effect = RuntimeError("connection reset")
+        config = {"sessions": 2, "turns": 3, "think_time_s": 0}
+        result = benchmark._execute(engine, config)
+
+        assert not result.passed
+        assert len(result.errors) == 2
+        assert mock_stream.call_count == 2
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock
 import pytest
 
 from kitt.benchmarks.quality.standard.multiturn import MultiTurnBenchmark
-from kitt.engines.base import GenerationMetrics, GenerationResult
+from kitt.engines.base import GenerationMetrics, GenerationResult, InferenceEngine
 
 
 @pytest.fixture
@@ -37,7 +37,7 @@ class TestMultiTurnBenchmark:
 
     def test_successful_conversation(self, benchmark):
         engine = MagicMock()
-        engine.generate.side_effect = [
+        engine.generate_chat.side_effect = [
             make_gen_result("345"),
             make_gen_result("690"),
             make_gen_result("15 and 23"),
@@ -62,7 +62,7 @@ class TestMultiTurnBenchmark:
 
     def test_engine_error_mid_conversation(self, benchmark):
         engine = MagicMock()
-        engine.generate.side_effect = [
+        engine.generate_chat.side_effect = [
             make_gen_result("First response"),
             RuntimeError("OOM"),
         ]
@@ -79,6 +79,42 @@ class TestMultiTurnBenchmark:
         assert not result.passed
         assert result.outputs[0]["turns_completed"] == 1
 
+    def test_history_sent_as_messages(self, benchmark):
+        engine = MagicMock()
+        sent = []
+
+        def chat(messages, **kwargs):
+            sent.append([dict(m) for m in messages])
+            return make_gen_result(f"reply {len(sent)}")
+
+        engine.generate_chat.side_effect = chat
+        benchmark._execute(
+            engine, {"conversations": [{"name": "t", "turns": ["a", "b"]}]}
+        )
+
+        assert sent[1] == [
+            {"role": "user", "content": "a"},
+            {"role": "assistant", "content": "reply 1"},
+            {"role": "user", "content": "b"},
+        ]
+        engine.generate.assert_not_called()
+
+    def test_engine_without_chat_gets_transcript(self, benchmark):
+        engine = MagicMock(spec=["generate", "generate_chat"])
+        engine.generate.side_effect = [make_gen_result("one"), make_gen_result("two")]
+        # The base-class fallback, as inherited by engines without a chat API
+        engine.generate_chat.side_effect = lambda **kwargs: (
+            InferenceEngine.generate_chat(engine, **kwargs)
+        )
+
+        result = benchmark._execute(
+            engine, {"conversations": [{"name": "t", "turns": ["a", "b"]}]}
+        )
+
+        assert result.outputs[0]["turns_completed"] == 2
+        prompt = engine.generate.call_args_list[1][0][0]
+        assert prompt == "User: a\nAssistant: one\nUser: b\nAssistant:"
+
     def test_aggregate_metrics(self, benchmark):
         outputs = [
             {"completion_rate": 1.0, "turns_completed": 3},
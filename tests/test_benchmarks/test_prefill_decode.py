@@ -0,0 +1,140 @@
+"""Tests for prefill vs. decode sweep benchmark."""
+
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from kitt.benchmarks.performance.prefill_decode import PrefillDecodeBenchmark
+from kitt.engines.base import GenerationMetrics, GenerationResult
+
+
+@pytest.fixture
+def benchmark():
+    return PrefillDecodeBenchmark()
+
+
+def _tokenizing_engine(chars_per_token=3.0, prefill_tps=1000.0, decode_tps=50.0):
+    """Engine whose prompt_tokens and latency follow the prompt length."""
+
+    def generate(prompt, temperature=0.0, max_tokens=128, **kwargs):
+        prompt_tokens = int(len(prompt) / chars_per_token)
+        ttft_ms = prompt_tokens / prefill_tps * 1000
+        total_ms = ttft_ms + (max_tokens - 1) / decode_tps * 1000
+        return GenerationResult(
+            output="x" * max_tokens,
+            metrics=GenerationMetrics(
+                ttft_ms=0,
+                tps=0,
+                total_latency_ms=total_ms,
+                gpu_memory_peak_gb=0,
+                gpu_memory_avg_gb=0,
+                timestamp=datetime.now(),
+            ),
+            prompt_tokens=prompt_tokens,
+            completion_tokens=max_tokens,
+        )
+
+    engine = MagicMock()
+    engine.generate.side_effect = generate
+    return engine
+
+
+class TestPrefillDecodeBenchmark:
+    def test_metadata(self, benchmark):
+        assert benchmark.name == "prefill_decode"
+        assert benchmark.category == "performance"
+
+    def test_default_input_lengths_fit_context(self, benchmark):
+        lengths = benchmark._input_lengths(
+            {"max_context": 4096, "output_lengths": [256]}
+        )
+        assert lengths == [128, 256, 512, 1024, 2048]
+
+    def test_explicit_input_lengths(self, benchmark):
+        assert benchmark._input_lengths({"input_lengths": [1024, 128]}) == [128, 1024]
+
+    def test_calibration_uses_engine_token_counts(self, benchmark):
+        engine = _tokenizing_engine(chars_per_token=3.0)
+        num_chars, cpt, exact = benchmark._calibrate(engine, 1000, 4.0, 0.02, 4)
+
+        prompt_tokens = int(len(benchmark._build_prompt(num_chars)) / 3.0)
+        assert exact is True
+        assert abs(prompt_tokens - 1000) / 1000 <= 0.02
+        assert cpt == pytest.approx(3.0, rel=0.05)
+
+    def test_calibration_without_token_counts(self, benchmark):
+        engine = MagicMock()
+        engine.generate.return_value.prompt_tokens = 0
+        _, _, exact = benchmark._calibrate(engine, 512, 4.0, 0.02, 4)
+        assert exact is False
+
+    def test_calibration_not_converged(self, benchmark):
+        engine = _tokenizing_engine(chars_per_token=3.0)
+        # One round from a poor estimate lands far from the target
+        _, _, exact = benchmark._calibrate(engine, 1000, 8.0, 0.02, 1)
+        assert exact is False
+
+    def test_prompts_are_unique(self, benchmark):
+        assert benchmark._build_prompt(200) != benchmark._build_prompt(200)
+
+    def test_sweep_separates_prefill_and_decode(self, benchmark):
+        engine = _tokenizing_engine(prefill_tps=1000.0, decode_tps=50.0)
+        result = benchmark._execute(
+            engine,
+            {
+                "input_lengths": [256, 1024],
+                "output_lengths": [32, 64],
+                "repetitions": 2,
+            },
+        )
+
+        assert result.passed
+        assert len(result.outputs) == 2 * 2 * 2
+        metrics = result.metrics
+        assert metrics["exact_token_counts"] is True
+        assert metrics["avg_prefill_tps"] == pytest.approx(1000.0, rel=0.01)
+        assert metrics["avg_decode_tps"] == pytest.approx(50.0, rel=0.01)
+        assert set(metrics["ttft_ms_by_input_length"]) == {"256", "1024"}
+        assert (
+            metrics["ttft_ms_by_input_length"]["1024"]
+            > metrics["ttft_ms_by_input_length"]["256"]
+        )
+        assert len(metrics["grid"]) == 4
+        assert metrics["grid"][0]["samples"] == 2
+
+    def test_uses_engine_reported_ttft(self, benchmark):
+        engine = MagicMock()
+        engine.generate.return_value = GenerationResult(
+            output="ok",
+            metrics=GenerationMetrics(
+                ttft_ms=100.0,
+                tps=0,
+                total_latency_ms=1100.0,
+                gpu_memory_peak_gb=0,
+                gpu_memory_avg_gb=0,
+                timestamp=datetime.now(),
+            ),
+            prompt_tokens=128,
+            completion_tokens=51,
+        )
+        result = benchmark._execute(
+            engine,
+            {"input_lengths": [128], "output_lengths": [50], "repetitions": 1},
+        )
+
+        point = result.outputs[0]["metrics"]
+        assert point["ttft_ms"] == 100.0
+        assert point["prefill_tps"] == 1280.0
+        assert point["decode_tps"] == 50.0
+
+    def test_errors_recorded(self, benchmark):
+        engine = MagicMock()
+        engine.generate.side_effect = RuntimeError("context overflow")
+        result = benchmark._execute(
+            engine, {"input_lengths": [128], "output_lengths": [32]}
+        )
+
+        assert not result.passed
+        assert result.metrics == {}
+        assert "Calibration failed" in result.errors[0]
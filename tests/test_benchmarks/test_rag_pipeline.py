@@ -5,8 +5,10 @@ from unittest.mock import MagicMock
 
 import pytest
 
+from kitt.benchmarks.quality.standard import rag_pipeline
 from kitt.benchmarks.quality.standard.rag_pipeline import (
     BUILT_IN_CORPUS,
+    BM25Retriever,
     RAGPipelineBenchmark,
     SimpleRetriever,
 )
@@ -86,6 +88,58 @@ class TestSimpleRetriever:
         assert results == []
 
 
+# --- BM25Retriever ---
+
+BM25_DOCS = [
+    "the cat sat on the mat",
+    "the dog chased the cat",
+    "the quick brown fox",
+    "a zebra is a striped animal",
+]
+
+
+class TestBM25Retriever:
+    def test_rare_term_ranks_first(self):
+        retriever = BM25Retriever(BM25_DOCS)
+        assert retriever.retrieve("the zebra", top_k=1) == [BM25_DOCS[3]]
+
+    def test_only_matching_documents_returned(self):
+        retriever = BM25Retriever(BM25_DOCS)
+        # Same term frequency, so the shorter document scores higher
+        assert retriever.retrieve("cat", top_k=10) == [BM25_DOCS[1], BM25_DOCS[0]]
+        assert retriever.retrieve("unknown words", top_k=3) == []
+        assert retriever.retrieve("", top_k=3) == []
+
+    def test_no_documents(self):
+        assert BM25Retriever([]).retrieve("anything") == []
+
+    def test_scores(self):
+        scores = BM25Retriever(BM25_DOCS).scores("cat")
+        assert set(scores) == {0, 1}
+        assert all(score > 0 for score in scores.values())
+
+    def test_python_fallback_matches(self, monkeypatch):
+        docs = [f"doc {i} term{i % 7} term{i % 3} shared" for i in range(50)]
+        queries = ["term1 shared", "term2 term5", "doc 7", "shared"]
+        expected = [BM25Retriever(docs).retrieve(q, top_k=5) for q in queries]
+
+        monkeypatch.setattr(rag_pipeline, "NUMPY_AVAILABLE", False)
+        fallback = BM25Retriever(docs)
+        assert [fallback.retrieve(q, top_k=5) for q in queries] == expected
+
+    def test_cached_index_reused(self, tmp_path):
+        built = BM25Retriever.cached(BM25_DOCS, tmp_path)
+        files = list(tmp_path.glob("bm25-*.npz"))
+        assert len(files) == 1
+
+        loaded = BM25Retriever.cached(BM25_DOCS, tmp_path)
+        assert loaded.retrieve("the cat", 3) == built.retrieve("the cat", 3)
+        assert loaded.scores("zebra") == pytest.approx(built.scores("zebra"))
+
+        BM25Retriever.cached(BM25_DOCS[:2], tmp_path)
+        assert len(list(tmp_path.glob("bm25-*.npz"))) == 2
+
+
 # --- RAGPipelineBenchmark ---
 
 
@@ -93,7 +147,7 @@ class TestRAGPipelineBenchmark:
     def test_name_and_category(self, bench):
         assert bench.name == "rag_pipeline"
         assert bench.category == "quality_standard"
-        assert bench.version == "1.0.0"
+        assert bench.version == "1.1.0"
 
     def test_basic_execution(self, bench, engine):
         engine.generate.return_value = MockResult(output="299792458")
@@ -165,3 +219,19 @@ class TestRAGPipelineBenchmark:
         assert "Python is a language." in prompt
         assert "Context:" in prompt
         assert "Answer:" in prompt
+
+    def test_retrieval_reported_separately(self, bench, engine):
+        engine.generate.return_value = MockResult(output="299792458")
+        result = bench._execute(engine, {})
+        for name in ("retrieval", "generation"):
+            assert f"{name}_latency_p50_ms" in result.metrics
+            assert f"{name}_latency_p95_ms" in result.metrics
+        assert "index_build_ms" in result.metrics
+        assert result.metrics["corpus_documents"] == 9
+
+    def test_documents_file_extends_corpus(self, bench, engine, tmp_path):
+        passages = tmp_path / "passages.jsonl"
+        passages.write_text('{"text": "extra passage one"}\n{"text": "two"}\n')
+        config = {"sample_size": 1, "documents_file": str(passages)}
+        result = bench._execute(engine, config)
+        assert result.metrics["corpus_documents"] == 5
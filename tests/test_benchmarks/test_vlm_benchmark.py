@@ -44,10 +44,20 @@ def engine():
     return mock
 
 
+@pytest.fixture
+def text_chat_engine():
+    """Engine with the text-only generate_chat fallback."""
+    mock = MagicMock(spec=["generate", "generate_chat", "supports_image_input"])
+    mock.supports_image_input = False
+    mock.generate.return_value = MockResult()
+    return mock
+
+
 @pytest.fixture
 def chat_engine():
-    """Engine with generate_chat (multimodal capable)."""
-    mock = MagicMock(spec=["generate", "generate_chat"])
+    """Engine whose generate_chat accepts images (multimodal capable)."""
+    mock = MagicMock(spec=["generate", "generate_chat", "supports_image_input"])
+    mock.supports_image_input = True
     mock.generate.return_value = MockResult()
     mock.generate_chat.return_value = MockResult()
     return mock
@@ -95,6 +105,21 @@ class TestVLMBenchmark:
         chat_engine.generate_chat.assert_called_once()
         assert result.passed
 
+    def test_text_only_chat_engine_uses_generate(self, bench, text_chat_engine):
+        config = {
+            "tasks": [
+                {
+                    "prompt": "What is in this image?",
+                    "image_url": "http://example.com/img.png",
+                    "expected_keywords": [],
+                },
+            ],
+        }
+        result = bench._execute(text_chat_engine, config)
+        text_chat_engine.generate_chat.assert_not_called()
+        text_chat_engine.generate.assert_called_once()
+        assert result.metrics["multimodal_supported"] is False
+
     def test_engine_with_chat_no_image_uses_generate(self, bench, chat_engine):
         config = {
             "tasks": [
@@ -1,6 +1,7 @@
 """Tests for auto-compare campaign results."""
 
 import json
+from unittest.mock import patch
 
 import pytest
 
@@ -186,3 +187,58 @@ class TestCompare:
         # new_bench not in baseline, so only throughput compared
         assert len(result["regressions"]) == 1
         assert result["regressions"][0]["benchmark"] == "throughput"
+
+
+class TestBaselineSources:
+    def test_index_reparses_only_changed_files(self, comparer, tmp_path):
+        for day in (1, 2, 3):
+            _write_metrics(
+                tmp_path,
+                f"run{day}",
+                {
+                    "model": "llama-8b",
+                    "engine": "vllm",
+                    "timestamp": f"2024-01-0{day}T00:00:00",
+                },
+            )
+
+        baseline = comparer._find_previous_result(
+            "llama-8b", "vllm", before="2024-01-03T00:00:00"
+        )
+        assert baseline["timestamp"] == "2024-01-02T00:00:00"
+        assert (tmp_path / "kitt-results" / ".kitt-index.json").exists()
+
+        reloaded = AutoComparer(results_dir=tmp_path)
+        with patch(
+            "kitt.storage.result_index.HardwareFingerprint.from_result"
+        ) as parse:
+            reloaded._find_previous_result("llama-8b", "vllm")
+        parse.assert_not_called()
+
+    def test_store_lookup_filters_hardware(self, tmp_path):
+        from kitt.storage.sqlite_store import SQLiteStore
+
+        store = SQLiteStore(db_path=tmp_path / "kitt.db")
+        for day, fp in ((1, "gpu-a"), (2, "gpu-b"), (3, "gpu-a")):
+            store.save_result(
+                {
+                    "model": "llama-8b",
+                    "engine": "vllm",
+                    "suite_name": "standard",
+                    "timestamp": f"2024-01-0{day}T00:00:00",
+                    "system_info": {"fingerprint": fp},
+                }
+            )
+        comparer = AutoComparer(results_dir=tmp_path, store=store)
+
+        baseline = comparer._find_previous_result(
+            "llama-8b",
+            "vllm",
+            suite_name="standard",
+            fingerprint="gpu-a",
+            before="2024-01-03T00:00:00",
+        )
+
+        assert baseline["timestamp"] == "2024-01-01T00:00:00"
+        assert len(store.find_baselines("llama-8b", "vllm", limit=5)) == 3
+        store.close()
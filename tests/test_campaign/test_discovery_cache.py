@@ -0,0 +1,146 @@
+"""Tests for the GGUF/Ollama discovery cache."""
+
+import json
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kitt.campaign.discovery_cache import MIRROR_VALIDATOR, DiscoveryCache
+from kitt.campaign.gguf_discovery import discover_gguf_quants, discover_ollama_tags
+
+# huggingface_hub may not be installed; create a stub so @patch targets resolve
+if "huggingface_hub" not in sys.modules:
+    sys.modules["huggingface_hub"] = MagicMock()
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return DiscoveryCache(cache_dir=tmp_path / "cache", ttl_s=60)
+
+
+def _age(cache, kind, key, seconds):
+    """Backdate an entry so it looks ``seconds`` old."""
+    path = cache._path(kind, key)
+    data = json.loads(path.read_text())
+    data["fetched_at"] = time.time() - seconds
+    path.write_text(json.dumps(data))
+
+
+class TestDiscoveryCache:
+    def test_fresh_entry_served_without_fetch(self, cache):
+        fetch = MagicMock(return_value=(["a.gguf"], "sha1"))
+        assert cache.get("gguf", "org/repo", fetch) == ["a.gguf"]
+        assert cache.get("gguf", "org/repo", fetch) == ["a.gguf"]
+        fetch.assert_called_once_with(None)
+
+    def test_expired_entry_revalidated(self, cache):
+        cache.put("gguf", "org/repo", ["a.gguf"], "sha1")
+        _age(cache, "gguf", "org/repo", 120)
+
+        fetch = MagicMock(return_value=None)
+        assert cache.get("gguf", "org/repo", fetch) == ["a.gguf"]
+        fetch.assert_called_once_with("sha1")
+
+        # Not-modified refreshes the entry, so the next lookup is a hit
+        assert cache.get("gguf", "org/repo", fetch) == ["a.gguf"]
+        assert fetch.call_count == 1
+
+    def test_changed_upstream_replaces_entry(self, cache):
+        cache.put("gguf", "org/repo", ["a.gguf"], "sha1")
+        _age(cache, "gguf", "org/repo", 120)
+
+        fetch = MagicMock(return_value=(["a.gguf", "b.gguf"], "sha2"))
+        assert cache.get("gguf", "org/repo", fetch) == ["a.gguf", "b.gguf"]
+        assert cache._read("gguf", "org/repo")["validator"] == "sha2"
+
+    def test_stale_entry_served_on_error(self, cache):
+        cache.put("ollama", "llama3.1", ["8b"], "etag")
+        _age(cache, "ollama", "llama3.1", 120)
+
+        fetch = MagicMock(side_effect=OSError("unreachable"))
+        assert cache.get("ollama", "llama3.1", fetch) == ["8b"]
+
+    def test_error_without_entry(self, cache):
+        fetch = MagicMock(side_effect=OSError("unreachable"))
+        assert cache.get("ollama", "llama3.1", fetch) is None
+
+    def test_offline_never_fetches(self, tmp_path):
+        cache = DiscoveryCache(cache_dir=tmp_path, ttl_s=0, offline=True)
+        fetch = MagicMock()
+        assert cache.get("gguf", "org/repo", fetch) is None
+
+        cache.put("gguf", "org/repo", ["a.gguf"])
+        assert cache.get("gguf", "org/repo", fetch) == ["a.gguf"]
+        fetch.assert_not_called()
+
+
+class TestSeedFromMirror:
+    def test_devon_and_ollama_layouts(self, cache, tmp_path):
+        mirror = tmp_path / "mirror"
+        repo = mirror / "huggingface" / "org" / "Model-GGUF"
+        (repo / "Q8_0").mkdir(parents=True)
+        (repo / "Model-Q4_K_M.gguf").touch()
+        (repo / "Q8_0" / "Model-Q8_0.gguf").touch()
+        (repo / "README.md").touch()
+        tags = mirror / "manifests" / "registry.ollama.ai" / "library" / "qwen2.5"
+        tags.mkdir(parents=True)
+        (tags / "7b").touch()
+        (tags / "7b-instruct-q4_0").touch()
+
+        assert cache.seed_from_mirror(mirror) == 2
+
+        gguf = cache._read("gguf", "org/Model-GGUF")
+        assert gguf["value"] == ["Model-Q4_K_M.gguf", "Q8_0/Model-Q8_0.gguf"]
+        assert gguf["validator"] == MIRROR_VALIDATOR
+        assert cache._read("ollama", "qwen2.5")["value"] == ["7b", "7b-instruct-q4_0"]
+
+    def test_keep_existing_entries(self, cache, tmp_path):
+        mirror = tmp_path / "mirror"
+        for name in ("Cached-GGUF", "New-GGUF"):
+            repo = mirror / "huggingface" / "org" / name
+            repo.mkdir(parents=True)
+            (repo / "model-Q4_K_M.gguf").touch()
+        cache.put("gguf", "org/Cached-GGUF", ["upstream.gguf"], "sha1")
+        fetched_at = cache._read("gguf", "org/Cached-GGUF")["fetched_at"]
+
+        assert cache.seed_from_mirror(mirror, overwrite=False) == 1
+
+        cached = cache._read("gguf", "org/Cached-GGUF")
+        assert cached["value"] == ["upstream.gguf"]
+        assert cached["fetched_at"] == fetched_at
+        assert cache._read("gguf", "org/New-GGUF")["value"] == ["model-Q4_K_M.gguf"]
+
+    def test_empty_mirror(self, cache, tmp_path):
+        assert cache.seed_from_mirror(tmp_path / "missing") == 0
+
+
+class TestCachedDiscovery:
+    @patch("huggingface_hub.HfApi")
+    @patch("huggingface_hub.list_repo_files")
+    def test_gguf_unchanged_sha_skips_listing(self, mock_list, mock_api, cache):
+        mock_list.return_value = ["Model-Q4_K_M.gguf", "README.md"]
+        mock_api.return_value.model_info.return_value.sha = "abc"
+
+        first = discover_gguf_quants("org/repo", cache=cache)
+        _age(cache, "gguf", "org/repo", 120)
+        second = discover_gguf_quants("org/repo", cache=cache)
+
+        assert [q.quant_name for q in first] == ["Q4_K_M"]
+        assert second == first
+        mock_list.assert_called_once()
+
+    def test_ollama_offline_from_cache(self, tmp_path):
+        cache = DiscoveryCache(cache_dir=tmp_path, offline=True)
+        cache.put("ollama", "llama3.1", ["8b", "8b-instruct-q4_0", "70b"])
+
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            tags = discover_ollama_tags("llama3.1:8b", cache=cache)
+
+        assert tags == ["llama3.1:8b", "llama3.1:8b-instruct-q4_0"]
+        mock_urlopen.assert_not_called()
+
+    def test_ollama_offline_cache_miss_falls_back(self, tmp_path):
+        cache = DiscoveryCache(cache_dir=tmp_path, offline=True)
+        assert discover_ollama_tags("llama3.1:8b", cache=cache) == ["llama3.1:8b"]
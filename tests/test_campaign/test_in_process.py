@@ -0,0 +1,149 @@
+"""Tests for in-process campaign execution."""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
+from kitt.campaign.in_process import InProcessExecutor
+from kitt.config.models import SuiteConfig
+from kitt.engines.base import GenerationMetrics, GenerationResult
+from kitt.hardware.fingerprint import SystemInfo
+from kitt.runners.suite import SuiteRunner
+
+
+class EchoBenchmark(LLMBenchmark):
+    name = "echo"
+    version = "1.0.0"
+    category = "performance"
+
+    def _execute(self, engine, config):
+        engine.generate(prompt="hi", max_tokens=4)
+        return BenchmarkResult(
+            test_name=self.name,
+            test_version=self.version,
+            passed=True,
+            metrics={"avg_tps": 10.0},
+            outputs=[{"output": "ok"}],
+        )
+
+
+def _engine_cls(available=True):
+    engine = MagicMock()
+    engine.generate.return_value = GenerationResult(
+        output="ok",
+        metrics=GenerationMetrics(
+            ttft_ms=1.0,
+            tps=10.0,
+            total_latency_ms=10.0,
+            gpu_memory_peak_gb=0.0,
+            gpu_memory_avg_gb=0.0,
+            timestamp=datetime.now(),
+        ),
+        prompt_tokens=2,
+        completion_tokens=4,
+    )
+    cls = MagicMock(return_value=engine)
+    cls.is_available.return_value = available
+    cls.validate_model.return_value = None
+    cls.diagnose.return_value.error = "Docker is not running"
+    return cls, engine
+
+
+@pytest.fixture
+def patched(tmp_path):
+    engine_cls, engine = _engine_cls()
+    system_info = MagicMock(spec=SystemInfo)
+    with (
+        patch("kitt.engines.registry.EngineRegistry.auto_discover") as eng_disc,
+        patch("kitt.benchmarks.registry.BenchmarkRegistry.auto_discover"),
+        patch(
+            "kitt.engines.registry.EngineRegistry.get_engine", return_value=engine_cls
+        ),
+        patch(
+            "kitt.benchmarks.registry.BenchmarkRegistry.get_benchmark",
+            return_value=EchoBenchmark,
+        ),
+        patch(
+            "kitt.hardware.fingerprint.HardwareFingerprint.detect_system",
+            return_value=system_info,
+        ) as detect,
+        patch("kitt.config.loader.find_suite_config", return_value=None) as find,
+        patch("kitt.runners.run_output.asdict", return_value={"gpu": "test"}),
+        patch("kitt.runners.run_output.save_json_report"),
+        patch("kitt.runners.run_output.generate_summary", return_value="# Summary"),
+    ):
+        yield {
+            "executor": InProcessExecutor(results_dir=tmp_path),
+            "engine_cls": engine_cls,
+            "engine": engine,
+            "discover": eng_disc,
+            "detect": detect,
+            "find_suite": find,
+        }
+
+
+class TestInProcessExecutor:
+    def test_runs_suite_and_writes_outputs(self, patched):
+        output_dir = patched["executor"].run(
+            "/models/llama.gguf", "llama_cpp", "quick", {"port": 8090}
+        )
+
+        engine = patched["engine"]
+        engine.initialize.assert_called_once_with("/models/llama.gguf", {"port": 8090})
+        engine.cleanup.assert_called_once()
+
+        config = json.loads((Path(output_dir) / "config.json").read_text())
+        assert config["engine_config"] == {"port": 8090}
+        assert Path(output_dir).parent.name == "llama_cpp"
+        assert (Path(output_dir) / "outputs").is_dir()
+
+    def test_setup_reused_across_runs(self, patched):
+        executor = patched["executor"]
+        executor.run("/models/a.gguf", "llama_cpp", "quick")
+        executor.run("/models/b.gguf", "llama_cpp", "quick")
+
+        assert patched["discover"].call_count == 1
+        assert patched["detect"].call_count == 1
+        assert patched["find_suite"].call_count == 1
+
+    def test_unavailable_engine(self, patched):
+        patched["engine_cls"].is_available.return_value = False
+        with pytest.raises(RuntimeError, match="Docker is not running"):
+            patched["executor"].run("/models/a.gguf", "llama_cpp", "quick")
+
+    def test_engine_cleaned_up_on_failure(self, patched):
+        with (
+            patch("kitt.runners.suite.SuiteRunner.run", side_effect=KeyError("x")),
+            pytest.raises(KeyError),
+        ):
+            patched["executor"].run("/models/a.gguf", "llama_cpp", "quick")
+        patched["engine"].cleanup.assert_called_once()
+
+    def test_suite_config_passed_to_runner(self, patched, tmp_path):
+        suite_cfg = SuiteConfig.model_validate(
+            {
+                "suite_name": "perf",
+                "tests": ["echo"],
+                "global_config": {"runs": 2},
+                "test_overrides": {"echo": {"runs": 1}},
+            }
+        )
+        with (
+            patch(
+                "kitt.config.loader.find_suite_config",
+                return_value=tmp_path / "perf.yaml",
+            ),
+            patch("kitt.config.loader.load_suite_config", return_value=suite_cfg),
+            patch.object(
+                SuiteRunner, "run", autospec=True, side_effect=SuiteRunner.run
+            ) as mock_run,
+        ):
+            patched["executor"].run("/models/a.gguf", "llama_cpp", "perf")
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["global_config"] == {"runs": 2}
+        assert kwargs["test_overrides"] == {"echo": {"runs": 1}}
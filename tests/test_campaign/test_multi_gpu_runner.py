@@ -0,0 +1,173 @@
+"""Tests for multi-GPU campaign runner."""
+
+import threading
+import time
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kitt.campaign.models import (
+    CampaignConfig,
+    CampaignEngineSpec,
+    CampaignModelSpec,
+    MultiGPUConfig,
+)
+from kitt.campaign.multi_gpu_runner import (
+    GPUSlot,
+    MultiGPUCampaignRunner,
+    partition_gpus,
+)
+from kitt.campaign.result import CampaignRunResult
+from kitt.campaign.runner import CampaignRunner
+from kitt.campaign.state_manager import CampaignState, CampaignStateManager
+
+
+def _make_config(num_models=4, **multi_gpu):
+    return CampaignConfig(
+        campaign_name="multi-gpu-test",
+        models=[
+            CampaignModelSpec(name=f"model-{i}", safetensors_repo=f"org/model-{i}")
+            for i in range(num_models)
+        ],
+        engines=[CampaignEngineSpec(name="vllm")],
+        suite="quick",
+        multi_gpu=MultiGPUConfig(enabled=True, **multi_gpu),
+    )
+
+
+@pytest.fixture
+def mock_state_manager():
+    sm = MagicMock(spec=CampaignStateManager)
+    sm.load.return_value = None
+    sm.create.return_value = CampaignState(
+        campaign_id="test-multi-gpu",
+        campaign_name="multi-gpu-test",
+        status="running",
+        started_at=datetime.now().isoformat(),
+        runs=[],
+    )
+    sm.is_run_done.return_value = False
+    return sm
+
+
+class TestPartitionGPUs:
+    def test_one_gpu_per_slot(self):
+        slots = partition_gpus([3, 1, 0, 2])
+        assert [s.devices for s in slots] == [(0,), (1,), (2,), (3,)]
+        assert [s.port_offset for s in slots] == [0, 10, 20, 30]
+
+    def test_pairs_leave_remainder_idle(self):
+        slots = partition_gpus([0, 1, 2, 3, 4], gpus_per_instance=2, port_stride=5)
+        assert [s.devices for s in slots] == [(0, 1), (2, 3)]
+        assert slots[1].port_offset == 5
+
+    def test_too_few_gpus(self):
+        with pytest.raises(ValueError, match="at least 2"):
+            partition_gpus([0], gpus_per_instance=2)
+
+
+class TestGPUSlot:
+    def test_args(self):
+        slot = GPUSlot(index=1, devices=(2, 3), port_offset=10)
+        assert slot.devices_arg == "2,3"
+        assert slot.container_prefix == "kitt-gpu2-3"
+        assert slot.port_for("vllm") == 8010
+
+    def test_run_benchmark_pins_slot(self):
+        runner = CampaignRunner(_make_config(), state_manager=MagicMock())
+        runner.executor = MagicMock()
+        slot = GPUSlot(index=1, devices=(1,), port_offset=10)
+
+        runner._run_benchmark(
+            "/models/m", "vllm", "quick", slot=slot, engine_config={"tp": 1}
+        )
+
+        engine_config = runner.executor.run.call_args[0][3]
+        assert engine_config == {
+            "tp": 1,
+            "gpu_devices": [1],
+            "name_prefix": "kitt-gpu1",
+            "port": 8010,
+        }
+
+    @patch("kitt.campaign.runner._run_subprocess_with_heartbeat")
+    def test_subprocess_run_pins_slot(self, mock_run):
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        config = _make_config().model_copy(update={"subprocess_isolation": True})
+        runner = CampaignRunner(config, state_manager=MagicMock())
+        slot = GPUSlot(index=1, devices=(1,), port_offset=10)
+
+        runner._run_benchmark("/models/m", "vllm", "quick", slot=slot)
+
+        args = mock_run.call_args[0][0]
+        assert args[args.index("--gpus") + 1] == "1"
+        assert args[args.index("--port") + 1] == "8010"
+
+    @patch("kitt.campaign.runner.subprocess.run")
+    def test_cleanup_scoped_to_slot(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="")
+        runner = CampaignRunner(_make_config(), state_manager=MagicMock())
+        runner._cleanup_docker("kitt-gpu1-")
+
+        assert "name=kitt-gpu1-" in mock_run.call_args[0][0]
+
+
+class TestMultiGPUCampaignRunner:
+    def test_slots_from_config(self, mock_state_manager):
+        runner = MultiGPUCampaignRunner(
+            _make_config(devices=[0, 1, 2, 3], gpus_per_instance=2),
+            state_manager=mock_state_manager,
+        )
+        assert [s.devices for s in runner.slots] == [(0, 1), (2, 3)]
+
+    def test_runs_concurrently_on_disjoint_slots(self, mock_state_manager):
+        runner = MultiGPUCampaignRunner(
+            _make_config(num_models=6),
+            state_manager=mock_state_manager,
+            devices=[0, 1, 2],
+        )
+
+        lock = threading.Lock()
+        active: set[tuple[int, ...]] = set()
+        seen_slots = set()
+        max_concurrent = 0
+
+        def fake_execute(run_spec, state, slot=None):
+            nonlocal max_concurrent
+            with lock:
+                assert slot.devices not in active, "slot used twice at once"
+                active.add(slot.devices)
+                seen_slots.add(slot.devices)
+                max_concurrent = max(max_concurrent, len(active))
+            time.sleep(0.05)
+            with lock:
+                active.discard(slot.devices)
+            return CampaignRunResult(
+                model_name=run_spec.model_name,
+                engine_name=run_spec.engine_name,
+                quant=run_spec.quant,
+                status="success",
+            )
+
+        with patch.object(runner._runner, "_execute_run", side_effect=fake_execute):
+            result = runner.run(campaign_id="test-multi-gpu")
+
+        assert result.total == 6
+        assert result.succeeded == 6
+        assert max_concurrent == 3
+        assert seen_slots == {(0,), (1,), (2,)}
+
+    def test_crashed_run_recorded_as_failure(self, mock_state_manager):
+        runner = MultiGPUCampaignRunner(
+            _make_config(num_models=2),
+            state_manager=mock_state_manager,
+            devices=[0],
+        )
+        with patch.object(
+            runner._runner, "_execute_run", side_effect=RuntimeError("boom")
+        ):
+            result = runner.run(campaign_id="test-multi-gpu")
+
+        assert result.failed == 2
+        assert result.runs[0].error == "boom"
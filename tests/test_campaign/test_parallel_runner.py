@@ -9,10 +9,10 @@ from kitt.campaign.models import (
     CampaignConfig,
     CampaignEngineSpec,
     CampaignModelSpec,
-    CampaignRunSpec,
     DiskConfig,
 )
 from kitt.campaign.parallel_runner import ParallelCampaignRunner
+from kitt.campaign.result import CampaignRunResult
 from kitt.campaign.state_manager import CampaignState, CampaignStateManager, RunState
 
 
@@ -32,6 +32,7 @@ def _make_config(models=None, engines=None):
         ],
         suite="quick",
         disk=DiskConfig(reserve_gb=5),
+        skip_gated=False,
     )
 
 
@@ -115,8 +116,6 @@ class TestParallelCampaignRunner:
 
         # Make all downloads fail but catch it in execute
         with patch.object(runner._runner, "_execute_run") as mock_exec:
-            from kitt.campaign.result import CampaignRunResult
-
             results = [
                 CampaignRunResult(
                     model_name="test-model",
@@ -162,27 +161,56 @@ class TestParallelCampaignRunner:
             )
             assert runner._check_disk_space() is False
 
-    def test_safe_download_catches_errors(self, mock_state_manager):
+    def test_prefetched_path_passed_to_run(self, mock_state_manager):
         config = _make_config()
         runner = ParallelCampaignRunner(
             config=config,
             state_manager=mock_state_manager,
         )
 
-        run_spec = CampaignRunSpec(
-            model_name="test",
-            engine_name="llama_cpp",
-            quant="Q4_K_M",
-            suite="quick",
+        with (
+            patch("kitt.campaign.runner.discover_gguf_quants") as mock_discover,
+            patch("kitt.campaign.runner.filter_quants") as mock_filter,
+            patch.object(
+                runner._runner, "_download_model", return_value="/models/q4"
+            ) as mock_download,
+            patch.object(runner._runner, "_execute_run") as mock_exec,
+        ):
+            quants = [MagicMock(quant_name="Q4_K_M", include_pattern="*Q4_K_M*")]
+            mock_discover.return_value = quants
+            mock_filter.return_value = quants
+            mock_exec.return_value = CampaignRunResult(
+                model_name="test-model",
+                engine_name="llama_cpp",
+                quant="Q4_K_M",
+                status="success",
+            )
+            runner.run(campaign_id="test-prefetch")
+
+        mock_download.assert_called_once()
+        assert mock_exec.call_args.kwargs["model_path"] == "/models/q4"
+
+    def test_skipped_run_not_downloaded(self, mock_state_manager):
+        config = _make_config()
+        runner = ParallelCampaignRunner(
+            config=config,
+            state_manager=mock_state_manager,
         )
 
-        with patch.object(
-            runner._runner,
-            "_download_model",
-            side_effect=RuntimeError("download failed"),
+        with (
+            patch("kitt.campaign.runner.discover_gguf_quants") as mock_discover,
+            patch("kitt.campaign.runner.filter_quants") as mock_filter,
+            patch.object(runner._runner, "_is_gated", return_value=True),
+            patch.object(runner._runner, "_download_model") as mock_download,
         ):
-            result = runner._safe_download(run_spec)
-            assert result is None
+            quants = [MagicMock(quant_name="Q4_K_M", include_pattern="*Q4_K_M*")]
+            mock_discover.return_value = quants
+            mock_filter.return_value = quants
+            result = runner.run(campaign_id="test-skip")
+
+        mock_download.assert_not_called()
+        assert result.skipped == 1
+        assert "gated" in result.runs[0].error
 
     def test_thread_safe_state_update(self, mock_state_manager):
         """Verify state lock is used during finalization."""
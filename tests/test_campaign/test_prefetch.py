@@ -0,0 +1,145 @@
+"""Tests for the download prefetch pipeline."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kitt.campaign.models import (
+    CampaignConfig,
+    CampaignRunSpec,
+    DiskConfig,
+    ResourceLimitsConfig,
+)
+from kitt.campaign.prefetch import PrefetchPipeline
+from kitt.campaign.runner import CampaignRunner
+
+GB = 1024**3
+
+
+def _run(quant, size_gb=10.0, repo="org/model-GGUF"):
+    return CampaignRunSpec(
+        model_name="model",
+        engine_name="llama_cpp",
+        quant=quant,
+        repo_id=repo,
+        include_pattern=f"*{quant}*",
+        estimated_size_gb=size_gb,
+    )
+
+
+@pytest.fixture
+def runner():
+    config = CampaignConfig(
+        campaign_name="prefetch-test",
+        disk=DiskConfig(reserve_gb=20),
+        resource_limits=ResourceLimitsConfig(max_model_size_gb=100),
+        skip_gated=False,
+    )
+    return CampaignRunner(config, state_manager=MagicMock())
+
+
+@pytest.fixture
+def free_disk():
+    with patch("kitt.campaign.prefetch.shutil.disk_usage") as mock_disk:
+        mock_disk.return_value = MagicMock(free=100 * GB)
+        yield mock_disk
+
+
+class TestPrefetchPipeline:
+    def test_prefetches_up_to_depth(self, runner, free_disk):
+        runs = [_run("Q2_K"), _run("Q4_K_M"), _run("Q8_0")]
+        with patch.object(runner, "_download_model", side_effect=lambda r: r.quant):
+            pipeline = PrefetchPipeline(runner, depth=2, max_workers=2)
+            pipeline.reschedule(runs)
+            assert pipeline.stats.started == 2
+
+            assert pipeline.take(runs[0]) == "Q2_K"
+            assert pipeline.take(runs[1]) == "Q4_K_M"
+            pipeline.close()
+
+    def test_admission_respects_reserve(self, runner, free_disk):
+        # 100GB free, 20GB reserve: 50GB fits, another 40GB in flight does not
+        release = threading.Event()
+
+        def slow_download(run):
+            release.wait(5)
+            return run.quant
+
+        runs = [_run("Q8_0", 50), _run("F16", 40)]
+        with patch.object(runner, "_download_model", side_effect=slow_download):
+            pipeline = PrefetchPipeline(runner, depth=2, max_workers=2)
+            pipeline.reschedule(runs)
+            assert pipeline.stats.started == 1
+            assert pipeline.stats.deferred == 1
+
+            # Deferral is counted once per file, not per reschedule
+            pipeline.reschedule(runs)
+            assert pipeline.stats.deferred == 1
+
+            release.set()
+            assert pipeline.take(runs[0]) == "Q8_0"
+            pipeline.close()
+
+    def test_plan_change_cancels_prefetch(self, runner, free_disk):
+        release = threading.Event()
+
+        def slow_download(run):
+            release.wait(5)
+            return run.quant
+
+        a, b, c = _run("Q2_K"), _run("Q4_K_M"), _run("Q8_0")
+        with patch.object(runner, "_download_model", side_effect=slow_download):
+            pipeline = PrefetchPipeline(runner, depth=1, max_workers=1)
+            pipeline.reschedule([a])
+            assert runner._repo_active["org/model-GGUF"] == 1
+
+            pipeline.reschedule([b, c])
+            assert pipeline.stats.cancelled == 1
+            assert pipeline.stats.started == 2
+
+            release.set()
+            assert pipeline.take(b) == "Q4_K_M"
+            pipeline.close()
+
+        # Holds from cancelled and consumed prefetches are all released
+        assert runner._repo_active["org/model-GGUF"] == 0
+
+    def test_take_without_prefetch_counts_idle(self, runner, free_disk):
+        with patch.object(runner, "_download_model", return_value="/models/m"):
+            pipeline = PrefetchPipeline(runner, depth=0)
+            assert pipeline.take(_run("Q4_K_M")) == "/models/m"
+            assert pipeline.stats.started == 0
+            assert pipeline.stats.gpu_idle_s >= 0.0
+            pipeline.close()
+
+    def test_failed_prefetch_returns_none(self, runner, free_disk):
+        run = _run("Q4_K_M")
+        with patch.object(
+            runner, "_download_model", side_effect=RuntimeError("download failed")
+        ):
+            pipeline = PrefetchPipeline(runner, depth=1)
+            pipeline.reschedule([run])
+            assert pipeline.take(run) is None
+            pipeline.close()
+
+    def test_oversized_runs_not_prefetched(self, runner, free_disk):
+        with patch.object(runner, "_download_model") as mock_download:
+            pipeline = PrefetchPipeline(runner, depth=1)
+            pipeline.reschedule([_run("F32", size_gb=500)])
+            pipeline.close()
+
+        assert pipeline.stats.started == 0
+        mock_download.assert_not_called()
+
+    def test_gated_runs_not_prefetched(self, runner, free_disk):
+        with (
+            patch.object(runner, "_is_gated", return_value=True),
+            patch.object(runner, "_download_model") as mock_download,
+        ):
+            pipeline = PrefetchPipeline(runner, depth=1)
+            pipeline.reschedule([_run("Q4_K_M")])
+            pipeline.close()
+
+        assert pipeline.stats.started == 0
+        mock_download.assert_not_called()
@@ -0,0 +1,146 @@
+"""Tests for resource-aware campaign planning."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from kitt.campaign.models import CampaignRunSpec
+from kitt.campaign.resource_planner import (
+    ResourceEstimator,
+    ScheduleSlot,
+    model_file_key,
+    pack_runs,
+)
+
+
+def _run(model="llama-8b", engine="llama_cpp", quant="Q4_K_M", size=5.0, **kwargs):
+    return CampaignRunSpec(
+        model_name=model,
+        engine_name=engine,
+        quant=quant,
+        repo_id=kwargs.pop("repo_id", f"org/{model}-GGUF"),
+        include_pattern=kwargs.pop("include_pattern", f"*{quant}*"),
+        estimated_size_gb=size,
+        suite="quick",
+        **kwargs,
+    )
+
+
+def _record(model, engine="llama_cpp", seconds=600.0, peak=6.0, suite="quick"):
+    return {
+        "model": model,
+        "engine": engine,
+        "suite_name": suite,
+        "total_time_seconds": seconds,
+        "results": [
+            {"metrics": {"avg_tps": 40.0}},
+            {"metrics": {"overall_peak_gpu_memory_gb": peak}},
+        ],
+    }
+
+
+class TestResourceEstimator:
+    def test_history_match(self):
+        estimator = ResourceEstimator(
+            [
+                _record("/models/llama-8b-GGUF/llama-8b-Q4_K_M.gguf", seconds=500),
+                _record("/models/llama-8b-GGUF/llama-8b-Q4_K_M.gguf", seconds=700),
+                _record("/models/llama-8b-GGUF/llama-8b-Q8_0.gguf", seconds=9000),
+            ]
+        )
+        est = estimator.estimate(_run())
+        assert est.source == "history"
+        assert est.duration_s == 600
+        assert est.vram_gb == 6.0
+
+    def test_fallback_to_size_model(self):
+        estimator = ResourceEstimator(
+            [_record("/models/other.gguf", seconds=1200)], default_duration_s=900
+        )
+        est = estimator.estimate(_run(size=10.0))
+        assert est.source == "model"
+        assert est.vram_gb == pytest.approx(12.0)
+        # Engine median from history beats the default
+        assert est.duration_s == 1200
+
+    def test_no_history_uses_default_duration(self):
+        est = ResourceEstimator(default_duration_s=900).estimate(_run(engine="vllm"))
+        assert est.duration_s == 900
+
+    def test_from_store_tolerates_errors(self):
+        store = MagicMock()
+        store.query.side_effect = OSError("unreadable")
+        assert ResourceEstimator.from_store(store).history == []
+
+    def test_from_store_queries_only_planned_engines(self):
+        store = MagicMock()
+        store.query.side_effect = lambda filters: [_record("llama-8b-Q4_K_M")]
+        runs = [_run(quant="Q4_K_M"), _run(quant="Q8_0"), _run(engine="vllm")]
+
+        estimator = ResourceEstimator.from_store(store, runs)
+
+        assert [c.kwargs["filters"] for c in store.query.call_args_list] == [
+            {"engine": "llama_cpp", "suite_name": "quick"},
+            {"engine": "vllm", "suite_name": "quick"},
+        ]
+        assert len(estimator.history) == 2
+
+
+class TestPackRuns:
+    def test_groups_shared_model_files(self):
+        runs = [
+            _run(engine="llama_cpp", quant="Q4_K_M"),
+            _run(engine="llama_cpp", quant="Q8_0"),
+            _run(engine="exllamav2", quant="Q4_K_M"),
+        ]
+        plan = pack_runs(
+            runs, [ScheduleSlot("a"), ScheduleSlot("b")], ResourceEstimator()
+        )
+
+        # Both Q4_K_M runs land on one slot back to back
+        for queue in plan.assignments.values():
+            keys = [model_file_key(s.run) for s in queue]
+            if model_file_key(runs[0]) in keys:
+                assert keys.count(model_file_key(runs[0])) == 2
+        assert plan.downloads == 2
+
+    def test_lpt_balances_makespan(self):
+        estimator = ResourceEstimator(default_duration_s=100)
+        runs = [_run(model=f"m{i}", quant="bf16") for i in range(4)]
+        plan = pack_runs(runs, [ScheduleSlot("a"), ScheduleSlot("b")], estimator)
+
+        assert plan.makespan_s == 200
+        assert all(len(q) == 2 for q in plan.assignments.values())
+
+    def test_respects_vram(self):
+        runs = [_run(model="big", size=60.0), _run(model="small", size=4.0)]
+        slots = [ScheduleSlot("small-gpu", 24.0), ScheduleSlot("big-gpu", 80.0)]
+        plan = pack_runs(runs, slots, ResourceEstimator())
+
+        big = [s.run.model_name for s in plan.assignments["big-gpu"]]
+        assert "big" in big
+        assert plan.oversized == []
+
+    def test_oversized_goes_to_largest_slot(self):
+        runs = [_run(model="huge", size=200.0)]
+        slots = [ScheduleSlot("a", 24.0), ScheduleSlot("b", 48.0)]
+        plan = pack_runs(runs, slots, ResourceEstimator())
+
+        assert [s.run.model_name for s in plan.assignments["b"]] == ["huge"]
+        assert plan.oversized == [runs[0].key]
+        assert "may not fit" in plan.summary()
+
+    def test_ordered_runs_sequential(self):
+        runs = [
+            _run(engine="llama_cpp", quant="Q4_K_M"),
+            _run(engine="llama_cpp", quant="Q8_0"),
+            _run(engine="exllamav2", quant="Q4_K_M"),
+        ]
+        plan = pack_runs(runs, [ScheduleSlot("local")], ResourceEstimator())
+        ordered = plan.ordered_runs()
+
+        assert len(ordered) == 3
+        # Shared Q4_K_M file runs back to back
+        keys = [model_file_key(r) for r in ordered]
+        first = keys.index(model_file_key(runs[0]))
+        assert keys[first + 1] == model_file_key(runs[0])
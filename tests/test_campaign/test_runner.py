@@ -133,6 +133,37 @@ class TestCampaignRunner:
         assert result.skipped == 1
         assert "disk space" in result.runs[0].error.lower()
 
+    @patch("shutil.disk_usage")
+    def test_shared_model_file_cleaned_after_last_run(self, mock_disk, state_mgr):
+        mock_disk.return_value = MagicMock(free=500 * 1024**3)
+        config = CampaignConfig(
+            campaign_name="shared-test",
+            models=[
+                CampaignModelSpec(name="M1", gguf_repo="test/m1-GGUF"),
+            ],
+            engines=[
+                CampaignEngineSpec(name="llama_cpp"),
+                CampaignEngineSpec(name="exllamav2"),
+            ],
+            disk=DiskConfig(reserve_gb=1.0),
+            devon_managed=False,
+            skip_gated=False,
+        )
+        runner = CampaignRunner(config, state_mgr, dry_run=False)
+        quant = MagicMock(quant_name="Q4_K_M", include_pattern="*Q4_K_M*")
+
+        with (
+            patch("kitt.campaign.runner.discover_gguf_quants", return_value=[quant]),
+            patch.object(runner, "_download_model", return_value="/models/m1.gguf"),
+            patch.object(runner, "_run_benchmark", return_value="kitt-results/x"),
+            patch.object(runner, "_cleanup_model") as mock_cleanup,
+        ):
+            result = runner.run(campaign_id="shared-test")
+
+        assert result.succeeded == 2
+        mock_cleanup.assert_called_once_with("test/m1-GGUF")
+        assert result.predicted_makespan_s > 0
+
 
 class TestExpandRuns:
     def test_expand_gguf_discovery(self, state_mgr):
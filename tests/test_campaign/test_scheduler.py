@@ -184,6 +184,31 @@ class TestCampaignScheduler:
         )
         assert sched.should_skip(run) is True
 
+    def test_estimator_reads_sqlite_store(self, scheduler, tmp_path):
+        from kitt.storage.sqlite_store import SQLiteStore
+
+        db_path = tmp_path / "kitt.db"
+        SQLiteStore(db_path=db_path).save_result(
+            {
+                "model": "Llama-8B",
+                "engine": "vllm",
+                "suite_name": "standard",
+                "timestamp": "2025-01-01T00:00:00",
+                "passed": True,
+                "total_time_seconds": 1234.0,
+                "results": [],
+            }
+        )
+        run = CampaignRunSpec(
+            model_name="Llama-8B", engine_name="vllm", quant="bf16", suite="standard"
+        )
+
+        with patch("kitt.storage.sqlite_store.DEFAULT_DB_PATH", db_path):
+            estimator = scheduler.estimator_for([run])
+
+        assert len(estimator.history) == 1
+        assert estimator.estimate(run).duration_s == 1234.0
+
 
 class TestParseParams:
     def test_simple(self):
@@ -88,8 +88,85 @@ class TestCampaignStateManager:
         assert state_mgr.is_run_done(state, "Llama-8B|vllm|bf16")
         assert not state_mgr.is_run_done(state, "Llama-8B|ollama|8b")
 
+    def test_update_run_appends_to_journal(self, state_mgr, tmp_path):
+        state = state_mgr.create("test-005", "Journal Test")
+        state.runs.append(RunState("M1", "vllm", "bf16", "pending"))
+        state_mgr.save(state)
+        snapshot = (tmp_path / "test-005.json").read_text()
+
+        state_mgr.update_run(state, "M1|vllm|bf16", status="running")
+        state_mgr.update_run(state, "M1|vllm|bf16", status="success", duration_s=9.0)
+
+        # Snapshot untouched; one journal line per transition
+        assert (tmp_path / "test-005.json").read_text() == snapshot
+        lines = (tmp_path / "test-005.journal").read_text().splitlines()
+        assert len(lines) == 2
+
+        loaded = state_mgr.load("test-005")
+        assert loaded.runs[0].status == "success"
+        assert loaded.runs[0].duration_s == 9.0
+        assert loaded.runs[0].started_at
+
+    def test_compaction(self, tmp_path):
+        mgr = CampaignStateManager(campaigns_dir=tmp_path, compact_every=3)
+        state = mgr.create("test-006", "Compaction")
+        state.runs = [RunState(f"M{i}", "vllm", "bf16", "pending") for i in range(3)]
+        mgr.save(state)
+
+        for i in range(3):
+            mgr.update_run(state, f"M{i}|vllm|bf16", status="success")
+
+        assert not (tmp_path / "test-006.journal").exists()
+        loaded = mgr.load("test-006")
+        assert loaded.succeeded == 3
+
+    def test_torn_journal_record_ignored(self, state_mgr, tmp_path):
+        state = state_mgr.create("test-007", "Torn")
+        state.runs.append(RunState("M1", "vllm", "bf16", "pending"))
+        state_mgr.save(state)
+        state_mgr.update_run(state, "M1|vllm|bf16", status="failed", error="oom")
+        with open(tmp_path / "test-007.journal", "a") as f:
+            f.write('{"model_name": "M1", "eng')
+
+        loaded = state_mgr.load("test-007")
+        assert loaded.runs[0].status == "failed"
+        assert loaded.runs[0].error == "oom"
+
+    def test_list_campaigns_includes_journal(self, state_mgr):
+        state = state_mgr.create("test-008", "Listed")
+        state.runs.append(RunState("M1", "vllm", "bf16", "pending"))
+        state_mgr.save(state)
+        state_mgr.update_run(state, "M1|vllm|bf16", status="success")
+
+        (summary,) = state_mgr.list_campaigns()
+        assert summary["succeeded"] == 1
+
+    def test_list_campaigns_is_read_only(self, state_mgr, tmp_path):
+        state = state_mgr.create("test-009", "Running")
+        state.runs.append(RunState("M1", "vllm", "bf16", "pending"))
+        state_mgr.save(state)
+        state_mgr.update_run(state, "M1|vllm|bf16", status="success")
+
+        # e.g. the web UI listing campaigns while another process runs one
+        viewer = CampaignStateManager(campaigns_dir=tmp_path)
+        viewer.list_campaigns()
+
+        assert viewer._journal_records == {}
+
 
 class TestCampaignState:
+    def test_get_run_tracks_list_changes(self):
+        state = CampaignState(campaign_id="t", campaign_name="t")
+        state.runs.append(RunState("M1", "e1", "q1", "pending"))
+        assert state.get_run("M1|e1|q1") is state.runs[0]
+
+        state.runs.append(RunState("M2", "e1", "q1", "pending"))
+        assert state.get_run("M2|e1|q1") is state.runs[1]
+
+        state.runs = [RunState("M3", "e1", "q1", "success")]
+        assert state.get_run("M1|e1|q1") is None
+        assert state.get_run("M3|e1|q1").status == "success"
+
     def test_completed_keys(self):
         state = CampaignState(campaign_id="t", campaign_name="t")
         state.runs = [
@@ -67,6 +67,24 @@ class TestGPUMemoryTracker:
         assert tracker.get_min_memory_mb() == 1000.0
         assert abs(tracker.get_average_memory_mb() - 1500.0) < 0.01
 
+    def test_tracker_sums_across_devices(self):
+        """Multi-GPU trackers report combined memory of all devices."""
+        tracker = GPUMemoryTracker(gpu_indices=[0, 1])
+        per_device = {
+            0: GPUMemoryStats(
+                used_mb=1000, free_mb=3000, total_mb=4000, utilization_percent=20
+            ),
+            1: GPUMemoryStats(
+                used_mb=3000, free_mb=1000, total_mb=4000, utilization_percent=60
+            ),
+        }
+        tracker.monitor.get_memory_stats = lambda i: per_device[i]
+
+        sample = tracker._sample()
+        assert sample.used_mb == 4000
+        assert sample.total_mb == 8000
+        assert sample.utilization_percent == 40
+
 
 class TestHardwareCompatibility:
     """Tests for various hardware scenarios including edge cases."""
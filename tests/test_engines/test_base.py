@@ -10,6 +10,7 @@ from kitt.engines.base import (
     GenerationMetrics,
     GenerationResult,
     InferenceEngine,
+    render_chat_prompt,
 )
 from kitt.engines.image_resolver import clear_cache
 
@@ -114,6 +115,45 @@ def _make_concrete_engine():
     return DummyEngine
 
 
+class TestGenerateChat:
+    def test_render_chat_prompt(self):
+        messages = [
+            {"role": "system", "content": "Be brief."},
+            {"role": "user", "content": [{"type": "text", "text": "Hi"}]},
+            {"role": "assistant", "content": "Hello"},
+            {"role": "user", "content": "Bye"},
+        ]
+        assert render_chat_prompt(messages) == (
+            "System: Be brief.\nUser: Hi\nAssistant: Hello\nUser: Bye\nAssistant:"
+        )
+
+    def test_image_parts_rejected(self):
+        messages = [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": "What is this?"},
+                    {"type": "image_url", "image_url": {"url": "http://x/img.png"}},
+                ],
+            }
+        ]
+        with pytest.raises(ValueError, match="image_url"):
+            render_chat_prompt(messages)
+        assert InferenceEngine.supports_image_input is False
+
+    def test_default_falls_back_to_generate(self):
+        DummyEngine = _make_concrete_engine()
+        engine = DummyEngine()
+        with patch.object(DummyEngine, "generate", return_value="result") as gen:
+            result = engine.generate_chat(
+                [{"role": "user", "content": "Hi"}], max_tokens=5
+            )
+
+        assert result == "result"
+        assert gen.call_args[0][0] == "User: Hi\nAssistant:"
+        assert gen.call_args[1]["max_tokens"] == 5
+
+
 class TestInferenceEngineABC:
     def test_cannot_instantiate_directly(self):
         """InferenceEngine cannot be instantiated directly."""
@@ -209,6 +209,22 @@ class TestRunContainer:
         cmd = mock_run.call_args[0][0]
         assert "--gpus" not in cmd
 
+    @patch("kitt.engines.docker_manager.time.time", return_value=1700000000)
+    @patch("kitt.engines.docker_manager.subprocess.run")
+    def test_run_pinned_gpus(self, mock_run, mock_time):
+        mock_run.return_value = MagicMock(returncode=0, stdout="pinned\n")
+        config = ContainerConfig(
+            image="vllm/vllm-openai:latest",
+            port=8010,
+            container_port=8000,
+            gpu_devices=[2, 3],
+            name_prefix="kitt-gpu2-3",
+        )
+        DockerManager.run_container(config)
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("--gpus") + 1] == '"device=2,3"'
+        assert cmd[cmd.index("--name") + 1] == "kitt-gpu2-3-1700000000-8010"
+
     @patch("kitt.engines.docker_manager.time.time", return_value=1700000000)
     @patch("kitt.engines.docker_manager.subprocess.run")
     def test_run_failure(self, mock_run, mock_time):
@@ -163,6 +163,26 @@ class TestLlamaCppEngineGenerate:
         assert mock_gen.call_args[1]["top_k"] == 40
         mock_parse.assert_called_once()
 
+    @patch("kitt.engines.openai_compat.parse_openai_result")
+    @patch("kitt.engines.openai_compat.openai_chat")
+    @patch("kitt.collectors.gpu_stats.GPUMemoryTracker")
+    def test_generate_chat_calls_chat_api(
+        self, mock_tracker_cls, mock_chat, mock_parse
+    ):
+        mock_tracker_cls.return_value.__enter__ = lambda s: MagicMock()
+        mock_tracker_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_chat.return_value = {"choices": [{"message": {"content": "hi"}}]}
+
+        engine = LlamaCppEngine()
+        engine._base_url = "http://localhost:8081"
+        engine._model_name = "/models/model.gguf"
+
+        engine.generate_chat([{"role": "user", "content": "Hello"}], top_k=40)
+
+        assert mock_chat.call_args[1]["model"] == "/models/model.gguf"
+        assert mock_chat.call_args[1]["top_k"] == 40
+        mock_parse.assert_called_once()
+
 
 class TestLlamaCppEngineCleanup:
     @patch("kitt.engines.docker_manager.DockerManager.stop_container")
@@ -100,6 +100,44 @@ class TestMLXEngineGenerate:
         assert result.prompt_tokens == 3
         assert result.completion_tokens == 4
 
+    @patch("kitt.engines.mlx_engine.mlx_lm", create=True)
+    @patch("kitt.engines.mlx_engine.MLX_AVAILABLE", True)
+    def test_generate_chat_uses_chat_template(self, mock_mlx):
+        mock_tokenizer = MagicMock()
+        mock_tokenizer.chat_template = "{{ messages }}"
+        mock_tokenizer.apply_chat_template.return_value = "<|user|>Hi<|assistant|>"
+        mock_tokenizer.encode.return_value = [1, 2]
+        mock_mlx.generate.return_value = "Hello"
+
+        engine = MLXEngine()
+        engine._model = MagicMock()
+        engine._tokenizer = mock_tokenizer
+        messages = [{"role": "user", "content": "Hi"}]
+
+        result = engine.generate_chat(messages)
+
+        mock_tokenizer.apply_chat_template.assert_called_once_with(
+            messages, tokenize=False, add_generation_prompt=True
+        )
+        assert mock_mlx.generate.call_args[1]["prompt"] == "<|user|>Hi<|assistant|>"
+        assert result.output == "Hello"
+
+    @patch("kitt.engines.mlx_engine.mlx_lm", create=True)
+    @patch("kitt.engines.mlx_engine.MLX_AVAILABLE", True)
+    def test_generate_chat_rejects_images(self, mock_mlx):
+        engine = MLXEngine()
+        engine._model = MagicMock()
+        engine._tokenizer = MagicMock(chat_template="{{ messages }}")
+        messages = [
+            {
+                "role": "user",
+                "content": [{"type": "image_url", "image_url": {"url": "x.png"}}],
+            },
+        ]
+        with pytest.raises(ValueError, match="image_url"):
+            engine.generate_chat(messages)
+        mock_mlx.generate.assert_not_called()
+
     def test_generate_not_initialized(self):
         engine = MLXEngine()
         with pytest.raises(RuntimeError, match="not initialized"):
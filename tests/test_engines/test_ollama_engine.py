@@ -137,6 +137,56 @@ class TestOllamaEngineGenerate:
         assert result.metrics.tps == 10 / 0.5  # 20 tps
         assert result.metrics.ttft_ms == 100.0
 
+    @patch("kitt.collectors.gpu_stats.GPUMemoryTracker")
+    @patch("kitt.engines.ollama_engine.urllib.request.urlopen")
+    def test_generate_chat_calls_chat_api(self, mock_urlopen, mock_tracker_cls):
+        mock_tracker = MagicMock()
+        mock_tracker.get_peak_memory_mb.return_value = 0.0
+        mock_tracker.get_average_memory_mb.return_value = 0.0
+        mock_tracker_cls.return_value.__enter__ = lambda s: mock_tracker
+        mock_tracker_cls.return_value.__exit__ = MagicMock(return_value=False)
+
+        response_data = {
+            "message": {"role": "assistant", "content": "Chat reply"},
+            "prompt_eval_count": 12,
+            "eval_count": 4,
+        }
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(response_data).encode()
+        mock_response.__enter__ = lambda s: s
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_response
+
+        engine = OllamaEngine()
+        engine._base_url = "http://localhost:11434"
+        engine._model_name = "llama3"
+        messages = [
+            {"role": "user", "content": [{"type": "text", "text": "Hi"}]},
+        ]
+        result = engine.generate_chat(messages)
+
+        req = mock_urlopen.call_args[0][0]
+        assert req.full_url == "http://localhost:11434/api/chat"
+        payload = json.loads(req.data)
+        assert payload["messages"] == [{"role": "user", "content": "Hi"}]
+        assert result.output == "Chat reply"
+        assert result.prompt_tokens == 12
+
+    @patch("kitt.engines.ollama_engine.urllib.request.urlopen")
+    def test_generate_chat_rejects_images(self, mock_urlopen):
+        engine = OllamaEngine()
+        engine._base_url = "http://localhost:11434"
+        engine._model_name = "llama3"
+        messages = [
+            {
+                "role": "user",
+                "content": [{"type": "image_url", "image_url": {"url": "x.png"}}],
+            },
+        ]
+        with pytest.raises(ValueError, match="image_url"):
+            engine.generate_chat(messages)
+        mock_urlopen.assert_not_called()
+
 
 class TestOllamaEngineCleanup:
     @patch("kitt.engines.docker_manager.DockerManager.stop_container")
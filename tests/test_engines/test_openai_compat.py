@@ -6,7 +6,12 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from kitt.engines.openai_compat import openai_generate, parse_openai_result
+from kitt.engines.openai_compat import (
+    openai_chat,
+    openai_chat_stream,
+    openai_generate,
+    parse_openai_result,
+)
 
 
 class TestOpenaiGenerate:
@@ -58,6 +63,55 @@ class TestOpenaiGenerate:
             openai_generate("http://localhost:8000", "test")
 
 
+class TestOpenaiChat:
+    @patch("kitt.engines.openai_compat.urllib.request.urlopen")
+    def test_posts_messages(self, mock_urlopen):
+        response_data = {"choices": [{"message": {"content": "Hi!"}}]}
+        mock_response = MagicMock()
+        mock_response.read.return_value = json.dumps(response_data).encode()
+        mock_response.__enter__ = lambda s: s
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_response
+        messages = [{"role": "user", "content": "hello"}]
+
+        result = openai_chat("http://localhost:8000", messages, model="llama")
+
+        assert result == response_data
+        req = mock_urlopen.call_args[0][0]
+        assert req.full_url == "http://localhost:8000/v1/chat/completions"
+        payload = json.loads(req.data)
+        assert payload["messages"] == messages
+        assert payload["model"] == "llama"
+
+
+class TestOpenaiChatStream:
+    @patch("kitt.engines.openai_compat.urllib.request.urlopen")
+    def test_yields_delta_content(self, mock_urlopen):
+        lines = [
+            b'data: {"choices": [{"delta": {"role": "assistant"}}]}\n',
+            b'data: {"choices": [{"delta": {"content": "Hi"}}]}\n',
+            b": keep-alive\n",
+            b'data: {"choices": [{"delta": {"content": " there"}}]}\n',
+            b"data: [DONE]\n",
+        ]
+        mock_response = MagicMock()
+        mock_response.__iter__ = lambda s: iter(lines)
+        mock_response.__enter__ = lambda s: s
+        mock_response.__exit__ = MagicMock(return_value=False)
+        mock_urlopen.return_value = mock_response
+        messages = [{"role": "user", "content": "hello"}]
+
+        chunks = list(openai_chat_stream("http://localhost:8000/", messages))
+
+        assert [c.token for c in chunks] == ["Hi", " there"]
+        assert chunks[0].timestamp_ms <= chunks[1].timestamp_ms
+        req = mock_urlopen.call_args[0][0]
+        assert req.full_url == "http://localhost:8000/v1/chat/completions"
+        payload = json.loads(req.data)
+        assert payload["messages"] == messages
+        assert payload["stream"] is True
+
+
 class TestParseOpenaiResult:
     def test_parse_success(self):
         response = {
@@ -78,6 +132,20 @@ class TestParseOpenaiResult:
         assert result.metrics.gpu_memory_peak_gb == 4.0
         assert result.metrics.gpu_memory_avg_gb == 3.0
 
+    def test_parse_chat_message(self):
+        tracker = MagicMock()
+        tracker.get_peak_memory_mb.return_value = 0.0
+        tracker.get_average_memory_mb.return_value = 0.0
+        response = {
+            "choices": [{"message": {"role": "assistant", "content": "Hi!"}}],
+            "usage": {"prompt_tokens": 7, "completion_tokens": 2},
+        }
+
+        result = parse_openai_result(response, 100.0, tracker)
+
+        assert result.output == "Hi!"
+        assert result.prompt_tokens == 7
+
     def test_parse_empty_choices(self):
         response = {"choices": [], "usage": {}}
         tracker = MagicMock()
@@ -245,6 +245,28 @@ class TestVLLMEngineGenerate:
         assert mock_gen.call_args[1]["temperature"] == 0.5
         mock_parse.assert_called_once()
 
+    @patch("kitt.engines.openai_compat.parse_openai_result")
+    @patch("kitt.engines.openai_compat.openai_chat")
+    @patch("kitt.collectors.gpu_stats.GPUMemoryTracker")
+    def test_generate_chat_calls_chat_api(
+        self, mock_tracker_cls, mock_chat, mock_parse
+    ):
+        mock_tracker_cls.return_value.__enter__ = lambda s: MagicMock()
+        mock_tracker_cls.return_value.__exit__ = MagicMock(return_value=False)
+        mock_chat.return_value = {"choices": [{"message": {"content": "hi"}}]}
+
+        engine = VLLMEngine()
+        engine._base_url = "http://localhost:8000"
+        engine._model_name = "llama-7b"
+        messages = [{"role": "user", "content": "Hello"}]
+
+        engine.generate_chat(messages, max_tokens=10)
+
+        assert mock_chat.call_args[0] == ("http://localhost:8000", messages)
+        assert mock_chat.call_args[1]["model"] == "llama-7b"
+        assert mock_chat.call_args[1]["max_tokens"] == 10
+        mock_parse.assert_called_once()
+
 
 class TestVLLMEngineCleanup:
     @patch("kitt.engines.docker_manager.DockerManager.stop_container")
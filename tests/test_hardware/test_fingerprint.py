@@ -73,3 +73,76 @@ class TestHardwareFingerprint:
         fp = HardwareFingerprint.generate()
         assert isinstance(fp, str)
         assert len(fp) > 0
+
+
+def _patch_probes(monkeypatch, calls, gpu=None):
+    from kitt.hardware import fingerprint
+
+    def probe(name, value):
+        def run(*args, **kwargs):
+            calls.append(name)
+            return value
+
+        return run
+
+    monkeypatch.setattr(fingerprint, "detect_gpu", probe("gpu", gpu))
+    monkeypatch.setattr(
+        fingerprint, "detect_cpu", probe("cpu", CPUInfo("Test CPU", 8, 16))
+    )
+    monkeypatch.setattr(fingerprint, "detect_ram_gb", probe("ram_gb", 32))
+    monkeypatch.setattr(fingerprint, "detect_ram_type", probe("ram_type", "DDR5"))
+    monkeypatch.setattr(
+        fingerprint,
+        "detect_storage",
+        probe("storage", StorageInfo("Samsung", "990 PRO", "nvme")),
+    )
+    monkeypatch.setattr(fingerprint, "detect_cuda_version", probe("cuda", "12.6"))
+    monkeypatch.setattr(fingerprint, "detect_driver_version", probe("driver", "560"))
+
+
+class TestDetectSystemCache:
+    def test_second_call_served_from_cache(self, monkeypatch, tmp_path):
+        calls = []
+        gpu = GPUInfo("NVIDIA RTX 5090", 32, 2, compute_capability=(12, 0))
+        _patch_probes(monkeypatch, calls, gpu=gpu)
+        path = tmp_path / "hardware.json"
+
+        first = HardwareFingerprint.detect_system(cache_path=path)
+        probed = len(calls)
+        second = HardwareFingerprint.detect_system(cache_path=path)
+
+        assert probed == 7
+        assert len(calls) == probed
+        assert second == first
+        assert second.gpu.compute_capability == (12, 0)
+
+    def test_host_change_invalidates(self, monkeypatch, tmp_path):
+        from kitt.hardware import cache
+
+        calls = []
+        _patch_probes(monkeypatch, calls)
+        path = tmp_path / "hardware.json"
+        HardwareFingerprint.detect_system(cache_path=path)
+
+        monkeypatch.setattr(cache, "_boot_id", lambda: "rebooted")
+        HardwareFingerprint.detect_system(cache_path=path)
+
+        assert len(calls) == 14
+
+    def test_timed_out_probe_falls_back_and_is_not_cached(self, monkeypatch, tmp_path):
+        import threading
+
+        from kitt.hardware import fingerprint
+
+        _patch_probes(monkeypatch, [])
+        release = threading.Event()
+        monkeypatch.setattr(fingerprint, "detect_ram_type", lambda: release.wait(5))
+        monkeypatch.setattr(fingerprint, "PROBE_TIMEOUT_S", 0.05)
+        path = tmp_path / "hardware.json"
+
+        info = HardwareFingerprint.detect_system(cache_path=path)
+        release.set()
+
+        assert info.ram_type == "Unknown"
+        assert info.ram_gb == 32
+        assert not path.exists()
@@ -1,18 +1,30 @@
 """Tests for model recommendation engine."""
 
+import random
 from unittest.mock import MagicMock
 
+import pytest
+
 from kitt.recommend.constraints import HardwareConstraints
-from kitt.recommend.engine import ModelRecommender
+from kitt.recommend.engine import ModelRecommender, pareto_front
+from kitt.storage.json_store import JsonStore
+from kitt.storage.sqlite_store import SQLiteStore
 
 
-def _make_result(model, engine, accuracy=0.8, avg_tps=50.0, peak_vram_gb=8.0):
-    """Helper to create a mock result dict."""
+def _make_result(
+    model,
+    engine,
+    accuracy=0.8,
+    avg_tps=50.0,
+    peak_vram_gb=8.0,
+    timestamp="2025-01-15T12:00:00Z",
+):
+    """Helper to create a result dict."""
     return {
         "model": model,
         "engine": engine,
         "passed": True,
-        "timestamp": "2025-01-15T12:00:00Z",
+        "timestamp": timestamp,
         "metrics": {
             "accuracy": accuracy,
             "avg_tps": avg_tps,
@@ -21,13 +33,29 @@ def _make_result(model, engine, accuracy=0.8, avg_tps=50.0, peak_vram_gb=8.0):
     }
 
 
+@pytest.fixture(params=["sqlite", "json"])
+def store(request, tmp_path):
+    if request.param == "sqlite":
+        s = SQLiteStore(db_path=tmp_path / "test.db")
+    else:
+        s = JsonStore(base_dir=tmp_path)
+    yield s
+    s.close()
+
+
+def _store_with(store, *results):
+    for r in results:
+        store.save_result(r)
+    return store
+
+
 class TestRecommend:
-    def test_returns_ranked_results(self):
-        store = MagicMock()
-        store.query.return_value = [
+    def test_returns_ranked_results(self, store):
+        _store_with(
+            store,
             _make_result("model-a", "vllm", accuracy=0.9, avg_tps=80),
             _make_result("model-b", "vllm", accuracy=0.7, avg_tps=40),
-        ]
+        )
         recommender = ModelRecommender(result_store=store)
         results = recommender.recommend()
 
@@ -35,23 +63,21 @@ class TestRecommend:
         # Higher score should come first
         assert results[0]["model"] == "model-a"
 
-    def test_with_empty_store(self):
-        store = MagicMock()
-        store.query.return_value = []
+    def test_with_empty_store(self, store):
         recommender = ModelRecommender(result_store=store)
         results = recommender.recommend()
         assert results == []
 
-    def test_filters_by_constraints(self):
-        store = MagicMock()
-        store.query.return_value = [
+    def test_filters_by_constraints(self, store):
+        _store_with(
+            store,
             _make_result(
                 "small-model", "vllm", accuracy=0.7, avg_tps=60, peak_vram_gb=4.0
             ),
             _make_result(
                 "large-model", "vllm", accuracy=0.9, avg_tps=30, peak_vram_gb=20.0
             ),
-        ]
+        )
         recommender = ModelRecommender(result_store=store)
         constraints = HardwareConstraints(max_vram_gb=10.0)
         results = recommender.recommend(constraints=constraints)
@@ -59,48 +85,51 @@ class TestRecommend:
         assert len(results) == 1
         assert results[0]["model"] == "small-model"
 
-    def test_limits_results(self):
-        store = MagicMock()
-        store.query.return_value = [
-            _make_result(f"model-{i}", "vllm") for i in range(20)
-        ]
+    def test_limits_results(self, store):
+        _store_with(store, *[_make_result(f"model-{i}", "vllm") for i in range(20)])
         recommender = ModelRecommender(result_store=store)
         results = recommender.recommend(limit=5)
         assert len(results) == 5
 
-    def test_sort_by_throughput(self):
-        store = MagicMock()
-        store.query.return_value = [
+    def test_sort_by_throughput(self, store):
+        _store_with(
+            store,
             _make_result("slow", "vllm", accuracy=0.95, avg_tps=10),
             _make_result("fast", "vllm", accuracy=0.7, avg_tps=100),
-        ]
+        )
         recommender = ModelRecommender(result_store=store)
         results = recommender.recommend(sort_by="throughput")
 
         assert results[0]["model"] == "fast"
 
-    def test_sort_by_accuracy(self):
-        store = MagicMock()
-        store.query.return_value = [
+    def test_sort_by_accuracy(self, store):
+        _store_with(
+            store,
             _make_result("low-acc", "vllm", accuracy=0.5, avg_tps=100),
             _make_result("high-acc", "vllm", accuracy=0.95, avg_tps=10),
-        ]
+        )
         recommender = ModelRecommender(result_store=store)
         results = recommender.recommend(sort_by="accuracy")
 
         assert results[0]["model"] == "high-acc"
 
-    def test_deduplicates_by_model_engine(self):
-        store = MagicMock()
-        store.query.return_value = [
-            _make_result("model-a", "vllm", accuracy=0.9, avg_tps=80),
+    def test_deduplicates_by_model_engine(self, store):
+        _store_with(
+            store,
             _make_result("model-a", "vllm", accuracy=0.85, avg_tps=75),
-        ]
+            _make_result(
+                "model-a",
+                "vllm",
+                accuracy=0.9,
+                avg_tps=80,
+                timestamp="2025-01-16T12:00:00Z",
+            ),
+        )
         recommender = ModelRecommender(result_store=store)
         results = recommender.recommend()
 
         assert len(results) == 1
-        # First result (latest) should be kept
+        # Latest result should be kept
         assert results[0]["accuracy"] == 0.9
 
 
@@ -133,13 +162,13 @@ class TestScoreResult:
 
 
 class TestParetoFrontier:
-    def test_returns_non_dominated_results(self):
-        store = MagicMock()
-        store.query.return_value = [
+    def test_returns_non_dominated_results(self, store):
+        _store_with(
+            store,
             _make_result("pareto-1", "vllm", accuracy=0.9, avg_tps=30),
             _make_result("pareto-2", "vllm", accuracy=0.7, avg_tps=90),
             _make_result("dominated", "vllm", accuracy=0.6, avg_tps=20),
-        ]
+        )
         recommender = ModelRecommender(result_store=store)
         frontier = recommender.pareto_frontier()
 
@@ -148,9 +177,117 @@ class TestParetoFrontier:
         assert "pareto-2" in names
         assert "dominated" not in names
 
-    def test_empty_store_returns_empty(self):
-        store = MagicMock()
-        store.query.return_value = []
+    def test_empty_store_returns_empty(self, store):
         recommender = ModelRecommender(result_store=store)
         frontier = recommender.pareto_frontier()
         assert frontier == []
+
+    def test_include_memory(self, store):
+        _store_with(
+            store,
+            _make_result("big", "vllm", accuracy=0.9, avg_tps=50, peak_vram_gb=40),
+            _make_result("small", "vllm", accuracy=0.9, avg_tps=50, peak_vram_gb=8),
+        )
+        recommender = ModelRecommender(result_store=store)
+
+        assert len(recommender.pareto_frontier()) == 2
+        frontier = recommender.pareto_frontier(include_memory=True)
+        assert [r["model"] for r in frontier] == ["small"]
+
+
+class TestRecommendationIndex:
+    def test_summarizes_benchmark_metrics(self, store):
+        store.save_result(
+            {
+                "model": "m",
+                "engine": "vllm",
+                "quant": "Q4_K_M",
+                "timestamp": "2025-01-01T00:00:00",
+                "results": [
+                    {"test_name": "t", "metrics": {"avg_tps": 40, "accuracy": 0.5}},
+                    {"test_name": "t", "metrics": {"avg_tps": 60, "peak_vram_gb": 9}},
+                ],
+                "system_info": {"gpu": {"model": "A100", "count": 2}},
+            }
+        )
+        (row,) = store.recommendation_candidates()
+
+        assert row["quant"] == "Q4_K_M"
+        assert row["hardware_class"] == "2x A100"
+        assert row["metrics"]["avg_tps"] == 50.0
+        assert row["metrics"]["accuracy"] == 0.5
+        assert row["metrics"]["peak_vram_gb"] == 9.0
+        assert row["metrics"]["avg_latency_ms"] is None
+
+    def test_constraints_apply_to_latest_run(self, store):
+        _store_with(
+            store,
+            _make_result("m", "vllm", avg_tps=100, timestamp="2025-01-01"),
+            _make_result("m", "vllm", avg_tps=10, timestamp="2025-01-02"),
+        )
+        constraints = HardwareConstraints(min_throughput_tps=50)
+        assert store.recommendation_candidates(constraints.conditions()) == []
+
+    def test_missing_metrics_follow_constraint_defaults(self, store):
+        result = _make_result("m", "vllm")
+        del result["metrics"]["peak_vram_gb"]
+        store.save_result(result)
+
+        def count(**kwargs):
+            conditions = HardwareConstraints(**kwargs).conditions()
+            return len(store.recommendation_candidates(conditions))
+
+        assert count(max_vram_gb=1) == 1
+        assert count(max_latency_ms=1000) == 0
+        assert count(engine="vllm") == 1
+        assert count(engine="tgi") == 0
+
+    def test_delete_falls_back_to_previous_run(self, tmp_path):
+        store = SQLiteStore(db_path=tmp_path / "test.db")
+        store.save_result(_make_result("m", "vllm", avg_tps=10, timestamp="2025-01-01"))
+        newest = store.save_result(
+            _make_result("m", "vllm", avg_tps=20, timestamp="2025-01-02")
+        )
+        store.delete_result(newest)
+
+        (row,) = store.recommendation_candidates()
+        assert row["metrics"]["avg_tps"] == 10.0
+        store.close()
+
+    def test_existing_runs_backfilled(self, tmp_path):
+        store = SQLiteStore(db_path=tmp_path / "test.db")
+        store.save_result(_make_result("m", "vllm"))
+        conn = store._get_conn()
+        conn.execute("DELETE FROM run_summaries")
+        conn.execute("DELETE FROM schema_version WHERE version = 14")
+        conn.commit()
+        store.close()
+
+        store = SQLiteStore(db_path=tmp_path / "test.db")
+        assert len(store.recommendation_candidates()) == 1
+        store.close()
+
+
+class TestParetoFront:
+    def test_matches_pairwise_scan(self):
+        rng = random.Random(0)
+        items = [
+            {"a": rng.randint(0, 20), "b": rng.randint(0, 20), "c": rng.randint(0, 5)}
+            for _ in range(300)
+        ]
+
+        def dominated(p, keys):
+            return any(
+                all(q[k] >= p[k] for k in keys) and any(q[k] > p[k] for k in keys)
+                for q in items
+            )
+
+        for keys in (("a", "b"), ("a", "b", "c")):
+            front = pareto_front(items, lambda i, keys=keys: tuple(i[k] for k in keys))
+            expected = [i for i in items if not dominated(i, keys)]
+            assert sorted(map(id, front)) == sorted(map(id, expected))
+
+    def test_identical_points_kept(self):
+        items = [{"a": 1, "b": 1}, {"a": 1, "b": 1}, {"a": 0, "b": 0}]
+        front = pareto_front(items, lambda i: (i["a"], i["b"]))
+        assert len(front) == 2
@@ -0,0 +1,205 @@
+"""Tests for the columnar analytics layer."""
+
+import random
+import statistics
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kitt.reporters import analytics
+from kitt.reporters.analytics import MetricTable
+from kitt.reporters.campaign_comparison import compare_campaigns
+from kitt.reporters.quant_curves import QuantCurveGenerator
+from kitt.storage.base import ResultStore
+
+
+def _result(model, engine="vllm", quant="", passed=True, **metrics):
+    return {
+        "model": model,
+        "engine": engine,
+        "quant": quant,
+        "passed": passed,
+        "total_time_seconds": 10.0,
+        "results": [{"test_name": "throughput", "metrics": metrics}],
+    }
+
+
+def _mock_store():
+    """MagicMock store whose metric_rows() walks query() like the base class."""
+    store = MagicMock()
+    store.metric_rows.side_effect = lambda **kw: ResultStore.metric_rows(store, **kw)
+    return store
+
+
+class TestMetricTable:
+    def test_flattens_benchmarks_and_nested_metrics(self):
+        result = _result("m", avg_tps=50, ttft_ms={"avg": 12.0, "p99": 30.0})
+        result["metrics"] = {"accuracy": 0.9}
+        table = MetricTable.from_results([result])
+
+        assert len(table) == 4
+        assert table.run_count == 1
+        assert set(table.column("metric")) == {
+            "avg_tps",
+            "ttft_ms.avg",
+            "ttft_ms.p99",
+            "accuracy",
+        }
+        assert table.column("benchmark")[table.column("metric").index("accuracy")] == ""
+
+    def test_group_stats_match_statistics_module(self):
+        rng = random.Random(0)
+        values = {m: [rng.uniform(10, 100) for _ in range(25)] for m in ("a", "b")}
+        results = [
+            _result(model, avg_tps=v) for model, vs in values.items() for v in vs
+        ]
+        stats = MetricTable.from_results(results).group_stats(("model", "metric"))
+
+        assert [s["model"] for s in stats] == ["a", "b"]
+        for s in stats:
+            expected = values[s["model"]]
+            assert s["count"] == 25
+            assert s["mean"] == pytest.approx(statistics.mean(expected))
+            assert s["median"] == pytest.approx(statistics.median(expected))
+            assert s["std"] == pytest.approx(statistics.stdev(expected))
+            assert s["min"] == min(expected)
+            assert s["max"] == max(expected)
+            assert s["p95"] == pytest.approx(
+                statistics.quantiles(expected, n=20, method="inclusive")[-1]
+            )
+
+    def test_pure_python_path_matches(self):
+        rng = random.Random(1)
+        results = [
+            _result(f"m{i % 3}", avg_tps=rng.random(), accuracy=rng.random())
+            for i in range(40)
+        ]
+        table = MetricTable.from_results(results)
+        by = ("model", "metric")
+        with patch.object(analytics, "NUMPY_AVAILABLE", False):
+            expected = table.group_stats(by, percentiles=(50, 90, 99.9))
+
+        pytest.importorskip("numpy")
+        for got, want in zip(
+            table.group_stats(by, percentiles=(50, 90, 99.9)), expected, strict=True
+        ):
+            assert got.keys() == want.keys()
+            for key, value in want.items():
+                assert got[key] == pytest.approx(value)
+
+    def test_single_value_group(self):
+        (stats,) = MetricTable.from_results([_result("m", avg_tps=5)]).group_stats(
+            ("metric",)
+        )
+        assert stats["std"] == 0.0
+        assert stats["p99"] == 5.0
+
+    def test_metric_filter_and_unknown_column(self):
+        table = MetricTable.from_results([_result("m", avg_tps=5, accuracy=0.5)])
+        assert [s["metric"] for s in table.group_stats(("metric",), ["accuracy"])] == [
+            "accuracy"
+        ]
+        assert table.group_stats(("metric",), ["missing"]) == []
+        with pytest.raises(ValueError):
+            table.group_stats(("passed",))
+
+    def test_run_totals(self):
+        table = MetricTable.from_results(
+            [_result("m"), _result("m", passed=False), _result("n")]
+        )
+        totals = table.run_totals()
+        assert [(t["model"], t["passed"], t["failed"]) for t in totals] == [
+            ("m", 1, 1),
+            ("n", 1, 0),
+        ]
+        assert totals[0]["total_time_s"] == 20.0
+
+    def test_run_values_prefer_top_level_metrics(self):
+        top = _result("m", accuracy=0.1)
+        top["metrics"] = {"accuracy": 0.9}
+        averaged = _result("m", accuracy=0.2)
+        averaged["results"].append({"test_name": "mmlu", "metrics": {"accuracy": 0.4}})
+        table = MetricTable.from_results([top, averaged, _result("m", avg_tps=5)])
+
+        values = table.run_values(["accuracy", "missing"])
+        assert values["accuracy"] == pytest.approx([0.9, 0.3, None])
+        assert values["missing"] == [None, None, None]
+
+    def test_run_stats_count_each_run_once(self):
+        rng = random.Random(2)
+        results = []
+        for i in range(30):
+            result = _result(f"m{i % 3}", quant=f"Q{i % 2}", accuracy=rng.random())
+            result["results"].append(
+                {"test_name": "mmlu", "metrics": {"accuracy": rng.random()}}
+            )
+            if i % 4 == 0:
+                result["metrics"] = {"accuracy": rng.random()}
+            results.append(result)
+        results.append(_result("m0", quant="Q0"))
+        table = MetricTable.from_results(results)
+        by = ("model", "quant")
+        with patch.object(analytics, "NUMPY_AVAILABLE", False):
+            expected = table.run_stats(by, ["accuracy", "missing"])
+            values = table.run_values(["accuracy"])
+
+        assert sum(g["runs"] for g in expected) == 31
+        group = next(g for g in expected if (g["model"], g["quant"]) == ("m0", "Q0"))
+        runs = [
+            v
+            for r, v in enumerate(values["accuracy"])
+            if (table.runs["model"][r], table.runs["quant"][r]) == ("m0", "Q0")
+        ]
+        assert group["runs"] == len(runs)
+        assert group["accuracy"] == pytest.approx(
+            statistics.mean(v for v in runs if v is not None)
+        )
+
+        pytest.importorskip("numpy")
+        assert table.run_values(["accuracy"]) == pytest.approx(values)
+        for got, want in zip(
+            table.run_stats(by, ["accuracy", "missing"]), expected, strict=True
+        ):
+            assert got == pytest.approx(want)
+
+    def test_from_store_reads_metric_rows_not_documents(self, tmp_path):
+        from kitt.storage.sqlite_store import SQLiteStore
+
+        store = SQLiteStore(db_path=tmp_path / "kitt.db")
+        top = _result("m", quant="Q8_0", accuracy=0.1)
+        top["metrics"] = {"accuracy": 0.9}
+        store.save_result(top)
+        store.save_result(_result("m", quant="Q8_0", accuracy=0.5))
+        with patch.object(SQLiteStore, "query", side_effect=AssertionError):
+            table = MetricTable.from_store(store, metrics=["accuracy"])
+        store.close()
+
+        (group,) = table.run_stats(("model", "quant"), ["accuracy"])
+        assert group["runs"] == 2
+        assert group["accuracy"] == pytest.approx(0.7)
+
+
+class TestReportersUseFullHistory:
+    def test_quant_curve_averages_repeated_runs(self):
+        store = _mock_store()
+        store.query.return_value = [
+            _result("m", quant="Q4_K_M", avg_tps=40, accuracy=0.7),
+            _result("m", quant="Q4_K_M", avg_tps=60, accuracy=0.8),
+            _result("m", quant="Q8_0", avg_tps=30),
+        ]
+        data = QuantCurveGenerator(result_store=store).gather_data()
+
+        assert store.query.call_args.kwargs.get("limit") is None
+        q4 = next(p for p in data if p["quant"] == "Q4_K_M")
+        assert (q4["throughput"], q4["accuracy"], q4["runs"]) == (50.0, 0.75, 2)
+        q8 = next(p for p in data if p["quant"] == "Q8_0")
+        assert q8["accuracy"] == 0
+
+    def test_comparison_averages_repeated_runs(self):
+        result = compare_campaigns(
+            [_result("m", avg_tps=100), _result("m", avg_tps=110)],
+            [_result("m", avg_tps=126)],
+        )
+        delta = result["m|vllm"]["deltas"]["throughput.avg_tps"]
+        assert delta["baseline"] == 105.0
+        assert delta["pct_change"] == 20.0
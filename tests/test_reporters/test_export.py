@@ -1,10 +1,21 @@
 """Tests for CSV and Parquet export."""
 
 import csv
+from pathlib import Path
 
 import pytest
 
-from kitt.reporters.export import export_to_csv, flatten_result
+from kitt.reporters.export import (
+    export_rows,
+    export_store,
+    export_to_csv,
+    flatten_output,
+    flatten_result,
+    iter_output_rows,
+    write_parquet,
+)
+from kitt.storage.sqlite_store import SQLiteStore
+from kitt.utils.compression import ResultCompression
 
 
 @pytest.fixture
@@ -115,3 +126,73 @@ class TestExportToCsv:
         out = tmp_path / "sub" / "dir" / "results.csv"
         export_to_csv([sample_result], out)
         assert out.exists()
+
+
+class TestStreamingExport:
+    def test_columns_from_later_rows_kept(self, tmp_path):
+        out = tmp_path / "rows.csv"
+        count = export_rows(iter([{"a": 1}, {"a": 2, "b": "x"}]), out)
+
+        with open(out) as f:
+            rows = list(csv.DictReader(f))
+        assert count == 2
+        assert rows == [{"a": "1", "b": ""}, {"a": "2", "b": "x"}]
+
+    def test_export_store_csv(self, sample_result, tmp_path):
+        store = SQLiteStore(db_path=tmp_path / "kitt.db")
+        for model in ("a", "b", "c"):
+            store.save_result({**sample_result, "model": model})
+        out = tmp_path / "store.csv"
+
+        count = export_store(store, out, filters={"model": "b"}, batch_size=1)
+        store.close()
+
+        with open(out) as f:
+            rows = list(csv.DictReader(f))
+        assert count == 2
+        assert {r["model"] for r in rows} == {"b"}
+
+    def test_parquet_schema_evolution(self, tmp_path):
+        pq = pytest.importorskip("pyarrow.parquet")
+        rows = [
+            {"tps": 10, "name": "a"},
+            {"tps": 12.5, "flag": True},
+            {"tps": 11, "name": 3, "extra": [1, 2]},
+        ]
+        out = tmp_path / "rows.parquet"
+
+        write_parquet(iter(rows), out, row_group_size=2)
+
+        parquet = pq.ParquetFile(out)
+        assert parquet.metadata.num_row_groups == 2
+        schema = parquet.schema_arrow
+        assert str(schema.field("tps").type) == "double"
+        assert str(schema.field("name").type) == "string"
+        assert str(schema.field("flag").type) == "bool"
+        table = parquet.read().to_pydict()
+        assert table["tps"] == [10.0, 12.5, 11.0]
+        assert table["name"] == ["a", None, "3"]
+        assert table["flag"] == [None, True, None]
+        assert table["extra"] == [None, None, "[1, 2]"]
+
+
+class TestOutputsExport:
+    def test_flatten_output(self):
+        row = flatten_output(
+            {"iteration": 1, "usage": {"tokens": 5}, "chunks": ["a", "b"]}
+        )
+        assert row == {"iteration": 1, "usage.tokens": 5, "chunks": '["a", "b"]'}
+
+    def test_exports_chunked_outputs(self, tmp_path):
+        outputs_dir = tmp_path / "run" / "outputs"
+        outputs_dir.mkdir(parents=True)
+        outputs = [{"iteration": i, "usage": {"tokens": i * 10}} for i in range(5)]
+        ResultCompression.save_outputs(outputs, outputs_dir / "results")
+        out = tmp_path / "outputs.csv"
+
+        count = export_rows(iter_output_rows(Path(tmp_path / "run")), out)
+
+        with open(out) as f:
+            rows = list(csv.DictReader(f))
+        assert count == 5
+        assert rows[4] == {"iteration": "4", "usage.tokens": "40"}
@@ -2,7 +2,10 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from kitt.reporters.quant_curves import _QUANT_BPP, QuantCurveGenerator
+from kitt.storage.base import ResultStore
 
 
 def _make_store_result(model, engine, quant, accuracy=0.8, avg_tps=50.0):
@@ -18,13 +21,20 @@ def _make_store_result(model, engine, quant, accuracy=0.8, avg_tps=50.0):
     }
 
 
+def _mock_store():
+    """MagicMock store whose metric_rows() walks query() like the base class."""
+    store = MagicMock()
+    store.metric_rows.side_effect = lambda **kw: ResultStore.metric_rows(store, **kw)
+    return store
+
+
 class TestGatherData:
     def test_with_no_store_returns_empty(self):
         gen = QuantCurveGenerator(result_store=None)
         assert gen.gather_data() == []
 
     def test_maps_quant_to_correct_bpp(self):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = [
             _make_store_result("Llama-3.1-8B", "llama_cpp", "Q4_K_M"),
         ]
@@ -36,7 +46,7 @@ class TestGatherData:
         assert data[0]["quant"] == "Q4_K_M"
 
     def test_filters_by_model_family(self):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = [
             _make_store_result("Llama-3.1-8B", "llama_cpp", "Q4_K_M"),
         ]
@@ -50,7 +60,7 @@ class TestGatherData:
         assert filters["model"] == "Llama-3.1"
 
     def test_skips_unknown_quants(self):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = [
             _make_store_result("model-a", "llama_cpp", "UNKNOWN_QUANT"),
             _make_store_result("model-b", "llama_cpp", "Q4_K_M"),
@@ -62,7 +72,7 @@ class TestGatherData:
         assert data[0]["quant"] == "Q4_K_M"
 
     def test_skips_results_without_quant(self):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = [
             {"model": "model-a", "engine": "vllm", "quant": "", "metrics": {}},
             _make_store_result("model-b", "llama_cpp", "Q8_0"),
@@ -73,6 +83,36 @@ class TestGatherData:
         assert len(data) == 1
         assert data[0]["quant"] == "Q8_0"
 
+    def test_weights_each_run_once(self):
+        store = _mock_store()
+        store.query.return_value = [
+            # Top-level metrics win over the benchmark values
+            {
+                **_make_store_result("m", "llama_cpp", "Q8_0", accuracy=0.9),
+                "results": [
+                    {"test_name": "a", "metrics": {"accuracy": 0.1}},
+                    {"test_name": "b", "metrics": {"accuracy": 0.2}},
+                ],
+            },
+            # No top-level metrics: mean over the benchmarks
+            {
+                "model": "m",
+                "engine": "llama_cpp",
+                "quant": "Q8_0",
+                "results": [
+                    {"test_name": "a", "metrics": {"accuracy": 0.4, "avg_tps": 20}},
+                    {"test_name": "b", "metrics": {"accuracy": 0.6}},
+                ],
+            },
+        ]
+        gen = QuantCurveGenerator(result_store=store)
+        data = gen.gather_data()
+
+        assert len(data) == 1
+        assert data[0]["runs"] == 2
+        assert data[0]["accuracy"] == pytest.approx((0.9 + 0.5) / 2)
+        assert data[0]["throughput"] == pytest.approx((50.0 + 20) / 2)
+
 
 class TestGenerateCurve:
     def test_returns_none_with_no_data(self):
@@ -81,7 +121,7 @@ class TestGenerateCurve:
         assert result is None
 
     def test_saves_file(self, tmp_path):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = [
             _make_store_result("Llama-3.1-8B", "llama_cpp", "Q4_K_M"),
             _make_store_result(
@@ -118,7 +158,7 @@ class TestGenerateCurve:
 
 class TestExportCsv:
     def test_creates_csv_file(self, tmp_path):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = [
             _make_store_result(
                 "Llama-3.1-8B", "llama_cpp", "Q4_K_M", accuracy=0.8, avg_tps=50
@@ -131,7 +171,7 @@ class TestExportCsv:
         assert output.exists()
 
     def test_includes_header_row(self, tmp_path):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = [
             _make_store_result("Llama-3.1-8B", "llama_cpp", "Q4_K_M"),
         ]
@@ -147,7 +187,7 @@ class TestExportCsv:
 
 class TestCompareModelFamilies:
     def test_with_no_data_returns_none(self):
-        store = MagicMock()
+        store = _mock_store()
         store.query.return_value = []
         gen = QuantCurveGenerator(result_store=store)
         result = gen.compare_model_families(["Llama-3.1", "Qwen2.5"])
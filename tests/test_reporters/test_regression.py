@@ -1,6 +1,12 @@
 """Tests for regression detection."""
 
-from kitt.reporters.regression import RegressionAlert, RegressionDetector
+import random
+
+from kitt.reporters.regression import (
+    HistoryRegressionDetector,
+    RegressionAlert,
+    RegressionDetector,
+)
 
 
 def _make_result(metrics):
@@ -141,3 +147,94 @@ class TestRegressionAlert:
         assert alert.metric == "avg_tps"
         assert alert.baseline_value == 100.0
         assert alert.current_value == 80.0
+
+
+def _series(values, metric="avg_tps", model="m", benchmark="throughput"):
+    return [
+        (model, "vllm", "fp", benchmark, metric, f"2025-01-{i + 1:02d}", v)
+        for i, v in enumerate(values)
+    ]
+
+
+def _noisy(level, n, spread, seed):
+    rng = random.Random(seed)
+    return [level + rng.uniform(-spread, spread) for _ in range(n)]
+
+
+class TestHistoryRegressionDetector:
+    def test_detects_step_and_its_start(self):
+        values = _noisy(100, 12, 2, seed=1) + _noisy(80, 6, 2, seed=2)
+        (change,) = HistoryRegressionDetector().analyze(_series(values))
+
+        assert change.kind == "shift"
+        assert change.timestamp == "2025-01-13"
+        assert change.runs_since == 6
+        assert 15 < change.delta_pct < 25
+        assert change.severity == "warning"
+
+    def test_detects_slow_drift(self):
+        values = [100 - i * 1.5 + (1 if i % 2 else -1) for i in range(20)]
+        (change,) = HistoryRegressionDetector().analyze(_series(values))
+        assert change.current_value < change.baseline_value
+
+    def test_noisy_series_does_not_alarm(self):
+        values = _noisy(100, 40, 15, seed=3)
+        assert HistoryRegressionDetector().analyze(_series(values)) == []
+
+    def test_improvement_ignored(self):
+        values = _noisy(100, 10, 1, seed=4) + _noisy(150, 5, 1, seed=5)
+        assert HistoryRegressionDetector().analyze(_series(values)) == []
+
+    def test_latency_increase_is_regression(self):
+        values = _noisy(50, 10, 1, seed=6) + _noisy(80, 5, 1, seed=7)
+        (change,) = HistoryRegressionDetector().analyze(
+            _series(values, metric="avg_latency_ms")
+        )
+        assert change.severity == "critical"
+
+    def test_latest_outlier(self):
+        values = _noisy(100, 15, 1, seed=8) + [60]
+        (change,) = HistoryRegressionDetector().analyze(_series(values))
+        assert change.kind == "outlier"
+        assert change.runs_since == 1
+
+    def test_series_kept_apart(self):
+        rows = _series(_noisy(100, 10, 1, seed=9), model="a") + _series(
+            _noisy(50, 10, 1, seed=10), model="b"
+        )
+        assert HistoryRegressionDetector().analyze(rows) == []
+
+    def test_short_and_unknown_series_skipped(self):
+        detector = HistoryRegressionDetector()
+        assert detector.analyze(_series([100, 100, 50, 50])) == []
+        assert detector.analyze(_series([1] * 10 + [9] * 10, metric="x")) == []
+
+    def test_scan_store(self, tmp_path):
+        from kitt.storage.sqlite_store import SQLiteStore
+
+        store = SQLiteStore(db_path=tmp_path / "test.db")
+        values = _noisy(100, 8, 1, seed=11) + _noisy(60, 4, 1, seed=12)
+        for i, tps in enumerate(values):
+            store.save_result(
+                {
+                    "model": "m",
+                    "engine": "vllm",
+                    "suite_name": "standard",
+                    "timestamp": f"2025-01-{i + 1:02d}T00:00:00",
+                    "passed": True,
+                    "results": [
+                        {"test_name": "throughput", "metrics": {"avg_tps": tps}},
+                        {"test_name": "throughput", "metrics": {"avg_tps": tps}},
+                    ],
+                }
+            )
+
+        history = store.metric_history(metrics=["avg_tps"])
+        assert len(history) == len(values)
+        assert [round(row[6], 6) for row in history] == [round(v, 6) for v in values]
+
+        (change,) = HistoryRegressionDetector().scan(store)
+        assert change.timestamp == "2025-01-09T00:00:00"
+        assert change.severity == "critical"
+        assert HistoryRegressionDetector().scan(store, filters={"model": "x"}) == []
+        store.close()
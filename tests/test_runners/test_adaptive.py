@@ -0,0 +1,144 @@
+"""Tests for adaptive (confidence-interval) sampling."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
+from kitt.runners.adaptive import (
+    AdaptiveConfig,
+    AdaptiveSampler,
+    confidence_interval,
+    get_metric,
+    t_critical,
+)
+from kitt.runners.suite import SuiteRunner
+
+
+class SequenceBenchmark(LLMBenchmark):
+    """Returns avg_tps values from a fixed sequence, one per run."""
+
+    name = "sequence"
+    version = "1.0.0"
+    category = "performance"
+
+    def __init__(self, values):
+        self._values = iter(values)
+
+    def _execute(self, engine, config):
+        return BenchmarkResult(
+            test_name=self.name,
+            test_version=self.version,
+            passed=True,
+            metrics={"avg_tps": next(self._values)},
+            outputs=[],
+        )
+
+
+class TestStatistics:
+    @pytest.mark.parametrize(
+        "df,expected",
+        [(1, 12.706), (2, 4.303), (3, 3.182), (5, 2.571), (10, 2.228), (30, 2.042)],
+    )
+    def test_t_critical_95(self, df, expected):
+        assert t_critical(0.95, df) == pytest.approx(expected, rel=0.01)
+
+    def test_confidence_interval(self):
+        mean, lower, upper = confidence_interval([10.0, 12.0, 11.0, 9.0, 13.0])
+        assert mean == 11.0
+        assert lower < mean < upper
+        assert upper - mean == pytest.approx(mean - lower)
+
+    def test_single_value_interval(self):
+        assert confidence_interval([5.0]) == (5.0, 5.0, 5.0)
+
+    def test_get_metric_nested(self):
+        metrics = {"avg_tps": 50, "ttft_ms": {"avg": 12.5}, "label": "x"}
+        assert get_metric(metrics, "avg_tps") == 50.0
+        assert get_metric(metrics, "ttft_ms.avg") == 12.5
+        assert get_metric(metrics, "ttft_ms.p99") is None
+        assert get_metric(metrics, "label") is None
+
+
+class TestAdaptiveSampler:
+    def _sampler(self, **kwargs):
+        return AdaptiveSampler(
+            config=AdaptiveConfig.from_dict(kwargs), metric="avg_tps"
+        )
+
+    def test_runs_at_least_min_runs(self):
+        sampler = self._sampler(min_runs=3)
+        sampler.add({"avg_tps": 50.0})
+        sampler.add({"avg_tps": 50.0})
+        assert sampler.should_continue() is True
+
+    def test_converges_on_stable_metric(self):
+        sampler = self._sampler(relative_ci=0.05)
+        for value in [50.0, 50.5, 49.5]:
+            sampler.add({"avg_tps": value})
+        assert sampler.should_continue() is False
+        assert sampler.stop_reason == "converged"
+
+    def test_stops_at_max_runs(self):
+        sampler = self._sampler(relative_ci=0.01, max_runs=4)
+        for value in [10.0, 50.0, 20.0, 80.0]:
+            sampler.add({"avg_tps": value})
+        assert sampler.should_continue() is False
+        assert sampler.stop_reason == "max_runs"
+        assert sampler.summary()["converged"] is False
+
+    def test_stops_on_time_budget(self):
+        clock = iter([0.0, 100.0])
+        with patch("kitt.runners.adaptive.time.perf_counter", lambda: next(clock)):
+            sampler = self._sampler(relative_ci=0.01, time_budget_s=60)
+            for value in [10.0, 50.0, 20.0]:
+                sampler.add({"avg_tps": value})
+            assert sampler.should_continue() is False
+        assert sampler.stop_reason == "time_budget"
+
+    def test_metric_unavailable(self):
+        sampler = self._sampler()
+        for _ in range(3):
+            sampler.add({"accuracy": 0.9})
+        assert sampler.should_continue() is False
+        assert sampler.stop_reason == "metric_unavailable"
+
+    def test_min_runs_floor(self):
+        config = AdaptiveConfig.from_dict({"min_runs": 1, "max_runs": 1})
+        assert config.min_runs == 2
+        assert config.max_runs == 2
+
+
+class TestSuiteRunnerAdaptive:
+    def test_adaptive_stops_when_converged(self):
+        runner = SuiteRunner(MagicMock())
+        benchmark = SequenceBenchmark([10.0, 40.0, 25.0, 25.0, 25.0, 25.0, 25.0])
+
+        result = runner.run(
+            "perf",
+            [benchmark],
+            {
+                "warmup": {"enabled": False},
+                "adaptive": {"relative_ci": 0.5, "max_runs": 10},
+            },
+        )
+
+        sampling = result.sampling["sequence"]
+        assert sampling["converged"] is True
+        assert sampling["runs"] == len(result.results)
+        assert 3 <= sampling["runs"] < 10
+        assert sampling["relative_ci"] <= 0.5
+        assert [r.run_number for r in result.results] == list(
+            range(1, sampling["runs"] + 1)
+        )
+
+    def test_fixed_runs_without_adaptive(self):
+        runner = SuiteRunner(MagicMock())
+        benchmark = SequenceBenchmark([1.0, 2.0])
+
+        result = runner.run(
+            "perf", [benchmark], {"warmup": {"enabled": False}, "runs": 2}
+        )
+
+        assert len(result.results) == 2
+        assert result.sampling == {}
@@ -0,0 +1,191 @@
+"""Tests for suite runner and session warmup."""
+
+from datetime import datetime
+from unittest.mock import MagicMock, patch
+
+from kitt.benchmarks.base import BenchmarkResult, LLMBenchmark
+from kitt.config.models import SuiteConfig
+from kitt.engines.base import GenerationMetrics, GenerationResult
+from kitt.reporters.json_reporter import suite_result_to_dict
+from kitt.runners.suite import SuiteRunner, suite_run_config
+from kitt.runners.warmup import SessionWarmup
+
+
+def _mock_engine():
+    engine = MagicMock()
+    engine.generate.return_value = GenerationResult(
+        output="ok",
+        metrics=GenerationMetrics(
+            ttft_ms=10.0,
+            tps=50.0,
+            total_latency_ms=100.0,
+            gpu_memory_peak_gb=1.0,
+            gpu_memory_avg_gb=1.0,
+            timestamp=datetime.now(),
+        ),
+        prompt_tokens=5,
+        completion_tokens=10,
+    )
+    return engine
+
+
+class OneCallBenchmark(LLMBenchmark):
+    name = "one_call"
+    version = "1.0.0"
+    category = "performance"
+
+    def _execute(self, engine, config):
+        engine.generate(prompt="test", max_tokens=10)
+        return BenchmarkResult(
+            test_name=self.name,
+            test_version=self.version,
+            passed=True,
+            metrics={},
+            outputs=[],
+        )
+
+
+class TestSessionWarmup:
+    def test_is_stable(self):
+        warmup = SessionWarmup(window=3, threshold=0.10)
+        assert warmup.is_stable([5.0, 1.0, 1.02, 0.99]) is True
+        assert warmup.is_stable([5.0, 2.0, 1.0]) is False
+        assert warmup.is_stable([1.0, 1.0]) is False
+
+    def test_stops_when_converged(self):
+        times = iter([0.0, 5.0, 5.0, 7.0, 7.0, 8.0, 8.0, 9.0, 9.0, 10.0])
+        engine = _mock_engine()
+        warmup = SessionWarmup(max_iterations=10, window=3, threshold=0.10)
+
+        with patch("kitt.runners.warmup.time.perf_counter", lambda: next(times)):
+            result = warmup.run(engine)
+
+        # Latencies: 5, 2, 1, 1, 1 -> stable after five iterations
+        assert result.converged is True
+        assert result.iterations == 5
+        assert engine.generate.call_count == 5
+
+    def test_gives_up_at_max_iterations(self):
+        clock = iter(float(x) for x in range(100))
+        engine = _mock_engine()
+
+        def slow_down():
+            return next(clock) ** 2
+
+        warmup = SessionWarmup(max_iterations=4, window=3, threshold=0.01)
+        with patch("kitt.runners.warmup.time.perf_counter", slow_down):
+            result = warmup.run(engine)
+
+        assert result.converged is False
+        assert result.iterations == 4
+
+    def test_failed_iterations_skipped(self):
+        engine = _mock_engine()
+        engine.generate.side_effect = RuntimeError("boom")
+        result = SessionWarmup(max_iterations=3).run(engine)
+        assert result.times == []
+        assert result.converged is False
+
+
+class TestSuiteRunner:
+    def test_warms_once_per_session(self):
+        engine = _mock_engine()
+        runner = SuiteRunner(engine)
+        benchmarks = [OneCallBenchmark(), OneCallBenchmark()]
+
+        with patch.object(SessionWarmup, "run") as mock_run:
+            mock_run.return_value.converged = True
+            first = runner.run("perf", benchmarks, {"runs": 3})
+            second = runner.run("perf", benchmarks, {"runs": 1})
+
+        assert mock_run.call_count == 1
+        assert first.warmup is second.warmup
+        # Benchmarks skip their own warmup: one call per benchmark run
+        assert engine.generate.call_count == 2 * 3 + 2 * 1
+        assert all(r.warmup_times == [] for r in first.results)
+
+    def test_cold_engine_benchmarks_run_before_session_warmup(self):
+        class ColdBenchmark(OneCallBenchmark):
+            name = "cold"
+            requires_cold_engine = True
+
+        engine = _mock_engine()
+        runner = SuiteRunner(engine)
+        order = []
+        engine.generate.side_effect = lambda **kw: (
+            order.append("call") or (_mock_engine().generate.return_value)
+        )
+
+        with patch.object(SessionWarmup, "run") as mock_run:
+            mock_run.side_effect = lambda engine: order.append("warmup")
+            result = runner.run(
+                "perf",
+                [OneCallBenchmark(), ColdBenchmark()],
+                {"warmup": {"iterations": 2}},
+            )
+
+        # Cold benchmark: its own 2 warmup calls plus 1 measured call first
+        assert order == ["call"] * 3 + ["warmup", "call"]
+        assert [r.test_name for r in result.results] == ["cold", "one_call"]
+        assert len(result.results[0].warmup_times) == 2
+        assert result.results[1].warmup_times == []
+
+    def test_reset_warmup_rewarms(self):
+        runner = SuiteRunner(_mock_engine())
+        with patch.object(SessionWarmup, "run") as mock_run:
+            runner.warm_up({})
+            runner.reset_warmup()
+            runner.warm_up({})
+        assert mock_run.call_count == 2
+
+    def test_skip_warmup(self):
+        engine = _mock_engine()
+        runner = SuiteRunner(engine)
+        result = runner.run(
+            "quick", [OneCallBenchmark()], {"warmup": {"enabled": False}}
+        )
+
+        assert result.warmup is None
+        assert engine.generate.call_count == 1
+
+    def test_per_benchmark_warmup_when_session_disabled(self):
+        engine = _mock_engine()
+        runner = SuiteRunner(engine)
+        result = runner.run(
+            "quick",
+            [OneCallBenchmark()],
+            {"warmup": {"session": False, "iterations": 2}},
+        )
+
+        assert result.warmup is None
+        assert len(result.results[0].warmup_times) == 2
+        assert engine.generate.call_count == 3
+
+    def test_warmup_recorded_in_report(self):
+        runner = SuiteRunner(_mock_engine())
+        result = runner.run("quick", [OneCallBenchmark()], {})
+
+        data = suite_result_to_dict(result)
+        assert data["warmup"]["iterations"] == result.warmup.iterations
+        assert "converged" in data["warmup"]
+
+
+class TestSuiteRunConfig:
+    def test_no_suite_file(self):
+        assert suite_run_config(None) == ({}, {})
+
+    def test_global_config_and_set_override_keys(self):
+        suite_cfg = SuiteConfig.model_validate(
+            {
+                "suite_name": "performance",
+                "global_config": {"runs": 3, "warmup": {"max_iterations": 8}},
+                "test_overrides": {"warmup_analysis": {"warmup": {"enabled": False}}},
+            }
+        )
+        global_config, test_overrides = suite_run_config(suite_cfg)
+
+        assert global_config == {"runs": 3, "warmup": {"max_iterations": 8}}
+        assert test_overrides == {"warmup_analysis": {"warmup": {"enabled": False}}}
+        # Callers may layer CLI flags on top without touching the suite
+        global_config["warmup"]["enabled"] = False
+        assert "enabled" not in suite_cfg.global_config["warmup"]
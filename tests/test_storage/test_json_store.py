@@ -146,6 +146,13 @@ class TestJsonStore:
     def test_delete_nonexistent(self, store):
         assert store.delete_result("nonexistent") is False
 
+    def test_iter_results_walks_all_pages(self, store):
+        for i in range(5):
+            store.save_result(_make_result(model=f"m{i}"))
+
+        results = list(store.iter_results(batch_size=2))
+        assert sorted(r["model"] for r in results) == [f"m{i}" for i in range(5)]
+
     def test_cache_invalidation(self, store):
         store.save_result(_make_result(model="first"))
         assert store.count() == 1
@@ -0,0 +1,123 @@
+"""Tests for keyset-paginated result queries."""
+
+import pytest
+
+from kitt.storage.json_store import JsonStore
+from kitt.storage.result_query import (
+    ResultQuery,
+    build_page_sql,
+    encode_cursor,
+    parse_condition,
+    parse_hardware_condition,
+)
+from kitt.storage.sqlite_store import SQLiteStore
+
+
+def _result(model, timestamp, tps, gpu="RTX 4090", vram=24):
+    return {
+        "model": model,
+        "engine": "vllm",
+        "suite_name": "standard",
+        "timestamp": timestamp,
+        "passed": True,
+        "results": [
+            {"test_name": "throughput", "run_number": 1, "metrics": {"avg_tps": tps}},
+            {"test_name": "throughput", "run_number": 2, "metrics": {"avg_tps": tps}},
+        ],
+        "system_info": {"gpu": {"model": gpu, "vram_gb": vram}},
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    s = SQLiteStore(db_path=tmp_path / "test.db")
+    s.save_result(_result("a", "2025-01-01T00:00:00", 30.0))
+    s.save_result(_result("b", "2025-01-02T00:00:00", 60.0, gpu="A100", vram=80))
+    s.save_result(_result("c", "2025-01-03T00:00:00", 90.0))
+    s.save_result(_result("d", "2025-01-03T00:00:00", 45.0, gpu="A100", vram=80))
+    yield s
+    s.close()
+
+
+def _walk(store, **kwargs):
+    """Follow cursors to the end and return the models in order."""
+    models, cursor = [], None
+    while True:
+        page = store.query_page(ResultQuery(cursor=cursor, limit=1, **kwargs))
+        models += [r["model"] for r in page.items]
+        if page.next_cursor is None:
+            return models
+        cursor = page.next_cursor
+
+
+class TestParsing:
+    def test_parse_condition(self):
+        cond = parse_condition("avg_tps>=50")
+        assert (cond.field, cond.op, cond.value) == ("avg_tps", ">=", 50.0)
+
+        with pytest.raises(ValueError):
+            parse_condition("avg_tps>fast")
+        with pytest.raises(ValueError):
+            parse_condition("avg_tps")
+
+    def test_parse_hardware_condition(self):
+        assert parse_hardware_condition("gpu_model=RTX 4090").value == "RTX 4090"
+        assert parse_hardware_condition("gpu_model=4090").value == "4090"
+        assert parse_hardware_condition("gpu_vram_gb>=24").value == 24.0
+
+        with pytest.raises(ValueError, match="only supports"):
+            parse_hardware_condition("gpu_model>5")
+        with pytest.raises(ValueError, match="Unknown hardware field"):
+            parse_hardware_condition("raw_json=x")
+
+
+class TestSQLiteQueryPage:
+    def test_walks_timestamp_ties_without_gaps(self, store):
+        newest_first = _walk(store)
+        assert sorted(newest_first[:2]) == ["c", "d"]  # tie broken by id
+        assert newest_first[2:] == ["b", "a"]
+        assert _walk(store, sort="timestamp") == newest_first[::-1]
+
+    def test_metric_range_uses_run_average(self, store):
+        page = store.query_page(ResultQuery(metrics=[parse_condition("avg_tps>50")]))
+        assert [r["model"] for r in page.items] == ["c", "b"]
+
+    def test_hardware_filters(self, store):
+        query = ResultQuery(
+            hardware=[parse_hardware_condition("gpu_model=A100")],
+            metrics=[parse_condition("avg_tps<50")],
+        )
+        assert [r["model"] for r in store.query_page(query).items] == ["d"]
+
+        query = ResultQuery(hardware=[parse_hardware_condition("gpu_vram_gb<80")])
+        assert [r["model"] for r in store.query_page(query).items] == ["c", "a"]
+
+    def test_sort_by_metric(self, store):
+        assert _walk(store, sort="-avg_tps") == ["c", "b", "d", "a"]
+        assert _walk(store, sort="avg_tps") == ["a", "d", "b", "c"]
+
+    def test_cursor_bound_to_sort(self, store):
+        cursor = encode_cursor("-timestamp", "2025-01-03T00:00:00", "x")
+        with pytest.raises(ValueError, match="issued for sort"):
+            store.query_page(ResultQuery(sort="-avg_tps", cursor=cursor))
+        with pytest.raises(ValueError, match="Invalid cursor"):
+            store.query_page(ResultQuery(cursor="not-a-cursor"))
+
+    def test_postgres_placeholders(self):
+        query = ResultQuery(filters={"passed": True}, sort="-avg_tps")
+        sql, params = build_page_sql(query, placeholder="%s", bool_as_int=False)
+        assert "?" not in sql
+        assert sql.count("%s") == len(params)
+        assert params == ["avg_tps", True, 26]
+
+
+class TestFallbackQueryPage:
+    def test_matches_sql_semantics(self, tmp_path, store):
+        json_store = JsonStore(base_dir=tmp_path)
+        for result in store.query(order_by="timestamp"):
+            json_store.save_result(result)
+
+        query = ResultQuery(sort="-avg_tps", metrics=[parse_condition("avg_tps>40")])
+        assert [r["model"] for r in json_store.query_page(query).items] == [
+            r["model"] for r in store.query_page(query).items
+        ]
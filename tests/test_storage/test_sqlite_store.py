@@ -4,6 +4,7 @@ import json
 
 import pytest
 
+from kitt.storage.base import ResultStore
 from kitt.storage.sqlite_store import SQLiteStore
 
 
@@ -217,6 +218,57 @@ class TestSQLiteStore:
         result = store.export_result("nope", tmp_path / "nope.json")
         assert result is None
 
+    def test_iter_results_batches(self, store):
+        for i in range(7):
+            store.save_result(_make_result(model=f"m{i}"))
+        store.save_result(_make_result(model="other", engine="llama_cpp"))
+
+        models = sorted(r["model"] for r in store.iter_results(batch_size=3))
+        assert models == [f"m{i}" for i in range(7)] + ["other"]
+
+        filtered = list(store.iter_results(filters={"engine": "llama_cpp"}))
+        assert [r["model"] for r in filtered] == ["other"]
+
+    def test_metric_rows_match_fallback(self, store):
+        top = _make_result(model="top")
+        top["quant"] = "Q4_K_M"
+        top["metrics"] = {"avg_tps": 50.0, "nested": {"p50": 1.0}, "label": "x"}
+        empty = _make_result(model="empty", engine="llama_cpp")
+        empty["results"] = []
+        for result in (top, empty, _make_result()):
+            store.save_result(result)
+
+        def normalized(rows):
+            return sorted((*row[1:5], bool(row[5]), *row[6:]) for row in rows)
+
+        for kwargs in ({}, {"metrics": ["avg_tps"]}, {"filters": {"model": "top"}}):
+            rows = store.metric_rows(**kwargs)
+            assert normalized(rows) == normalized(
+                ResultStore.metric_rows(store, **kwargs)
+            )
+        assert (
+            "top",
+            "vllm",
+            "Q4_K_M",
+            "standard",
+            True,
+            120.5,
+            "",
+            "avg_tps",
+            50.0,
+        ) in (normalized(store.metric_rows()))
+        assert (
+            "empty",
+            "llama_cpp",
+            "",
+            "standard",
+            True,
+            120.5,
+            None,
+            None,
+            None,
+        ) in (normalized(store.metric_rows()))
+
     def test_close_and_reopen(self, tmp_path):
         db_path = tmp_path / "test.db"
         store = SQLiteStore(db_path=db_path)
@@ -226,3 +278,22 @@ class TestSQLiteStore:
         store2 = SQLiteStore(db_path=db_path)
         assert store2.count() == 1
         store2.close()
+
+    def test_fingerprints_backfilled_on_upgrade(self, tmp_path):
+        db_path = tmp_path / "test.db"
+        store = SQLiteStore(db_path=db_path)
+        run_id = store.save_result(_make_result())
+        conn = store._get_conn()
+        conn.execute("UPDATE hardware SET fingerprint = NULL")
+        conn.execute("DELETE FROM schema_version WHERE version >= 13")
+        conn.commit()
+        store.close()
+
+        store = SQLiteStore(db_path=db_path)
+        row = (
+            store._get_conn()
+            .execute("SELECT fingerprint FROM hardware WHERE run_id = ?", (run_id,))
+            .fetchone()
+        )
+        assert row["fingerprint"] == "rtx4090-24gb"
+        store.close()
@@ -0,0 +1,142 @@
+"""Tests for the ASGI front end and async SSE streaming."""
+
+import asyncio
+import os
+import threading
+from unittest.mock import patch
+
+import pytest
+from click.testing import CliRunner
+
+from kitt.cli.main import cli
+from kitt.web.asgi import SSEDispatcher, stream_source
+from kitt.web.services.event_bus import EventBus
+
+
+def _scope(path, method="GET"):
+    return {"type": "http", "method": method, "path": path}
+
+
+class TestStreamSource:
+    def test_paths(self):
+        assert stream_source("/api/v1/events/stream") == ""
+        assert stream_source("/api/v1/events/stream/camp-1") == "camp-1"
+        assert stream_source("/api/v1/events/stream/a/b") is None
+        assert stream_source("/api/v1/campaigns") is None
+
+
+class TestSubscribeAsync:
+    def test_receives_events_published_from_threads(self):
+        bus = EventBus()
+
+        async def main():
+            stream = bus.subscribe_async("s1", source_filter="camp-1")
+            first = asyncio.ensure_future(stream.__anext__())
+            await asyncio.sleep(0)
+            assert bus.subscriber_count == 1
+
+            def publish():
+                bus.publish("log", "other", {"line": "skip"})
+                bus.publish("log", "camp-1", {"line": "hello"})
+
+            threading.Thread(target=publish).start()
+            chunk = await asyncio.wait_for(first, 5)
+            await stream.aclose()
+            return chunk
+
+        chunk = asyncio.run(main())
+        assert "event: log\n" in chunk
+        assert '"hello"' in chunk
+        assert bus.subscriber_count == 0
+
+    def test_keepalive_when_idle(self):
+        bus = EventBus()
+
+        async def main():
+            stream = bus.subscribe_async("s1", keepalive_s=0.01)
+            chunk = await stream.__anext__()
+            await stream.aclose()
+            return chunk
+
+        assert asyncio.run(main()) == ": keepalive\n\n"
+
+
+class TestSSEDispatcher:
+    def test_non_stream_requests_delegated(self):
+        calls = []
+
+        async def app(scope, receive, send):
+            calls.append(scope["path"])
+
+        dispatcher = SSEDispatcher(app, bus=EventBus())
+        asyncio.run(dispatcher(_scope("/api/v1/campaigns"), None, None))
+        asyncio.run(dispatcher(_scope("/api/v1/events/stream", "POST"), None, None))
+
+        assert calls == ["/api/v1/campaigns", "/api/v1/events/stream"]
+
+    def test_streams_until_disconnect(self):
+        bus = EventBus()
+        sent = []
+
+        async def main():
+            disconnect = asyncio.Event()
+
+            async def receive():
+                await disconnect.wait()
+                return {"type": "http.disconnect"}
+
+            async def send(message):
+                sent.append(message)
+                if message.get("more_body"):
+                    disconnect.set()
+
+            async def app(scope, receive, send):
+                raise AssertionError("stream must not reach the WSGI app")
+
+            dispatcher = SSEDispatcher(app, bus=bus)
+            task = asyncio.ensure_future(
+                dispatcher(_scope("/api/v1/events/stream/camp-1"), receive, send)
+            )
+            while bus.subscriber_count == 0:
+                await asyncio.sleep(0.001)
+            bus.publish("status", "camp-1", {"state": "running"})
+            await asyncio.wait_for(task, 5)
+
+        asyncio.run(main())
+
+        assert sent[0]["status"] == 200
+        assert (b"content-type", b"text/event-stream; charset=utf-8") in sent[0][
+            "headers"
+        ]
+        assert b"event: status" in sent[1]["body"]
+        assert bus.subscriber_count == 0
+
+
+class TestWebCommand:
+    def test_workers_without_uvicorn_fails(self):
+        with (
+            patch("kitt.web.server.production_server_available", return_value=False),
+            patch("kitt.web.app.create_app") as create_app,
+        ):
+            result = CliRunner().invoke(cli, ["web", "--workers", "2"])
+
+        assert result.exit_code == 1
+        assert "uvicorn and a2wsgi" in result.output
+        create_app.assert_not_called()
+
+    @pytest.mark.parametrize(("workers", "bus"), [("1", None), ("2", "sqlite")])
+    def test_event_broker_only_for_several_workers(self, workers, bus):
+        with (
+            patch.dict(os.environ),
+            patch("kitt.web.server.production_server_available", return_value=True),
+            patch("kitt.web.server.serve") as serve,
+            patch("kitt.web.app.create_app"),
+        ):
+            os.environ.pop("KITT_EVENT_BUS", None)
+            result = CliRunner().invoke(
+                cli, ["web", "--insecure", "--workers", workers]
+            )
+            assert os.environ.get("KITT_EVENT_BUS") == bus
+
+        assert result.exit_code == 0
+        serve.assert_called_once()
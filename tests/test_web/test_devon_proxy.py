@@ -0,0 +1,176 @@
+"""Tests for the streaming Devon reverse proxy."""
+
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+try:
+    from flask import Flask
+
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not FLASK_AVAILABLE, reason="flask not installed")
+
+INDEX = b'<script>window.__DEVON_BASE_URL__=""</script>'
+BLOB = bytes(range(256)) * 1024  # 256 KiB
+
+
+class _Devon(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    connections: set = set()
+    seen_headers: list = []
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        type(self).connections.add(self.client_address)
+        type(self).seen_headers.append(dict(self.headers))
+        if self.path == "/":
+            self._send(200, "text/html", INDEX)
+        elif self.path == "/gz":
+            self._send(200, "text/html", gzip.compress(INDEX), encoding="gzip")
+        elif self.path == "/blob":
+            self._send(200, "application/octet-stream", BLOB)
+        elif self.path == "/events":
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Transfer-Encoding", "chunked")
+            self.end_headers()
+            for i in range(3):
+                data = f"data: {i}\n\n".encode()
+                self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.write(b"0\r\n\r\n")
+        elif self.path == "/moved":
+            self._redirect(f"http://{self.headers['Host']}/blob?x=1")
+        elif self.path == "/relative":
+            self._redirect("blob")
+        elif self.path == "/away":
+            self._redirect("https://example.com/login")
+        else:
+            self._send(404, "application/json", b'{"error": "nope"}')
+
+    def _redirect(self, location):
+        self.send_response(302)
+        self.send_header("Location", location)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def _send(self, status, content_type, body, encoding=None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("X-Frame-Options", "DENY")
+        if encoding:
+            self.send_header("Content-Encoding", encoding)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def devon():
+    _Devon.connections = set()
+    _Devon.seen_headers = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Devon)
+    server.handle_error = lambda request, address: None  # pooled conns reset
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(devon):
+    from kitt.web.api.v1 import devon_proxy
+
+    app = Flask(__name__)
+    app.register_blueprint(devon_proxy.bp)
+    with (
+        patch.object(devon_proxy, "_get_devon_url", return_value=devon),
+        patch.object(devon_proxy, "_get_devon_api_key", return_value="secret"),
+    ):
+        yield app.test_client()
+    devon_proxy._pool.clear()
+
+
+class TestDevonProxy:
+    def test_streams_binary_without_buffering(self, client):
+        resp = client.get("/devon-app/blob", buffered=False)
+
+        assert resp.is_streamed
+        assert resp.headers["Content-Length"] == str(len(BLOB))
+        assert b"".join(resp.response) == BLOB
+        assert "X-Frame-Options" not in resp.headers
+        resp.close()
+
+    def test_html_rewritten(self, client):
+        resp = client.get("/devon-app/")
+
+        assert b'window.__DEVON_BASE_URL__="/devon-app"' in resp.data
+        assert resp.headers["Content-Length"] == str(len(resp.data))
+        assert _Devon.seen_headers[0]["Authorization"] == "Bearer secret"
+
+    def test_gzipped_html_rewritten(self, client):
+        resp = client.get("/devon-app/gz")
+
+        assert b'"/devon-app"' in resp.data
+        assert "Content-Encoding" not in resp.headers
+
+    def test_event_stream_passes_through(self, client):
+        resp = client.get("/devon-app/events")
+
+        assert resp.data == b"data: 0\n\ndata: 1\n\ndata: 2\n\n"
+
+    def test_event_stream_connection_pooled_with_timeout(self, client):
+        from kitt.web.api.v1 import devon_proxy
+
+        assert client.get("/devon-app/events").data
+
+        idle = [c for conns in devon_proxy._pool._idle.values() for c in conns]
+        assert len(idle) == 1
+        assert idle[0].sock.gettimeout() == devon_proxy._TIMEOUT_S
+
+    def test_keep_alive_connection_reused(self, client):
+        for path, status in (
+            ("/devon-app/", 200),
+            ("/devon-app/blob", 200),
+            ("/devon-app/moved", 302),
+            ("/devon-app/missing", 404),
+        ):
+            resp = client.get(path)
+            resp.get_data()  # Drain the stream so the connection is pooled
+            assert resp.status_code == status
+
+        assert len(_Devon.connections) == 1
+
+    def test_redirect_location_rewritten(self, client):
+        resp = client.get("/devon-app/moved")
+
+        assert resp.status_code == 302
+        assert resp.headers["Location"] == "/devon-app/blob?x=1"
+        assert client.get("/devon-app/relative").headers["Location"] == (
+            "/devon-app/blob"
+        )
+        assert client.get("/devon-app/away").headers["Location"] == (
+            "https://example.com/login"
+        )
+
+    def test_upstream_errors(self, client):
+        assert client.get("/devon-app/missing").status_code == 404
+        assert client.get("/devon-app/a/../b").status_code in (400, 404)
+
+    def test_unreachable(self):
+        from kitt.web.api.v1 import devon_proxy
+
+        app = Flask(__name__)
+        app.register_blueprint(devon_proxy.bp)
+        with patch.object(
+            devon_proxy, "_get_devon_url", return_value="http://127.0.0.1:1"
+        ):
+            assert app.test_client().get("/devon-app/").status_code == 502
@@ -0,0 +1,131 @@
+"""Tests for cross-process event delivery and Last-Event-ID resume."""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from kitt.web.services.event_broker import SQLiteEventBroker
+from kitt.web.services.event_bus import EventBus, parse_last_event_id
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = tmp_path / "kitt.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        """CREATE TABLE events (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_type TEXT NOT NULL,
+            source_id TEXT NOT NULL,
+            data TEXT NOT NULL,
+            created_at TEXT NOT NULL DEFAULT (datetime('now'))
+        )"""
+    )
+    conn.close()
+    return path
+
+
+@pytest.fixture
+def buses(db_path):
+    """Two buses on one database, standing in for two worker processes."""
+    a, b = EventBus(), EventBus()
+    a.attach_broker(SQLiteEventBroker(db_path, poll_interval_s=0.01))
+    b.attach_broker(SQLiteEventBroker(db_path, poll_interval_s=0.01))
+    yield a, b
+    a.detach_broker()
+    b.detach_broker()
+
+
+def _drain(stream, count):
+    return [next(stream) for _ in range(count)]
+
+
+class TestSQLiteEventBroker:
+    def test_fans_out_across_buses(self, buses):
+        a, b = buses
+        stream = b.subscribe("sub", source_filter="agent-1")
+        received = []
+        reader = threading.Thread(target=lambda: received.append(next(stream)))
+        reader.start()
+        while b.subscriber_count == 0:
+            time.sleep(0.001)
+
+        a.publish("heartbeat", "agent-2", {"ok": True})
+        a.publish("heartbeat", "agent-1", {"ok": True})
+        reader.join(5)
+
+        assert received[0].startswith("id: 2\nevent: heartbeat\n")
+
+    def test_own_events_not_delivered_twice(self, buses):
+        a, _ = buses
+        a.publish("log", "camp-1", {"line": "one"})
+        time.sleep(0.1)  # several poll cycles
+
+        assert len(a.get_history("camp-1")) == 1
+
+    def test_resume_from_last_event_id(self, buses):
+        a, b = buses
+        for i in range(3):
+            a.publish("log", "camp-1", {"line": i})
+
+        stream = b.subscribe("sub", source_filter="camp-1", last_event_id=1)
+        chunks = _drain(stream, 2)
+        stream.close()
+
+        assert chunks[0].startswith("id: 2\n")
+        assert chunks[1].startswith("id: 3\n")
+
+    def test_prune_keeps_recent(self, db_path):
+        broker = SQLiteEventBroker(db_path, retain=2)
+        bus = EventBus()
+        bus.attach_broker(broker)
+        for i in range(5):
+            bus.publish("log", "camp-1", {"line": i})
+        broker._prune()
+
+        assert [e.event_id for e in broker.since(0)] == [4, 5]
+        bus.detach_broker()
+
+
+class TestInProcessResume:
+    def test_replay_from_history(self):
+        bus = EventBus()
+        for i in range(3):
+            bus.publish("log", "camp-1", {"line": i})
+        bus.publish("log", "camp-2", {"line": "other"})
+
+        stream = bus.subscribe("sub", source_filter="camp-1", last_event_id=1)
+        chunks = _drain(stream, 2)
+        stream.close()
+
+        assert [c.split("\n")[0] for c in chunks] == ["id: 2", "id: 3"]
+
+    def test_parse_last_event_id(self):
+        assert parse_last_event_id("42") == 42
+        assert parse_last_event_id(" 7 ") == 7
+        assert parse_last_event_id("nope") is None
+        assert parse_last_event_id(None) is None
+
+
+class TestAppEventBus:
+    @pytest.mark.parametrize(("setting", "attached"), [(None, False), ("sqlite", True)])
+    def test_broker_attached_only_when_configured(
+        self, tmp_path, monkeypatch, setting, attached
+    ):
+        pytest.importorskip("flask")
+        from kitt.web.app import create_app
+        from kitt.web.services.event_bus import event_bus
+
+        if setting:
+            monkeypatch.setenv("KITT_EVENT_BUS", setting)
+        else:
+            monkeypatch.delenv("KITT_EVENT_BUS", raising=False)
+        try:
+            create_app(
+                results_dir=str(tmp_path), db_path=tmp_path / "kitt.db", insecure=True
+            )
+            assert (event_bus._broker is not None) == attached
+        finally:
+            event_bus.detach_broker()
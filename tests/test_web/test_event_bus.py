@@ -0,0 +1,73 @@
+"""Tests for EventBus history and subscriber indexing."""
+
+import queue
+from unittest.mock import patch
+
+from kitt.web.services.event_bus import Event, EventBus
+
+
+class TestHistory:
+    def test_bounded_and_per_source(self):
+        bus = EventBus(max_history=4)
+        for i in range(6):
+            bus.publish("log", "a" if i % 2 else "b", {"i": i})
+
+        assert [e.data["i"] for e in bus.get_history()] == [2, 3, 4, 5]
+        assert [e.data["i"] for e in bus.get_history("a")] == [3, 5]
+        assert [e.data["i"] for e in bus.get_history("b", limit=1)] == [4]
+        assert bus.get_history("missing") == []
+        assert bus.get_history(limit=0) == []
+
+    def test_evicted_sources_dropped(self):
+        bus = EventBus(max_history=2)
+        bus.publish("log", "old", {})
+        bus.publish("log", "new", {})
+        bus.publish("log", "new", {})
+
+        assert bus.get_history("old") == []
+        assert "old" not in bus._source_history
+
+    def test_history_disabled(self):
+        bus = EventBus(max_history=0)
+        sub_queue = queue.Queue()
+        bus._register("sub", None, sub_queue)
+        bus.publish("log", "a", {})
+
+        assert bus.get_history() == []
+        assert sub_queue.get_nowait().source_id == "a"
+
+
+class TestSubscriberIndex:
+    def test_publish_skips_unrelated_subscribers(self):
+        bus = EventBus()
+        watched, other, everything = queue.Queue(), queue.Queue(), queue.Queue()
+        bus._register("watched", "camp-1", watched)
+        bus._register("other", "camp-2", other)
+        bus._register("all", None, everything)
+
+        bus.publish("log", "camp-1", {"line": "x"})
+
+        assert watched.qsize() == 1
+        assert other.qsize() == 0
+        assert everything.qsize() == 1
+
+    def test_unsubscribe_cleans_index(self):
+        bus = EventBus()
+        bus._register("s1", "camp-1", queue.Queue())
+        bus.unsubscribe("s1")
+
+        assert bus.subscriber_count == 0
+        assert bus._by_source == {}
+
+    def test_sse_serialized_once_per_event(self):
+        bus = EventBus()
+        for i in range(3):
+            bus._register(f"s{i}", None, queue.Queue())
+
+        with patch.object(Event, "_format_sse", autospec=True, return_value="x") as fmt:
+            bus.publish("log", "camp-1", {"line": "x"})
+            for sub_id in ("s0", "s1", "s2"):
+                event = bus._subscribers[sub_id][1].get_nowait()
+                assert event.to_sse() == "x"
+
+        assert fmt.call_count == 1
@@ -0,0 +1,78 @@
+"""Tests for ResultService summary caching."""
+
+from unittest.mock import MagicMock
+
+from kitt.web.services.result_service import ResultService
+
+
+def _store():
+    store = MagicMock()
+    store.count.return_value = 4
+    store.aggregate.return_value = [{"engine": "vllm", "count": 4}]
+    store.query.return_value = [{"id": "r1"}]
+    store.delete_result.return_value = True
+    return store
+
+
+class TestSummaryCache:
+    def test_summary_served_from_cache(self):
+        store = _store()
+        svc = ResultService(store)
+
+        first = svc.get_summary()
+        second = svc.get_summary()
+
+        assert first == second
+        assert first["total_results"] == 4
+        assert store.count.call_count == 2  # total + passed, once
+        assert store.aggregate.call_count == 2
+
+    def test_writes_invalidate(self):
+        store = _store()
+        svc = ResultService(store)
+
+        svc.get_summary()
+        svc.get_recent(limit=5)
+        svc.save_result({"model": "m"})
+        svc.get_summary()
+        svc.get_recent(limit=5)
+        svc.delete_result("r1")
+        svc.get_summary()
+
+        assert store.count.call_count == 6
+        assert store.query.call_count == 2
+
+    def test_ttl_expiry(self):
+        store = _store()
+        svc = ResultService(store, cache_ttl_s=0)
+
+        svc.get_recent(limit=5)
+        svc.get_recent(limit=5)
+
+        assert store.query.call_count == 2
+
+    def test_recent_cached_per_limit(self):
+        store = _store()
+        svc = ResultService(store)
+
+        svc.get_recent(limit=5)
+        svc.get_recent(limit=10)
+        svc.get_recent(limit=5)
+
+        assert store.query.call_count == 2
+
+    def test_invalidation_during_compute_not_cached(self):
+        store = _store()
+        svc = ResultService(store)
+
+        def stale_query(**kwargs):
+            # Another request saves a result while this one is reading
+            svc.invalidate_cache()
+            return [{"id": "r1"}]
+
+        store.query.side_effect = stale_query
+        svc.get_recent(limit=5)
+        store.query.side_effect = None
+        svc.get_recent(limit=5)
+
+        assert store.query.call_count == 2
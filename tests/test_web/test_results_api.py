@@ -0,0 +1,66 @@
+"""Tests for the v1 results list endpoint."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+try:
+    from flask import Flask
+
+    FLASK_AVAILABLE = True
+except ImportError:
+    FLASK_AVAILABLE = False
+
+pytestmark = pytest.mark.skipif(not FLASK_AVAILABLE, reason="flask not installed")
+
+
+@pytest.fixture
+def svc():
+    from kitt.web.api.v1.results import bp
+
+    service = MagicMock()
+    service.list_results.return_value = {
+        "items": [],
+        "total": 0,
+        "page": 1,
+        "per_page": 25,
+        "pages": 0,
+    }
+    service.query_page.return_value = {
+        "items": [],
+        "next_cursor": None,
+        "per_page": 25,
+        "sort": "-timestamp",
+    }
+    app = Flask(__name__)
+    app.register_blueprint(bp)
+    with patch("kitt.web.api.v1.results._get_result_service", return_value=service):
+        service.client = app.test_client()
+        yield service
+
+
+class TestListResults:
+    def test_default_keeps_page_envelope(self, svc):
+        data = svc.client.get("/api/v1/results/?model=m").get_json()
+
+        assert data["total"] == 0
+        assert data["pages"] == 0
+        svc.list_results.assert_called_once_with(
+            model="m", engine="", suite_name="", page=1, per_page=25
+        )
+        svc.query_page.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "params", ["sort=-avg_tps", "metric=avg_tps>5", "cursor=abc", "passed=1"]
+    )
+    def test_cursor_params_switch_to_cursor_paging(self, svc, params):
+        data = svc.client.get(f"/api/v1/results/?{params}").get_json()
+
+        assert "next_cursor" in data
+        svc.list_results.assert_not_called()
+
+    def test_page_wins_over_cursor_params(self, svc):
+        svc.client.get("/api/v1/results/?page=2&sort=-avg_tps")
+
+        svc.list_results.assert_called_once()
+        svc.query_page.assert_not_called()